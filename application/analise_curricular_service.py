@@ -0,0 +1,191 @@
+# application/analise_curricular_service.py
+"""
+Módulo que implementa as análises estruturais do catálogo de disciplinas.
+
+Apoia a coordenação no planejamento da oferta de turmas respondendo, sobre
+o GrafoCurricular, a perguntas como: qual é a maior cadeia de
+pré-requisitos do curso? Quais disciplinas, se não forem ofertadas ou se
+o aluno reprovar, travam mais horas da grade? Como as disciplinas se
+distribuem por nível (profundidade) na cadeia de requisitos?
+
+Todas as métricas são obtidas de uma única ordenação topológica do grafo
+de pré-requisitos: uma passada em ordem direta calcula profundidades e o
+caminho crítico; uma passada em ordem reversa propaga, como bitsets
+(inteiros do Python), o conjunto de disciplinas alcançáveis a partir de
+cada vértice, de onde saem as horas bloqueadas a jusante.
+"""
+
+from typing import Iterable
+
+
+# int.bit_count só existe a partir do Python 3.10
+_contar_bits = getattr(int, "bit_count", None) or (lambda valor: bin(valor).count("1"))
+
+
+class AnaliseCurricularService:
+    """
+    Calcula métricas de estrutura curricular sobre o grafo de requisitos.
+
+    A sequência entre semestres é dada pelos pré-requisitos, por isso
+    profundidade, caminho crítico e horas a jusante consideram apenas
+    esse vínculo. Co-requisitos entram na contagem de fan-in/fan-out,
+    já que também prendem a oferta de uma disciplina à de outra.
+
+    Métricas produzidas:
+        - caminho_critico: maior cadeia de pré-requisitos (em semestres);
+        - fan_in / fan_out: requisitos diretos de cada disciplina e
+          disciplinas que a exigem diretamente;
+        - gargalos: disciplinas ordenadas pelas horas de todas as
+          disciplinas que dependem delas, direta ou indiretamente;
+        - histograma_profundidade: quantidade de disciplinas por nível.
+
+    Exemplo de uso:
+        >>> svc = AnaliseCurricularService(repo_disc.carregar_grafo())
+        >>> relatorio = svc.analisar()
+        >>> relatorio["caminho_critico"]
+        ['Cálculo I', 'Cálculo II', 'Cálculo III']
+        >>> relatorio["gargalos"][0]
+        {'nome': 'Cálculo I', 'horas_bloqueadas': 144, 'dependentes': 2}
+    """
+
+    def __init__(self, grafo):
+        """
+        :param grafo: GrafoCurricular com o catálogo a analisar.
+        """
+        self._grafo = grafo
+
+    def analisar(self, grade: Iterable[str] = None, top: int = 10) -> dict:
+        """
+        Gera o relatório estrutural do catálogo ou da grade de um curso.
+
+        :param grade: Nomes das disciplinas da grade do curso. Se None,
+                      todo o catálogo é analisado. Requisitos fora da grade
+                      são ignorados.
+        :param top: Quantidade de gargalos retornados.
+        :raises ValueError: se houver ciclo de pré-requisitos.
+        :return: Dicionário com 'total_disciplinas', 'caminho_critico',
+                 'comprimento_caminho_critico', 'fan_in', 'fan_out',
+                 'gargalos' e 'histograma_profundidade'.
+        """
+        grafo = self._grafo
+        nomes = list(grafo.nomes) if grade is None else [n for n in grade if n in grafo]
+        indice = {nome: i for i, nome in enumerate(nomes)}
+        n = len(nomes)
+
+        # Adjacência por índice (requisito → dependentes) restrita à grade
+        sucessores = [[] for _ in range(n)]
+        grau = [0] * n
+        fan_in = {}
+        fan_out = dict.fromkeys(nomes, 0)
+        for i, nome in enumerate(nomes):
+            requisitos = 0
+            for req in grafo.pre[nome]:
+                j = indice.get(req)
+                if j is not None:
+                    sucessores[j].append(i)
+                    grau[i] += 1
+                    fan_out[req] += 1
+                    requisitos += 1
+            for req in grafo.co[nome]:
+                if req in indice:
+                    fan_out[req] += 1
+                    requisitos += 1
+            fan_in[nome] = requisitos
+
+        ordem = self._ordem_topologica(sucessores, grau)
+
+        # Passada direta: profundidade e predecessor no caminho mais longo
+        profundidade = [1] * n
+        anterior = [-1] * n
+        for i in ordem:
+            for s in sucessores[i]:
+                if profundidade[i] + 1 > profundidade[s]:
+                    profundidade[s] = profundidade[i] + 1
+                    anterior[s] = i
+
+        # Passada reversa: alcançáveis a jusante como bitset
+        alcance = [0] * n
+        for i in reversed(ordem):
+            bits = 1 << i
+            for s in sucessores[i]:
+                bits |= alcance[s]
+            alcance[i] = bits
+
+        return {
+            "total_disciplinas": n,
+            "caminho_critico": self._caminho(profundidade, anterior, nomes),
+            "comprimento_caminho_critico": max(profundidade, default=0),
+            "fan_in": fan_in,
+            "fan_out": fan_out,
+            "gargalos": self._gargalos(nomes, alcance, top),
+            "histograma_profundidade": self._histograma(profundidade),
+        }
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _ordem_topologica(sucessores: list, grau: list) -> list:
+        """
+        Ordena os vértices pelo algoritmo de Kahn.
+
+        :raises ValueError: se houver ciclo de pré-requisitos.
+        """
+        grau = list(grau)
+        ordem = [i for i, d in enumerate(grau) if d == 0]
+        for i in ordem:
+            for s in sucessores[i]:
+                grau[s] -= 1
+                if grau[s] == 0:
+                    ordem.append(s)
+        if len(ordem) != len(grau):
+            raise ValueError("Ciclo de pré-requisitos detectado no catálogo.")
+        return ordem
+
+    @staticmethod
+    def _caminho(profundidade: list, anterior: list, nomes: list) -> list:
+        """Reconstrói, do início ao fim, a cadeia de maior profundidade."""
+        if not nomes:
+            return []
+        i = max(range(len(nomes)), key=profundidade.__getitem__)
+        caminho = []
+        while i != -1:
+            caminho.append(nomes[i])
+            i = anterior[i]
+        return caminho[::-1]
+
+    def _gargalos(self, nomes: list, alcance: list, top: int) -> list:
+        """
+        Ordena as disciplinas pelas horas que bloqueiam a jusante.
+
+        Em vez de somar a carga bit a bit, agrupa as disciplinas por carga
+        horária (poucos valores distintos no catálogo) e usa a contagem de
+        bits de cada interseção.
+        """
+        carga = self._grafo.carga
+        mascaras = {}
+        for i, nome in enumerate(nomes):
+            mascaras[carga[nome]] = mascaras.get(carga[nome], 0) | (1 << i)
+
+        gargalos = []
+        for i, nome in enumerate(nomes):
+            jusante = alcance[i] & ~(1 << i)
+            if not jusante:
+                continue
+            horas = sum(c * _contar_bits(jusante & m) for c, m in mascaras.items())
+            gargalos.append({
+                "nome": nome,
+                "horas_bloqueadas": horas,
+                "dependentes": _contar_bits(jusante),
+            })
+        gargalos.sort(key=lambda g: (-g["horas_bloqueadas"], g["nome"]))
+        return gargalos[:top]
+
+    @staticmethod
+    def _histograma(profundidade: list) -> dict:
+        """Conta as disciplinas por nível, em ordem crescente de nível."""
+        contagem = {}
+        for p in profundidade:
+            contagem[p] = contagem.get(p, 0) + 1
+        return dict(sorted(contagem.items()))
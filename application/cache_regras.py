@@ -0,0 +1,173 @@
+# application/cache_regras.py
+"""
+Módulo que implementa a memorização de resultados de regras acadêmicas.
+
+Em períodos de matrícula o mesmo aluno envia várias solicitações seguidas
+e as mesmas verificações (pré-requisitos, créditos, vínculo) são refeitas
+sobre um histórico que não mudou. O CacheResultadosRegras guarda as
+violações produzidas por regras determinísticas, indexadas pelas versões
+do histórico do aluno e do catálogo: qualquer alteração em um dos dois
+gera chaves novas, e as entradas antigas simplesmente deixam de ser
+consultadas até saírem pela política LRU.
+
+Como cada requisição recarrega aluno e disciplinas do banco, as versões
+usadas vêm dos dados persistidos: o histórico carimbado com o registro
+do aluno (Historico.carimbar) e a versão do catálogo gravado, informada
+por versao_catalogo (ex: RepositorioDisciplina.versao_catalogo).
+"""
+
+import threading
+from collections import OrderedDict
+
+from domain.disciplina import Disciplina
+
+
+class CacheResultadosRegras:
+    """
+    Cache LRU limitado de resultados de regras, com contadores de acerto.
+
+    Apenas regras que informam uma chave em Regra.chave_cache() são
+    memorizadas. A chave completa é:
+        (regra, matrícula, versão do histórico, versão do catálogo em
+         memória, versão do catálogo gravado,
+         *partes específicas da regra — ex: nome da disciplina-alvo)
+
+    Não há invalidação explícita: como cada estado tem versões próprias,
+    resultados de estados antigos nunca mais são encontrados e são
+    descartados pela ordem de uso quando a capacidade é atingida.
+
+    O mesmo cache é usado pelas threads do pool da API: consultas e
+    gravações nas entradas (e os contadores) passam por uma trava. A
+    avaliação das regras nas faltas roda fora dela.
+
+    Exemplo de uso:
+        >>> cache = CacheResultadosRegras(4096, RepositorioDisciplina.versao_catalogo)
+        >>> pipeline = PipelineRegras(regras, nome="matricula", cache=cache)
+        >>> cache.estatisticas()
+        {'acertos': 812, 'faltas': 95, 'taxa_acerto': 0.8953, ...}
+    """
+
+    def __init__(self, capacidade: int = 4096, versao_catalogo=None):
+        """
+        :param capacidade: Número máximo de resultados mantidos.
+        :param versao_catalogo: Função sem argumentos que retorna a versão
+                                do catálogo gravado (None = só o catálogo
+                                em memória, como em testes e na demo).
+        :raises ValueError: se a capacidade não for positiva.
+        """
+        if capacidade <= 0:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        self._capacidade = capacidade
+        self._versao_catalogo = versao_catalogo
+        self._entradas = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+
+    def chave(self, regra, solicitacao):
+        """
+        Monta a chave de cache da regra para a solicitação.
+
+        :return: Tupla hashable, ou None se a regra não for memorizável
+                 para esta solicitação.
+        """
+        partes = regra.chave_cache(solicitacao)
+        if partes is None:
+            return None
+        aluno = solicitacao.aluno
+        gravado = self._versao_catalogo() if self._versao_catalogo is not None else None
+        return (regra, aluno.matricula, aluno.historico.versao,
+                Disciplina.versao_catalogo(), gravado) + tuple(partes)
+
+    def avaliar(self, regra, solicitacao, contexto=None) -> list:
+        """
+        Avalia a regra usando o resultado memorizado quando disponível.
+
+        :param regra: Objeto Regra a avaliar.
+        :param solicitacao: Solicitação sob avaliação.
+        :param contexto: ContextoAvaliacao repassado à regra em caso de falta.
+        :return: Lista de objetos Violacao (cópia da lista memorizada).
+        """
+        chave = self.chave(regra, solicitacao)
+        if chave is None:
+            return regra.avaliar(solicitacao, contexto)
+
+        violacoes = self._obter(chave)
+        if violacoes is not None:
+            return list(violacoes)
+
+        violacoes = regra.avaliar(solicitacao, contexto)
+        self._guardar(chave, violacoes)
+        return violacoes
+
+    def avaliar_lote(self, regra, solicitacoes: list, contextos: list) -> list:
+        """
+        Versão em lote de avaliar(): consulta o cache para cada solicitação
+        e avalia apenas as faltas, em uma única chamada a regra.avaliar_lote().
+
+        :return: Lista de listas de Violacao, na ordem das solicitações.
+        """
+        resultados = [None] * len(solicitacoes)
+        faltas, chaves = [], []
+        for i, sol in enumerate(solicitacoes):
+            chave = self.chave(regra, sol)
+            violacoes = self._obter(chave) if chave is not None else None
+            if violacoes is not None:
+                resultados[i] = list(violacoes)
+            else:
+                faltas.append(i)
+                chaves.append(chave)
+
+        if faltas:
+            avaliadas = regra.avaliar_lote([solicitacoes[i] for i in faltas],
+                                           [contextos[i] for i in faltas])
+            for i, chave, violacoes in zip(faltas, chaves, avaliadas):
+                resultados[i] = violacoes
+                if chave is not None:
+                    self._guardar(chave, violacoes)
+        return resultados
+
+    def _obter(self, chave):
+        """Retorna o resultado memorizado (renovando-o) e conta o acerto, ou None."""
+        with self._trava:
+            violacoes = self._entradas.get(chave)
+            if violacoes is not None:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+            return violacoes
+
+    def _guardar(self, chave, violacoes: list) -> None:
+        """Conta a falta e armazena o resultado, descartando o menos recente se necessário."""
+        with self._trava:
+            self.faltas += 1
+            self._entradas[chave] = tuple(violacoes)
+            if len(self._entradas) > self._capacidade:
+                self._entradas.popitem(last=False)
+                self.descartes += 1
+
+    def limpar(self) -> None:
+        """Remove todas as entradas e zera os contadores."""
+        with self._trava:
+            self._entradas.clear()
+            self.acertos = self.faltas = self.descartes = 0
+
+    def estatisticas(self) -> dict:
+        """
+        Retorna os contadores do cache.
+
+        :return: Dicionário com 'acertos', 'faltas', 'taxa_acerto',
+                 'descartes', 'tamanho' e 'capacidade'.
+        """
+        consultas = self.acertos + self.faltas
+        return {
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "taxa_acerto": round(self.acertos / consultas, 4) if consultas else 0.0,
+            "descartes": self.descartes,
+            "tamanho": len(self._entradas),
+            "capacidade": self._capacidade,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entradas)
@@ -0,0 +1,286 @@
+# application/calendario_service.py
+"""
+Módulo que implementa o calendário acadêmico consultado pela RegraPrazo.
+
+O calendário reúne os períodos em que cada tipo de solicitação é aceito,
+por semestre, para a instituição inteira ou para um curso específico.
+Os períodos são persistidos no sgsa.json e indexados por (curso, tipo)
+em listas ordenadas pela data de início: como os períodos de uma mesma
+chave não se sobrepõem, o período que rege uma data é encontrado por
+busca binária, em O(log n), sem depender do prazo informado pelo cliente.
+"""
+
+import bisect
+import csv
+import datetime
+import json
+
+
+# Tipos de solicitação que podem ter período no calendário
+TIPOS = ("matricula", "trancamento", "colacao")
+
+
+class CalendarioService:
+    """
+    Calendário acadêmico com índice de intervalos por curso e tipo.
+
+    Cada período é um dicionário:
+        {"curso": "Medicina" ou None, "semestre": "2026.1",
+         "tipo": "trancamento", "inicio": date, "fim": date}
+    O curso None define o calendário institucional; um curso com
+    períodos próprios para um tipo substitui o institucional apenas
+    para esse tipo.
+
+    Índice:
+        {(curso, tipo): (inícios ordenados, períodos na mesma ordem)}.
+        É montado na primeira consulta (uma leitura do banco) e refeito
+        a cada importação.
+
+    Período atual:
+        Quase todas as consultas usam a data de hoje, que cai sempre no
+        mesmo período. O último período encontrado para cada (curso, tipo)
+        fica guardado e é devolvido sem busca enquanto contiver a data
+        consultada; ele é descartado junto com o índice.
+
+    Exemplo de uso:
+        >>> calendario = CalendarioService(RepositorioCalendario())
+        >>> calendario.importar_arquivo("calendario_2026.csv")
+        12
+        >>> calendario.periodo("trancamento", datetime.date(2026, 3, 10))
+        {'curso': None, 'semestre': '2026.1', 'tipo': 'trancamento',
+         'inicio': datetime.date(2026, 2, 2), 'fim': datetime.date(2026, 4, 10)}
+    """
+
+    def __init__(self, repositorio=None, periodos: list = None):
+        """
+        :param repositorio: RepositorioCalendario usado para ler e gravar
+                            os períodos. Se None, o calendário fica apenas
+                            em memória.
+        :param periodos: Períodos iniciais (apenas sem repositório).
+        :raises ValueError: se algum período inicial for inválido.
+        """
+        self._repositorio = repositorio
+        self._indice = None
+        self._atual = {}
+        if periodos is not None:
+            self._montar_indice([self._normalizar(p) for p in periodos])
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def periodo(self, tipo: str, data: datetime.date, curso: str = None) -> dict:
+        """
+        Retorna o período do calendário que rege a data informada.
+
+        É o período que contém a data; se nenhum contiver, o último que
+        começou antes dela (prazo encerrado) ou, na falta deste, o
+        primeiro que ainda vai começar.
+
+        :param tipo: Tipo da solicitação.
+        :param data: Data da solicitação.
+        :param curso: Nome do curso; sem períodos próprios para o tipo,
+                      usa o calendário institucional.
+        :return: Dicionário do período, ou None se o calendário não
+                 define períodos para o tipo.
+        """
+        chave = self._chave(tipo, curso)
+        if chave is None:
+            return None
+        atual = self._atual.get(chave)
+        if atual is not None and atual["inicio"] <= data <= atual["fim"]:
+            return atual
+
+        inicios, periodos = self._indice[chave]
+        i = bisect.bisect_right(inicios, data) - 1
+        if i < 0:
+            return periodos[0]
+        encontrado = periodos[i]
+        if data <= encontrado["fim"]:
+            self._atual[chave] = encontrado
+        return encontrado
+
+    def periodo_atual(self, tipo: str, curso: str = None, hoje: datetime.date = None) -> dict:
+        """
+        Retorna o período aberto hoje para o tipo e o curso.
+
+        :param hoje: Data de referência (padrão: datetime.date.today()).
+        :return: Dicionário do período, ou None se nenhum estiver aberto.
+        """
+        hoje = hoje or datetime.date.today()
+        encontrado = self.periodo(tipo, hoje, curso)
+        if encontrado is not None and encontrado["inicio"] <= hoje <= encontrado["fim"]:
+            return encontrado
+        return None
+
+    def semestre(self, data: datetime.date = None, curso: str = None) -> str:
+        """
+        Identifica o semestre letivo de uma data.
+
+        Usa o semestre do período do calendário que contém a data (de
+        qualquer tipo); sem período, usa o semestre civil ('AAAA.1' até
+        junho, 'AAAA.2' a partir de julho).
+
+        :param data: Data de referência (padrão: datetime.date.today()).
+        :param curso: Curso cujo calendário é consultado.
+        """
+        data = data or datetime.date.today()
+        for tipo in TIPOS:
+            encontrado = self.periodo(tipo, data, curso)
+            if encontrado is not None and encontrado["inicio"] <= data <= encontrado["fim"]:
+                return encontrado["semestre"]
+        return f"{data.year}.{1 if data.month <= 6 else 2}"
+
+    def define(self, tipo: str, curso: str = None) -> bool:
+        """Indica se o calendário tem períodos para o tipo (e o curso)."""
+        return self._chave(tipo, curso) is not None
+
+    def listar(self, tipo: str = None, curso: str = None) -> list:
+        """
+        Lista os períodos cadastrados, ordenados por curso, tipo e início.
+
+        :param tipo: Restringe a um tipo de solicitação.
+        :param curso: Restringe aos períodos próprios de um curso.
+        """
+        self._garantir_indice()
+        resultado = []
+        for (c, t), (_, periodos) in sorted(self._indice.items(),
+                                            key=lambda item: (item[0][0] or "", item[0][1])):
+            if (tipo is None or t == tipo) and (curso is None or c == curso):
+                resultado.extend(periodos)
+        return resultado
+
+    # ------------------------------------------------------------------
+    # Importação
+    # ------------------------------------------------------------------
+
+    def importar(self, registros: list, substituir: bool = False) -> int:
+        """
+        Importa períodos em lote, validando tudo antes de gravar.
+
+        Um período importado substitui o já cadastrado com o mesmo curso,
+        semestre e tipo. O calendário resultante é gravado de uma só vez
+        e o índice é refeito.
+
+        :param registros: Lista de dicionários com curso (opcional),
+                          semestre, tipo, inicio e fim (date ou texto
+                          YYYY-MM-DD).
+        :param substituir: Se True, descarta todo o calendário anterior.
+        :raises ValueError: se algum registro for inválido ou se dois
+                            períodos da mesma chave se sobrepuserem; nada
+                            é gravado nesse caso.
+        :return: Quantidade de períodos importados.
+        """
+        novos = [self._normalizar(r, n) for n, r in enumerate(registros, start=1)]
+        periodos = {} if substituir else {
+            (p["curso"], p["semestre"], p["tipo"]): p for p in self.listar()
+        }
+        for p in novos:
+            periodos[(p["curso"], p["semestre"], p["tipo"])] = p
+
+        self._montar_indice(list(periodos.values()))
+        if self._repositorio is not None:
+            self._repositorio.substituir([
+                dict(p, inicio=p["inicio"].isoformat(), fim=p["fim"].isoformat())
+                for p in self.listar()
+            ])
+        return len(novos)
+
+    def importar_arquivo(self, caminho: str, substituir: bool = False) -> int:
+        """
+        Importa o calendário de um arquivo CSV ou JSON.
+
+        O CSV tem cabeçalho curso,semestre,tipo,inicio,fim (curso vazio
+        para o calendário institucional). O JSON é uma lista de períodos
+        ou um objeto com a chave "periodos".
+
+        :raises ValueError: se o arquivo for ilegível ou inválido.
+        :return: Quantidade de períodos importados.
+        """
+        try:
+            with open(caminho, "r", encoding="utf-8", newline="") as f:
+                if caminho.endswith(".csv"):
+                    registros = list(csv.DictReader(f))
+                else:
+                    registros = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Arquivo de calendário inválido: {caminho} ({e}).")
+        if isinstance(registros, dict):
+            registros = registros.get("periodos", [])
+        return self.importar(registros, substituir=substituir)
+
+    def recarregar(self) -> None:
+        """Descarta o índice; a próxima consulta relê o banco."""
+        self._indice = None
+        self._atual = {}
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+
+    def _garantir_indice(self) -> None:
+        """Monta o índice a partir do repositório, se ainda não existir."""
+        if self._indice is None:
+            registros = self._repositorio.listar() if self._repositorio is not None else []
+            self._montar_indice([self._normalizar(r) for r in registros])
+
+    def _chave(self, tipo: str, curso: str):
+        """Resolve a chave do índice: a do curso, se existir, ou a institucional."""
+        self._garantir_indice()
+        if (curso, tipo) in self._indice:
+            return (curso, tipo)
+        if (None, tipo) in self._indice:
+            return (None, tipo)
+        return None
+
+    def _montar_indice(self, periodos: list) -> None:
+        """
+        Agrupa e ordena os períodos por (curso, tipo).
+
+        :raises ValueError: se dois períodos da mesma chave se sobrepuserem.
+        """
+        grupos = {}
+        for p in periodos:
+            grupos.setdefault((p["curso"], p["tipo"]), []).append(p)
+
+        indice = {}
+        for (curso, tipo), lista in grupos.items():
+            lista.sort(key=lambda p: p["inicio"])
+            for anterior, seguinte in zip(lista, lista[1:]):
+                if seguinte["inicio"] <= anterior["fim"]:
+                    raise ValueError(
+                        f"Períodos sobrepostos para {tipo} ({curso or 'institucional'}): "
+                        f"{anterior['semestre']} e {seguinte['semestre']}.")
+            indice[(curso, tipo)] = ([p["inicio"] for p in lista], lista)
+
+        self._indice = indice
+        self._atual = {}
+
+    @staticmethod
+    def _normalizar(registro: dict, linha: int = None) -> dict:
+        """
+        Valida um registro e converte as datas para datetime.date.
+
+        :raises ValueError: se faltar campo, o tipo for desconhecido ou as
+                            datas forem inválidas.
+        """
+        onde = f" (registro {linha})" if linha else ""
+        try:
+            tipo = registro["tipo"]
+            semestre = str(registro["semestre"])
+            inicio, fim = registro["inicio"], registro["fim"]
+        except (KeyError, TypeError):
+            raise ValueError(f"Período do calendário deve ter semestre, tipo, inicio e fim{onde}.")
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de solicitação inválido no calendário{onde}: '{tipo}'.")
+        try:
+            if not isinstance(inicio, datetime.date):
+                inicio = datetime.date.fromisoformat(inicio)
+            if not isinstance(fim, datetime.date):
+                fim = datetime.date.fromisoformat(fim)
+        except (TypeError, ValueError):
+            raise ValueError(f"Datas devem estar no formato YYYY-MM-DD{onde}.")
+        if inicio > fim:
+            raise ValueError(f"Início posterior ao fim no período {semestre}{onde}.")
+        return {"curso": registro.get("curso") or None, "semestre": semestre,
+                "tipo": tipo, "inicio": inicio, "fim": fim}
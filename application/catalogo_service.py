@@ -0,0 +1,106 @@
+# application/catalogo_service.py
+"""
+Módulo que implementa consultas do aluno sobre o catálogo de disciplinas.
+
+Responde à pergunta "em quais disciplinas posso me matricular agora?"
+em uma única passada sobre o GrafoCurricular, comparando os conjuntos de
+requisitos pré-calculados com o conjunto de disciplinas aprovadas do aluno
+— sem instanciar solicitações nem usar exceções como sinal de bloqueio.
+"""
+
+
+class CatalogoService:
+    """
+    Serviço de consultas sobre o catálogo na perspectiva de um aluno.
+
+    As mesmas condições de RegraPreRequisito, RegraCoRequisito e
+    RegraLimiteCargaHoraria são avaliadas de forma agregada:
+        - pré-requisito: todos os pré-requisitos devem estar aprovados;
+        - co-requisito: cada co-requisito deve estar aprovado ou poder ser
+          cursado no mesmo semestre (ou seja, ter os pré-requisitos cumpridos);
+        - carga horária: a disciplina sozinha não pode exceder o limite
+          semestral do curso do aluno.
+
+    Exemplo de uso:
+        >>> svc = CatalogoService(repo_disc.carregar_grafo())
+        >>> svc.disciplinas_elegiveis(aluno)["elegiveis"]
+        {'Cálculo I': [], 'Física Teórica': ['Laboratório de Física']}
+    """
+
+    def __init__(self, grafo):
+        """
+        :param grafo: GrafoCurricular com o catálogo a consultar. O grafo é
+                      reutilizado entre consultas de alunos diferentes.
+        """
+        self._grafo = grafo
+
+    def disciplinas_elegiveis(self, aluno) -> dict:
+        """
+        Calcula o conjunto completo de disciplinas disponíveis para o aluno,
+        agrupando as demais pelo motivo do bloqueio.
+
+        :param aluno: Objeto Aluno (histórico e curso são consultados).
+        :return: Dicionário com as chaves:
+                 'elegiveis' — {nome: frozenset de co-requisitos a cursar junto};
+                 'pre_requisito' — {nome: frozenset de pré-requisitos pendentes};
+                 'co_requisito' — {nome: frozenset de co-requisitos bloqueados};
+                 'carga_horaria' — {nome: carga acima do limite semestral};
+                 'ja_aprovadas' — [nomes já concluídos].
+        """
+        grafo = self._grafo
+        pre, co, carga = grafo.pre, grafo.co, grafo.carga
+        aprovadas = {d.nome for d in aluno.historico.disciplinas_aprovadas()}
+        limite = aluno.curso.limite_horas_semestrais
+
+        # Quantos pré-requisitos de cada disciplina já foram aprovados.
+        # Percorre apenas as arestas que saem das aprovadas (em geral poucas),
+        # evitando operações de conjunto para o restante do catálogo.
+        cumpridos = {}
+        dependentes = grafo.dependentes_pre
+        for nome in aprovadas:
+            for dep in dependentes.get(nome, ()):
+                cumpridos[dep] = cumpridos.get(dep, 0) + 1
+
+        elegiveis, bloq_pre, bloq_co, bloq_carga = {}, {}, {}, {}
+        ja_aprovadas = []
+        vazio = frozenset()
+
+        # Disciplinas cujos pré-requisitos estão cumpridos (cursáveis agora)
+        pre_ok = set()
+        for nome in grafo.nomes:
+            if nome in aprovadas:
+                ja_aprovadas.append(nome)
+                continue
+            requisitos = pre[nome]
+            if requisitos:
+                n = cumpridos.get(nome)
+                if n is None:
+                    bloq_pre[nome] = requisitos
+                    continue
+                if n < len(requisitos):
+                    bloq_pre[nome] = requisitos - aprovadas
+                    continue
+            if carga[nome] > limite:
+                bloq_carga[nome] = carga[nome]
+            else:
+                pre_ok.add(nome)
+
+        for nome in pre_ok:
+            co_req = co[nome]
+            if not co_req:
+                elegiveis[nome] = vazio
+                continue
+            pendentes = co_req - aprovadas
+            bloqueados = pendentes - pre_ok
+            if bloqueados:
+                bloq_co[nome] = bloqueados
+            else:
+                elegiveis[nome] = pendentes
+
+        return {
+            "elegiveis": elegiveis,
+            "pre_requisito": bloq_pre,
+            "co_requisito": bloq_co,
+            "carga_horaria": bloq_carga,
+            "ja_aprovadas": ja_aprovadas,
+        }
@@ -0,0 +1,184 @@
+# application/exportacao_service.py
+"""
+Módulo que implementa a exportação de dados do SGSA para CSV e JSONL.
+
+Os registros são lidos do banco um de cada vez (ver
+db_config.iterar_colecao) e escritos no destino à medida que chegam: a
+memória usada não depende do tamanho da coleção exportada, o que permite
+extrações noturnas completas para o BI e para auditorias.
+"""
+
+import csv
+import json
+from datetime import date
+
+
+class ExportacaoService:
+    """
+    Exporta solicitações, alunos e o catálogo de disciplinas.
+
+    Formatos:
+        - csv:   cabeçalho + uma linha por registro; listas viram nomes
+                 separados por ';' e booleanos viram sim/nao (o mesmo
+                 formato aceito pela importação).
+        - jsonl: um objeto JSON por linha; sem seleção de colunas, o
+                 registro completo.
+
+    Filtros (combinados com E):
+        - solicitacoes: status, tipo, curso do aluno e período de criação
+                        (de/ate, inclusivos). Registros anteriores ao
+                        campo 'criada_em' ficam fora quando há período.
+        - alunos:       curso.
+        - disciplinas:  nenhum.
+
+    Exemplo de uso:
+        >>> exportacao = ExportacaoService(RepositorioAluno(), RepositorioDisciplina(),
+        ...                                RepositorioSolicitacao())
+        >>> with open("abertas.csv", "w", newline="", encoding="utf-8") as destino:
+        ...     exportacao.exportar("solicitacoes", destino, status="Aberta")
+        1520
+    """
+
+    COLECOES = ("solicitacoes", "alunos", "disciplinas")
+    FORMATOS = ("csv", "jsonl")
+
+    # Colunas padrão do CSV, na ordem de saída
+    COLUNAS = {
+        "solicitacoes": ("id", "protocolo", "tipo", "aluno_id", "status", "alvo",
+                         "semestre", "carga_horaria", "criada_em"),
+        "alunos": ("nome", "email", "matricula", "curso",
+                   "limite_horas_semestrais", "min_horas_optativas"),
+        "disciplinas": ("nome", "carga_horaria", "obrigatoria", "pre_requisitos", "co_requisitos"),
+    }
+    # Colunas que podem ser pedidas além das padrão
+    COLUNAS_EXTRAS = {"solicitacoes": ("simultaneas", "lote"), "alunos": (), "disciplinas": ()}
+
+    FILTROS = {
+        "solicitacoes": ("status", "tipo", "curso", "de", "ate"),
+        "alunos": ("curso",),
+        "disciplinas": (),
+    }
+
+    def __init__(self, repo_aluno, repo_disc, repo_sol):
+        """
+        :param repo_aluno: RepositorioAluno.
+        :param repo_disc: RepositorioDisciplina.
+        :param repo_sol: RepositorioSolicitacao.
+        """
+        self._repo_aluno = repo_aluno
+        self._repo_disc = repo_disc
+        self._repo_sol = repo_sol
+
+    def colunas(self, colecao: str, colunas=None) -> tuple:
+        """
+        Valida a seleção de colunas de uma coleção.
+
+        :param colunas: Nomes escolhidos (None = colunas padrão).
+        :raises ValueError: se a coleção ou alguma coluna não existir.
+        :return: Tupla com as colunas, na ordem pedida.
+        """
+        self._validar_colecao(colecao)
+        if not colunas:
+            return self.COLUNAS[colecao]
+        validas = self.COLUNAS[colecao] + self.COLUNAS_EXTRAS[colecao]
+        invalidas = [c for c in colunas if c not in validas]
+        if invalidas:
+            raise ValueError(f"Coluna(s) inexistente(s) em {colecao}: {', '.join(invalidas)}. "
+                             f"Disponíveis: {', '.join(validas)}.")
+        return tuple(colunas)
+
+    def registros(self, colecao: str, **filtros):
+        """
+        Percorre os registros de uma coleção que atendem aos filtros.
+
+        :param filtros: status, tipo, curso (str) e de, ate (date); valores
+                        None são ignorados.
+        :raises ValueError: se algum filtro não se aplicar à coleção.
+        :return: Gerador de dicionários no formato persistido.
+        """
+        self._validar_colecao(colecao)
+        filtros = {k: v for k, v in filtros.items() if v is not None}
+        invalidos = [f for f in filtros if f not in self.FILTROS[colecao]]
+        if invalidos:
+            raise ValueError(f"Filtro(s) não aplicável(is) a {colecao}: {', '.join(invalidos)}.")
+
+        if colecao == "disciplinas":
+            return self._repo_disc.iterar()
+        if colecao == "alunos":
+            curso = filtros.get("curso")
+            return (a for a in self._repo_aluno.iterar() if curso is None or a.get("curso") == curso)
+        return self._solicitacoes(**filtros)
+
+    def exportar(self, colecao: str, destino, formato: str = "csv", colunas=None, **filtros) -> int:
+        """
+        Escreve os registros filtrados no destino, um por vez.
+
+        :param destino: Arquivo de texto aberto para escrita (no CSV, com
+                        newline='').
+        :param formato: 'csv' ou 'jsonl'.
+        :param colunas: Colunas a exportar (None = padrão da coleção; no
+                        JSONL, o registro completo).
+        :param filtros: Ver registros().
+        :raises ValueError: se formato, coluna ou filtro for inválido.
+        :return: Quantidade de registros exportados.
+        """
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato inválido: {formato}. Use {' ou '.join(self.FORMATOS)}.")
+        selecionadas = self.colunas(colecao, colunas)
+        registros = self.registros(colecao, **filtros)
+        total = 0
+        if formato == "csv":
+            escritor = csv.writer(destino)
+            escritor.writerow(selecionadas)
+            for registro in registros:
+                escritor.writerow([_celula(registro.get(c)) for c in selecionadas])
+                total += 1
+        else:
+            for registro in registros:
+                if colunas:
+                    registro = {c: registro.get(c) for c in selecionadas}
+                destino.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                total += 1
+        return total
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+
+    def _validar_colecao(self, colecao: str) -> None:
+        """Levanta ValueError se a coleção não existir."""
+        if colecao not in self.COLECOES:
+            raise ValueError(f"Coleção inválida: {colecao}. Use {', '.join(self.COLECOES)}.")
+
+    def _solicitacoes(self, status=None, tipo=None, curso=None, de: date = None, ate: date = None):
+        """Gerador das solicitações filtradas (ver registros())."""
+        matriculas = None
+        if curso is not None:
+            # Só as matrículas do curso ficam em memória, não os alunos
+            matriculas = {a["matricula"] for a in self._repo_aluno.iterar() if a.get("curso") == curso}
+        inicio = de.isoformat() if de else None
+        fim = ate.isoformat() if ate else None
+
+        for registro in self._repo_sol.iterar():
+            if status is not None and registro.get("status") != status:
+                continue
+            if tipo is not None and registro.get("tipo") != tipo:
+                continue
+            if matriculas is not None and registro.get("aluno_id") not in matriculas:
+                continue
+            if inicio or fim:
+                dia = (registro.get("criada_em") or "")[:10]
+                if not dia or (inicio and dia < inicio) or (fim and dia > fim):
+                    continue
+            yield registro
+
+
+def _celula(valor) -> str:
+    """Converte um valor do registro para uma célula de CSV."""
+    if valor is None:
+        return ""
+    if isinstance(valor, bool):
+        return "sim" if valor else "nao"
+    if isinstance(valor, list):
+        return ";".join(str(v) for v in valor)
+    return valor
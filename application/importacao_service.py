@@ -0,0 +1,251 @@
+# application/importacao_service.py
+"""
+Módulo que implementa a importação em massa de alunos e disciplinas.
+
+O cadastro um a um pelo CLI relê e reescreve o sgsa.json a cada aluno e
+resolve cada requisito com uma busca linear no catálogo. A importação lê
+o CSV linha a linha, valida todos os registros de uma vez contra índices
+em memória (matrículas existentes, nomes do catálogo e do próprio
+arquivo) e grava tudo em uma única escrita — ou nada, se houver qualquer
+problema.
+"""
+
+import csv
+
+
+class ImportacaoService:
+    """
+    Importação em lote, tudo ou nada, de alunos e disciplinas.
+
+    Formatos (CSV com cabeçalho):
+        alunos:      nome,email,matricula,curso[,limite_horas,min_optativas]
+        disciplinas: nome,carga_horaria[,obrigatoria,pre_requisitos,co_requisitos]
+                     (requisitos separados por ';'; obrigatoria aceita
+                     sim/nao, true/false ou 1/0 e vale sim se vazia)
+
+    Os requisitos podem citar disciplinas já cadastradas ou do próprio
+    arquivo, em qualquer ordem, sem diferenciar maiúsculas; são gravados
+    com o nome canônico.
+
+    Validação (todos os problemas são reunidos em um único ValueError):
+        - campos obrigatórios ausentes e números inválidos;
+        - matrícula ou disciplina repetida no arquivo ou já cadastrada;
+        - requisito inexistente, requisito de si mesma e ciclo de
+          pré-requisitos.
+
+    Exemplo de uso:
+        >>> importacao = ImportacaoService(RepositorioAluno(), RepositorioDisciplina())
+        >>> importacao.importar_disciplinas(ImportacaoService.ler_csv("catalogo.csv"))
+        412
+    """
+
+    # Quantidade máxima de problemas listados na mensagem de erro
+    MAX_PROBLEMAS = 20
+
+    def __init__(self, repo_aluno=None, repo_disc=None):
+        """
+        :param repo_aluno: RepositorioAluno (para importar alunos).
+        :param repo_disc: RepositorioDisciplina (para importar disciplinas).
+        """
+        self._repo_aluno = repo_aluno
+        self._repo_disc = repo_disc
+
+    @staticmethod
+    def ler_csv(caminho: str):
+        """
+        Lê um CSV com cabeçalho sob demanda, uma linha por vez.
+
+        :raises ValueError: se o arquivo não puder ser aberto.
+        :return: Gerador de tuplas (número da linha no arquivo, dicionário).
+        """
+        try:
+            arquivo = open(caminho, "r", encoding="utf-8-sig", newline="")
+        except OSError as e:
+            raise ValueError(f"Não foi possível ler {caminho}: {e}.")
+        with arquivo:
+            leitor = csv.DictReader(arquivo)
+            for registro in leitor:
+                yield leitor.line_num, registro
+
+    # ------------------------------------------------------------------
+    # Alunos
+    # ------------------------------------------------------------------
+
+    def importar_alunos(self, linhas) -> int:
+        """
+        Valida e grava alunos em uma única escrita.
+
+        :param linhas: Iterável de (número da linha, dicionário), como o
+                       retornado por ler_csv().
+        :raises ValueError: se algum registro for inválido; nada é gravado.
+        :return: Quantidade de alunos importados.
+        """
+        existentes = {registro[2] for registro in self._repo_aluno.listar()}
+        vistas = {}
+        registros, problemas = [], []
+        for linha, r in linhas:
+            nome, email, matricula, curso = (_texto(r, c) for c in ("nome", "email", "matricula", "curso"))
+            faltando = [c for c, v in (("nome", nome), ("email", email), ("matricula", matricula),
+                                       ("curso", curso)) if not v]
+            if faltando:
+                problemas.append(f"linha {linha}: campo(s) obrigatório(s) vazio(s): {', '.join(faltando)}")
+                continue
+            if matricula in existentes:
+                problemas.append(f"linha {linha}: matrícula {matricula} já cadastrada")
+            elif matricula in vistas:
+                problemas.append(f"linha {linha}: matrícula {matricula} repetida (linha {vistas[matricula]})")
+            vistas.setdefault(matricula, linha)
+            try:
+                limite = _inteiro(r, "limite_horas", 360)
+                optativas = _inteiro(r, "min_optativas", 0)
+            except ValueError as e:
+                problemas.append(f"linha {linha}: {e}")
+                continue
+            registros.append({
+                "nome": nome, "email": email, "matricula": matricula, "curso": curso,
+                "limite_horas_semestrais": limite, "min_horas_optativas": optativas,
+            })
+
+        self._verificar(problemas)
+        self._repo_aluno.adicionar_lote(registros)
+        return len(registros)
+
+    # ------------------------------------------------------------------
+    # Disciplinas
+    # ------------------------------------------------------------------
+
+    def importar_disciplinas(self, linhas) -> int:
+        """
+        Valida e grava disciplinas e seus requisitos em uma única escrita.
+
+        :param linhas: Iterável de (número da linha, dicionário), como o
+                       retornado por ler_csv().
+        :raises ValueError: se algum registro for inválido; nada é gravado.
+        :return: Quantidade de disciplinas importadas.
+        """
+        catalogo = self._repo_disc.listar_completo()
+        # Índice de nomes: minúsculas → nome canônico (catálogo + arquivo)
+        canonico = {d["nome"].lower(): d["nome"] for d in catalogo}
+        cadastradas = set(canonico)
+        vistas = {}
+        registros, requisitos, problemas = [], [], []
+        for linha, r in linhas:
+            nome = _texto(r, "nome")
+            if not nome:
+                problemas.append(f"linha {linha}: campo obrigatório vazio: nome")
+                continue
+            chave = nome.lower()
+            if chave in cadastradas:
+                problemas.append(f"linha {linha}: disciplina '{nome}' já cadastrada")
+            elif chave in vistas:
+                problemas.append(f"linha {linha}: disciplina '{nome}' repetida (linha {vistas[chave]})")
+            vistas.setdefault(chave, linha)
+            canonico.setdefault(chave, nome)
+            try:
+                carga = _inteiro(r, "carga_horaria", None)
+                if carga <= 0:
+                    raise ValueError("carga_horaria deve ser positiva")
+                obrigatoria = _booleano(r, "obrigatoria", True)
+            except ValueError as e:
+                problemas.append(f"linha {linha}: {e}")
+                continue
+            registros.append({"nome": nome, "carga_horaria": carga, "obrigatoria": obrigatoria,
+                              "pre_requisitos": [], "co_requisitos": []})
+            requisitos.append((linha, _lista(r, "pre_requisitos"), _lista(r, "co_requisitos")))
+
+        # Requisitos resolvidos só depois de ler o arquivo inteiro (qualquer ordem)
+        for registro, (linha, pre, co) in zip(registros, requisitos):
+            for chave, nomes in (("pre_requisitos", pre), ("co_requisitos", co)):
+                for req in nomes:
+                    resolvido = canonico.get(req.lower())
+                    if resolvido is None:
+                        problemas.append(f"linha {linha}: requisito '{req}' de '{registro['nome']}' "
+                                         f"não existe no catálogo nem no arquivo")
+                    elif resolvido == registro["nome"]:
+                        problemas.append(f"linha {linha}: '{registro['nome']}' não pode ser "
+                                         f"requisito de si mesma")
+                    elif resolvido not in registro[chave]:
+                        registro[chave].append(resolvido)
+
+        if not problemas:
+            ciclo = _em_ciclo(catalogo + registros)
+            if ciclo:
+                problemas.append(f"ciclo de pré-requisitos envolvendo: {', '.join(ciclo[:10])}")
+
+        self._verificar(problemas)
+        self._repo_disc.adicionar_lote(registros)
+        return len(registros)
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+
+    def _verificar(self, problemas: list) -> None:
+        """Levanta ValueError com os primeiros problemas encontrados, se houver."""
+        if not problemas:
+            return
+        listados = "\n".join(f"  - {p}" for p in problemas[:self.MAX_PROBLEMAS])
+        restantes = len(problemas) - self.MAX_PROBLEMAS
+        if restantes > 0:
+            listados += f"\n  ... e mais {restantes} problema(s)"
+        raise ValueError(f"Importação cancelada, nada foi gravado. "
+                         f"{len(problemas)} problema(s):\n{listados}")
+
+
+def _texto(registro: dict, campo: str) -> str:
+    """Valor do campo sem espaços nas pontas ('' se ausente)."""
+    return (registro.get(campo) or "").strip()
+
+
+def _inteiro(registro: dict, campo: str, padrao) -> int:
+    """Converte o campo para inteiro; vazio usa o padrão (None = obrigatório)."""
+    valor = _texto(registro, campo)
+    if not valor:
+        if padrao is None:
+            raise ValueError(f"campo obrigatório vazio: {campo}")
+        return padrao
+    try:
+        return int(valor)
+    except ValueError:
+        raise ValueError(f"{campo} deve ser um número inteiro ('{valor}')")
+
+
+def _booleano(registro: dict, campo: str, padrao: bool) -> bool:
+    """Interpreta sim/nao, true/false e 1/0; vazio usa o padrão."""
+    valor = _texto(registro, campo).lower()
+    if not valor:
+        return padrao
+    if valor in ("sim", "s", "true", "1"):
+        return True
+    if valor in ("nao", "não", "n", "false", "0"):
+        return False
+    raise ValueError(f"{campo} deve ser sim ou nao ('{valor}')")
+
+
+def _lista(registro: dict, campo: str) -> list:
+    """Nomes separados por ';', sem vazios."""
+    return [n.strip() for n in _texto(registro, campo).split(";") if n.strip()]
+
+
+def _em_ciclo(registros: list) -> list:
+    """
+    Verifica ciclos de pré-requisitos (ordenação topológica de Kahn).
+
+    :return: Nomes das disciplinas que não puderam ser ordenadas (estão em
+             um ciclo ou dependem de um); lista vazia se não há ciclo.
+    """
+    canonico = {r["nome"].lower(): r["nome"] for r in registros}
+    grau = {r["nome"]: 0 for r in registros}
+    dependentes = {}
+    for r in registros:
+        for req in set(canonico.get(n.lower()) for n in r.get("pre_requisitos", [])):
+            if req is not None and req != r["nome"]:
+                grau[r["nome"]] += 1
+                dependentes.setdefault(req, []).append(r["nome"])
+    prontas = [nome for nome, g in grau.items() if g == 0]
+    while prontas:
+        for dependente in dependentes.get(prontas.pop(), ()):
+            grau[dependente] -= 1
+            if grau[dependente] == 0:
+                prontas.append(dependente)
+    return [nome for nome, g in grau.items() if g > 0]
@@ -0,0 +1,342 @@
+# application/instrumentacao_regras.py
+"""
+Módulo que implementa a instrumentação opcional da avaliação de regras.
+
+Responde a duas perguntas de produção: qual regra domina a latência da
+validação e qual regra rejeita mais solicitações. Quando habilitada, a
+instrumentação registra, por classe de regra, o tempo de cada execução em
+um histograma de latência no estilo HDR (faixas log-lineares com erro
+relativo limitado), as aprovações e as rejeições — atribuídas pelo campo
+'regra' da violação, o mesmo de ViolacaoRegraAcademicaError.regra — e até
+que ponto da sequência de regras cada avaliação chegou.
+
+Os dados podem ser salvos em JSON e acumulados entre execuções do CLI.
+"""
+
+import json
+import math
+import os
+
+
+class HistogramaLatencia:
+    """
+    Histograma de latências com faixas log-lineares (estilo HDR).
+
+    Valores menores que 2**bits são guardados exatamente; acima disso,
+    cada potência de dois é dividida em 2**bits faixas iguais. Com o
+    padrão bits=5, o erro relativo de qualquer percentil é menor que
+    1/32 (~3%), usando poucas dezenas de faixas por ordem de grandeza,
+    independentemente de quantas amostras forem registradas.
+
+    As faixas são esparsas (dicionário índice → contagem), e dois
+    histogramas com a mesma precisão podem ser somados com mesclar().
+
+    Exemplo de uso:
+        >>> h = HistogramaLatencia()
+        >>> for ns in (1200, 1350, 98000):
+        ...     h.registrar(ns)
+        >>> h.percentil(50)      # 1350 arredondado ao limite da faixa
+        1375
+    """
+
+    def __init__(self, bits: int = 5):
+        """
+        :param bits: Bits de subdivisão por potência de dois (precisão).
+        :raises ValueError: se bits não estiver entre 1 e 16.
+        """
+        if not 1 <= bits <= 16:
+            raise ValueError("A precisão do histograma deve estar entre 1 e 16 bits.")
+        self.bits = bits
+        self._faixas = {}
+        self.contagem = 0
+        self.soma = 0
+        self.minimo = None
+        self.maximo = 0
+
+    def _indice(self, valor: int) -> int:
+        """Faixa do valor: exata abaixo de 2**bits, log-linear acima."""
+        deslocamento = valor.bit_length() - self.bits - 1
+        if deslocamento < 0:
+            return valor
+        return ((deslocamento + 1) << self.bits) + (valor >> deslocamento) - (1 << self.bits)
+
+    def _limite_superior(self, indice: int) -> int:
+        """Maior valor que cai na faixa (valor equivalente mais alto)."""
+        if indice < (1 << self.bits):
+            return indice
+        deslocamento = (indice >> self.bits) - 1
+        base = (1 << self.bits) + (indice & ((1 << self.bits) - 1))
+        return ((base + 1) << deslocamento) - 1
+
+    def registrar(self, valor: int, vezes: int = 1) -> None:
+        """
+        Registra uma latência (em nanossegundos).
+
+        :param valor: Latência medida; valores negativos contam como 0.
+        :param vezes: Quantas amostras com esse valor registrar.
+        """
+        valor = max(int(valor), 0)
+        indice = self._indice(valor)
+        self._faixas[indice] = self._faixas.get(indice, 0) + vezes
+        self.contagem += vezes
+        self.soma += valor * vezes
+        self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+        self.maximo = max(self.maximo, valor)
+
+    def percentil(self, p: float) -> int:
+        """
+        Retorna o valor do percentil p (0–100), com o erro da faixa.
+
+        :return: Limite superior da faixa que contém o percentil, sem
+                 ultrapassar o máximo registrado; 0 se vazio.
+        """
+        if not self.contagem:
+            return 0
+        alvo = max(1, math.ceil(self.contagem * p / 100))
+        acumulado = 0
+        for indice in sorted(self._faixas):
+            acumulado += self._faixas[indice]
+            if acumulado >= alvo:
+                return min(self._limite_superior(indice), self.maximo)
+        return self.maximo
+
+    def media(self) -> float:
+        """Média exata das amostras registradas."""
+        return self.soma / self.contagem if self.contagem else 0.0
+
+    def mesclar(self, outro: "HistogramaLatencia") -> None:
+        """
+        Soma as amostras de outro histograma a este.
+
+        :raises ValueError: se as precisões forem diferentes.
+        """
+        if outro.bits != self.bits:
+            raise ValueError("Histogramas com precisões diferentes não podem ser mesclados.")
+        for indice, contagem in outro._faixas.items():
+            self._faixas[indice] = self._faixas.get(indice, 0) + contagem
+        self.contagem += outro.contagem
+        self.soma += outro.soma
+        if outro.minimo is not None:
+            self.minimo = outro.minimo if self.minimo is None else min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+
+    def como_dict(self) -> dict:
+        """Representação serializável em JSON."""
+        return {
+            "bits": self.bits,
+            "faixas": {str(i): c for i, c in sorted(self._faixas.items())},
+            "contagem": self.contagem,
+            "soma": self.soma,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+        }
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> "HistogramaLatencia":
+        """Reconstrói o histograma a partir de como_dict()."""
+        h = cls(dados.get("bits", 5))
+        h._faixas = {int(i): c for i, c in dados.get("faixas", {}).items()}
+        h.contagem = dados.get("contagem", 0)
+        h.soma = dados.get("soma", 0)
+        h.minimo = dados.get("minimo")
+        h.maximo = dados.get("maximo", 0)
+        return h
+
+
+class InstrumentacaoRegras:
+    """
+    Coletor opcional de latência, aprovações, rejeições e profundidade por regra.
+
+    É repassado ao SolicitacaoService, ao PipelineRegras ou à
+    PoliticaRegras (que o entrega a todos os pipelines que compila); sem
+    ele, a avaliação não mede nada além das estatísticas do pipeline.
+
+    Dados coletados:
+        - por regra (nome da classe): histograma de latência, aprovações e
+          rejeições. Uma rejeição é contada para a regra indicada em cada
+          violação (Violacao.regra / ViolacaoRegraAcademicaError.regra);
+        - por conjunto de regras (nome do pipeline ou 'aplicar_regras'):
+          quantas regras cada avaliação chegou a executar antes de parar.
+
+    Exemplo de uso:
+        >>> instr = InstrumentacaoRegras()
+        >>> svc = SolicitacaoService(instrumentacao=instr)
+        >>> svc.aplicar_regras(sol, [RegraPreRequisito(), RegraCoRequisito()])
+        >>> instr.resumo()[0]
+        {'regra': 'RegraPreRequisito', 'execucoes': 1, 'rejeicoes': 0, 'p99_us': 4.1, ...}
+        >>> instr.salvar("instrumentacao.json")
+    """
+
+    def __init__(self):
+        self._regras = {}
+        self._conjuntos = {}
+
+    def _dados_regra(self, nome: str) -> dict:
+        dados = self._regras.get(nome)
+        if dados is None:
+            dados = self._regras[nome] = {
+                "histograma": HistogramaLatencia(), "aprovacoes": 0, "rejeicoes": 0}
+        return dados
+
+    def registrar_regra(self, nome: str, tempo_ns: int, violacoes: list, vezes: int = 1) -> None:
+        """
+        Registra a execução de uma regra.
+
+        :param nome: Nome da classe da regra executada.
+        :param tempo_ns: Tempo de uma execução, em nanossegundos.
+        :param violacoes: Violações retornadas; vazia se aprovou.
+        :param vezes: Execuções representadas (avaliação em lote).
+        """
+        dados = self._dados_regra(nome)
+        dados["histograma"].registrar(tempo_ns, vezes)
+        if not violacoes:
+            dados["aprovacoes"] += vezes
+            return
+        for regra in {v.regra or nome for v in violacoes}:
+            self._dados_regra(regra)["rejeicoes"] += vezes
+
+    def registrar_avaliacao(self, conjunto: str, executadas: int, total: int) -> None:
+        """
+        Registra até onde uma avaliação chegou na sequência de regras.
+
+        :param conjunto: Nome do pipeline ou da lista de regras.
+        :param executadas: Regras executadas antes de parar.
+        :param total: Regras no conjunto.
+        """
+        dados = self._conjuntos.setdefault(conjunto, {"avaliacoes": 0, "total_regras": total,
+                                                      "profundidade": {}})
+        dados["avaliacoes"] += 1
+        dados["total_regras"] = total
+        dados["profundidade"][executadas] = dados["profundidade"].get(executadas, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def resumo(self, ordenar_por: str = "tempo_total_ms") -> list:
+        """
+        Resume cada regra, ordenado pela métrica informada (decrescente).
+
+        :param ordenar_por: Chave do resumo usada na ordenação (ex:
+                            'tempo_total_ms', 'p99_us', 'rejeicoes').
+        :raises ValueError: se a chave de ordenação não existir.
+        :return: Lista de dicionários com 'regra', 'execucoes',
+                 'aprovacoes', 'rejeicoes', 'taxa_rejeicao', 'media_us',
+                 'p50_us', 'p90_us', 'p99_us', 'max_us' e 'tempo_total_ms'.
+        """
+        linhas = []
+        for nome, dados in self._regras.items():
+            h = dados["histograma"]
+            linhas.append({
+                "regra": nome,
+                "execucoes": h.contagem,
+                "aprovacoes": dados["aprovacoes"],
+                "rejeicoes": dados["rejeicoes"],
+                "taxa_rejeicao": round(dados["rejeicoes"] / h.contagem, 4) if h.contagem else 0.0,
+                "media_us": round(h.media() / 1000, 3),
+                "p50_us": round(h.percentil(50) / 1000, 3),
+                "p90_us": round(h.percentil(90) / 1000, 3),
+                "p99_us": round(h.percentil(99) / 1000, 3),
+                "max_us": round(h.maximo / 1000, 3),
+                "tempo_total_ms": round(h.soma / 1e6, 3),
+            })
+        if linhas and ordenar_por not in linhas[0]:
+            raise ValueError(f"Métrica de ordenação inválida: '{ordenar_por}'.")
+        linhas.sort(key=lambda l: (-l[ordenar_por], l["regra"]) if ordenar_por != "regra"
+                    else (l["regra"],))
+        return linhas
+
+    def profundidades(self) -> dict:
+        """
+        Distribuição de regras executadas por avaliação, por conjunto.
+
+        :return: {conjunto: {'avaliacoes', 'total_regras',
+                 'profundidade_media', 'profundidade': {n: contagem}}}.
+        """
+        resultado = {}
+        for conjunto, dados in self._conjuntos.items():
+            soma = sum(n * c for n, c in dados["profundidade"].items())
+            resultado[conjunto] = {
+                "avaliacoes": dados["avaliacoes"],
+                "total_regras": dados["total_regras"],
+                "profundidade_media": round(soma / dados["avaliacoes"], 3),
+                "profundidade": dict(sorted(dados["profundidade"].items())),
+            }
+        return resultado
+
+    def __bool__(self) -> bool:
+        return bool(self._regras or self._conjuntos)
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+
+    def mesclar(self, outra: "InstrumentacaoRegras") -> None:
+        """Soma os dados coletados por outra instrumentação a esta."""
+        for nome, dados in outra._regras.items():
+            meus = self._dados_regra(nome)
+            meus["histograma"].mesclar(dados["histograma"])
+            meus["aprovacoes"] += dados["aprovacoes"]
+            meus["rejeicoes"] += dados["rejeicoes"]
+        for conjunto, dados in outra._conjuntos.items():
+            meus = self._conjuntos.setdefault(conjunto, {"avaliacoes": 0, "profundidade": {}})
+            meus["avaliacoes"] += dados["avaliacoes"]
+            meus["total_regras"] = dados["total_regras"]
+            for n, c in dados["profundidade"].items():
+                meus["profundidade"][n] = meus["profundidade"].get(n, 0) + c
+
+    def limpar(self) -> None:
+        """Descarta todos os dados coletados."""
+        self._regras.clear()
+        self._conjuntos.clear()
+
+    def como_dict(self) -> dict:
+        """Representação completa (com as faixas dos histogramas) em JSON."""
+        return {
+            "regras": {
+                nome: {"histograma": d["histograma"].como_dict(),
+                       "aprovacoes": d["aprovacoes"], "rejeicoes": d["rejeicoes"]}
+                for nome, d in self._regras.items()
+            },
+            "conjuntos": {
+                conjunto: {"avaliacoes": d["avaliacoes"], "total_regras": d["total_regras"],
+                           "profundidade": {str(n): c for n, c in d["profundidade"].items()}}
+                for conjunto, d in self._conjuntos.items()
+            },
+        }
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> "InstrumentacaoRegras":
+        """Reconstrói a instrumentação a partir de como_dict()."""
+        instr = cls()
+        for nome, d in dados.get("regras", {}).items():
+            instr._regras[nome] = {"histograma": HistogramaLatencia.de_dict(d["histograma"]),
+                                   "aprovacoes": d["aprovacoes"], "rejeicoes": d["rejeicoes"]}
+        for conjunto, d in dados.get("conjuntos", {}).items():
+            instr._conjuntos[conjunto] = {
+                "avaliacoes": d["avaliacoes"], "total_regras": d["total_regras"],
+                "profundidade": {int(n): c for n, c in d["profundidade"].items()}}
+        return instr
+
+    def salvar(self, caminho: str) -> None:
+        """Grava os dados em JSON de forma atômica (arquivo temporário + replace)."""
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(self.como_dict(), f, ensure_ascii=False)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "InstrumentacaoRegras":
+        """
+        Lê os dados salvos por salvar().
+
+        :return: Instrumentação vazia se o arquivo não existir.
+        :raises ValueError: se o arquivo existir mas for inválido.
+        """
+        if not os.path.exists(caminho):
+            return cls()
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                return cls.de_dict(json.load(f))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Arquivo de instrumentação inválido: {caminho} ({e}).")
@@ -9,6 +9,8 @@ que no futuro os métodos de envio sejam substituídos por integrações reais
 (e-mail, SMS, push) sem alterar nenhuma outra parte do sistema.
 """
 
+from infrastructure.medicao import fase
+
 
 class NotificacaoService:
     """
@@ -60,7 +62,8 @@ class NotificacaoService:
         :param solicitacao: Objeto Solicitacao que teve o estado alterado.
                             Contém aluno, tipo da solicitação e novo status.
         """
-        self._notificar_aluno(solicitacao)
+        with fase("notificacao"):
+            self._notificar_aluno(solicitacao)
 
     def notificar_setor(self, solicitacao,
                         nome_setor: str = "Coordenação do Curso") -> None:
@@ -76,12 +79,13 @@ class NotificacaoService:
         :param nome_setor: Nome do setor a ser notificado.
                            Padrão: 'Coordenação do Curso'.
         """
-        print(
-            f"[Notificação → Setor '{nome_setor}'] "
-            f"Nova solicitação de {solicitacao.__class__.__name__} "
-            f"para o aluno '{solicitacao.aluno.nome}' "
-            f"(Status: {solicitacao.status})."
-        )
+        with fase("notificacao"):
+            print(
+                f"[Notificação → Setor '{nome_setor}'] "
+                f"Nova solicitação de {solicitacao.__class__.__name__} "
+                f"para o aluno '{solicitacao.aluno.nome}' "
+                f"(Status: {solicitacao.status})."
+            )
 
     def _notificar_aluno(self, solicitacao) -> None:
         """
@@ -0,0 +1,292 @@
+# application/pipeline_regras.py
+"""
+Módulo que implementa o pipeline compilado de regras acadêmicas.
+
+Um PipelineRegras agrupa as regras de um tipo de solicitação e as executa
+como uma única Regra (padrão Composite): para na primeira violação, como
+SolicitacaoService.aplicar_regras, mas mede o custo e a taxa de rejeição
+de cada regra e, periodicamente, reordena a sequência para que regras
+baratas e que rejeitam com frequência rodem primeiro — respeitando as
+dependências declaradas em Regra.DEPENDE_DE.
+
+As estatísticas vivem na memória do processo. Uma execução do CLI avalia
+poucas solicitações e nunca chega a 'amostras_minimas': roda na ordem
+declarada (ajustada só pelas dependências). A reordenação adaptativa vale
+para processos de longa duração ('serve', 'api' e 'batch' com muitas
+operações).
+"""
+
+import heapq
+import time
+
+from rules.regra_base import Regra
+from rules.contexto_avaliacao import ContextoAvaliacao
+
+
+class _EstatisticaRegra:
+    """Contadores acumulados de uma regra dentro do pipeline."""
+
+    __slots__ = ("regra", "nome", "execucoes", "rejeicoes", "tempo_ns")
+
+    def __init__(self, regra):
+        self.regra = regra
+        self.nome = type(regra).__name__
+        self.execucoes = 0
+        self.rejeicoes = 0
+        self.tempo_ns = 0
+
+    def custo_medio_ns(self) -> float:
+        return self.tempo_ns / self.execucoes if self.execucoes else 0.0
+
+    def taxa_rejeicao(self) -> float:
+        return self.rejeicoes / self.execucoes if self.execucoes else 0.0
+
+    def prioridade(self) -> float:
+        """
+        Custo esperado por rejeição (custo / probabilidade de rejeitar).
+
+        É a ordenação ótima para filtros independentes que param na primeira
+        falha. Regras que nunca rejeitaram vão para o fim, por custo.
+        """
+        taxa = self.taxa_rejeicao()
+        if taxa == 0:
+            return float("inf")
+        return self.custo_medio_ns() / taxa
+
+
+class PipelineRegras(Regra):
+    """
+    Sequência de regras de um tipo de solicitação com ordenação adaptativa.
+
+    O pipeline é ele próprio uma Regra: pode ser passado para
+    SolicitacaoService.aplicar_regras() / avaliar_regras() ou usado
+    diretamente via validar() e avaliar().
+    A cada execução, registra para cada regra avaliada o tempo gasto e se
+    ela rejeitou a solicitação. Depois de 'amostras_minimas' execuções,
+    e novamente a cada 'intervalo' execuções, a ordem é recompilada pela
+    prioridade custo/taxa de rejeição. Os contadores não são persistidos:
+    só processos de longa duração chegam a reordenar.
+
+    Dependências:
+        Uma regra pode declarar, em DEPENDE_DE, nomes de classes de regras
+        que precisam rodar antes dela (ex: quando sua mensagem só faz
+        sentido se a outra já passou). A recompilação é uma ordenação
+        topológica que escolhe, entre as regras liberadas, a de menor
+        prioridade. Dependências para regras ausentes do pipeline são
+        ignoradas.
+
+    Como o pipeline para na primeira violação, a reordenação pode mudar
+    qual violação é relatada quando mais de uma regra falharia; o
+    veredito (aprovada ou rejeitada) nunca muda.
+
+    Exemplo de uso:
+        >>> pipeline = PipelineRegras(
+        ...     [RegraPreRequisito(), RegraCoRequisito(), RegraLimiteCargaHoraria()],
+        ...     nome="matricula")
+        >>> service.aplicar_regras(sol, pipeline)
+        >>> pipeline.estatisticas()
+        [{'regra': 'RegraLimiteCargaHoraria', 'posicao': 1, ...}, ...]
+    """
+
+    def __init__(self, regras: list, nome: str = "", amostras_minimas: int = 50,
+                 intervalo: int = 200, cache=None, instrumentacao=None):
+        """
+        :param regras: Regras na ordem inicial (a ordem declarada).
+        :param nome: Identificação do pipeline (ex: tipo da solicitação).
+        :param amostras_minimas: Execuções antes da primeira reordenação.
+        :param intervalo: Execuções entre reordenações seguintes.
+        :param cache: CacheResultadosRegras opcional; quando informado, as
+                      regras memorizáveis são avaliadas através dele.
+        :param instrumentacao: InstrumentacaoRegras opcional, que recebe a
+                               latência e o resultado de cada regra.
+        :raises ValueError: se as dependências declaradas formarem ciclo.
+        """
+        self.nome = nome
+        self.cache = cache
+        self.instrumentacao = instrumentacao
+        self._amostras_minimas = amostras_minimas
+        self._intervalo = intervalo
+        self._estatisticas = [_EstatisticaRegra(r) for r in regras]
+        self._posicao_original = {id(e): i for i, e in enumerate(self._estatisticas)}
+        self._ordem = self._ordenar(self._estatisticas, adaptativo=False)
+        self._execucoes = 0
+        self._proxima_reordenacao = amostras_minimas
+
+    @property
+    def regras(self) -> list:
+        """Regras na ordem de execução atual."""
+        return [e.regra for e in self._ordem]
+
+    def validar(self, solicitacao, contexto=None) -> bool:
+        """
+        Executa as regras na ordem atual, parando na primeira violação.
+
+        As regras são chamadas pela API sem exceções (avaliar); apenas a
+        violação que interrompe o pipeline é convertida em exceção.
+
+        :raises ViolacaoRegraAcademicaError: com a primeira violação encontrada.
+        :return: True se todas as regras forem satisfeitas.
+        """
+        violacoes = self._executar(solicitacao, contexto, parar_na_primeira=True)
+        if violacoes:
+            raise violacoes[0].como_excecao()
+        return True
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
+        """
+        Executa todas as regras e reúne as violações de cada uma.
+
+        :return: Lista de objetos Violacao, na ordem de execução atual.
+        """
+        return self._executar(solicitacao, contexto, parar_na_primeira=False)
+
+    def avaliar_lote(self, solicitacoes: list, contextos: list = None) -> list:
+        """
+        Executa todas as regras sobre um lote de solicitações.
+
+        Cada regra é chamada uma única vez com o lote inteiro (avaliar_lote),
+        o que permite às regras numéricas comparar todas as solicitações em
+        uma só operação. As estatísticas contam uma execução por
+        solicitação, como em avaliar().
+
+        :param solicitacoes: Lista de objetos Solicitacao.
+        :param contextos: Lista de ContextoAvaliacao alinhada, ou None.
+        :return: Lista de listas de Violacao, na ordem das solicitações.
+        """
+        if contextos is None:
+            contextos = [ContextoAvaliacao(s) for s in solicitacoes]
+        relogio = time.perf_counter_ns
+        resultados = [[] for _ in solicitacoes]
+        for est in self._ordem:
+            inicio = relogio()
+            if self.cache is None:
+                por_solicitacao = est.regra.avaliar_lote(solicitacoes, contextos)
+            else:
+                por_solicitacao = self.cache.avaliar_lote(est.regra, solicitacoes, contextos)
+            decorrido = relogio() - inicio
+            est.tempo_ns += decorrido
+            est.execucoes += len(solicitacoes)
+            for acumuladas, encontradas in zip(resultados, por_solicitacao):
+                if encontradas:
+                    est.rejeicoes += 1
+                    acumuladas.extend(encontradas)
+                if self.instrumentacao is not None:
+                    # Em lote, cada solicitação recebe o custo médio da chamada
+                    self.instrumentacao.registrar_regra(
+                        est.nome, decorrido // len(solicitacoes), encontradas)
+
+        if self.instrumentacao is not None:
+            for _ in solicitacoes:
+                self.instrumentacao.registrar_avaliacao(
+                    self.nome or "pipeline", len(self._ordem), len(self._ordem))
+        self._execucoes += len(solicitacoes)
+        if self._execucoes >= self._proxima_reordenacao:
+            self.recompilar()
+        return resultados
+
+    def _executar(self, solicitacao, contexto, parar_na_primeira: bool) -> list:
+        """
+        Avalia as regras registrando custo e rejeições de cada uma.
+
+        Todas as regras compartilham o mesmo ContextoAvaliacao.
+        """
+        if contexto is None:
+            contexto = ContextoAvaliacao(solicitacao)
+        relogio = time.perf_counter_ns
+        cache = self.cache
+        instrumentacao = self.instrumentacao
+        violacoes = []
+        executadas = 0
+        for est in self._ordem:
+            inicio = relogio()
+            if cache is None:
+                encontradas = est.regra.avaliar(solicitacao, contexto)
+            else:
+                encontradas = cache.avaliar(est.regra, solicitacao, contexto)
+            decorrido = relogio() - inicio
+            est.tempo_ns += decorrido
+            est.execucoes += 1
+            executadas += 1
+            if instrumentacao is not None:
+                instrumentacao.registrar_regra(est.nome, decorrido, encontradas)
+            if encontradas:
+                est.rejeicoes += 1
+                violacoes.extend(encontradas)
+                if parar_na_primeira:
+                    break
+
+        if instrumentacao is not None:
+            instrumentacao.registrar_avaliacao(self.nome or "pipeline", executadas, len(self._ordem))
+        self._execucoes += 1
+        if self._execucoes >= self._proxima_reordenacao:
+            self.recompilar()
+        return violacoes
+
+    def recompilar(self) -> list:
+        """
+        Recalcula a ordem de execução a partir das estatísticas coletadas.
+
+        :return: Nomes das regras na nova ordem.
+        """
+        self._ordem = self._ordenar(self._estatisticas, adaptativo=True)
+        self._proxima_reordenacao = self._execucoes + self._intervalo
+        return [e.nome for e in self._ordem]
+
+    def estatisticas(self) -> list:
+        """
+        Retorna os contadores de cada regra, na ordem de execução atual.
+
+        :return: Lista de dicionários com 'regra', 'posicao', 'execucoes',
+                 'rejeicoes', 'taxa_rejeicao' e 'custo_medio_us'.
+        """
+        return [
+            {
+                "regra": e.nome,
+                "posicao": i,
+                "execucoes": e.execucoes,
+                "rejeicoes": e.rejeicoes,
+                "taxa_rejeicao": round(e.taxa_rejeicao(), 4),
+                "custo_medio_us": round(e.custo_medio_ns() / 1000, 3),
+            }
+            for i, e in enumerate(self._ordem, start=1)
+        ]
+
+    def _ordenar(self, estatisticas: list, adaptativo: bool) -> list:
+        """
+        Ordenação topológica por DEPENDE_DE, desempatada pela prioridade
+        (modo adaptativo) ou pela posição declarada.
+
+        :raises ValueError: se as dependências formarem ciclo.
+        """
+        por_nome = {}
+        for e in estatisticas:
+            por_nome.setdefault(e.nome, []).append(e)
+
+        pendentes = {id(e): 0 for e in estatisticas}
+        liberam = {id(e): [] for e in estatisticas}
+        for e in estatisticas:
+            for dep in getattr(e.regra, "DEPENDE_DE", ()):
+                for anterior in por_nome.get(dep, ()):
+                    liberam[id(anterior)].append(e)
+                    pendentes[id(e)] += 1
+
+        def chave(e):
+            posicao = self._posicao_original[id(e)]
+            return (e.prioridade(), e.custo_medio_ns(), posicao) if adaptativo else (posicao,)
+
+        fila = [(chave(e), id(e), e) for e in estatisticas if pendentes[id(e)] == 0]
+        heapq.heapify(fila)
+        ordem = []
+        while fila:
+            _, _, e = heapq.heappop(fila)
+            ordem.append(e)
+            for seguinte in liberam[id(e)]:
+                pendentes[id(seguinte)] -= 1
+                if pendentes[id(seguinte)] == 0:
+                    heapq.heappush(fila, (chave(seguinte), id(seguinte), seguinte))
+        if len(ordem) != len(estatisticas):
+            raise ValueError(f"Dependências cíclicas entre as regras do pipeline '{self.nome}'.")
+        return ordem
+
+    def __repr__(self) -> str:
+        return f"PipelineRegras({self.nome!r}, {[e.nome for e in self._ordem]})"
@@ -0,0 +1,385 @@
+# application/planejamento_service.py
+"""
+Módulo que implementa o planejamento de integralização curricular.
+
+Dado um aluno, seu histórico e o limite semestral do curso, o planejador
+monta um cronograma semestre a semestre com as obrigatórias restantes e
+as optativas necessárias para atingir min_horas_optativas, respeitando
+pré-requisitos (semestre anterior), co-requisitos (mesmo semestre ou
+anterior, como aceita RegraCoRequisito) e o teto de horas por semestre.
+
+Algoritmo:
+    Escalonamento por lista com prioridade pelo caminho crítico. Só
+    co-requisitos mútuos (ciclos de co-requisitos) precisam caber no mesmo
+    semestre e formam um grupo; os demais vínculos são arestas entre
+    grupos, com intervalo mínimo de 1 semestre (pré-requisito) ou 0
+    (co-requisito). Cada grupo recebe como prioridade a altura da cadeia
+    que depende dele; a cada semestre, os grupos liberados são alocados
+    em ordem de prioridade enquanto houver horas disponíveis — um grupo
+    liberado por co-requisito alocado no próprio semestre ainda pode
+    entrar nele. O limite inferior max(caminho crítico, ⌈horas / teto⌉)
+    acompanha o plano, permitindo saber quando o resultado é
+    comprovadamente ótimo. Todo o processo é linear no tamanho do grafo
+    (mais a ordenação).
+"""
+
+import heapq
+import itertools
+import math
+
+
+class PlanejamentoService:
+    """
+    Planeja a sequência mínima de semestres para o aluno integralizar o curso.
+
+    A grade considerada é a do Curso do aluno (curso.disciplinas). Quando o
+    curso não possui disciplinas vinculadas — caso dos alunos carregados do
+    sgsa.json —, todo o catálogo do GrafoCurricular é tratado como grade.
+
+    Exemplo de uso:
+        >>> svc = PlanejamentoService(repo_disc.carregar_grafo())
+        >>> plano = svc.planejar(aluno)
+        >>> plano["semestres"]
+        [['Cálculo I', 'Física Teórica', 'Laboratório de Física'], ['Cálculo II']]
+        >>> planos = svc.planejar_lote(alunos)   # coorte inteira
+    """
+
+    def __init__(self, grafo):
+        """
+        :param grafo: GrafoCurricular com cargas e requisitos das disciplinas.
+        """
+        self._grafo = grafo
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def planejar(self, aluno) -> dict:
+        """
+        Calcula o plano de integralização de um aluno.
+
+        :param aluno: Objeto Aluno (histórico e curso são consultados).
+        :raises ValueError: se o plano for inviável (requisito inexistente
+                            no catálogo, ciclo de requisitos, disciplina ou
+                            grupo de co-requisitos mútuos maior que o teto
+                            semestral).
+        :return: Dicionário com 'matricula', 'semestres' (lista de listas
+                 de nomes), 'horas_por_semestre', 'total_semestres',
+                 'limite_inferior', 'otimo' e 'optativas_escolhidas'.
+        """
+        grafo = self._grafo
+        curso = aluno.curso
+        teto = curso.limite_horas_semestrais
+        aprovadas = {d.nome for d in aluno.historico.disciplinas_aprovadas()}
+
+        grade = [d.nome for d in curso.disciplinas if d.nome in grafo] or grafo.nomes
+        pendentes = {n for n in grade if grafo.obrigatoria[n] and n not in aprovadas}
+        pendentes = self._fechamento(pendentes, aprovadas)
+
+        optativas = self._escolher_optativas(grade, aprovadas, pendentes,
+                                             curso.min_horas_optativas)
+        pendentes |= optativas
+
+        semestres, critico = self._escalonar(pendentes, teto)
+        horas = [sum(grafo.carga[n] for n in s) for s in semestres]
+        limite_inferior = max(critico, math.ceil(sum(horas) / teto)) if semestres else 0
+        return {
+            "matricula": aluno.matricula,
+            "semestres": semestres,
+            "horas_por_semestre": horas,
+            "total_semestres": len(semestres),
+            "limite_inferior": limite_inferior,
+            "otimo": len(semestres) == limite_inferior,
+            "optativas_escolhidas": sorted(optativas),
+        }
+
+    def planejar_lote(self, alunos) -> list:
+        """
+        Planeja a integralização de vários alunos (ex: uma coorte inteira).
+
+        O grafo é compartilhado entre todos os planos; alunos com plano
+        inviável recebem a chave 'erro' em vez de interromper o lote.
+
+        :param alunos: Iterável de objetos Aluno.
+        :return: Lista de planos, na mesma ordem dos alunos.
+        """
+        planos = []
+        for aluno in alunos:
+            try:
+                planos.append(self.planejar(aluno))
+            except ValueError as e:
+                planos.append({"matricula": aluno.matricula, "erro": str(e)})
+        return planos
+
+    # ------------------------------------------------------------------
+    # Seleção de disciplinas
+    # ------------------------------------------------------------------
+
+    def _fechamento(self, nomes: set, aprovadas: set) -> set:
+        """
+        Inclui, transitivamente, os pré e co-requisitos ainda não aprovados.
+
+        :raises ValueError: se algum requisito não existir no catálogo.
+        """
+        grafo = self._grafo
+        resultado = set()
+        pilha = list(nomes)
+        while pilha:
+            nome = pilha.pop()
+            if nome in resultado or nome in aprovadas:
+                continue
+            if nome not in grafo:
+                raise ValueError(f"Requisito '{nome}' não existe no catálogo.")
+            resultado.add(nome)
+            pilha.extend(grafo.pre[nome])
+            pilha.extend(grafo.co[nome])
+        return resultado
+
+    def _escolher_optativas(self, grade: list, aprovadas: set,
+                            pendentes: set, minimo: int) -> set:
+        """
+        Escolhe optativas suficientes para completar o mínimo do curso.
+
+        Prefere optativas que exigem menos horas extras de requisitos ainda
+        não planejados e, em seguida, as de maior carga (menos disciplinas).
+        Optativas com requisito inexistente no catálogo são ignoradas.
+
+        :return: Conjunto das optativas escolhidas e de seus requisitos.
+        """
+        grafo = self._grafo
+        faltam = minimo - sum(
+            grafo.carga[n] for n in aprovadas if n in grafo and not grafo.obrigatoria[n]
+        )
+        if faltam <= 0:
+            return set()
+
+        nomes = [n for n in grade
+                 if not grafo.obrigatoria[n] and n not in aprovadas and n not in pendentes]
+        fecho, horas = self._fechos(nomes, aprovadas | pendentes)
+        candidatas = sorted((horas[nome] - grafo.carga[nome], -grafo.carga[nome], nome, fecho[nome])
+                            for nome in nomes if nome in fecho)
+
+        escolhidas = set()
+        for _, _, nome, extras in candidatas:
+            if faltam <= 0:
+                break
+            if nome in escolhidas:
+                continue
+            novas = extras - escolhidas
+            escolhidas |= novas
+            faltam -= sum(grafo.carga[n] for n in novas if not grafo.obrigatoria[n])
+        if faltam > 0:
+            raise ValueError(
+                f"Optativas insuficientes no catálogo para completar "
+                f"{minimo}h (faltariam {faltam}h)."
+            )
+        return escolhidas
+
+    def _fechos(self, nomes: list, planejadas: set) -> tuple:
+        """
+        Calcula de uma vez, para cada nome, o conjunto dele com os seus
+        requisitos (transitivos) ainda não planejados e a soma das horas.
+
+        As componentes fortemente conexas do grafo de requisitos saem das
+        mais profundas para as mais rasas, de modo que o fecho de cada uma
+        reaproveita os já calculados: cada requisito é percorrido uma vez,
+        não uma vez por candidata.
+
+        :param nomes: Disciplinas cujo fecho é pedido.
+        :param planejadas: Aprovadas ou já no plano (não entram nos fechos).
+        :return: (fecho, horas) — dicionários por nome, sem os nomes que
+                 dependem de requisito inexistente no catálogo.
+        """
+        grafo = self._grafo
+
+        def requisitos(nome):
+            if nome not in grafo:
+                return ()
+            return [r for r in itertools.chain(grafo.pre[nome], grafo.co[nome])
+                    if r not in planejadas]
+
+        fecho, horas, invalidas = {}, {}, set()
+        for componente in self._componentes(nomes, requisitos):
+            membros = set(componente)
+            invalida = any(n not in grafo for n in componente)
+            for nome in componente:
+                for r in requisitos(nome):
+                    if r in invalidas:
+                        invalida = True
+                    elif r not in membros:
+                        membros |= fecho[r]
+            if invalida:
+                invalidas.update(componente)
+                continue
+            total = sum(grafo.carga[n] for n in membros)
+            for nome in componente:
+                fecho[nome], horas[nome] = membros, total
+        return fecho, horas
+
+    @staticmethod
+    def _componentes(nos, vizinhos) -> list:
+        """
+        Componentes fortemente conexas do grafo (Tarjan, sem recursão).
+
+        :param nos: Nós de partida, na ordem de visita.
+        :param vizinhos: Função nó → iterável dos nós alcançados por ele.
+        :return: Lista de componentes (listas de nós); cada componente
+                 aparece depois de todas as que ela alcança.
+        """
+        indice, menor, na_pilha = {}, {}, set()
+        pilha, componentes = [], []
+        for inicio in nos:
+            if inicio in indice:
+                continue
+            indice[inicio] = menor[inicio] = len(indice)
+            pilha.append(inicio)
+            na_pilha.add(inicio)
+            trabalho = [(inicio, iter(vizinhos(inicio)))]
+            while trabalho:
+                no, restantes = trabalho[-1]
+                for vizinho in restantes:
+                    if vizinho not in indice:
+                        indice[vizinho] = menor[vizinho] = len(indice)
+                        pilha.append(vizinho)
+                        na_pilha.add(vizinho)
+                        trabalho.append((vizinho, iter(vizinhos(vizinho))))
+                        break
+                    if vizinho in na_pilha:
+                        menor[no] = min(menor[no], indice[vizinho])
+                else:
+                    trabalho.pop()
+                    if trabalho:
+                        anterior = trabalho[-1][0]
+                        menor[anterior] = min(menor[anterior], menor[no])
+                    if menor[no] == indice[no]:
+                        componente = []
+                        while not componente or componente[-1] != no:
+                            componente.append(pilha.pop())
+                            na_pilha.discard(componente[-1])
+                        componentes.append(componente)
+        return componentes
+
+    # ------------------------------------------------------------------
+    # Escalonamento
+    # ------------------------------------------------------------------
+
+    def _grupos(self, pendentes: set) -> tuple:
+        """
+        Agrupa as disciplinas que precisam ser cursadas no mesmo semestre e
+        monta o grafo de precedência entre os grupos.
+
+        Um co-requisito pode ser cursado no mesmo semestre ou antes
+        (RegraCoRequisito aceita o co-requisito já aprovado); só
+        co-requisitos mútuos — ciclos de co-requisitos — obrigam o mesmo
+        semestre e formam um grupo.
+
+        :raises ValueError: se um grupo exigir um dos seus membros como
+                            pré-requisito.
+        :return: (membros, sucessores, predecessores), onde membros[g]
+                 lista as disciplinas do grupo g e sucessores[g] mapeia
+                 cada grupo seguinte ao intervalo mínimo em semestres
+                 (1 para pré-requisito, 0 para co-requisito).
+        """
+        grafo = self._grafo
+        membros = sorted(sorted(c) for c in self._componentes(
+            sorted(pendentes), lambda n: [c for c in grafo.co[n] if c in pendentes]))
+        grupo_de = {nome: g for g, m in enumerate(membros) for nome in m}
+
+        sucessores = [{} for _ in membros]
+        predecessores = [0] * len(membros)
+        for nome in pendentes:
+            g = grupo_de[nome]
+            for intervalo, requisitos in ((1, grafo.pre[nome]), (0, grafo.co[nome])):
+                for requisito in requisitos:
+                    origem = grupo_de.get(requisito)
+                    if origem is None or (origem == g and not intervalo):
+                        continue
+                    if origem == g:
+                        raise ValueError(
+                            f"'{nome}' exige '{requisito}' como pré-requisito, mas ambas "
+                            f"são co-requisitos mútuos (mesmo semestre) — plano inviável."
+                        )
+                    if g not in sucessores[origem]:
+                        predecessores[g] += 1
+                    sucessores[origem][g] = max(sucessores[origem].get(g, 0), intervalo)
+        return membros, sucessores, predecessores
+
+    def _alturas(self, sucessores: list, predecessores: list) -> list:
+        """
+        Calcula, em ordem topológica reversa, o caminho crítico (em semestres)
+        que começa em cada grupo.
+
+        :raises ValueError: se houver ciclo de pré-requisitos.
+        """
+        grau = list(predecessores)
+        ordem = [g for g, d in enumerate(grau) if d == 0]
+        for g in ordem:
+            for s in sucessores[g]:
+                grau[s] -= 1
+                if grau[s] == 0:
+                    ordem.append(s)
+        if len(ordem) != len(grau):
+            raise ValueError("Ciclo de pré-requisitos detectado — plano inviável.")
+
+        altura = [1] * len(grau)
+        for g in reversed(ordem):
+            for s, intervalo in sucessores[g].items():
+                altura[g] = max(altura[g], altura[s] + intervalo)
+        return altura
+
+    def _escalonar(self, pendentes: set, teto: int) -> tuple:
+        """
+        Distribui os grupos nos semestres por escalonamento em lista.
+
+        :raises ValueError: se uma disciplina ou um grupo de co-requisitos
+                            mútuos exceder o teto.
+        :return: (semestres, comprimento do caminho crítico em semestres).
+        """
+        if not pendentes:
+            return [], 0
+        grafo = self._grafo
+        membros, sucessores, predecessores = self._grupos(pendentes)
+        altura = self._alturas(sucessores, predecessores)
+        carga = [sum(grafo.carga[n] for n in m) for m in membros]
+
+        for g, horas in enumerate(carga):
+            if horas > teto and len(membros[g]) == 1:
+                raise ValueError(
+                    f"'{membros[g][0]}' tem {horas}h, mais que o teto semestral de {teto}h."
+                )
+            if horas > teto:
+                raise ValueError(
+                    f"{', '.join(membros[g])} somam {horas}h e precisam ser "
+                    f"cursadas juntas, mas o teto semestral é {teto}h."
+                )
+
+        def prioridade(g):
+            return (-altura[g], -carga[g], membros[g][0], g)
+
+        grau = list(predecessores)
+        inicio = [0] * len(membros)     # primeiro semestre permitido a cada grupo
+        liberados = [g for g, d in enumerate(grau) if d == 0]
+        semestres = []
+        while liberados:
+            atual = len(semestres)
+            prontos = [prioridade(g) for g in liberados if inicio[g] <= atual]
+            liberados = [g for g in liberados if inicio[g] > atual]
+            heapq.heapify(prontos)
+            livre = teto
+            alocados = []
+            while prontos:
+                g = heapq.heappop(prontos)[-1]
+                if carga[g] > livre:
+                    liberados.append(g)
+                    continue
+                livre -= carga[g]
+                alocados.append(g)
+                for s, intervalo in sucessores[g].items():
+                    inicio[s] = max(inicio[s], atual + intervalo)
+                    grau[s] -= 1
+                    if grau[s] == 0 and inicio[s] <= atual:
+                        heapq.heappush(prontos, prioridade(s))   # co-requisito no mesmo semestre
+                    elif grau[s] == 0:
+                        liberados.append(s)
+            semestres.append(sorted(n for g in alocados for n in membros[g]))
+        return semestres, max(altura)
@@ -0,0 +1,328 @@
+# application/politica_regras.py
+"""
+Módulo que implementa a política declarativa de regras por curso e tipo.
+
+Os conjuntos de regras e seus parâmetros (créditos mínimos, limite de
+trancamentos, vínculos bloqueados, mínimo de horas para cursos sem grade)
+são descritos em um arquivo JSON ou TOML, em vez de fixados no código. A
+política é compilada uma única vez ao ser carregada: cada combinação
+(curso, tipo) vira um PipelineRegras pronto, e a consulta por solicitação
+é uma busca em dicionário. Em processos de longa duração, o arquivo pode
+ser recarregado sem interromper avaliações em andamento.
+"""
+
+import json
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:  # TOML é opcional; JSON sempre funciona
+        tomllib = None
+
+from application.pipeline_regras import PipelineRegras
+from rules.regra_pre_requisito import RegraPreRequisito
+from rules.regra_co_requisito import RegraCoRequisito
+from rules.regra_limite_carga_horaria import RegraLimiteCargaHoraria
+from rules.regra_prazo import RegraPrazo
+from rules.regra_limite_trancamentos import RegraLimiteTrancamentos
+from rules.regra_vinculo_ativo import RegraVinculoAtivo
+from rules.regra_elegibilidade import RegraElegibilidade
+from rules.regra_pendencia_documentacao import RegraPendenciaDocumentacao
+from rules.regra_creditos import RegraCreditos
+
+
+# Regras que podem ser citadas pelo nome da classe no arquivo de política
+REGRAS_DISPONIVEIS = {
+    cls.__name__: cls for cls in (
+        RegraPreRequisito, RegraCoRequisito, RegraLimiteCargaHoraria,
+        RegraPrazo, RegraLimiteTrancamentos, RegraVinculoAtivo,
+        RegraElegibilidade, RegraPendenciaDocumentacao, RegraCreditos,
+    )
+}
+
+TIPOS = ("matricula", "trancamento", "colacao")
+
+# Política usada quando nenhum arquivo é informado (as regras históricas do CLI)
+POLITICA_PADRAO = {
+    "padrao": {
+        "matricula": ["RegraPreRequisito", "RegraCoRequisito", "RegraLimiteCargaHoraria"],
+        "trancamento": ["RegraPrazo", "RegraLimiteTrancamentos", "RegraVinculoAtivo"],
+        "colacao": ["RegraElegibilidade", "RegraPendenciaDocumentacao",
+                    {"regra": "RegraCreditos", "minimo": 80}],
+    },
+    "cursos": {},
+}
+
+
+class PoliticaRegras:
+    """
+    Conjuntos de regras por curso e tipo de solicitação, compilados em
+    pipelines e recarregáveis a quente.
+
+    Formato do arquivo (JSON; o TOML equivalente usa as mesmas chaves):
+        {
+          "padrao": {
+            "matricula":   ["RegraPreRequisito", "RegraCoRequisito",
+                            "RegraLimiteCargaHoraria"],
+            "trancamento": ["RegraPrazo",
+                            {"regra": "RegraLimiteTrancamentos", "limite": 4},
+                            {"regra": "RegraVinculoAtivo",
+                             "bloqueados": ["Trancado", "Egresso"]}],
+            "colacao":     [{"regra": "RegraElegibilidade", "minimo_fallback": 120},
+                            "RegraPendenciaDocumentacao",
+                            {"regra": "RegraCreditos", "minimo": 80}]
+          },
+          "cursos": {
+            "Medicina": {"colacao": [{"regra": "RegraCreditos", "minimo": 200}]}
+          }
+        }
+
+    Cada regra é o nome da classe ou um objeto com "regra" e os
+    parâmetros do construtor. Um curso substitui apenas os tipos que
+    declara; os demais usam o conjunto "padrao" (o mesmo pipeline).
+
+    Recarga:
+        recarregar() compila a nova política por completo e só então troca
+        a tabela de pipelines, em uma única atribuição. Avaliações em
+        andamento continuam com o pipeline que já obtiveram; se o arquivo
+        novo for inválido, a política atual é mantida. As estatísticas
+        de ordenação dos pipelines recomeçam após a recarga.
+
+    Exemplo de uso:
+        >>> politica = PoliticaRegras(cache=CACHE_REGRAS)
+        >>> politica.carregar("politica_regras.json")
+        >>> pipeline = politica.pipeline("colacao", curso="Medicina")
+        >>> service.avaliar_regras(sol, pipeline)
+        >>> politica.recarregar_se_alterado()   # no laço de um daemon
+        False
+    """
+
+    def __init__(self, definicao: dict = None, cache=None, instrumentacao=None,
+                 calendario=None):
+        """
+        :param definicao: Política já lida (dicionário no formato acima).
+                          Se None, usa POLITICA_PADRAO.
+        :param cache: CacheResultadosRegras repassado a todos os pipelines.
+        :param instrumentacao: InstrumentacaoRegras repassada a todos os pipelines.
+        :param calendario: CalendarioService entregue às regras que consultam
+                           o calendário acadêmico (RegraPrazo).
+        :raises ValueError: se a definição for inválida.
+        """
+        self._cache = cache
+        self._instrumentacao = instrumentacao
+        self._calendario = calendario
+        self._caminho = None
+        self._versao_arquivo = None
+        self._pipelines = self._compilar(definicao if definicao is not None else POLITICA_PADRAO)
+
+    @property
+    def caminho(self) -> str:
+        """Arquivo de origem da política, ou None se for a padrão."""
+        return self._caminho
+
+    @property
+    def instrumentacao(self):
+        """InstrumentacaoRegras entregue aos pipelines, ou None."""
+        return self._instrumentacao
+
+    @instrumentacao.setter
+    def instrumentacao(self, instrumentacao) -> None:
+        """Liga (ou desliga, com None) a instrumentação em todos os pipelines."""
+        self._instrumentacao = instrumentacao
+        for pipeline in self._pipelines.values():
+            pipeline.instrumentacao = instrumentacao
+
+    @property
+    def calendario(self):
+        """CalendarioService entregue às regras de prazo, ou None."""
+        return self._calendario
+
+    @calendario.setter
+    def calendario(self, calendario) -> None:
+        """Liga (ou desliga, com None) o calendário nas regras de prazo."""
+        self._calendario = calendario
+        for pipeline in self._pipelines.values():
+            for regra in pipeline.regras:
+                if hasattr(regra, "calendario"):
+                    regra.calendario = calendario
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def pipeline(self, tipo: str, curso: str = None) -> PipelineRegras:
+        """
+        Retorna o pipeline compilado para o tipo e o curso.
+
+        :param tipo: 'matricula', 'trancamento' ou 'colacao'.
+        :param curso: Nome do curso; sem política própria, usa a padrão.
+        :raises ValueError: se o tipo não for reconhecido.
+        """
+        pipelines = self._pipelines
+        encontrado = pipelines.get((curso, tipo)) or pipelines.get((None, tipo))
+        if encontrado is None:
+            raise ValueError(f"Tipo de solicitação inválido: '{tipo}'. Use um de {list(TIPOS)}.")
+        return encontrado
+
+    def pipelines(self) -> dict:
+        """
+        Retorna os pipelines distintos compilados.
+
+        :return: Dicionário {(curso ou None, tipo): PipelineRegras}. Cursos
+                 que herdam o pipeline padrão não aparecem.
+        """
+        return dict(self._pipelines)
+
+    def regras_por_curso(self, tipo: str) -> dict:
+        """
+        Lista as regras de um tipo para cada curso com política própria.
+
+        :return: Dicionário {curso ou None: lista de Regra}; a chave None
+                 traz as regras padrão.
+        """
+        return {curso: p.regras for (curso, t), p in self.pipelines().items() if t == tipo}
+
+    # ------------------------------------------------------------------
+    # Carga e recarga
+    # ------------------------------------------------------------------
+
+    def carregar(self, caminho: str) -> None:
+        """
+        Lê, valida e compila a política de um arquivo JSON ou TOML.
+
+        :param caminho: Arquivo .json ou .toml.
+        :raises ValueError: se o arquivo for inválido ou ilegível; nesse
+                            caso a política atual é mantida.
+        """
+        versao = self._versao(caminho)
+        pipelines = self._compilar(self._ler(caminho))
+        self._pipelines = pipelines
+        self._caminho = caminho
+        self._versao_arquivo = versao
+
+    def recarregar(self) -> None:
+        """
+        Recarrega o arquivo de origem, trocando a política atomicamente.
+
+        :raises ValueError: se não houver arquivo de origem ou se o novo
+                            conteúdo for inválido.
+        """
+        if self._caminho is None:
+            raise ValueError("A política atual não foi carregada de um arquivo.")
+        self.carregar(self._caminho)
+
+    def recarregar_se_alterado(self) -> bool:
+        """
+        Recarrega a política apenas se o arquivo mudou desde a última carga.
+
+        :return: True se a política foi recarregada.
+        :raises ValueError: se o arquivo alterado for inválido (a política
+                            atual é mantida até a próxima alteração).
+        """
+        if self._caminho is None:
+            return False
+        versao = self._versao(self._caminho)
+        if versao == self._versao_arquivo:
+            return False
+        try:
+            self.recarregar()
+        except ValueError:
+            # Não tenta de novo a mesma versão inválida a cada consulta
+            self._versao_arquivo = versao
+            raise
+        return True
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _versao(caminho: str) -> tuple:
+        """Identifica a versão do arquivo por data de modificação e tamanho."""
+        try:
+            info = os.stat(caminho)
+        except OSError as e:
+            raise ValueError(f"Arquivo de política inacessível: {caminho} ({e}).")
+        return info.st_mtime_ns, info.st_size
+
+    @staticmethod
+    def _ler(caminho: str) -> dict:
+        """
+        Lê o arquivo conforme a extensão (.toml ou JSON).
+
+        :raises ValueError: se o conteúdo não puder ser interpretado.
+        """
+        toml = caminho.endswith(".toml")
+        if toml and tomllib is None:
+            raise ValueError("Política em TOML requer Python 3.11+ ou o pacote 'tomli'.")
+        try:
+            if toml:
+                with open(caminho, "rb") as f:
+                    return tomllib.load(f)
+            with open(caminho, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:  # JSON/TOMLDecodeError são ValueError
+            raise ValueError(f"Arquivo de política inválido: {caminho} ({e}).")
+
+    def _compilar(self, definicao: dict) -> dict:
+        """
+        Valida a definição e cria um PipelineRegras por (curso, tipo).
+
+        :raises ValueError: se houver tipo, regra ou parâmetro inválido.
+        """
+        if not isinstance(definicao, dict):
+            raise ValueError("A política deve ser um objeto com 'padrao' e 'cursos'.")
+        padrao = definicao.get("padrao", {})
+        if not isinstance(padrao, dict):
+            raise ValueError("'padrao' da política deve ser um objeto com uma lista por tipo.")
+        faltando = [t for t in TIPOS if t not in padrao]
+        if faltando:
+            raise ValueError(f"A política padrão não define os tipos: {', '.join(faltando)}.")
+
+        pipelines = {}
+        for tipo, regras in padrao.items():
+            pipelines[(None, tipo)] = self._montar_pipeline(regras, tipo)
+        cursos = definicao.get("cursos") or {}
+        if not isinstance(cursos, dict):
+            raise ValueError("'cursos' da política deve ser um objeto com um item por curso.")
+        for curso, tipos in cursos.items():
+            if not isinstance(tipos, dict):
+                raise ValueError(f"Política do curso '{curso}' deve ser um objeto com uma "
+                                 f"lista de regras por tipo.")
+            for tipo, regras in tipos.items():
+                pipelines[(curso, tipo)] = self._montar_pipeline(regras, tipo, curso)
+        return pipelines
+
+    def _montar_pipeline(self, entradas: list, tipo: str, curso: str = None) -> PipelineRegras:
+        """Instancia as regras declaradas para um tipo (e curso)."""
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de solicitação inválido na política: '{tipo}'.")
+        onde = f"curso '{curso}', tipo '{tipo}'" if curso else f"padrão, tipo '{tipo}'"
+        if not isinstance(entradas, list):
+            raise ValueError(f"Política ({onde}): as regras devem ser uma lista.")
+        regras = []
+        for posicao, entrada in enumerate(entradas, start=1):
+            if isinstance(entrada, str):
+                entrada = {"regra": entrada}
+            elif not isinstance(entrada, dict):
+                raise ValueError(f"Política ({onde}), regra {posicao}: use o nome da regra ou "
+                                 f"um objeto com 'regra' e parâmetros, não {entrada!r}.")
+            parametros = dict(entrada)
+            nome = parametros.pop("regra", None)
+            classe = REGRAS_DISPONIVEIS.get(nome)
+            if classe is None:
+                raise ValueError(f"Regra desconhecida na política: '{nome}'. "
+                                 f"Disponíveis: {', '.join(sorted(REGRAS_DISPONIVEIS))}.")
+            try:
+                regra = classe(**parametros)
+            except TypeError as e:
+                raise ValueError(f"Parâmetros inválidos para {nome}: {e}.")
+            if hasattr(regra, "calendario"):
+                regra.calendario = self._calendario
+            regras.append(regra)
+        nome_pipeline = f"{curso}/{tipo}" if curso else tipo
+        return PipelineRegras(regras, nome=nome_pipeline, cache=self._cache,
+                              instrumentacao=self._instrumentacao)
@@ -58,3 +58,19 @@ class RelatorioService:
                 )
 
         print("=" * 60 + "\n")
+
+    def resumir(self, registros: list) -> dict:
+        """
+        Consolida as solicitações persistidas em contagens por status e tipo.
+
+        :param registros: Tuplas (id, tipo, aluno_id, status, alvo,
+                          protocolo), como retornadas por
+                          RepositorioSolicitacao.listar().
+        :return: Dicionário com total, por_status e por_tipo.
+        """
+        por_status, por_tipo = {}, {}
+        for registro in registros:
+            tipo, status = registro[1], registro[3]
+            por_status[status] = por_status.get(status, 0) + 1
+            por_tipo[tipo] = por_tipo.get(tipo, 0) + 1
+        return {"total": len(registros), "por_status": por_status, "por_tipo": por_tipo}
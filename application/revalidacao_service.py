@@ -0,0 +1,175 @@
+# application/revalidacao_service.py
+"""
+Módulo que implementa a revalidação incremental de matrículas pendentes.
+
+Quando a coordenação altera o catálogo (ex: inclui um pré-requisito via
+atualizar_pre_requisitos) ou quando o histórico de um aluno muda, as
+matrículas ainda em vigor — abertas ou aprovadas para o semestre atual —
+podem deixar de ser válidas. Este serviço usa o índice reverso de
+dependências do RepositorioDisciplina e o índice de solicitações
+pendentes do RepositorioSolicitacao para encontrar somente os pedidos
+afetados e reaplicar apenas as regras relacionadas à mudança.
+"""
+
+from domain.solicitacao_matricula import SolicitacaoMatricula
+from rules.regra_pre_requisito import RegraPreRequisito
+from rules.regra_co_requisito import RegraCoRequisito
+from rules.contexto_avaliacao import ContextoAvaliacao
+
+
+class RevalidacaoService:
+    """
+    Reaplica regras de matrícula sobre as matrículas pendentes afetadas
+    por uma mudança no catálogo ou no histórico.
+
+    São pendentes as matrículas abertas ou em análise e as aprovadas para
+    o semestre atual do aluno (informado por semestre_atual): a aprovação
+    vale até o fim do semestre, e uma mudança nos requisitos ainda pode
+    invalidá-la. Matrículas aprovadas em semestres passados são ignoradas.
+
+    O trabalho realizado é proporcional ao tamanho da mudança:
+        - Alteração dos requisitos de X: apenas as matrículas pendentes
+          cujo alvo é X são revalidadas, e somente com a regra do vínculo
+          alterado (pré ou co-requisito).
+        - Alteração do histórico do aluno A na disciplina D: apenas as
+          matrículas pendentes de A cujo alvo depende diretamente de D
+          (consulta ao índice reverso) são revalidadas.
+
+    Solicitações que passam a violar alguma regra têm o status persistido
+    alterado para 'Rejeitada' (uma matrícula aprovada deixa a carga do
+    semestre). Para uma matrícula aprovada, as demais disciplinas do
+    aluno no mesmo semestre contam como cursadas simultaneamente.
+
+    A reconstrução dos objetos de domínio é delegada a funções injetadas
+    (carregar_aluno, carregar_disciplina e semestre_atual), mantendo o
+    serviço desacoplado da forma como o CLI monta Aluno e Disciplina a
+    partir do banco e consulta o calendário (DIP).
+
+    Exemplo de uso:
+        >>> svc = RevalidacaoService(repo_sol, repo_disc, carregar_aluno,
+        ...                          carregar_disciplina, semestre_atual)
+        >>> repo_disc.atualizar_pre_requisitos("Cálculo II", ["Cálculo I"])
+        >>> svc.apos_alteracao_catalogo("Cálculo II", "pre")
+        [{'id': 3, 'protocolo': 'SGSA-1A2B3C4D', ..., 'status': 'Rejeitada'}]
+    """
+
+    def __init__(self, repo_sol, repo_disc, carregar_aluno, carregar_disciplina,
+                 semestre_atual):
+        """
+        :param repo_sol: Instância de RepositorioSolicitacao.
+        :param repo_disc: Instância de RepositorioDisciplina.
+        :param carregar_aluno: Função matricula → Aluno (ou None).
+        :param carregar_disciplina: Função nome → Disciplina completa (ou None).
+        :param semestre_atual: Função Aluno → semestre letivo em curso
+                               (ex: '2026.2') para o curso do aluno.
+        """
+        self._repo_sol = repo_sol
+        self._repo_disc = repo_disc
+        self._carregar_aluno = carregar_aluno
+        self._carregar_disciplina = carregar_disciplina
+        self._semestre_atual = semestre_atual
+        self._regras_por_vinculo = {
+            "pre": [RegraPreRequisito()],
+            "co": [RegraCoRequisito()],
+        }
+
+    def apos_alteracao_catalogo(self, nome_disciplina: str, vinculo: str = None) -> list:
+        """
+        Revalida as matrículas pendentes cujo alvo teve os requisitos alterados.
+
+        :param nome_disciplina: Disciplina cujos pré/co-requisitos mudaram.
+        :param vinculo: 'pre', 'co' ou None (reaplica ambas as regras).
+        :return: Lista de resultados, um por solicitação revalidada.
+        """
+        registros = self._repo_sol.listar_pendentes(alvos=[nome_disciplina], tipo="matricula")
+        return self._revalidar(registros, self._regras_do_vinculo(vinculo))
+
+    def apos_alteracao_historico(self, matricula: str, nome_disciplina: str) -> list:
+        """
+        Revalida as matrículas pendentes do aluno que dependem da disciplina
+        cuja situação no histórico foi alterada.
+
+        :param matricula: Matrícula do aluno cujo histórico mudou.
+        :param nome_disciplina: Disciplina aprovada/reprovada/removida.
+        :return: Lista de resultados, um por solicitação revalidada.
+        """
+        dependentes = self._repo_disc.dependentes_diretos(nome_disciplina)
+        if not dependentes:
+            return []
+        registros = self._repo_sol.listar_pendentes(
+            alvos=dependentes, aluno_id=matricula, tipo="matricula")
+        return self._revalidar(registros, self._regras_do_vinculo(None))
+
+    def _regras_do_vinculo(self, vinculo: str) -> list:
+        """Seleciona as regras afetadas pelo tipo de vínculo alterado."""
+        if vinculo is None:
+            return self._regras_por_vinculo["pre"] + self._regras_por_vinculo["co"]
+        if vinculo not in self._regras_por_vinculo:
+            raise ValueError(f"Vínculo inválido: '{vinculo}'. Use 'pre', 'co' ou None.")
+        return self._regras_por_vinculo[vinculo]
+
+    def _revalidar(self, registros: list, regras: list) -> list:
+        """
+        Reconstrói cada solicitação pendente e reaplica as regras informadas.
+
+        Os objetos Aluno e Disciplina são carregados uma única vez por
+        matrícula/nome, mesmo que apareçam em vários registros. Matrículas
+        aprovadas de outro semestre que não o atual do aluno são puladas.
+
+        :return: Lista de dicionários com id, protocolo, aluno_id, alvo,
+                 status resultante e a mensagem da violação (se houver).
+        """
+        alunos, disciplinas = {}, {}
+        resultados = []
+        for registro in registros:
+            mat, alvo = registro.get('aluno_id'), registro.get('alvo')
+            if mat not in alunos:
+                alunos[mat] = self._carregar_aluno(mat)
+            aprovada = registro.get('status') == "Aprovada"
+            if aprovada and (alunos[mat] is None or
+                             registro.get('semestre') != self._semestre_atual(alunos[mat])):
+                continue
+            if alvo not in disciplinas:
+                disciplinas[alvo] = self._carregar_disciplina(alvo)
+            aluno, disciplina = alunos[mat], disciplinas[alvo]
+
+            resultado = {
+                "id": registro['id'],
+                "protocolo": registro.get('protocolo', 'S/P'),
+                "aluno_id": mat,
+                "alvo": alvo,
+                "status": registro.get('status'),
+                "violacao": None,
+            }
+            if aluno is None or disciplina is None:
+                resultado["violacao"] = "Aluno ou disciplina não encontrado no banco."
+                resultados.append(resultado)
+                continue
+
+            simultaneas = self._simultaneas(registro, disciplina, aprovada, disciplinas)
+            sol = SolicitacaoMatricula(aluno, disciplina,
+                                       disciplinas_co_req_solicitadas=simultaneas)
+            contexto = ContextoAvaliacao(sol)
+            violacoes = [v for regra in regras for v in regra.avaliar(sol, contexto)]
+            if violacoes:
+                self._repo_sol.atualizar_status(registro['id'], "Rejeitada")
+                resultado["status"] = "Rejeitada"
+                resultado["violacao"] = " ".join(str(v) for v in violacoes)
+            resultados.append(resultado)
+        return resultados
+
+    def _simultaneas(self, registro: dict, disciplina, aprovada: bool, disciplinas: dict) -> list:
+        """
+        Disciplinas cursadas junto com a do registro: as informadas no
+        pedido e, numa matrícula aprovada, as demais do aluno no semestre.
+        Só são carregadas se a disciplina tiver co-requisitos.
+        """
+        if not disciplina.co_requisitos:
+            return []
+        nomes = list(registro.get('simultaneas', []))
+        if aprovada:
+            nomes += [n for n in self._repo_sol.disciplinas_semestre(registro['aluno_id'],
+                                                                     registro['semestre'])
+                      if n != disciplina.nome and n not in nomes]
+        return [d for d in (disciplinas.get(n) or self._carregar_disciplina(n) for n in nomes)
+                if d is not None]
@@ -7,10 +7,15 @@ combina três padrões de projeto para fornecer uma interface clara e
 extensível: Factory (criação), Strategy (validação) e Observer (notificação).
 """
 
+import time
+
+from infrastructure.medicao import fase
 from domain.solicitacao_trancamento import SolicitacaoTrancamento
 from domain.solicitacao_matricula import SolicitacaoMatricula
 from domain.solicitacao_colacao import SolicitacaoColacao
-from domain.excecoes import ViolacaoRegraAcademicaError
+from domain.resultado_validacao import ResultadoValidacao
+from rules.regra_base import Regra
+from rules.contexto_avaliacao import ContextoAvaliacao
 
 
 class SolicitacaoService:
@@ -57,7 +62,7 @@ class SolicitacaoService:
         >>> svc.processar(sol)   # avança para 'Em Análise' + notifica
     """
 
-    def __init__(self, notificacao_service=None):
+    def __init__(self, notificacao_service=None, instrumentacao=None):
         """
         Inicializa o serviço com um NotificacaoService opcional.
 
@@ -68,8 +73,14 @@ class SolicitacaoService:
         :param notificacao_service: Instância de NotificacaoService a ser
                                     registrada como observador nas solicitações.
                                     Se None, nenhuma notificação será enviada.
+        :param instrumentacao: InstrumentacaoRegras opcional. Quando
+                               informada, aplicar_regras() e avaliar_regras()
+                               medem cada regra de uma lista; um
+                               PipelineRegras recebido inteiro usa a
+                               instrumentação configurada nele próprio.
         """
         self._notificacao = notificacao_service
+        self._instrumentacao = instrumentacao
 
     # ------------------------------------------------------------------
     # Factory Method — criação de solicitações
@@ -119,6 +130,47 @@ class SolicitacaoService:
 
         return solicitacao
 
+    def criar_matricula_lote(self, aluno, disciplinas: list, carga_atual: int = 0,
+                             semestre: str = None) -> list:
+        """
+        Cria as matrículas de um conjunto de disciplinas pedidas juntas.
+
+        As disciplinas do conjunto são avaliadas como um único pedido:
+          - co-requisito: cada matrícula recebe as demais disciplinas do
+            conjunto em disciplinas_co_req_solicitadas;
+          - carga horária: a carga já matriculada de cada uma inclui a
+            carga atual mais a das disciplinas anteriores do conjunto, de
+            modo que RegraLimiteCargaHoraria verifica o total acumulado;
+          - pré-requisito: continua exigindo aprovação no histórico (cursar
+            no mesmo semestre não satisfaz um pré-requisito).
+
+        A decisão é tudo ou nada: o conjunto só é aprovado se todas as
+        matrículas forem aprovadas (ver validar_lote()).
+
+        :param aluno: Objeto Aluno solicitante.
+        :param disciplinas: Lista de objetos Disciplina, sem repetição.
+        :param carga_atual: Horas já matriculadas no semestre.
+        :param semestre: Semestre letivo registrado em cada matrícula.
+        :raises ValueError: se a lista estiver vazia ou tiver disciplinas repetidas.
+        :return: Lista de SolicitacaoMatricula, na ordem das disciplinas.
+        """
+        if not disciplinas:
+            raise ValueError("Informe ao menos uma disciplina para a matrícula.")
+        if len(set(disciplinas)) != len(disciplinas):
+            raise ValueError("Disciplinas repetidas no pedido de matrícula.")
+
+        solicitacoes = []
+        acumulada = carga_atual
+        for disciplina in disciplinas:
+            demais = [d for d in disciplinas if d is not disciplina]
+            solicitacao = self.criar_solicitacao("matricula", aluno, disciplina,
+                                                 disciplinas_co_req_solicitadas=demais)
+            solicitacao.carga_horaria_semestre_atual = acumulada
+            solicitacao.semestre = semestre
+            acumulada += disciplina.carga_horaria
+            solicitacoes.append(solicitacao)
+        return solicitacoes
+
     # ------------------------------------------------------------------
     # Strategy — aplicação de regras acadêmicas
     # ------------------------------------------------------------------
@@ -127,11 +179,15 @@ class SolicitacaoService:
         """
         Aplica polimorficamente cada regra da lista à solicitação.
 
-        Itera sobre a lista de objetos Regra e chama validar() em cada um.
-        A primeira regra que falhar lançará ViolacaoRegraAcademicaError,
+        Itera sobre a lista de objetos Regra e avalia cada um. A primeira
+        regra que falhar lançará ViolacaoRegraAcademicaError,
         interrompendo a validação imediatamente e propagando a exceção
         ao chamador com uma mensagem clara.
 
+        Um único ContextoAvaliacao é criado aqui e compartilhado por todas
+        as regras, para que fatos do histórico (aprovadas, créditos,
+        pendências) sejam calculados uma só vez.
+
         O serviço não conhece as regras concretas — apenas depende da
         abstração Regra.validar(). Isso garante total desacoplamento
         (DIP) e extensibilidade (OCP).
@@ -139,13 +195,104 @@ class SolicitacaoService:
         :param solicitacao: Objeto Solicitacao a ser validado.
         :param regras: Lista de objetos que implementam a classe Regra.
                        A ordem importa: as regras são avaliadas em sequência.
+                       Também aceita uma única Regra — em especial um
+                       PipelineRegras, que decide a ordem por conta própria.
         :raises ViolacaoRegraAcademicaError: na primeira regra violada,
                                              com mensagem descritiva.
         :return: True se todas as regras forem satisfeitas.
         """
+        with fase("regras"):
+            contexto = ContextoAvaliacao(solicitacao)
+            if isinstance(regras, Regra):
+                return regras.validar(solicitacao, contexto)
+            if self._instrumentacao is not None:
+                return ResultadoValidacao(
+                    self._avaliar_instrumentado(solicitacao, regras, contexto, True)).levantar()
+            for regra in regras:
+                violacoes = regra.avaliar(solicitacao, contexto)
+                if violacoes:
+                    raise violacoes[0].como_excecao()
+            return True
+
+    def avaliar_regras(self, solicitacao, regras: list) -> ResultadoValidacao:
+        """
+        Avalia todas as regras sem interromper na primeira falha.
+
+        Versão sem exceções de aplicar_regras(): cada regra é chamada via
+        avaliar() e todas as violações são reunidas, com código e
+        parâmetros estruturados. As mensagens só são formatadas quando
+        exibidas, o que torna este método o indicado para processamento
+        em lote e para mostrar ao aluno todos os problemas de uma vez.
+
+        :param solicitacao: Objeto Solicitacao a ser validado.
+        :param regras: Lista de objetos Regra ou uma única Regra
+                       (ex: um PipelineRegras).
+        :return: ResultadoValidacao (verdadeiro se nenhuma regra falhou).
+        """
+        with fase("regras"):
+            contexto = ContextoAvaliacao(solicitacao)
+            if isinstance(regras, Regra):
+                return ResultadoValidacao(regras.avaliar(solicitacao, contexto))
+            if self._instrumentacao is not None:
+                return ResultadoValidacao(
+                    self._avaliar_instrumentado(solicitacao, regras, contexto, False))
+            violacoes = []
+            for regra in regras:
+                violacoes.extend(regra.avaliar(solicitacao, contexto))
+            return ResultadoValidacao(violacoes)
+
+    def _avaliar_instrumentado(self, solicitacao, regras: list, contexto,
+                               parar_na_primeira: bool) -> list:
+        """
+        Avalia a lista de regras registrando latência, resultado e
+        profundidade alcançada na instrumentação.
+
+        :return: Violações encontradas (apenas as da primeira regra que
+                 falhou, se parar_na_primeira).
+        """
+        instrumentacao = self._instrumentacao
+        relogio = time.perf_counter_ns
+        violacoes = []
+        executadas = 0
         for regra in regras:
-            regra.validar(solicitacao)
-        return True
+            inicio = relogio()
+            encontradas = regra.avaliar(solicitacao, contexto)
+            instrumentacao.registrar_regra(type(regra).__name__, relogio() - inicio, encontradas)
+            executadas += 1
+            if encontradas:
+                violacoes.extend(encontradas)
+                if parar_na_primeira:
+                    break
+        instrumentacao.registrar_avaliacao("aplicar_regras", executadas, len(regras))
+        return violacoes
+
+    def validar_lote(self, solicitacoes: list, regras: list) -> list:
+        """
+        Avalia as mesmas regras sobre muitas solicitações de uma vez.
+
+        Indicado para revisões de fim de semestre: cada regra é chamada
+        uma vez com o lote inteiro (Regra.avaliar_lote), e as regras
+        numéricas — créditos, carga semestral, trancamentos e horas de
+        optativas — comparam todas as solicitações em uma única operação
+        vetorizada (NumPy, se instalado). Cada solicitação recebe o seu
+        próprio ContextoAvaliacao, compartilhado entre as regras.
+
+        :param solicitacoes: Lista de objetos Solicitacao.
+        :param regras: Lista de objetos Regra ou uma única Regra
+                       (ex: um PipelineRegras).
+        :return: Lista de ResultadoValidacao, um por solicitação, na ordem
+                 recebida (cada um verdadeiro se a solicitação foi aprovada).
+        """
+        with fase("regras"):
+            contextos = [ContextoAvaliacao(s) for s in solicitacoes]
+            if isinstance(regras, Regra):
+                regras = [regras]
+            violacoes = [[] for _ in solicitacoes]
+            for regra in regras:
+                for acumuladas, encontradas in zip(violacoes,
+                                                   regra.avaliar_lote(solicitacoes, contextos)):
+                    acumuladas.extend(encontradas)
+            return [ResultadoValidacao(v) for v in violacoes]
 
     # ------------------------------------------------------------------
     # Fluxo de estado — conveniência
@@ -0,0 +1,242 @@
+# application/varredura_colacao_service.py
+"""
+Módulo que implementa a varredura de elegibilidade para colação de grau.
+
+Ao fim de cada período, a secretaria avalia as regras de colação para
+todos os alunos de uma vez. Com dezenas de milhares de alunos, a
+avaliação é distribuída entre processos: os alunos são divididos em
+blocos, cada processo trabalhador monta as regras uma única vez ao
+iniciar e avalia seus blocos com SolicitacaoService.validar_lote(). Os
+veredictos são gravados em um relatório JSONL à medida que os blocos
+terminam, e um arquivo de checkpoint permite retomar uma varredura
+interrompida sem reavaliar os blocos já gravados.
+"""
+
+import hashlib
+import json
+import os
+from multiprocessing import Pool
+
+from application.solicitacao_service import SolicitacaoService
+from domain.solicitacao_colacao import SolicitacaoColacao
+from infrastructure.repositorio_aluno import RepositorioAluno
+
+
+# Estado somente leitura de cada processo trabalhador, montado uma única
+# vez por _inicializar_trabalhador() e reaproveitado em todos os blocos.
+_ESTADO_TRABALHADOR = {}
+
+
+def _inicializar_trabalhador(regras: list, regras_por_curso: dict) -> None:
+    """
+    Monta, no processo trabalhador, as regras e o serviço de validação.
+
+    :param regras: Regras de colação padrão.
+    :param regras_por_curso: Regras próprias de cada curso, {nome: regras}.
+    """
+    _ESTADO_TRABALHADOR.clear()
+    _ESTADO_TRABALHADOR.update({
+        "regras": regras,
+        "regras_por_curso": regras_por_curso,
+        "service": SolicitacaoService(),
+    })
+
+
+def _avaliar_bloco(tarefa: tuple) -> tuple:
+    """
+    Avalia um bloco de alunos no processo trabalhador.
+
+    Os alunos são montados por RepositorioAluno.reconstruir(), como na
+    solicitação de colação do CLI: a varredura e 'solicitacao criar
+    --tipo colacao' chegam ao mesmo veredicto para o mesmo aluno.
+
+    :param tarefa: Tupla (índice do bloco, lista de registros de aluno no
+                   formato de RepositorioAluno.listar()).
+    :return: Tupla (índice do bloco, lista de veredictos).
+    """
+    indice, registros = tarefa
+    solicitacoes = []
+    for registro in registros:
+        aluno = RepositorioAluno.reconstruir(registro)
+        solicitacoes.append(SolicitacaoColacao(aluno, aluno.curso))
+
+    # Cada curso pode ter regras próprias: um lote por conjunto de regras
+    por_curso = {}
+    for i, sol in enumerate(solicitacoes):
+        por_curso.setdefault(sol.aluno.curso.nome, []).append(i)
+    resultados = [None] * len(solicitacoes)
+    for curso, posicoes in por_curso.items():
+        regras = _ESTADO_TRABALHADOR["regras_por_curso"].get(curso, _ESTADO_TRABALHADOR["regras"])
+        lote = _ESTADO_TRABALHADOR["service"].validar_lote(
+            [solicitacoes[i] for i in posicoes], regras)
+        for i, resultado in zip(posicoes, lote):
+            resultados[i] = resultado
+    veredictos = [
+        {
+            "matricula": sol.aluno.matricula,
+            "nome": sol.aluno.nome,
+            "curso": sol.aluno.curso.nome,
+            "apto": resultado.aprovado,
+            "violacoes": [v.como_dict() for v in resultado.violacoes],
+        }
+        for sol, resultado in zip(solicitacoes, resultados)
+    ]
+    return indice, veredictos
+
+
+class VarreduraColacaoService:
+    """
+    Avalia as regras de colação para uma coorte inteira de alunos, em
+    paralelo, gravando um relatório JSONL retomável.
+
+    Funcionamento:
+        - Os alunos são ordenados por matrícula e divididos em blocos de
+          'tamanho_bloco'. Cada bloco é uma tarefa independente.
+        - Cada processo trabalhador recebe as regras uma única vez, no
+          inicializador do Pool, e as mantém como estado somente leitura
+          para todos os blocos que avaliar.
+        - Os blocos são consumidos na ordem em que terminam
+          (imap_unordered): cada um é anexado ao relatório e só então
+          registrado no checkpoint.
+
+    Relatório (uma linha JSON por aluno):
+        {"matricula": "2023001", "nome": "Ana", "curso": "Física",
+         "apto": false, "violacoes": [{"regra": ..., "codigo": ..., ...}]}
+
+    Checkpoint (<relatorio>.checkpoint):
+        Guarda os blocos concluídos e o tamanho do relatório, em bytes,
+        após o último bloco gravado. Ao retomar, linhas de um bloco
+        gravado pela metade são descartadas e apenas os blocos pendentes
+        são avaliados. O checkpoint é removido ao fim da varredura.
+        A assinatura do checkpoint inclui resumos (SHA-256) dos registros
+        de aluno, em ordem de matrícula, e do catálogo: uma coorte ou um
+        catálogo diferente recomeça a varredura em vez de herdar os
+        blocos concluídos de outra.
+
+    Com processos=1, a avaliação é feita no próprio processo, sem Pool.
+
+    Exemplo de uso:
+        >>> svc = VarreduraColacaoService(repo_disc.listar_completo(),
+        ...                               POLITICA.pipeline("colacao").regras)
+        >>> svc.executar(repo_aluno.listar(), "colacao.jsonl", processos=8)
+        {'total': 30000, 'avaliados': 30000, 'aptos': 4120, 'retomados': 0, ...}
+    """
+
+    def __init__(self, catalogo: list, regras: list, regras_por_curso: dict = None):
+        """
+        :param catalogo: Registros de disciplinas (RepositorioDisciplina.listar_completo()),
+                         usados para identificar a varredura no checkpoint.
+        :param regras: Regras de colação a aplicar a cada aluno.
+        :param regras_por_curso: Regras próprias de alguns cursos, {nome: regras}
+                                 (ex: PoliticaRegras.regras_por_curso('colacao')).
+        """
+        self._catalogo = list(catalogo)
+        self._regras = list(regras)
+        self._regras_por_curso = {c: list(r) for c, r in (regras_por_curso or {}).items()}
+
+    def executar(self, alunos: list, relatorio: str, processos: int = None,
+                 tamanho_bloco: int = 500, retomar: bool = False,
+                 progresso=None) -> dict:
+        """
+        Executa a varredura e grava o relatório JSONL.
+
+        :param alunos: Registros de aluno (RepositorioAluno.listar()).
+        :param relatorio: Caminho do arquivo JSONL de saída.
+        :param processos: Número de processos trabalhadores. Padrão: um
+                          por CPU.
+        :param tamanho_bloco: Alunos por tarefa.
+        :param retomar: Se True e houver checkpoint compatível, continua a
+                        varredura anterior; caso contrário, recomeça.
+        :param progresso: Função opcional chamada como
+                          progresso(avaliados, total) a cada bloco gravado.
+        :raises ValueError: se processos ou tamanho_bloco não forem positivos.
+        :return: Dicionário com 'total', 'avaliados', 'aptos' e 'inaptos'
+                 (referentes a esta execução), 'retomados' (alunos já
+                 gravados por uma execução anterior) e 'relatorio'.
+        """
+        if processos is None:
+            processos = os.cpu_count() or 1
+        if processos <= 0 or tamanho_bloco <= 0:
+            raise ValueError("Processos e tamanho do bloco devem ser positivos.")
+
+        alunos = sorted(alunos, key=lambda r: r[2])
+        blocos = [alunos[i:i + tamanho_bloco] for i in range(0, len(alunos), tamanho_bloco)]
+        caminho_checkpoint = relatorio + ".checkpoint"
+        assinatura = {"total": len(alunos), "tamanho_bloco": tamanho_bloco,
+                      "alunos": self._resumo(alunos), "catalogo": self._resumo(self._catalogo)}
+
+        checkpoint = self._ler_checkpoint(caminho_checkpoint) if retomar else None
+        if (checkpoint is None or checkpoint.get("assinatura") != assinatura
+                or not os.path.exists(relatorio)
+                or os.path.getsize(relatorio) < checkpoint.get("bytes", 0)):
+            checkpoint = {"assinatura": assinatura, "concluidos": [], "bytes": 0}
+
+        concluidos = set(checkpoint["concluidos"])
+        retomados = sum(len(blocos[i]) for i in concluidos)
+        pendentes = [(i, b) for i, b in enumerate(blocos) if i not in concluidos]
+        avaliados, aptos = retomados, 0
+
+        with open(relatorio, "a+b") as saida:
+            saida.truncate(checkpoint["bytes"])
+            saida.seek(0, os.SEEK_END)
+            for indice, veredictos in self._avaliar(pendentes, processos):
+                for v in veredictos:
+                    saida.write(json.dumps(v, ensure_ascii=False, default=str).encode("utf-8"))
+                    saida.write(b"\n")
+                saida.flush()
+                concluidos.add(indice)
+                checkpoint["concluidos"] = sorted(concluidos)
+                checkpoint["bytes"] = saida.tell()
+                self._gravar_checkpoint(caminho_checkpoint, checkpoint)
+
+                avaliados += len(veredictos)
+                aptos += sum(1 for v in veredictos if v["apto"])
+                if progresso:
+                    progresso(avaliados, len(alunos))
+
+        if os.path.exists(caminho_checkpoint):
+            os.remove(caminho_checkpoint)
+        return {
+            "total": len(alunos),
+            "avaliados": avaliados - retomados,
+            "aptos": aptos,
+            "inaptos": avaliados - retomados - aptos,
+            "retomados": retomados,
+            "relatorio": relatorio,
+        }
+
+    def _avaliar(self, pendentes: list, processos: int):
+        """Gera (índice, veredictos) por bloco, em paralelo quando possível."""
+        if processos == 1 or len(pendentes) <= 1:
+            _inicializar_trabalhador(self._regras, self._regras_por_curso)
+            for tarefa in pendentes:
+                yield _avaliar_bloco(tarefa)
+            return
+
+        with Pool(processes=min(processos, len(pendentes)),
+                  initializer=_inicializar_trabalhador,
+                  initargs=(self._regras, self._regras_por_curso)) as pool:
+            yield from pool.imap_unordered(_avaliar_bloco, pendentes)
+
+    @staticmethod
+    def _resumo(dados) -> str:
+        """SHA-256 da representação JSON de 'dados' (chaves ordenadas)."""
+        texto = json.dumps(dados, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _ler_checkpoint(caminho: str) -> dict:
+        """Lê o checkpoint, ou None se ausente ou ilegível."""
+        try:
+            with open(caminho, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _gravar_checkpoint(caminho: str, checkpoint: dict) -> None:
+        """Grava o checkpoint de forma atômica (arquivo temporário + replace)."""
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(temporario, caminho)
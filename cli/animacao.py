@@ -0,0 +1,111 @@
+# cli/animacao.py
+"""
+Animações do CLI interativo.
+
+Carregado apenas quando há animação a exibir ('solicitacao criar' e
+'matricular' em um terminal), fora do caminho dos demais comandos.
+"""
+
+import itertools
+import sys
+import threading
+import time
+
+
+def _suporta_unicode() -> bool:
+    """Verifica se o terminal suporta UTF-8."""
+    try:
+        return sys.stdout.encoding.lower().replace("-", "") in ("utf8", "utf16", "utf32")
+    except Exception:
+        return False
+
+
+def animacao_verificando_solicitacao(duracao: float = 3.5) -> None:
+    """
+    Exibe uma animação visual impactante de verificação de solicitação no CLI.
+    Dura aproximadamente `duracao` segundos.
+    """
+    unicode_ok = _suporta_unicode()
+
+    BARRA_CHEIA  = "█" if unicode_ok else "#"
+    BARRA_VAZIA  = "░" if unicode_ok else "-"
+    SETA         = "▶" if unicode_ok else ">"
+    CHECK        = "✔" if unicode_ok else "OK"
+    ICONE_SOL    = "◈" if unicode_ok else "*"
+
+    LARGURA_BARRA = 35
+
+    etapas = [
+        (f"  {SETA}  Autenticando solicitação    ", 0.22),
+        (f"  {SETA}  Carregando dados do aluno   ", 0.20),
+        (f"  {SETA}  Verificando pré-requisitos  ", 0.25),
+        (f"  {SETA}  Analisando regras acadêmicas", 0.20),
+        (f"  {SETA}  Consultando histórico        ", 0.18),
+        (f"  {SETA}  Validando carga horária      ", 0.20),
+        (f"  {SETA}  Registrando solicitação      ", 0.22),
+    ]
+
+    # --- cabeçalho ---
+    sys.stdout.write("\n")
+    borda = "═" * 48 if unicode_ok else "=" * 48
+    sys.stdout.write(f"  {borda}\n")
+    sys.stdout.write(f"    {ICONE_SOL}  SGSA — PROCESSANDO SOLICITAÇÃO  {ICONE_SOL}\n")
+    sys.stdout.write(f"  {borda}\n\n")
+    sys.stdout.flush()
+
+    tempo_por_etapa = duracao / len(etapas)
+
+    for label, _ in etapas:
+        total_passos = int(tempo_por_etapa / 0.045)
+        total_passos = max(total_passos, 8)
+
+        for i in range(total_passos + 1):
+            progresso = i / total_passos
+            cheias = int(LARGURA_BARRA * progresso)
+            vazias = LARGURA_BARRA - cheias
+            barra = BARRA_CHEIA * cheias + BARRA_VAZIA * vazias
+            pct = int(progresso * 100)
+            sys.stdout.write(f"\r{label}  [{barra}] {pct:>3}%")
+            sys.stdout.flush()
+            time.sleep(0.045)
+
+        sys.stdout.write(f"\r{label}  [{BARRA_CHEIA * LARGURA_BARRA}] {CHECK}\n")
+        sys.stdout.flush()
+
+    # --- rodapé ---
+    sys.stdout.write("\n")
+    sys.stdout.write(f"  {borda}\n")
+    sys.stdout.flush()
+    time.sleep(0.15)
+
+
+class Spinner:
+    """
+    Spinner simples usado em operações rápidas que não usam a animação completa.
+    """
+    FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"] if _suporta_unicode() \
+             else ["|", "/", "-", "\\"]
+
+    def __init__(self, mensagem: str = "Processando", delay: float = 0.08):
+        self.mensagem = mensagem
+        self.delay = delay
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._spin, daemon=True)
+
+    def _spin(self):
+        for frame in itertools.cycle(self.FRAMES):
+            if self._stop_event.is_set():
+                break
+            sys.stdout.write(f"\r   {frame}  {self.mensagem}...")
+            sys.stdout.flush()
+            time.sleep(self.delay)
+        sys.stdout.write("\r" + " " * (len(self.mensagem) + 10) + "\r")
+        sys.stdout.flush()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop_event.set()
+        self._thread.join()
@@ -0,0 +1,389 @@
+# cli/demo.py
+"""
+Comando 'demo': cenários pré-configurados que demonstram casos de aceite
+e de negação para cada tipo de solicitação.
+
+Carregado apenas pelo comando 'demo'.
+"""
+
+import datetime
+
+from application.solicitacao_service import SolicitacaoService
+from cli.protocolo import gerar_protocolo, processar_solicitacao
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+from domain.excecoes import ViolacaoRegraAcademicaError
+
+
+def imprimir_estatisticas_regras(politica, cache) -> None:
+    """
+    Exibe custo e taxa de rejeição de cada regra, por tipo de solicitação.
+
+    :param politica: PoliticaRegras cujos pipelines foram usados.
+    :param cache: CacheResultadosRegras compartilhado pelos pipelines.
+    """
+    print("\n📈 Estatísticas dos pipelines de regras:")
+    for pipeline in politica.pipelines().values():
+        print(f"  [{pipeline.nome}]")
+        for e in pipeline.estatisticas():
+            print(f"    {e['posicao']}. {e['regra']:<28} execuções: {e['execucoes']:>5} | "
+                  f"rejeições: {e['rejeicoes']:>5} ({e['taxa_rejeicao']:.0%}) | "
+                  f"custo médio: {e['custo_medio_us']:.1f}µs")
+    c = cache.estatisticas()
+    print(f"  [cache] acertos: {c['acertos']} | faltas: {c['faltas']} | "
+          f"taxa de acerto: {c['taxa_acerto']:.0%} | "
+          f"entradas: {c['tamanho']}/{c['capacidade']} | descartes: {c['descartes']}")
+
+
+def _linha_separadora(char: str = "─", largura: int = 60) -> str:
+    """Retorna uma linha separadora formatada."""
+    return char * largura
+
+
+def _cabecalho_cenario(numero: int, titulo: str) -> None:
+    """Imprime o cabeçalho de um cenário de demonstração."""
+    print(f"\n{'═' * 60}")
+    print(f"  CENÁRIO {numero}: {titulo}")
+    print('═' * 60)
+
+
+def _resultado(status: str, motivo: str = "") -> None:
+    """Imprime o resultado de um cenário com ícone visual."""
+    if status == "Aprovada":
+        icone = "✅ APROVADA"
+    elif status == "Rejeitada":
+        icone = "❌ REJEITADA"
+    else:
+        icone = f"⚠️  {status.upper()}"
+
+    print(f"\n  Resultado: {icone}")
+    if motivo:
+        print(f"  Motivo:    {motivo}")
+    print("─" * 60)
+
+
+def executar_demo(repo_sol, politica, cache) -> None:
+    """
+    Executa cenários de demonstração que mostram claramente quando
+    solicitações são ACEITAS e quando são NEGADAS.
+
+    Cenários cobertos:
+        1.  Matrícula ACEITA  — sem pré-requisitos, sem co-requisitos.
+        2.  Matrícula NEGADA  — pré-requisito não cumprido.
+        3.  Matrícula NEGADA  — co-requisito não matriculado simultaneamente.
+        4.  Matrícula NEGADA  — limite de carga horária semestral excedido.
+        5.  Trancamento ACEITO — vínculo ativo, dentro do prazo.
+        6.  Trancamento NEGADO — prazo acadêmico encerrado.
+        7.  Trancamento NEGADO — limite de 4 trancamentos atingido.
+        8.  Trancamento NEGADO — vínculo já trancado (duplo trancamento).
+        9.  Colação ACEITA  — currículo integralizado, sem pendências.
+        10. Colação NEGADA  — disciplina obrigatória não concluída.
+        11. Colação NEGADA  — pendência documental em aberto.
+        12. Colação NEGADA  — créditos insuficientes.
+
+    :param repo_sol: Repositório onde as solicitações são registradas.
+    :param politica: PoliticaRegras que fornece os pipelines (sem calendário:
+                     os cenários de trancamento usam os próprios prazos).
+    :param cache: CacheResultadosRegras da política, para as estatísticas.
+    """
+    service = SolicitacaoService(notificacao_service=None)
+
+    print("\n" + "═" * 60)
+    print("  DEMONSTRAÇÃO: CASOS DE ACEITE E NEGAÇÃO DE SOLICITAÇÕES")
+    print("  Sistema de Gestão de Solicitações Acadêmicas (SGSA)")
+    print("═" * 60)
+
+    def _aluno(nome, mat, curso_nome="Eng. Software", limite_horas=360):
+        curso = Curso(curso_nome, limite_horas_semestrais=limite_horas)
+        return Aluno(nome, f"{mat}@sgsa.edu.br", mat, curso)
+
+    def _disc(nome, carga=72, obrigatoria=True):
+        return Disciplina(nome=nome, carga_horaria=carga, obrigatoria=obrigatoria)
+
+    # ===============================================================
+    # BLOCO 1 — SOLICITAÇÕES DE MATRÍCULA
+    # ===============================================================
+    print("\n\n  ► BLOCO 1: SOLICITAÇÕES DE MATRÍCULA\n")
+
+    # Cenário 1: Matrícula ACEITA
+    _cabecalho_cenario(1, "Matrícula ACEITA — sem restrições")
+    aluno = _aluno("Carlos Mendes", "MAT001")
+    disc_poo = _disc("Programação Orientada a Objetos", 60)
+    print(f"  Aluno:      {aluno.nome} (mat. {aluno.matricula})")
+    print(f"  Disciplina: {disc_poo.nome} ({disc_poo.carga_horaria}h)")
+    print("  Pré-req.:   nenhum  |  Co-req.: nenhum  |  Carga atual: 0h")
+    try:
+        sol = service.criar_solicitacao("matricula", aluno, disc_poo)
+        service.aplicar_regras(sol, politica.pipeline("matricula"))
+        status = processar_solicitacao(sol, service, repo_sol, "matricula", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 2: Matrícula NEGADA — pré-requisito
+    _cabecalho_cenario(2, "Matrícula NEGADA — pré-requisito não cumprido")
+    aluno2 = _aluno("Fernanda Costa", "MAT002")
+    calc1 = _disc("Cálculo I", 72)
+    calc2 = _disc("Cálculo II", 72)
+    calc2.adicionar_pre_requisito(calc1)
+    print(f"  Aluno:      {aluno2.nome} (mat. {aluno2.matricula})")
+    print(f"  Disciplina: {calc2.nome} — exige pré-req.: {calc1.nome}")
+    print("  Histórico:  Cálculo I → NÃO cursado")
+    try:
+        sol2 = service.criar_solicitacao("matricula", aluno2, calc2)
+        service.aplicar_regras(sol2, politica.pipeline("matricula"))
+        status = processar_solicitacao(sol2, service, repo_sol, "matricula", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol2.avancar(); sol2.rejeitar()
+        sol2.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol2, "matricula")
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 3: Matrícula NEGADA — co-requisito
+    _cabecalho_cenario(3, "Matrícula NEGADA — co-requisito não matriculado simultaneamente")
+    aluno3 = _aluno("Lucas Alves", "MAT003")
+    teoria = _disc("Física Teórica", 60)
+    lab = _disc("Laboratório de Física", 30)
+    teoria.adicionar_co_requisito(lab)
+    print(f"  Aluno:      {aluno3.nome} (mat. {aluno3.matricula})")
+    print(f"  Disciplina: {teoria.nome} — exige co-req. simultâneo: {lab.nome}")
+    print("  Simultâneas informadas: nenhuma")
+    try:
+        sol3 = service.criar_solicitacao("matricula", aluno3, teoria)
+        service.aplicar_regras(sol3, politica.pipeline("matricula"))
+        status = processar_solicitacao(sol3, service, repo_sol, "matricula", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol3.avancar(); sol3.rejeitar()
+        sol3.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol3, "matricula")
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 4: Matrícula NEGADA — carga horária
+    _cabecalho_cenario(4, "Matrícula NEGADA — limite de carga horária excedido")
+    aluno4 = _aluno("Beatriz Lima", "MAT004", limite_horas=200)
+    disc_pesada = _disc("Projeto de Sistemas", 120)
+    sol4 = service.criar_solicitacao("matricula", aluno4, disc_pesada)
+    sol4.carga_horaria_semestre_atual = 100
+    print(f"  Aluno:      {aluno4.nome} (mat. {aluno4.matricula})")
+    print(f"  Disciplina: {disc_pesada.nome} ({disc_pesada.carga_horaria}h)")
+    print(f"  Limite: {aluno4.curso.limite_horas_semestrais}h  |  "
+          f"Atual: {sol4.carga_horaria_semestre_atual}h  |  "
+          f"Total seria: {sol4.carga_horaria_semestre_atual + disc_pesada.carga_horaria}h")
+    try:
+        service.aplicar_regras(sol4, politica.pipeline("matricula"))
+        status = processar_solicitacao(sol4, service, repo_sol, "matricula", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol4.avancar(); sol4.rejeitar()
+        sol4.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol4, "matricula")
+        _resultado("Rejeitada", str(e))
+
+    # ===============================================================
+    # BLOCO 2 — SOLICITAÇÕES DE TRANCAMENTO
+    # ===============================================================
+    print("\n\n  ► BLOCO 2: SOLICITAÇÕES DE TRANCAMENTO\n")
+    disc_tran = _disc("Banco de Dados", 60)
+    prazo_ok = datetime.date.today() + datetime.timedelta(days=30)
+    prazo_vencido = datetime.date.today() - datetime.timedelta(days=10)
+
+    # Cenário 5: Trancamento ACEITO
+    _cabecalho_cenario(5, "Trancamento ACEITO — dentro do prazo, vínculo ativo")
+    aluno5 = _aluno("Roberto Nunes", "TRA001")
+    print(f"  Aluno:      {aluno5.nome} (mat. {aluno5.matricula})")
+    print(f"  Vínculo:    {aluno5.historico.status_vinculo}  |  "
+          f"Trancamentos: {aluno5.historico.trancamentos}/4  |  "
+          f"Prazo: {prazo_ok.strftime('%d/%m/%Y')}")
+    try:
+        sol5 = service.criar_solicitacao(
+            "trancamento", aluno5, disc_tran,
+            data=datetime.date.today(), prazo=prazo_ok)
+        service.aplicar_regras(sol5, politica.pipeline("trancamento"))
+        status = processar_solicitacao(sol5, service, repo_sol, "trancamento", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 6: Trancamento NEGADO — prazo encerrado
+    _cabecalho_cenario(6, "Trancamento NEGADO — prazo acadêmico encerrado")
+    aluno6 = _aluno("Patrícia Souza", "TRA002")
+    print(f"  Aluno:      {aluno6.nome} (mat. {aluno6.matricula})")
+    print(f"  Data: {datetime.date.today().strftime('%d/%m/%Y')}  |  "
+          f"Prazo limite: {prazo_vencido.strftime('%d/%m/%Y')} (vencido há 10 dias)")
+    try:
+        sol6 = service.criar_solicitacao(
+            "trancamento", aluno6, disc_tran,
+            data=datetime.date.today(), prazo=prazo_vencido)
+        service.aplicar_regras(sol6, politica.pipeline("trancamento"))
+        status = processar_solicitacao(sol6, service, repo_sol, "trancamento", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol6.avancar(); sol6.rejeitar()
+        sol6.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol6, "trancamento")
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 7: Trancamento NEGADO — limite atingido
+    _cabecalho_cenario(7, "Trancamento NEGADO — limite de 4 trancamentos atingido")
+    aluno7 = _aluno("Marcos Vieira", "TRA003")
+    aluno7.historico._trancamentos = 4
+    print(f"  Aluno:      {aluno7.nome} (mat. {aluno7.matricula})")
+    print(f"  Trancamentos realizados: {aluno7.historico.trancamentos}/4 (limite máximo atingido)")
+    try:
+        sol7 = service.criar_solicitacao(
+            "trancamento", aluno7, disc_tran,
+            data=datetime.date.today(), prazo=prazo_ok)
+        service.aplicar_regras(sol7, politica.pipeline("trancamento"))
+        status = processar_solicitacao(sol7, service, repo_sol, "trancamento", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol7.avancar(); sol7.rejeitar()
+        sol7.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol7, "trancamento")
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 8: Trancamento NEGADO — vínculo trancado
+    _cabecalho_cenario(8, "Trancamento NEGADO — vínculo já está 'Trancado'")
+    aluno8 = _aluno("Juliana Ramos", "TRA004")
+    aluno8.historico.status_vinculo = "Trancado"
+    print(f"  Aluno:      {aluno8.nome} (mat. {aluno8.matricula})")
+    print(f"  Vínculo atual: {aluno8.historico.status_vinculo} "
+          f"(duplo trancamento não permitido)")
+    try:
+        sol8 = service.criar_solicitacao(
+            "trancamento", aluno8, disc_tran,
+            data=datetime.date.today(), prazo=prazo_ok)
+        service.aplicar_regras(sol8, politica.pipeline("trancamento"))
+        status = processar_solicitacao(sol8, service, repo_sol, "trancamento", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol8.avancar(); sol8.rejeitar()
+        sol8.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol8, "trancamento")
+        _resultado("Rejeitada", str(e))
+
+    # ===============================================================
+    # BLOCO 3 — SOLICITAÇÕES DE COLAÇÃO DE GRAU
+    # ===============================================================
+    print("\n\n  ► BLOCO 3: SOLICITAÇÕES DE COLAÇÃO DE GRAU\n")
+
+    # Cenário 9: Colação ACEITA
+    _cabecalho_cenario(9, "Colação ACEITA — currículo completo, sem pendências")
+    curso_ads = Curso("ADS", min_horas_optativas=0)
+    tcc = _disc("TCC", 80, obrigatoria=True)
+    poo_disc = _disc("POO", 60, obrigatoria=True)
+    curso_ads.adicionar_disciplina(tcc)
+    curso_ads.adicionar_disciplina(poo_disc)
+    aluno9 = Aluno("Aline Ferreira", "aline@sgsa.edu.br", "COL001", curso_ads)
+    aluno9.historico.adicionar_disciplina(tcc, 8.5)
+    aluno9.historico.adicionar_disciplina(poo_disc, 9.0)
+    print(f"  Aluno:      {aluno9.nome} (mat. {aluno9.matricula})")
+    print("  Disciplinas: TCC (8.5) ✓ | POO (9.0) ✓")
+    print(f"  Pendências: nenhuma  |  Créditos: {aluno9.historico.total_creditos()}h")
+    try:
+        sol9 = service.criar_solicitacao("colacao", aluno9, curso_ads)
+        service.aplicar_regras(sol9, politica.pipeline("colacao"))
+        status = processar_solicitacao(sol9, service, repo_sol, "colacao", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 10: Colação NEGADA — obrigatória pendente
+    _cabecalho_cenario(10, "Colação NEGADA — disciplina obrigatória não concluída")
+    curso_si = Curso("Sistemas de Informação", min_horas_optativas=0)
+    tcc2 = _disc("TCC", 80, obrigatoria=True)
+    etica = _disc("Ética em TI", 40, obrigatoria=True)
+    curso_si.adicionar_disciplina(tcc2)
+    curso_si.adicionar_disciplina(etica)
+    aluno10 = Aluno("Diego Martins", "diego@sgsa.edu.br", "COL002", curso_si)
+    aluno10.historico.adicionar_disciplina(tcc2, 7.0)
+    # Ética em TI NÃO cursada
+    print(f"  Aluno:      {aluno10.nome} (mat. {aluno10.matricula})")
+    print("  Disciplinas: TCC (7.0) ✓ | Ética em TI → NÃO cursada ✗")
+    try:
+        sol10 = service.criar_solicitacao("colacao", aluno10, curso_si)
+        service.aplicar_regras(sol10, politica.pipeline("colacao"))
+        status = processar_solicitacao(sol10, service, repo_sol, "colacao", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol10.avancar(); sol10.rejeitar()
+        sol10.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol10, "colacao")
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 11: Colação NEGADA — pendência documental
+    _cabecalho_cenario(11, "Colação NEGADA — pendência documental em aberto")
+    curso_cc = Curso("Ciência da Computação", min_horas_optativas=0)
+    prog = _disc("Programação I", 72, obrigatoria=True)
+    prog2 = _disc("Programação II", 72, obrigatoria=True)
+    curso_cc.adicionar_disciplina(prog)
+    curso_cc.adicionar_disciplina(prog2)
+    aluno11 = Aluno("Renata Gomes", "renata@sgsa.edu.br", "COL003", curso_cc)
+    aluno11.historico.adicionar_disciplina(prog, 9.5)
+    aluno11.historico.adicionar_disciplina(prog2, 8.0)
+    aluno11.adicionar_pendencia("Débito na biblioteca")
+    aluno11.adicionar_pendencia("Certidão de nascimento pendente")
+    print(f"  Aluno:      {aluno11.nome} (mat. {aluno11.matricula})")
+    print("  Currículo:  completo ✓")
+    print(f"  Pendências: {', '.join(aluno11.pendencias)}")
+    try:
+        sol11 = service.criar_solicitacao("colacao", aluno11, curso_cc)
+        service.aplicar_regras(sol11, politica.pipeline("colacao"))
+        status = processar_solicitacao(sol11, service, repo_sol, "colacao", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol11.avancar(); sol11.rejeitar()
+        sol11.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol11, "colacao")
+        _resultado("Rejeitada", str(e))
+
+    # Cenário 12: Colação NEGADA — créditos insuficientes
+    _cabecalho_cenario(12, "Colação NEGADA — créditos insuficientes (< 80h)")
+    curso_mat = Curso("Matemática", min_horas_optativas=0)
+    intro = _disc("Introdução à Matemática", 40, obrigatoria=True)
+    curso_mat.adicionar_disciplina(intro)
+    aluno12 = Aluno("Pedro Carvalho", "pedro@sgsa.edu.br", "COL004", curso_mat)
+    aluno12.historico.adicionar_disciplina(intro, 8.0)
+    print(f"  Aluno:      {aluno12.nome} (mat. {aluno12.matricula})")
+    print(f"  Créditos: {aluno12.historico.total_creditos()}h  |  Mínimo exigido: 80h")
+    try:
+        sol12 = service.criar_solicitacao("colacao", aluno12, curso_mat)
+        service.aplicar_regras(sol12, politica.pipeline("colacao"))
+        status = processar_solicitacao(sol12, service, repo_sol, "colacao", gerar_protocolo())
+        _resultado(status)
+    except ViolacaoRegraAcademicaError as e:
+        sol12.avancar(); sol12.rejeitar()
+        sol12.protocolo = gerar_protocolo()
+        repo_sol.adicionar(sol12, "colacao")
+        _resultado("Rejeitada", str(e))
+
+    # ---------------------------------------------------------------
+    # Resumo final
+    # ---------------------------------------------------------------
+    print("\n" + "═" * 60)
+    print("  RESUMO DA DEMONSTRAÇÃO")
+    print("═" * 60)
+    print(f"  {'Cen.':<6} {'Tipo':<14} {'Resultado'}")
+    print("  " + "─" * 56)
+    resumo = [
+        ("1",  "Matrícula",   "✅ APROVADA  — sem restrições"),
+        ("2",  "Matrícula",   "❌ NEGADA    — pré-requisito não cumprido"),
+        ("3",  "Matrícula",   "❌ NEGADA    — co-requisito não simultâneo"),
+        ("4",  "Matrícula",   "❌ NEGADA    — carga horária excedida"),
+        ("5",  "Trancamento", "✅ APROVADA  — dentro do prazo, vínculo ativo"),
+        ("6",  "Trancamento", "❌ NEGADA    — prazo encerrado"),
+        ("7",  "Trancamento", "❌ NEGADA    — limite de 4 trancamentos"),
+        ("8",  "Trancamento", "❌ NEGADA    — vínculo já trancado"),
+        ("9",  "Colação",     "✅ APROVADA  — currículo completo"),
+        ("10", "Colação",     "❌ NEGADA    — disciplina obrigatória pendente"),
+        ("11", "Colação",     "❌ NEGADA    — pendência documental"),
+        ("12", "Colação",     "❌ NEGADA    — créditos insuficientes"),
+    ]
+    for num, tipo, resultado in resumo:
+        print(f"  {num:<6} {tipo:<14} {resultado}")
+    print("═" * 60)
+    imprimir_estatisticas_regras(politica, cache)
+    print()
@@ -0,0 +1,29 @@
+# cli/protocolo.py
+"""
+Protocolo e registro de solicitações aprovadas, comuns aos comandos de
+criação e à demonstração.
+"""
+
+
+def gerar_protocolo() -> str:
+    """Gera um protocolo único no formato SGSA-XXXXXXXX."""
+    import uuid  # só quem gera protocolo paga a importação
+    return f"SGSA-{uuid.uuid4().hex[:8].upper()}"
+
+
+def processar_solicitacao(sol, service, repo_sol, tipo: str, protocolo: str) -> str:
+    """
+    Aplica o fluxo de estado e persiste a solicitação como aprovada.
+
+    :param sol: Objeto Solicitacao já validado pelas regras.
+    :param service: Instância de SolicitacaoService.
+    :param repo_sol: Instância de RepositorioSolicitacao.
+    :param tipo: Tipo da solicitação.
+    :param protocolo: Código de protocolo gerado para esta solicitação.
+    :return: Status final ('Aprovada').
+    """
+    sol.avancar()  # Aberta → Em Análise
+    sol.avancar()  # Em Análise → Aprovada
+    sol.protocolo = protocolo
+    repo_sol.adicionar(sol, tipo)
+    return sol.status
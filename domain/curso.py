@@ -79,7 +79,7 @@ class Curso:
         """
         return list(self._disciplinas)
 
-    def adicionar_disciplina(self, disciplina: "Disciplina") -> None:
+    def adicionar_disciplina(self, disciplina: "Disciplina", reconstrucao: bool = False) -> None:
         """
         Adiciona uma disciplina à grade curricular do curso.
 
@@ -87,9 +87,13 @@ class Curso:
         a operação é ignorada silenciosamente.
 
         :param disciplina: Objeto Disciplina a ser vinculado ao curso.
+        :param reconstrucao: True se a grade é montada a partir do catálogo
+                             gravado; não avança a versão do catálogo.
         """
         if disciplina not in self._disciplinas:
             self._disciplinas.append(disciplina)
+            if not reconstrucao:
+                disciplina.registrar_alteracao_catalogo()
 
     def disciplinas_obrigatorias(self) -> List["Disciplina"]:
         """
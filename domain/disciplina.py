@@ -32,6 +32,14 @@ class Disciplina:
         _co_requisitos (list[Disciplina]): Disciplinas que devem ser cursadas
                         simultaneamente a esta (ex: teoria + laboratório).
 
+    Versão do catálogo:
+        Toda alteração em memória de requisitos (em qualquer disciplina) ou
+        da grade de um Curso avança Disciplina.versao_catalogo(). Resultados
+        de regras memorizados com esse carimbo deixam de valer sozinhos
+        quando o catálogo muda. Reconstruir disciplinas a partir do banco
+        (reconstrucao=True) não é alteração: o catálogo gravado tem versão
+        própria (RepositorioDisciplina.versao_catalogo()).
+
     Princípios SOLID aplicados:
         - SRP: responsabilidade única de modelar uma disciplina curricular.
         - OCP: novos tipos de vínculo entre disciplinas podem ser adicionados
@@ -73,6 +81,26 @@ class Disciplina:
         self._pre_requisitos: List["Disciplina"] = []
         self._co_requisitos: List["Disciplina"] = []
 
+    # ------------------------------------------------------------------
+    # Versão do catálogo
+    # ------------------------------------------------------------------
+
+    _versao_catalogo: int = 0
+
+    @classmethod
+    def versao_catalogo(cls) -> int:
+        """
+        Carimbo de versão das alterações do catálogo feitas em memória.
+
+        :return: Inteiro que cresce a cada alteração de requisitos ou grade.
+        """
+        return Disciplina._versao_catalogo
+
+    @classmethod
+    def registrar_alteracao_catalogo(cls) -> None:
+        """Avança a versão do catálogo (chamado pelos métodos de alteração)."""
+        Disciplina._versao_catalogo += 1
+
     # ------------------------------------------------------------------
     # Pré-requisitos
     # ------------------------------------------------------------------
@@ -91,7 +119,7 @@ class Disciplina:
         """
         return list(self._pre_requisitos)
 
-    def adicionar_pre_requisito(self, disciplina: "Disciplina") -> None:
+    def adicionar_pre_requisito(self, disciplina: "Disciplina", reconstrucao: bool = False) -> None:
         """
         Registra uma disciplina como pré-requisito desta.
 
@@ -100,9 +128,13 @@ class Disciplina:
 
         :param disciplina: Objeto Disciplina que deve ser concluída
                            (com aprovação) antes desta.
+        :param reconstrucao: True se o vínculo apenas reproduz o catálogo
+                             gravado; não avança a versão do catálogo.
         """
         if disciplina not in self._pre_requisitos:
             self._pre_requisitos.append(disciplina)
+            if not reconstrucao:
+                Disciplina.registrar_alteracao_catalogo()
 
     # ------------------------------------------------------------------
     # Co-requisitos
@@ -122,7 +154,7 @@ class Disciplina:
         """
         return list(self._co_requisitos)
 
-    def adicionar_co_requisito(self, disciplina: "Disciplina") -> None:
+    def adicionar_co_requisito(self, disciplina: "Disciplina", reconstrucao: bool = False) -> None:
         """
         Registra uma disciplina como co-requisito desta.
 
@@ -131,9 +163,13 @@ class Disciplina:
 
         :param disciplina: Objeto Disciplina que deve ser cursada
                            no mesmo semestre que esta.
+        :param reconstrucao: True se o vínculo apenas reproduz o catálogo
+                             gravado; não avança a versão do catálogo.
         """
         if disciplina not in self._co_requisitos:
             self._co_requisitos.append(disciplina)
+            if not reconstrucao:
+                Disciplina.registrar_alteracao_catalogo()
 
     # ------------------------------------------------------------------
     # Representação
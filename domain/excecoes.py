@@ -32,6 +32,9 @@ class ViolacaoRegraAcademicaError(Exception):
         regra (str | None): Nome da classe de regra que gerou a exceção,
                             ex: 'RegraPreRequisito'. Útil para logging
                             e para exibição detalhada ao usuário.
+        codigo (str | None): Código estável do motivo da violação
+                             (ver domain.resultado_validacao.Violacao).
+        parametros (dict): Valores estruturados que explicam a violação.
 
     Exemplo de uso:
         >>> raise ViolacaoRegraAcademicaError(
@@ -46,7 +49,8 @@ class ViolacaoRegraAcademicaError(Exception):
         ...     print(e)  # [Violação Acadêmica - RegraPreRequisito] ...
     """
 
-    def __init__(self, mensagem: str, regra: str = None):
+    def __init__(self, mensagem: str, regra: str = None,
+                 codigo: str = None, parametros: dict = None):
         """
         Inicializa a exceção com a mensagem descritiva e o nome da regra.
 
@@ -55,9 +59,13 @@ class ViolacaoRegraAcademicaError(Exception):
         :param regra: Nome da classe de regra que originou o erro.
                       Opcional; se omitido, a representação textual não
                       incluirá o nome da regra.
+        :param codigo: Código estável do motivo da violação. Opcional.
+        :param parametros: Valores estruturados da violação. Opcional.
         """
         super().__init__(mensagem)
         self.regra = regra
+        self.codigo = codigo
+        self.parametros = parametros or {}
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,121 @@
+# domain/grafo_curricular.py
+"""
+Módulo que representa o catálogo de disciplinas como um grafo de requisitos.
+
+Enquanto Disciplina modela uma unidade curricular isolada (com listas de
+objetos pré/co-requisito), o GrafoCurricular é uma visão compacta e somente
+leitura do catálogo inteiro: cada disciplina aparece uma única vez, com seus
+requisitos já resolvidos para nomes canônicos e armazenados em frozensets.
+Consultas que envolvem o catálogo todo (disciplinas elegíveis, planejamento,
+análises) operam sobre esta estrutura sem reconstruir objetos Disciplina.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List
+
+
+class GrafoCurricular:
+    """
+    Visão imutável do catálogo como grafo dirigido de requisitos.
+
+    Cada vértice é uma disciplina identificada pelo nome canônico. As
+    arestas ligam a disciplina aos seus pré-requisitos e co-requisitos,
+    normalizados (sem diferenciar maiúsculas) para o nome cadastrado.
+    Requisitos que não existem no catálogo são mantidos com o nome
+    informado, para que continuem bloqueando a disciplina.
+
+    Atributos públicos (somente leitura):
+        nomes (list[str]): Nomes das disciplinas, na ordem do catálogo.
+        carga (dict[str, int]): Carga horária por disciplina.
+        obrigatoria (dict[str, bool]): Obrigatoriedade por disciplina.
+        pre (dict[str, frozenset]): Pré-requisitos diretos por disciplina.
+        co (dict[str, frozenset]): Co-requisitos diretos por disciplina.
+        dependentes_pre (dict[str, tuple]): Adjacência reversa de pre
+                        (requisito → disciplinas que o exigem), calculada
+                        sob demanda na primeira consulta.
+
+    Exemplo de uso:
+        >>> grafo = GrafoCurricular.de_registros(repo_disc.listar_completo())
+        >>> grafo.pre["Cálculo II"]
+        frozenset({'Cálculo I'})
+    """
+
+    def __init__(self, nomes: List[str], carga: Dict[str, int],
+                 obrigatoria: Dict[str, bool],
+                 pre: Dict[str, FrozenSet[str]], co: Dict[str, FrozenSet[str]]):
+        """
+        Inicializa o grafo a partir de estruturas já normalizadas.
+
+        Prefira os construtores de_registros() e de_disciplinas().
+        """
+        self.nomes = nomes
+        self.carga = carga
+        self.obrigatoria = obrigatoria
+        self.pre = pre
+        self.co = co
+        self._dependentes_pre = None
+
+    @classmethod
+    def de_registros(cls, registros: Iterable[dict]) -> "GrafoCurricular":
+        """
+        Constrói o grafo a partir dos dicionários persistidos no sgsa.json.
+
+        :param registros: Dicionários com as chaves 'nome', 'carga_horaria',
+                          'obrigatoria', 'pre_requisitos' e 'co_requisitos'.
+        :return: Novo GrafoCurricular.
+        """
+        registros = list(registros)
+        canonico = {r['nome'].lower(): r['nome'] for r in registros}
+
+        def resolver(nomes_req):
+            return frozenset(canonico.get(n.lower(), n) for n in nomes_req)
+
+        nomes = [r['nome'] for r in registros]
+        return cls(
+            nomes=nomes,
+            carga={r['nome']: r['carga_horaria'] for r in registros},
+            obrigatoria={r['nome']: r.get('obrigatoria', True) for r in registros},
+            pre={r['nome']: resolver(r.get('pre_requisitos', [])) for r in registros},
+            co={r['nome']: resolver(r.get('co_requisitos', [])) for r in registros},
+        )
+
+    @classmethod
+    def de_disciplinas(cls, disciplinas: Iterable) -> "GrafoCurricular":
+        """
+        Constrói o grafo a partir de objetos Disciplina (ex: grade de um Curso).
+
+        :param disciplinas: Objetos Disciplina com pré/co-requisitos ligados.
+        :return: Novo GrafoCurricular.
+        """
+        return cls.de_registros(
+            {
+                "nome": d.nome,
+                "carga_horaria": d.carga_horaria,
+                "obrigatoria": d.obrigatoria,
+                "pre_requisitos": [p.nome for p in d.pre_requisitos],
+                "co_requisitos": [c.nome for c in d.co_requisitos],
+            }
+            for d in disciplinas
+        )
+
+    @property
+    def dependentes_pre(self) -> Dict[str, tuple]:
+        """
+        Adjacência reversa dos pré-requisitos (requisito → dependentes).
+
+        :return: Dicionário {nome_requisito: (nomes_dependentes, ...)}.
+        """
+        if self._dependentes_pre is None:
+            reverso: Dict[str, list] = {}
+            for nome in self.nomes:
+                for req in self.pre[nome]:
+                    reverso.setdefault(req, []).append(nome)
+            self._dependentes_pre = {k: tuple(v) for k, v in reverso.items()}
+        return self._dependentes_pre
+
+    def __len__(self) -> int:
+        """Retorna o número de disciplinas do catálogo."""
+        return len(self.nomes)
+
+    def __contains__(self, nome: str) -> bool:
+        """Indica se a disciplina (pelo nome canônico) pertence ao grafo."""
+        return nome in self.carga
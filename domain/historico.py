@@ -8,11 +8,16 @@ pelas regras de validação para verificar aprovações, calcular créditos,
 contar trancamentos e checar o status do vínculo.
 """
 
+import itertools
 from typing import Dict, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from domain.disciplina import Disciplina
 
+# Fonte única de carimbos das alterações em memória: nenhum par de
+# históricos (nem dois estados do mesmo histórico) compartilha o mesmo valor.
+_versoes = itertools.count(1)
+
 
 class Historico:
     """
@@ -34,6 +39,12 @@ class Historico:
         _status_vinculo (str): Status atual do vínculo institucional
                                do aluno. Valores possíveis: 'Ativo',
                                'Trancado', 'Egresso'.
+        _versao (int | tuple): Carimbo de versão, renovado a cada
+                       alteração. Permite memorizar resultados de regras
+                       enquanto o histórico não muda (ver
+                       CacheResultadosRegras). Um histórico carregado do
+                       banco adota a versão dos dados persistidos
+                       (ver carimbar()).
 
     Constante de classe:
         NOTA_MINIMA_APROVACAO (float): Nota mínima para aprovação.
@@ -61,6 +72,38 @@ class Historico:
         self._disciplinas: Dict["Disciplina", float] = {}
         self._trancamentos: int = 0
         self._status_vinculo: str = "Ativo"
+        self._versao: int = next(_versoes)
+
+    @property
+    def versao(self) -> int:
+        """
+        Carimbo de versão do histórico.
+
+        Renovada a cada alteração (disciplina, trancamento ou vínculo) e
+        única entre todas as instâncias de Historico, de modo que
+        (matrícula, versao) identifica um estado do histórico. Históricos
+        carimbados com a mesma versão persistida compartilham o valor
+        até a primeira alteração em memória.
+
+        :return: Inteiro positivo, ou a tupla ('persistido', versão)
+                 definida por carimbar().
+        """
+        return self._versao
+
+    def carimbar(self, versao_persistida) -> None:
+        """
+        Adota a versão dos dados persistidos de onde o histórico foi carregado.
+
+        Cada requisição do CLI, do servidor ou da API recarrega o aluno do
+        banco em um objeto novo; com o carimbo, dois carregamentos dos
+        mesmos dados têm a mesma versão e reaproveitam os resultados
+        memorizados das regras.
+
+        :param versao_persistida: Valor hashable que muda sempre que os
+                                  dados de origem mudam (ex: o próprio
+                                  registro do aluno).
+        """
+        self._versao = ("persistido", versao_persistida)
 
     # ------------------------------------------------------------------
     # Disciplinas e notas
@@ -80,6 +123,7 @@ class Historico:
                      indicam reprovação.
         """
         self._disciplinas[disciplina] = nota
+        self._versao = next(_versoes)
 
     def foi_aprovado(self, disciplina: "Disciplina") -> bool:
         """
@@ -152,6 +196,7 @@ class Historico:
         efetivamente concedido e processado pelo setor acadêmico.
         """
         self._trancamentos += 1
+        self._versao = next(_versoes)
 
     # ------------------------------------------------------------------
     # Status de vínculo
@@ -194,3 +239,4 @@ class Historico:
                 f"Valores aceitos: {sorted(permitidos)}."
             )
         self._status_vinculo = novo_status
+        self._versao = next(_versoes)
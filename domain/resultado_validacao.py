@@ -0,0 +1,148 @@
+# domain/resultado_validacao.py
+"""
+Módulo que representa o resultado da validação de regras sem exceções.
+
+Enquanto ViolacaoRegraAcademicaError interrompe a validação na primeira
+falha, Violacao e ResultadoValidacao permitem coletar todas as violações
+de uma solicitação como dados: cada violação carrega um código estável e
+os parâmetros que a explicam, e o texto para o usuário só é montado
+quando alguém o exibe. Isso barateia o processamento em lote, onde a
+maior parte dos resultados é contada ou filtrada por código e nunca
+chega a ser impressa.
+"""
+
+from domain.excecoes import ViolacaoRegraAcademicaError
+
+
+class Violacao:
+    """
+    Uma violação de regra acadêmica, com formatação preguiçosa da mensagem.
+
+    Atributos:
+        regra (str): Nome da classe de regra que detectou a violação.
+        codigo (str): Identificador estável do motivo (ex:
+                      'pre_requisito_pendente'), próprio para filtros,
+                      contagens e tradução.
+        parametros (dict): Valores que explicam a violação (ex: a lista
+                           de pré-requisitos pendentes).
+
+    O modelo da mensagem é um str.format comum; listas e tuplas são
+    unidas por vírgula no momento da formatação, e datas podem usar
+    especificadores como {prazo:%d/%m/%Y}.
+
+    Exemplo de uso:
+        >>> v = Violacao("RegraCreditos", "creditos_insuficientes",
+        ...              "Créditos insuficientes. Mínimo: {minimo}h, total: {total}h.",
+        ...              minimo=80, total=40)
+        >>> v.codigo, v.parametros
+        ('creditos_insuficientes', {'minimo': 80, 'total': 40})
+        >>> v.mensagem          # formatada apenas aqui
+        'Créditos insuficientes. Mínimo: 80h, total: 40h.'
+    """
+
+    __slots__ = ("regra", "codigo", "parametros", "_modelo", "_mensagem")
+
+    def __init__(self, regra: str, codigo: str, modelo: str, **parametros):
+        """
+        :param regra: Nome da classe de regra que detectou a violação.
+        :param codigo: Código estável do motivo da violação.
+        :param modelo: Modelo str.format da mensagem para o usuário.
+        :param parametros: Valores referenciados pelo modelo.
+        """
+        self.regra = regra
+        self.codigo = codigo
+        self.parametros = parametros
+        self._modelo = modelo
+        self._mensagem = None
+
+    @classmethod
+    def de_excecao(cls, erro: ViolacaoRegraAcademicaError) -> "Violacao":
+        """
+        Converte uma exceção lançada por uma regra em Violacao.
+
+        Usado para regras que só implementam validar(); a mensagem já vem
+        formatada e o código é o da exceção (ou 'violacao', se ausente).
+        """
+        violacao = cls(erro.regra, getattr(erro, "codigo", None) or "violacao", "",
+                       **(getattr(erro, "parametros", None) or {}))
+        violacao._mensagem = erro.args[0]
+        return violacao
+
+    @property
+    def mensagem(self) -> str:
+        """Mensagem para o usuário, formatada no primeiro acesso."""
+        if self._mensagem is None:
+            valores = {
+                k: ", ".join(map(str, v)) if isinstance(v, (list, tuple)) else v
+                for k, v in self.parametros.items()
+            }
+            self._mensagem = self._modelo.format(**valores)
+        return self._mensagem
+
+    def como_excecao(self) -> ViolacaoRegraAcademicaError:
+        """Retorna a exceção equivalente, para a API que interrompe na falha."""
+        return ViolacaoRegraAcademicaError(self.mensagem, self.regra,
+                                           codigo=self.codigo, parametros=self.parametros)
+
+    def como_dict(self) -> dict:
+        """Representação serializável (sem formatar a mensagem)."""
+        return {"regra": self.regra, "codigo": self.codigo, "parametros": self.parametros}
+
+    def __str__(self) -> str:
+        """Mesmo formato textual de ViolacaoRegraAcademicaError."""
+        if self.regra:
+            return f"[Violação Acadêmica - {self.regra}] {self.mensagem}"
+        return f"[Violação Acadêmica] {self.mensagem}"
+
+    def __repr__(self) -> str:
+        return f"Violacao({self.regra!r}, {self.codigo!r}, {self.parametros!r})"
+
+
+class ResultadoValidacao:
+    """
+    Resultado da avaliação de um conjunto de regras sobre uma solicitação.
+
+    Avaliado como booleano, indica se a solicitação foi aprovada por
+    todas as regras.
+
+    Exemplo de uso:
+        >>> resultado = service.avaliar_regras(sol, POLITICA.pipeline("matricula"))
+        >>> if not resultado:
+        ...     for v in resultado.violacoes:
+        ...         print(v)
+    """
+
+    __slots__ = ("violacoes",)
+
+    def __init__(self, violacoes: list = None):
+        """
+        :param violacoes: Lista de objetos Violacao (vazia se aprovado).
+        """
+        self.violacoes = violacoes if violacoes is not None else []
+
+    @property
+    def aprovado(self) -> bool:
+        """True se nenhuma regra foi violada."""
+        return not self.violacoes
+
+    @property
+    def codigos(self) -> list:
+        """Códigos das violações, na ordem em que foram detectadas."""
+        return [v.codigo for v in self.violacoes]
+
+    def levantar(self) -> bool:
+        """
+        Lança a primeira violação como ViolacaoRegraAcademicaError.
+
+        :raises ViolacaoRegraAcademicaError: se houver alguma violação.
+        :return: True se aprovado.
+        """
+        if self.violacoes:
+            raise self.violacoes[0].como_excecao()
+        return True
+
+    def __bool__(self) -> bool:
+        return self.aprovado
+
+    def __repr__(self) -> str:
+        return f"ResultadoValidacao({self.violacoes!r})"
@@ -10,6 +10,10 @@ class Solicitacao:
     em código externo, garantindo a consistência do fluxo.
     """
 
+    # Tipo da solicitação ('matricula', 'trancamento', 'colacao'), usado
+    # para consultar a política de regras e o calendário acadêmico
+    TIPO = None
+
     def __init__(self, aluno, disciplina=None, curso=None):
         self.aluno = aluno
         self._disciplina = disciplina
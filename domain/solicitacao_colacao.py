@@ -44,6 +44,8 @@ class SolicitacaoColacao(Solicitacao):
         ... ])
     """
 
+    TIPO = "colacao"
+
     def __init__(self, aluno, curso):
         """
         Inicializa o pedido de colação de grau vinculado ao curso.
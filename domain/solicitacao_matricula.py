@@ -39,7 +39,11 @@ class SolicitacaoMatricula(Solicitacao):
     Atributo opcional da solicitação (definido externamente):
         carga_horaria_semestre_atual (int): total de horas já matriculadas
             no semestre corrente, necessário para RegraLimiteCargaHoraria.
-            Deve ser definido antes de aplicar as regras.
+            Deve ser definido antes de aplicar as regras; o CLI o obtém
+            de RepositorioSolicitacao.carga_semestral().
+        semestre (str): Semestre letivo da matrícula (ex: '2026.1').
+            Se definido, a matrícula aprovada entra na carga semestral
+            persistida do aluno.
 
     Exemplo de uso:
         >>> sol = SolicitacaoMatricula(aluno, calc2,
@@ -48,6 +52,8 @@ class SolicitacaoMatricula(Solicitacao):
         >>> service.aplicar_regras(sol, regras_matricula)
     """
 
+    TIPO = "matricula"
+
     def __init__(self, aluno, disciplina,
                  disciplinas_co_req_solicitadas=None):
         """
@@ -65,3 +71,5 @@ class SolicitacaoMatricula(Solicitacao):
         self.disciplinas_co_req_solicitadas = disciplinas_co_req_solicitadas or []
         # Carga horária já matriculada no semestre (consultada por RegraLimiteCargaHoraria)
         self.carga_horaria_semestre_atual: int = 0
+        # Semestre letivo (contabilizado na carga semestral quando aprovada)
+        self.semestre: str = None
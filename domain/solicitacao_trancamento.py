@@ -37,6 +37,9 @@ class SolicitacaoTrancamento(Solicitacao):
         prazo (datetime.date): Último dia permitido para trancamento
                                conforme o calendário acadêmico.
                                Padrão: hoje (sem prazo restritivo).
+        semestre (str): Semestre letivo do trancamento (ex: '2026.1').
+                        Se definido, o trancamento aprovado retira a
+                        disciplina da carga semestral persistida.
 
     Exemplo de uso:
         >>> prazo_semestre = datetime.date(2025, 10, 31)
@@ -46,6 +49,8 @@ class SolicitacaoTrancamento(Solicitacao):
         >>> service.aplicar_regras(sol, regras_trancamento)
     """
 
+    TIPO = "trancamento"
+
     def __init__(self, aluno, disciplina,
                  data: datetime.date = None,
                  prazo: datetime.date = None):
@@ -63,3 +68,4 @@ class SolicitacaoTrancamento(Solicitacao):
         super().__init__(aluno, disciplina=disciplina)
         self.data = data or datetime.date.today()
         self.prazo = prazo or datetime.date.today()
+        self.semestre: str = None
@@ -12,20 +12,107 @@ Funções disponíveis:
     - init_db(): cria o arquivo com estrutura inicial se não existir.
     - load_db(): lê e retorna todos os dados do arquivo.
     - save_db(data): sobrescreve o arquivo com os dados fornecidos.
+    - ativar_cache(): mantém o conteúdo lido em memória entre chamadas
+      (processos de longa duração, como o servidor 'serve').
+    - versao_db(): identifica a versão atual do arquivo.
+    - adiar_gravacao() / confirmar(): agrupam várias gravações em uma
+      única escrita do arquivo (comando 'batch').
+    - iterar_colecao(chave): percorre os registros de uma coleção sem
+      carregar o arquivo inteiro (exportações).
 """
 
 import json
 import os
+import re
+
+from infrastructure.medicao import fase
 
 DB_FILE = "sgsa.json"
 
 _ESTRUTURA_PADRAO = {
     "alunos": [],
     "disciplinas": [],
-    "solicitacoes": []
+    "solicitacoes": [],
+    "calendario": [],
+    "carga_semestral": {}
 }
 
 
+# Conteúdo já lido, reaproveitado enquanto o arquivo não mudar (ver ativar_cache)
+_cache = {"ativo": False, "versao": None, "dados": None, "adiado": False, "pendente": False}
+
+
+def ativar_cache(ativo: bool = True) -> None:
+    """
+    Liga ou desliga a reutilização do conteúdo lido entre chamadas.
+
+    Com o cache ativo, load_db() só relê e interpreta o arquivo quando
+    ele muda (ver versao_db()); caso contrário, devolve o
+    mesmo dicionário da leitura anterior. save_db() atualiza o cache com
+    o que gravou. Como o dicionário é compartilhado, quem o altera deve
+    sempre chamar save_db() em seguida — o mesmo contrato de sempre.
+
+    Indicado para processos de longa duração; no CLI de uma única
+    execução o arquivo é lido poucas vezes e o cache não é usado.
+
+    :param ativo: True para ativar; False para desativar e descartar.
+    """
+    _cache.update(ativo=ativo, versao=None, dados=None)
+
+
+def adiar_gravacao(adiar: bool = True) -> None:
+    """
+    Liga ou desliga o agrupamento de gravações.
+
+    Com o agrupamento ligado, save_db() apenas guarda os dados em memória
+    (o cache é ativado) e load_db() devolve esses dados; o arquivo só é
+    reescrito em confirmar(). Outros processos veem o banco como estava
+    na última confirmação, e uma interrupção antes dela descarta todas as
+    gravações do grupo de uma vez.
+
+    :param adiar: True para agrupar; False para voltar a gravar a cada
+                  save_db() (gravações pendentes são descartadas — chame
+                  confirmar() antes para mantê-las).
+    """
+    if adiar:
+        if not _cache["ativo"]:
+            ativar_cache()
+        _cache["adiado"] = True
+    else:
+        _cache.update(adiado=False, pendente=False, versao=None, dados=None)
+
+
+def confirmar() -> None:
+    """Grava no arquivo, de uma só vez, as alterações pendentes do grupo."""
+    if _cache["pendente"]:
+        _gravar_arquivo(_cache["dados"])
+        _cache.update(versao=versao_db(), pendente=False)
+
+
+def versao_db() -> tuple:
+    """
+    Identifica a versão atual do arquivo do banco.
+
+    Além da data de modificação e do tamanho, usa o inode: toda gravação
+    substitui o arquivo com os.replace(), que sempre cria um inode novo.
+    Assim, uma regravação de mesmo tamanho dentro da mesma marca de tempo
+    do sistema de arquivos também muda a versão.
+
+    :return: Tupla (caminho, inode, mtime_ns, tamanho), ou None se o
+             arquivo não existir.
+    """
+    try:
+        info = os.stat(DB_FILE)
+    except OSError:
+        return None
+    return DB_FILE, info.st_ino, info.st_mtime_ns, info.st_size
+
+
+def _estrutura_vazia() -> dict:
+    """Retorna uma cópia da estrutura padrão com coleções novas (não compartilhadas)."""
+    return {chave: type(vazio)() for chave, vazio in _ESTRUTURA_PADRAO.items()}
+
+
 def init_db() -> None:
     """
     Inicializa o arquivo JSON de persistência com a estrutura básica.
@@ -47,9 +134,10 @@ def init_db() -> None:
         ✅ Ficheiro sgsa.json criado com sucesso.
         # (ou silêncio, se o arquivo já existia)
     """
-    if not os.path.exists(DB_FILE):
-        save_db(dict(_ESTRUTURA_PADRAO))
-        print(f"✅ Ficheiro {DB_FILE} criado com sucesso.")
+    with fase("init_db"):
+        if not os.path.exists(DB_FILE):
+            save_db(_estrutura_vazia())
+            print(f"✅ Ficheiro {DB_FILE} criado com sucesso.")
 
 
 def load_db() -> dict:
@@ -68,28 +156,40 @@ def load_db() -> dict:
     """
     if not os.path.exists(DB_FILE):
         init_db()
-        return dict(_ESTRUTURA_PADRAO)
+        return _estrutura_vazia()
 
-    with open(DB_FILE, "r", encoding="utf-8") as f:
-        conteudo = f.read().strip()
+    if _cache["adiado"] and _cache["dados"] is not None:
+        return _cache["dados"]  # o arquivo ainda não tem as gravações do grupo
+    # A versão é obtida antes da leitura: uma gravação concorrente apenas
+    # invalida o cache na próxima chamada, nunca o associa ao conteúdo antigo
+    versao = versao_db() if _cache["ativo"] else None
+    if versao is not None and versao == _cache["versao"]:
+        return _cache["dados"]
 
-    # Arquivo vazio ou corrompido: recria com estrutura padrão
-    if not conteudo:
-        dados = dict(_ESTRUTURA_PADRAO)
-        save_db(dados)
-        return dados
+    with fase("load_db"):
+        with open(DB_FILE, "r", encoding="utf-8") as f:
+            conteudo = f.read().strip()
 
-    try:
-        dados = json.loads(conteudo)
-        # Garante que todas as chaves obrigatórias existem
-        for chave in _ESTRUTURA_PADRAO:
-            dados.setdefault(chave, [])
-        return dados
-    except json.JSONDecodeError:
-        print(f"⚠️  Arquivo {DB_FILE} corrompido. Recriando com estrutura padrão...")
-        dados = dict(_ESTRUTURA_PADRAO)
-        save_db(dados)
-        return dados
+        # Arquivo vazio ou corrompido: recria com estrutura padrão
+        if not conteudo:
+            dados = _estrutura_vazia()
+            save_db(dados)
+            return dados
+
+        try:
+            with fase("parse"):
+                dados = json.loads(conteudo)
+            # Garante que todas as chaves obrigatórias existem
+            for chave, vazio in _ESTRUTURA_PADRAO.items():
+                dados.setdefault(chave, type(vazio)())
+            if versao is not None:
+                _cache.update(versao=versao, dados=dados)
+            return dados
+        except json.JSONDecodeError:
+            print(f"⚠️  Arquivo {DB_FILE} corrompido. Recriando com estrutura padrão...")
+            dados = _estrutura_vazia()
+            save_db(dados)
+            return dados
 
 
 def save_db(data: dict) -> None:
@@ -104,9 +204,189 @@ def save_db(data: dict) -> None:
     atualizações parciais, use load_db(), modifique o dicionário e
     chame save_db() com o dicionário completo.
 
+    O conteúdo é escrito em um arquivo temporário e colocado no lugar
+    do original com os.replace(): uma interrupção no meio da gravação
+    nunca deixa o banco pela metade.
+
+    Com adiar_gravacao() ligado, os dados ficam em memória até confirmar().
+
     :param data: Dicionário completo com todos os dados a serem salvos.
                  Deve conter as chaves 'alunos', 'disciplinas' e
                  'solicitacoes'.
     """
-    with open(DB_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+    if _cache["adiado"]:
+        _cache.update(dados=data, pendente=True)
+        return
+    _gravar_arquivo(data)
+    if _cache["ativo"]:
+        _cache.update(versao=versao_db(), dados=data)
+
+
+def _gravar_arquivo(data: dict) -> None:
+    """Escreve o arquivo de forma atômica (temporário + os.replace)."""
+    temporario = DB_FILE + ".tmp"
+    with fase("persistencia"):
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        os.replace(temporario, DB_FILE)
+
+# ---------------------------------------------------------------------------
+# Leitura incremental (exportações de bancos grandes)
+# ---------------------------------------------------------------------------
+
+_TAMANHO_BLOCO = 1 << 16
+_ESPACOS = re.compile(r"[ \t\n\r]*")
+_DELIMITADORES = frozenset(",:]} \t\n\r")
+_SEPARADOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+
+def iterar_colecao(chave: str):
+    """
+    Percorre os registros de uma coleção do banco, um de cada vez.
+
+    Diferente de load_db(), o arquivo é lido em blocos e apenas um
+    registro por vez é interpretado: a memória usada não cresce com o
+    tamanho do banco. As demais coleções são atravessadas da mesma forma
+    e descartadas. Com o cache ativo e atualizado (ou gravações
+    pendentes), percorre os dados já em memória.
+
+    :param chave: Nome da coleção (ex.: 'solicitacoes').
+    :raises ValueError: se o arquivo estiver corrompido.
+    :return: Gerador dos registros (dicionários), na ordem do arquivo.
+    """
+    dados = _cache["dados"]
+    if dados is not None and (_cache["adiado"] or
+                              (_cache["ativo"] and versao_db() == _cache["versao"])):
+        yield from dados.get(chave, [])
+        return
+    if not os.path.exists(DB_FILE):
+        return
+
+    with open(DB_FILE, "r", encoding="utf-8") as f:
+        leitor = _LeitorJSON(f)
+        if leitor.proximo() == "":
+            return  # arquivo vazio
+        leitor.esperar("{")
+        if leitor.proximo() == "}":
+            return
+        while True:
+            nome = leitor.valor()
+            leitor.esperar(":")
+            if nome != chave:
+                leitor.pular()
+            elif leitor.proximo() != "[":
+                yield from leitor.valor() or []
+                return
+            else:
+                yield from leitor.elementos()
+                return
+            if leitor.consumir() == "}":
+                return  # coleção ausente
+
+
+class _LeitorJSON:
+    """
+    Leitor de JSON em blocos para iterar_colecao().
+
+    Cada valor é interpretado por json.JSONDecoder.raw_decode() sobre um
+    buffer que recebe novos blocos do arquivo conforme necessário.
+    """
+
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+        self._buffer = ""
+        self._pos = 0
+        self._fim = False
+        # Leitor interno do json (em C quando disponível), sem o invólucro de raw_decode()
+        self._interpretar = json.JSONDecoder().scan_once
+
+    def _carregar(self) -> bool:
+        """Acrescenta um bloco ao buffer; False no fim do arquivo."""
+        if self._fim:
+            return False
+        bloco = self._arquivo.read(_TAMANHO_BLOCO)
+        if not bloco:
+            self._fim = True
+            return False
+        if self._pos >= _TAMANHO_BLOCO:
+            # Descarta o que já foi lido para o buffer não crescer
+            self._buffer, self._pos = self._buffer[self._pos:], 0
+        self._buffer += bloco
+        return True
+
+    def proximo(self) -> str:
+        """Próximo caractere significativo, sem consumi-lo ('' no fim)."""
+        while True:
+            self._pos = _ESPACOS.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._carregar():
+                return ""
+
+    def consumir(self) -> str:
+        """Consome e retorna o próximo caractere significativo."""
+        caractere = self.proximo()
+        if caractere:
+            self._pos += 1
+        return caractere
+
+    def esperar(self, caractere: str) -> None:
+        """Consome o caractere esperado. :raises ValueError: se for outro."""
+        if self.consumir() != caractere:
+            raise ValueError(f"Arquivo {DB_FILE} corrompido: esperado '{caractere}'.")
+
+    def valor(self):
+        """Interpreta e consome o próximo valor JSON completo."""
+        self.proximo()
+        while True:
+            try:
+                valor, fim = self._interpretar(self._buffer, self._pos)
+            except (StopIteration, json.JSONDecodeError):
+                if self._carregar():
+                    continue
+                raise ValueError(f"Arquivo {DB_FILE} corrompido.")
+            if (fim == len(self._buffer) or self._buffer[fim] not in _DELIMITADORES) \
+                    and self._carregar():
+                continue  # um número pode ter sido cortado no fim do bloco (ex.: '1.' de '1.5')
+            self._pos = fim
+            return valor
+
+    def elementos(self):
+        """Gerador dos elementos da lista na posição atual, consumindo-a."""
+        self.esperar("[")
+        if self.proximo() == "]":
+            self.consumir()
+            return
+        while True:
+            yield self.valor()
+            # Caminho rápido: separador inteiro já no buffer
+            separador = _SEPARADOR.match(self._buffer, self._pos)
+            if separador is not None:
+                self._pos = separador.end()
+                fim = separador.group(1) == "]"
+            else:
+                caractere = self.consumir()
+                if caractere not in (",", "]"):
+                    raise ValueError(f"Arquivo {DB_FILE} corrompido: esperado ',' ou ']'.")
+                fim = caractere == "]"
+            if fim:
+                return
+
+    def pular(self) -> None:
+        """Consome o próximo valor, elemento a elemento se for lista ou objeto."""
+        inicio = self.proximo()
+        if inicio not in ("[", "{"):
+            self.valor()
+            return
+        fim = "]" if inicio == "[" else "}"
+        self.consumir()
+        if self.proximo() == fim:
+            self.consumir()
+            return
+        while True:
+            if inicio == "{":
+                self.valor()
+                self.esperar(":")
+            self.pular()
+            if self.consumir() == fim:
+                return
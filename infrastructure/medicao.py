@@ -0,0 +1,136 @@
+# infrastructure/medicao.py
+"""
+Módulo que implementa a medição opcional do tempo por fase de um comando.
+
+As etapas caras do sistema (leitura e interpretação do banco, gravação,
+busca do aluno, reconstrução das disciplinas, avaliação das regras e
+notificação) são marcadas com o gerenciador de contexto fase():
+
+    with fase("load_db"):
+        ...
+
+Enquanto nenhuma medição está ativa (o normal), fase() devolve sempre o
+mesmo contexto vazio: o custo é uma chamada de função. Com --tempos, o
+CLI ativa uma MedicaoFases, que acumula chamadas e tempo de cada fase, e
+exibe o resumo ao final do comando.
+
+A medição é global ao processo e pensada para o CLI; em servidores com
+várias threads as fases de requisições simultâneas se misturam.
+"""
+
+import time
+from contextlib import nullcontext
+
+
+class MedicaoFases:
+    """
+    Acumula a quantidade de chamadas e o tempo total de cada fase.
+
+    Fases podem ser aninhadas e são acumuladas pelo caminho em que
+    ocorreram: 'load_db' dentro de 'busca_aluno' é contada separadamente
+    de 'load_db' fora dela. O tempo de uma fase inclui o das fases
+    internas (ex.: 'parse' faz parte de 'load_db').
+
+    Exemplo de uso:
+        >>> medicao = ativar_medicao()
+        >>> with fase("load_db"):
+        ...     with fase("parse"):
+        ...         dados = json.loads(conteudo)
+        >>> desativar_medicao()
+        >>> [f["caminho"] for f in medicao.resumo()]
+        ['load_db', 'load_db/parse']
+    """
+
+    def __init__(self):
+        # caminho (tupla de nomes) → [ordem, chamadas, tempo_ns]
+        self._fases = {}
+        self._abertas = []
+
+    def abrir(self, nome: str) -> list:
+        """Registra o início de uma fase e retorna o seu acumulador."""
+        caminho = (self._abertas[-1][0] if self._abertas else ()) + (nome,)
+        dados = self._fases.get(caminho)
+        if dados is None:
+            dados = self._fases[caminho] = [len(self._fases), 0, 0]
+        self._abertas.append((caminho, dados))
+        return dados
+
+    def fechar(self, dados: list, tempo_ns: int) -> None:
+        """Soma uma execução da fase aberta por abrir()."""
+        self._abertas.pop()
+        dados[1] += 1
+        dados[2] += tempo_ns
+
+    def resumo(self) -> list:
+        """
+        :return: Lista de dicionários (fase, caminho, nivel, chamadas,
+                 total_ms, media_ms) em profundidade: cada fase seguida das
+                 suas fases internas, na ordem em que começaram.
+        """
+        ordem = {caminho: dados[0] for caminho, dados in self._fases.items()}
+
+        def posicao(caminho):
+            return [ordem[caminho[:i]] for i in range(1, len(caminho) + 1)]
+
+        return [{"fase": caminho[-1], "caminho": "/".join(caminho), "nivel": len(caminho) - 1,
+                 "chamadas": chamadas, "total_ms": round(ns / 1e6, 3),
+                 "media_ms": round(ns / 1e6 / chamadas, 3)}
+                for caminho, (_, chamadas, ns) in sorted(self._fases.items(),
+                                                         key=lambda item: posicao(item[0]))
+                if chamadas]
+
+    def __bool__(self) -> bool:
+        """True se alguma fase foi medida."""
+        return any(dados[1] for dados in self._fases.values())
+
+
+class _Cronometro:
+    """Contexto devolvido por fase() com uma medição ativa."""
+
+    __slots__ = ("_medicao", "_nome", "_dados", "_inicio")
+
+    def __init__(self, medicao: MedicaoFases, nome: str):
+        self._medicao = medicao
+        self._nome = nome
+
+    def __enter__(self):
+        self._dados = self._medicao.abrir(self._nome)
+        self._inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *excecao) -> bool:
+        self._medicao.fechar(self._dados, time.perf_counter_ns() - self._inicio)
+        return False
+
+
+_NULO = nullcontext()
+_ativa = None
+
+
+def ativar_medicao(medicao: MedicaoFases = None) -> MedicaoFases:
+    """
+    Passa a medir as fases marcadas com fase().
+
+    :param medicao: MedicaoFases que recebe os tempos (None = uma nova).
+    :return: A medição ativa.
+    """
+    global _ativa
+    _ativa = medicao if medicao is not None else MedicaoFases()
+    return _ativa
+
+
+def desativar_medicao() -> None:
+    """Volta a ignorar as fases (a medição anterior mantém os dados)."""
+    global _ativa
+    _ativa = None
+
+
+def fase(nome: str):
+    """
+    Gerenciador de contexto que mede o bloco como a fase 'nome'.
+
+    :return: Contexto vazio se não há medição ativa.
+    """
+    if _ativa is None:
+        return _NULO
+    return _Cronometro(_ativa, nome)
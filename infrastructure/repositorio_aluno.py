@@ -3,7 +3,7 @@
 Módulo que implementa o repositório de persistência de alunos.
 """
 
-from infrastructure.db_config import load_db, save_db
+from infrastructure.db_config import iterar_colecao, load_db, save_db
 
 
 class RepositorioAluno:
@@ -29,6 +29,21 @@ class RepositorioAluno:
         })
         save_db(db)
 
+    def adicionar_lote(self, registros: list) -> None:
+        """
+        Persiste vários alunos em uma única gravação.
+
+        Não verifica duplicidade: os registros já devem ter sido validados
+        (ver ImportacaoService).
+
+        :param registros: Dicionários no formato persistido (nome, email,
+                          matricula, curso, limite_horas_semestrais,
+                          min_horas_optativas).
+        """
+        db = load_db()
+        db['alunos'].extend(registros)
+        save_db(db)
+
     def listar(self) -> list:
         """Retorna lista de tuplas (nome, email, matricula, curso)."""
         db = load_db()
@@ -39,6 +54,40 @@ class RepositorioAluno:
             for a in db['alunos']
         ]
 
+    @staticmethod
+    def reconstruir(registro: tuple):
+        """
+        Monta o Aluno (e o seu Curso) a partir de um registro de listar().
+
+        É o único caminho de reconstrução: a busca do CLI e a varredura de
+        colação avaliam as regras sobre o mesmo aluno. Cursos persistidos
+        não guardam grade, então o curso volta sem disciplinas.
+
+        :param registro: Tupla (nome, email, matricula, curso,
+                         limite_horas, min_optativas); as duas últimas
+                         são opcionais.
+        :return: Objeto Aluno com o histórico carimbado pelo registro.
+        """
+        from domain.aluno import Aluno
+        from domain.curso import Curso
+
+        limite_horas = registro[4] if len(registro) > 4 else 360
+        min_optativas = registro[5] if len(registro) > 5 else 0
+        curso = Curso(registro[3], limite_horas_semestrais=limite_horas,
+                      min_horas_optativas=min_optativas)
+        aluno = Aluno(registro[0], registro[1], registro[2], curso)
+        # O histórico vem só do registro: mesma versão a cada recarga
+        aluno.historico.carimbar(tuple(registro))
+        return aluno
+
+    def iterar(self):
+        """
+        Percorre os alunos persistidos sem carregar o banco inteiro.
+
+        :return: Gerador de dicionários no formato persistido.
+        """
+        return iterar_colecao('alunos')
+
     def remover(self, matricula: str) -> None:
         """Remove um aluno pela matrícula."""
         db = load_db()
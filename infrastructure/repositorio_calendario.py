@@ -0,0 +1,40 @@
+# infrastructure/repositorio_calendario.py
+"""
+Módulo que implementa o repositório de persistência do calendário acadêmico.
+
+Cada período do calendário é um registro com o curso (ou None para o
+calendário institucional), o semestre, o tipo de solicitação e as datas
+de início e fim, gravadas no formato ISO (YYYY-MM-DD).
+"""
+
+from infrastructure.db_config import load_db, save_db
+
+
+class RepositorioCalendario:
+    """
+    Gerencia a persistência dos períodos do calendário acadêmico no
+    arquivo JSON.
+
+    Padrão aplicado: Repository.
+
+    Exemplo de uso:
+        >>> repo = RepositorioCalendario()
+        >>> repo.substituir([{"curso": None, "semestre": "2026.1",
+        ...     "tipo": "trancamento", "inicio": "2026-02-02", "fim": "2026-04-10"}])
+        >>> repo.listar()[0]["semestre"]
+        '2026.1'
+    """
+
+    def listar(self) -> list:
+        """Retorna todos os períodos como lista de dicionários."""
+        return load_db().get('calendario', [])
+
+    def substituir(self, periodos: list) -> None:
+        """
+        Sobrescreve todo o calendário em uma única gravação.
+
+        :param periodos: Lista completa de períodos (dicionários já validados).
+        """
+        db = load_db()
+        db['calendario'] = periodos
+        save_db(db)
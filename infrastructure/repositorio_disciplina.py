@@ -9,9 +9,18 @@ do sistema.
 Nesta versão, os atributos pre_requisitos, co_requisitos e obrigatoria
 também são persistidos, permitindo que as regras de validação funcionem
 corretamente ao reconstruir as disciplinas a partir do banco de dados.
+
+O repositório mantém ainda um índice reverso de dependências (quem exige
+quem como pré/co-requisito), construído na primeira consulta e atualizado
+incrementalmente a cada escrita feita pela mesma instância.
+
+Toda gravação do catálogo avança o contador 'versao_catalogo' do banco,
+que identifica o catálogo gravado entre processos (ver versao_catalogo()).
 """
 
-from infrastructure.db_config import load_db, save_db
+from collections import deque
+
+from infrastructure.db_config import iterar_colecao, load_db, save_db, versao_db
 
 
 class RepositorioDisciplina:
@@ -32,8 +41,25 @@ class RepositorioDisciplina:
         >>> repo.adicionar(Disciplina("Cálculo I", 72))
         >>> for d in repo.listar():
         ...     print(d)  # ('Cálculo I', 72)
+        >>> repo.dependentes_diretos("Cálculo I")
+        ['Cálculo II']
     """
 
+    VINCULOS = ("pre", "co")
+
+    # (versão do arquivo, versão do catálogo) da última leitura ou gravação
+    _versao_lida = (None, 0)
+
+    def __init__(self):
+        """
+        Inicializa o repositório com o índice reverso ainda não construído.
+
+        O índice é montado de forma preguiçosa na primeira consulta de
+        dependentes, evitando custo para comandos que não o utilizam.
+        """
+        # {nome_requisito_lower: {"pre": {dependentes}, "co": {dependentes}}}
+        self._indice_reverso = None
+
     def adicionar(self, disciplina) -> None:
         """
         Persiste uma nova disciplina no arquivo JSON.
@@ -55,7 +81,28 @@ class RepositorioDisciplina:
             "pre_requisitos": [p.nome for p in getattr(disciplina, '_pre_requisitos', [])],
             "co_requisitos": [c.nome for c in getattr(disciplina, '_co_requisitos', [])]
         })
-        save_db(db)
+        self._gravar_alteracao(db)
+        registro = db['disciplinas'][-1]
+        self._indexar(registro['nome'], "pre", registro['pre_requisitos'])
+        self._indexar(registro['nome'], "co", registro['co_requisitos'])
+
+    def adicionar_lote(self, registros: list) -> None:
+        """
+        Persiste várias disciplinas, com seus requisitos, em uma única gravação.
+
+        Não verifica duplicidade nem requisitos: os registros já devem ter
+        sido validados (ver ImportacaoService).
+
+        :param registros: Dicionários no formato persistido (nome,
+                          carga_horaria, obrigatoria, pre_requisitos,
+                          co_requisitos).
+        """
+        db = load_db()
+        db['disciplinas'].extend(registros)
+        self._gravar_alteracao(db)
+        for registro in registros:
+            self._indexar(registro['nome'], "pre", registro['pre_requisitos'])
+            self._indexar(registro['nome'], "co", registro['co_requisitos'])
 
     def listar(self) -> list:
         """Retorna todas as disciplinas como lista de tuplas (nome, carga_horaria)."""
@@ -67,6 +114,14 @@ class RepositorioDisciplina:
         db = load_db()
         return db.get('disciplinas', [])
 
+    def iterar(self):
+        """
+        Percorre o catálogo sem carregar o banco inteiro.
+
+        :return: Gerador de dicionários no formato persistido.
+        """
+        return iterar_colecao('disciplinas')
+
     def carregar_todas(self) -> dict:
         """
         Carrega todas as disciplinas do JSON e reconstrói os vínculos de
@@ -84,12 +139,22 @@ class RepositorioDisciplina:
             obj = disciplinas[d['nome']]
             for pre in d.get('pre_requisitos', []):
                 if pre in disciplinas:
-                    obj.adicionar_pre_requisito(disciplinas[pre])
+                    obj.adicionar_pre_requisito(disciplinas[pre], reconstrucao=True)
             for co in d.get('co_requisitos', []):
                 if co in disciplinas:
-                    obj.adicionar_co_requisito(disciplinas[co])
+                    obj.adicionar_co_requisito(disciplinas[co], reconstrucao=True)
         return disciplinas
 
+    def carregar_grafo(self):
+        """
+        Carrega o catálogo como GrafoCurricular (nomes, cargas e conjuntos
+        de requisitos), sem reconstruir objetos Disciplina.
+
+        :return: GrafoCurricular com todas as disciplinas cadastradas.
+        """
+        from domain.grafo_curricular import GrafoCurricular
+        return GrafoCurricular.de_registros(load_db()['disciplinas'])
+
     def buscar_por_nome(self, nome: str) -> dict:
         """Busca e retorna o dicionário completo de uma disciplina pelo nome."""
         db = load_db()
@@ -100,18 +165,146 @@ class RepositorioDisciplina:
 
     def atualizar_pre_requisitos(self, nome_disciplina: str, nomes_pre_requisitos: list) -> None:
         """Atualiza a lista de pré-requisitos de uma disciplina no banco."""
-        db = load_db()
-        for d in db['disciplinas']:
-            if d['nome'].lower() == nome_disciplina.lower():
-                d['pre_requisitos'] = nomes_pre_requisitos
-                break
-        save_db(db)
+        self._atualizar_vinculos(nome_disciplina, "pre", nomes_pre_requisitos)
 
     def atualizar_co_requisitos(self, nome_disciplina: str, nomes_co_requisitos: list) -> None:
         """Atualiza a lista de co-requisitos de uma disciplina no banco."""
+        self._atualizar_vinculos(nome_disciplina, "co", nomes_co_requisitos)
+
+    def _atualizar_vinculos(self, nome_disciplina: str, vinculo: str, nomes: list) -> None:
+        """
+        Substitui a lista de pré ou co-requisitos de uma disciplina,
+        mantendo o índice reverso em sincronia com o banco.
+
+        :param nome_disciplina: Nome da disciplina a atualizar.
+        :param vinculo: 'pre' ou 'co'.
+        :param nomes: Nova lista completa de nomes de requisitos.
+        """
+        chave = "pre_requisitos" if vinculo == "pre" else "co_requisitos"
         db = load_db()
         for d in db['disciplinas']:
             if d['nome'].lower() == nome_disciplina.lower():
-                d['co_requisitos'] = nomes_co_requisitos
-                break
+                anteriores = list(d.get(chave, []))
+                d[chave] = nomes
+                self._gravar_alteracao(db)
+                self._desindexar(d['nome'], vinculo, anteriores)
+                self._indexar(d['nome'], vinculo, nomes)
+                return
         save_db(db)
+
+    # ------------------------------------------------------------------
+    # Versão do catálogo gravado
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def versao_catalogo(cls) -> int:
+        """
+        Versão do catálogo gravado no banco.
+
+        O contador avança a cada gravação de disciplinas ou requisitos,
+        inclusive as feitas por outros processos. Só é relido quando o
+        arquivo muda (versao_db()); gravações de alunos e solicitações
+        mudam o arquivo, mas não o contador.
+
+        :return: Inteiro (0 se o catálogo nunca foi gravado).
+        """
+        versao = versao_db()
+        if versao != cls._versao_lida[0]:
+            RepositorioDisciplina._versao_lida = (versao, load_db().get('versao_catalogo', 0))
+        return cls._versao_lida[1]
+
+    @staticmethod
+    def _gravar_alteracao(db: dict) -> None:
+        """Grava o banco avançando a versão do catálogo."""
+        db['versao_catalogo'] = db.get('versao_catalogo', 0) + 1
+        save_db(db)
+        # Com a gravação adiada (batch) o arquivo ainda não mudou: a versão
+        # nova fica associada à versão atual do arquivo até a confirmação
+        RepositorioDisciplina._versao_lida = (versao_db(), db['versao_catalogo'])
+
+    # ------------------------------------------------------------------
+    # Índice reverso de dependências
+    # ------------------------------------------------------------------
+
+    def _construir_indice_reverso(self) -> None:
+        """Monta o índice reverso a partir de uma única leitura do catálogo."""
+        self._indice_reverso = {}
+        for d in load_db()['disciplinas']:
+            self._indexar(d['nome'], "pre", d.get('pre_requisitos', []))
+            self._indexar(d['nome'], "co", d.get('co_requisitos', []))
+
+    def _indexar(self, dependente: str, vinculo: str, requisitos: list) -> None:
+        """Registra `dependente` como dependente de cada requisito informado."""
+        if self._indice_reverso is None:
+            return
+        for req in requisitos:
+            entrada = self._indice_reverso.setdefault(
+                req.lower(), {v: set() for v in self.VINCULOS}
+            )
+            entrada[vinculo].add(dependente)
+
+    def _desindexar(self, dependente: str, vinculo: str, requisitos: list) -> None:
+        """Remove as arestas `requisito → dependente` do índice reverso."""
+        if self._indice_reverso is None:
+            return
+        for req in requisitos:
+            entrada = self._indice_reverso.get(req.lower())
+            if entrada:
+                entrada[vinculo].discard(dependente)
+
+    def reconstruir_indice(self) -> None:
+        """
+        Descarta e reconstrói o índice reverso a partir do banco.
+
+        Útil em processos de longa duração quando o arquivo foi alterado
+        por outra instância do repositório.
+        """
+        self._construir_indice_reverso()
+
+    def dependentes_diretos(self, nome: str, vinculo: str = None) -> list:
+        """
+        Retorna as disciplinas que exigem `nome` diretamente como requisito.
+
+        A consulta é um acesso ao índice reverso — não percorre o catálogo.
+
+        :param nome: Nome da disciplina-requisito (sem diferenciar maiúsculas).
+        :param vinculo: 'pre', 'co' ou None para ambos os tipos de vínculo.
+        :raises ValueError: se o vínculo informado não for reconhecido.
+        :return: Lista ordenada com os nomes das disciplinas dependentes.
+        """
+        if vinculo is not None and vinculo not in self.VINCULOS:
+            raise ValueError(
+                f"Vínculo inválido: '{vinculo}'. Use 'pre', 'co' ou None."
+            )
+        if self._indice_reverso is None:
+            self._construir_indice_reverso()
+        entrada = self._indice_reverso.get(nome.lower())
+        if not entrada:
+            return []
+        vinculos = self.VINCULOS if vinculo is None else (vinculo,)
+        dependentes = set()
+        for v in vinculos:
+            dependentes |= entrada[v]
+        return sorted(dependentes)
+
+    def dependentes_transitivos(self, nome: str, vinculo: str = None) -> list:
+        """
+        Retorna todas as disciplinas que dependem de `nome`, direta ou
+        indiretamente (ex: Cálculo I → Cálculo II → Cálculo III).
+
+        Percorre o índice reverso em largura, visitando cada dependente
+        uma única vez — o custo é proporcional ao tamanho da resposta.
+
+        :param nome: Nome da disciplina de origem.
+        :param vinculo: 'pre', 'co' ou None para seguir ambos os vínculos.
+        :return: Lista ordenada com os nomes dos dependentes (sem a origem).
+        """
+        visitados = set()
+        fronteira = deque([nome])
+        while fronteira:
+            atual = fronteira.popleft()
+            for dep in self.dependentes_diretos(atual, vinculo):
+                if dep.lower() != nome.lower() and dep not in visitados:
+                    visitados.add(dep)
+                    fronteira.append(dep)
+        return sorted(visitados)
@@ -7,7 +7,12 @@ extraindo os dados relevantes dos objetos de domínio e convertendo-os
 para um formato serializável.
 """
 
-from infrastructure.db_config import load_db, save_db
+import bisect
+import itertools
+import threading
+from datetime import datetime
+
+from infrastructure.db_config import iterar_colecao, load_db, save_db, versao_db
 
 
 class RepositorioSolicitacao:
@@ -29,6 +34,42 @@ class RepositorioSolicitacao:
         forma segura, e extrai o nome do objeto se ele existir. Se
         nenhum alvo estiver presente, usa 'N/A'.
 
+    Índice de solicitações pendentes:
+        Solicitações com status 'Aberta' ou 'Em Análise' e matrículas
+        aprovadas com semestre definido (que valem até o fim do semestre)
+        são indexadas por alvo e por aluno na primeira consulta, para que
+        a revalidação após mudanças no catálogo ou no histórico alcance
+        apenas os registros afetados, sem varrer todas as solicitações.
+        Cabe a quem revalida descartar as matrículas de semestres passados.
+        Como o índice de consulta, guarda a versão do arquivo indexada: se
+        outro processo gravar o sgsa.json, é reconstruído na próxima
+        consulta em vez de revalidar contra pendências antigas.
+
+    Carga semestral:
+        Matrículas e trancamentos com semestre definido gravam também a
+        carga horária da disciplina. O agregado por (aluno, semestre) em
+        db['carga_semestral'] é atualizado na mesma gravação em que o
+        registro entra ou muda de status: uma matrícula aprovada soma a
+        disciplina e um trancamento aprovado a retira. Consultar a carga
+        do semestre não percorre as solicitações.
+
+    Consulta paginada:
+        consultar() e pagina() filtram por status, tipo, aluno e alvo e
+        paginam pelo id (a próxima página começa após o último id
+        recebido), sem contar nem pular registros. Em processos de longa
+        duração (servidor, API), indexar_consultas() mantém em memória as
+        listas ordenadas de ids por valor de cada filtro; sem o índice, a
+        consulta lê o arquivo incrementalmente e para ao obter o
+        necessário.
+
+    Concorrência:
+        Gravações e índices em memória são protegidos por uma trava do
+        repositório. As gravações a mantêm da leitura do banco até o
+        índice refletir o que foi gravado, e pagina() monta a página
+        inteira com ela: leitores em outras threads (pool de consultas
+        da API) nunca percorrem uma lista do índice enquanto ela é
+        alterada nem veem o arquivo gravado antes do índice.
+
     Nota sobre IDs:
         O ID é gerado como len(lista) + 1 no momento da inserção.
         Este método simples não garante unicidade em caso de exclusões,
@@ -42,6 +83,21 @@ class RepositorioSolicitacao:
         ...     print(s)  # (id, tipo, aluno_id, status, alvo)
     """
 
+    STATUS_ABERTOS = ("Aberta", "Em Análise")
+    TIPOS_CARGA = ("matricula", "trancamento")
+    FILTROS_CONSULTA = ("status", "tipo", "aluno_id", "alvo")
+
+    def __init__(self):
+        """Inicializa o repositório com os índices ainda não construídos."""
+        # {"alvo": {alvo_lower: {ids}}, "aluno": {matricula: {ids}}} e a versão indexada
+        self._indice_pendentes = None
+        self._versao_pendentes = None
+        # {filtro: {valor: [ids em ordem crescente]}} e a versão do arquivo indexada
+        self._indice_consulta = None
+        self._versao_consulta = None
+        # Gravações x pagina()/indexar_consultas() em threads distintas
+        self._trava = threading.RLock()
+
     def adicionar(self, solicitacao, tipo: str) -> None:
         """
         Persiste uma solicitação no arquivo JSON.
@@ -57,11 +113,54 @@ class RepositorioSolicitacao:
                      Armazenado explicitamente pois não é possível
                      inferir o tipo apenas do objeto JSON.
         """
-        db = load_db()
+        with self._trava:
+            em_dia, pendentes_em_dia = self._consulta_em_dia(), self._pendentes_em_dia()
+            db = load_db()
+
+            if 'solicitacoes' not in db:
+                db['solicitacoes'] = []
+
+            nova_sol = self._registro(solicitacao, tipo, len(db['solicitacoes']) + 1)
+            db['solicitacoes'].append(nova_sol)
+            self._contabilizar_carga(db, nova_sol, +1)
+            save_db(db)
+            self._atualizar_pendentes(pendentes_em_dia, novos=[nova_sol])
+            self._atualizar_consulta(em_dia, novos=[nova_sol])
+        print(f"✅ Solicitação {nova_sol['protocolo']} guardada com sucesso.")
+
+    def adicionar_lote(self, solicitacoes: list, tipo: str, lote: str = None) -> list:
+        """
+        Persiste várias solicitações em uma única gravação do arquivo.
 
-        if 'solicitacoes' not in db:
-            db['solicitacoes'] = []
+        Usado pela matrícula em lote: ou todas as solicitações entram no
+        arquivo, ou nenhuma (uma só chamada a save_db). O agregado de
+        carga semestral e o índice de pendentes são atualizados juntos.
 
+        :param solicitacoes: Objetos Solicitacao a persistir.
+        :param tipo: Tipo comum às solicitações.
+        :param lote: Identificador do pedido (ex: o protocolo), gravado
+                     em cada registro para agrupá-los.
+        :return: Lista com os ids atribuídos, na ordem recebida.
+        """
+        with self._trava:
+            em_dia, pendentes_em_dia = self._consulta_em_dia(), self._pendentes_em_dia()
+            db = load_db()
+            registros = []
+            for solicitacao in solicitacoes:
+                registro = self._registro(solicitacao, tipo, len(db['solicitacoes']) + 1)
+                if lote:
+                    registro["lote"] = lote
+                db['solicitacoes'].append(registro)
+                self._contabilizar_carga(db, registro, +1)
+                registros.append(registro)
+            save_db(db)
+            self._atualizar_pendentes(pendentes_em_dia, novos=registros)
+            self._atualizar_consulta(em_dia, novos=registros)
+        print(f"✅ {len(registros)} solicitação(ões) guardada(s) com sucesso.")
+        return [r['id'] for r in registros]
+
+    def _registro(self, solicitacao, tipo: str, id_solicitacao: int) -> dict:
+        """Serializa uma solicitação de domínio no registro JSON."""
         # Extração segura do alvo (disciplina ou curso)
         alvo_obj = getattr(solicitacao, 'disciplina', None) or \
                    getattr(solicitacao, 'curso', None)
@@ -71,17 +170,27 @@ class RepositorioSolicitacao:
             alvo_nome = "N/A"
 
         nova_sol = {
-            "id": len(db['solicitacoes']) + 1,
+            "id": id_solicitacao,
             "protocolo": getattr(solicitacao, 'protocolo', "S/P"),
             "tipo": tipo,
             "aluno_id": solicitacao.aluno.matricula,
             "status": solicitacao.status,
-            "alvo": alvo_nome
+            "alvo": alvo_nome,
+            "criada_em": datetime.now().isoformat(timespec="seconds")
         }
 
-        db['solicitacoes'].append(nova_sol)
-        save_db(db)
-        print(f"✅ Solicitação {nova_sol['protocolo']} guardada com sucesso.")
+        # Co-requisitos informados no mesmo ato (necessários para revalidar)
+        simultaneas = getattr(solicitacao, 'disciplinas_co_req_solicitadas', None)
+        if simultaneas:
+            nova_sol["simultaneas"] = [d.nome for d in simultaneas]
+
+        # Semestre e carga, para o agregado de carga semestral
+        semestre = getattr(solicitacao, 'semestre', None)
+        disciplina = getattr(solicitacao, 'disciplina', None)
+        if semestre and disciplina is not None and tipo in self.TIPOS_CARGA:
+            nova_sol["semestre"] = semestre
+            nova_sol["carga_horaria"] = disciplina.carga_horaria
+        return nova_sol
 
     def listar(self) -> list:
         """
@@ -106,3 +215,363 @@ class RepositorioSolicitacao:
             )
             for s in db.get('solicitacoes', [])
         ]
+
+    # ------------------------------------------------------------------
+    # Solicitações pendentes (revalidação incremental)
+    # ------------------------------------------------------------------
+
+    def iterar(self):
+        """
+        Percorre os registros persistidos sem carregar o banco inteiro.
+
+        Registros gravados antes da inclusão do campo 'criada_em' não o
+        possuem.
+
+        :return: Gerador de dicionários no formato persistido.
+        """
+        return iterar_colecao('solicitacoes')
+
+    @classmethod
+    def pendente(cls, registro: dict) -> bool:
+        """
+        Indica se o registro ainda pode ser afetado por uma revalidação:
+        aberto, em análise ou matrícula aprovada de um semestre.
+        """
+        if registro.get('status') in cls.STATUS_ABERTOS:
+            return True
+        return registro.get('tipo') == "matricula" and registro.get('status') == "Aprovada" \
+            and bool(registro.get('semestre'))
+
+    def _construir_indice_pendentes(self) -> None:
+        """Indexa, em uma única leitura, as solicitações pendentes."""
+        versao = versao_db()
+        self._indice_pendentes = {"alvo": {}, "aluno": {}}
+        for s in load_db().get('solicitacoes', []):
+            self._indexar_pendente(s)
+        self._versao_pendentes = versao
+
+    def _pendentes_em_dia(self) -> bool:
+        """True se o índice de pendentes existe e o arquivo não mudou desde então."""
+        return self._indice_pendentes is not None and versao_db() == self._versao_pendentes
+
+    def _atualizar_pendentes(self, em_dia: bool, novos: list, removidos: list = ()) -> None:
+        """
+        Reflete uma gravação deste repositório no índice de pendentes.
+
+        :param em_dia: Se o índice estava em dia antes da gravação; se não,
+                       é descartado (a gravação incluiu alterações externas).
+        """
+        if self._indice_pendentes is None:
+            return
+        if not em_dia:
+            self._indice_pendentes = None
+            return
+        for registro in removidos:
+            self._desindexar_pendente(registro)
+        for registro in novos:
+            self._indexar_pendente(registro)
+        self._versao_pendentes = versao_db()
+
+    def _indexar_pendente(self, registro: dict) -> None:
+        """Inclui o registro no índice, se o índice existir e ele estiver pendente."""
+        if self._indice_pendentes is None or not self.pendente(registro):
+            return
+        self._indice_pendentes["alvo"].setdefault(
+            str(registro.get('alvo')).lower(), set()).add(registro['id'])
+        self._indice_pendentes["aluno"].setdefault(
+            registro.get('aluno_id'), set()).add(registro['id'])
+
+    def _desindexar_pendente(self, registro: dict) -> None:
+        """Retira o registro do índice de pendentes."""
+        if self._indice_pendentes is None:
+            return
+        self._indice_pendentes["alvo"].get(str(registro.get('alvo')).lower(), set()).discard(registro['id'])
+        self._indice_pendentes["aluno"].get(registro.get('aluno_id'), set()).discard(registro['id'])
+
+    def listar_pendentes(self, alvos: list = None, aluno_id: str = None,
+                         tipo: str = None) -> list:
+        """
+        Retorna os registros pendentes que envolvem algum dos alvos e/ou o aluno.
+
+        A seleção é feita pelo índice: o custo é proporcional ao número de
+        alvos consultados e de registros encontrados. O índice é
+        reconstruído se o arquivo foi alterado por outro processo.
+
+        :param alvos: Nomes das disciplinas/cursos de interesse (None = todos).
+        :param aluno_id: Matrícula do aluno (None = todos os alunos).
+        :param tipo: Filtra pelo tipo da solicitação (ex: 'matricula').
+        :return: Lista de dicionários de solicitações, ordenada por id.
+        """
+        if not self._pendentes_em_dia():
+            self._construir_indice_pendentes()
+
+        ids = None
+        if alvos is not None:
+            ids = set()
+            for alvo in alvos:
+                ids |= self._indice_pendentes["alvo"].get(alvo.lower(), set())
+        if aluno_id is not None:
+            do_aluno = self._indice_pendentes["aluno"].get(aluno_id, set())
+            ids = set(do_aluno) if ids is None else ids & do_aluno
+        if ids is None:
+            ids = set().union(*self._indice_pendentes["aluno"].values())
+        if not ids:
+            return []
+
+        todas = load_db().get('solicitacoes', [])
+        registros = []
+        for id_sol in sorted(ids):
+            registro = self._buscar_por_id(todas, id_sol)
+            if registro and (tipo is None or registro.get('tipo') == tipo):
+                registros.append(registro)
+        return registros
+
+    @staticmethod
+    def _buscar_por_id(solicitacoes: list, id_solicitacao: int) -> dict:
+        """
+        Localiza um registro pelo id.
+
+        Como os ids são sequenciais (len + 1), o registro costuma estar na
+        posição id - 1; a varredura é apenas um fallback para arquivos
+        editados manualmente.
+        """
+        pos = id_solicitacao - 1
+        if 0 <= pos < len(solicitacoes) and solicitacoes[pos].get('id') == id_solicitacao:
+            return solicitacoes[pos]
+        for s in solicitacoes:
+            if s.get('id') == id_solicitacao:
+                return s
+        return None
+
+    def atualizar_status(self, id_solicitacao: int, status: str) -> None:
+        """
+        Altera o status persistido de uma solicitação.
+
+        :param id_solicitacao: Identificador numérico do registro.
+        :param status: Novo status (ex: 'Rejeitada').
+        """
+        with self._trava:
+            em_dia, pendentes_em_dia = self._consulta_em_dia(), self._pendentes_em_dia()
+            db = load_db()
+            registro = self._buscar_por_id(db.get('solicitacoes', []), id_solicitacao)
+            if registro is None:
+                return
+            anterior = dict(registro)
+            self._contabilizar_carga(db, registro, -1)
+            registro['status'] = status
+            self._contabilizar_carga(db, registro, +1)
+            save_db(db)
+            self._atualizar_pendentes(pendentes_em_dia, novos=[registro], removidos=[anterior])
+            self._atualizar_consulta(em_dia, novos=[registro], removidos=[anterior])
+
+    # ------------------------------------------------------------------
+    # Consulta paginada (listagem, API e servidor)
+    # ------------------------------------------------------------------
+
+    def consultar(self, status: str = None, tipo: str = None, aluno_id: str = None,
+                  alvo: str = None, apos: int = 0):
+        """
+        Percorre, em ordem de id, as solicitações que atendem aos filtros.
+
+        Paginação por chave: apenas ids maiores que 'apos' são retornados,
+        e o consumidor pode parar a qualquer momento. Com o índice de
+        consulta em dia, o percurso começa pela lista de ids do filtro
+        mais seletivo; sem ele, o arquivo é lido incrementalmente.
+
+        :param alvo: Comparado sem diferenciar maiúsculas.
+        :param apos: Último id já recebido (0 = desde o início).
+        :return: Gerador de dicionários no formato persistido. O gerador
+                 não segura a trava: com gravações em outras threads,
+                 use pagina().
+        """
+        valores = {"status": status, "tipo": tipo, "aluno_id": aluno_id, "alvo": alvo}
+        filtros = {campo: self._chave_consulta(campo, valor)
+                   for campo, valor in valores.items() if valor is not None}
+        if self._consulta_em_dia():
+            return self._consultar_indice(filtros, apos)
+        return self._consultar_arquivo(filtros, apos)
+
+    def pagina(self, limite: int = 50, apos: int = 0, **filtros) -> dict:
+        """
+        Retorna uma página de solicitações, construindo o índice se preciso.
+
+        Seguro para chamar de várias threads junto com as gravações.
+
+        :param limite: Máximo de registros na página.
+        :param apos: Último id da página anterior (0 = primeira página).
+        :param filtros: status, tipo, aluno_id e alvo (ver consultar()).
+        :raises ValueError: se o limite não for positivo.
+        :return: Dicionário com itens e proximo (valor de 'apos' da
+                 página seguinte, ou None se esta for a última).
+        """
+        if limite < 1:
+            raise ValueError("O limite deve ser positivo.")
+        with self._trava:
+            if not self._consulta_em_dia():
+                self.indexar_consultas()
+            itens = list(itertools.islice(self.consultar(apos=apos, **filtros), limite + 1))
+        proximo = itens[limite - 1]['id'] if len(itens) > limite else None
+        return {"itens": itens[:limite], "proximo": proximo}
+
+    def indexar_consultas(self) -> None:
+        """
+        Constrói, em uma única leitura, o índice usado por consultar().
+
+        O índice é mantido pelas gravações deste repositório. Se outro
+        processo alterar o arquivo, deixa de ser usado até ser reconstruído
+        (pagina() o reconstrói automaticamente).
+        """
+        with self._trava:
+            versao = versao_db()
+            indice = {campo: {} for campo in self.FILTROS_CONSULTA}
+            for registro in load_db().get('solicitacoes', []):
+                self._indexar_consulta(indice, registro)
+            self._indice_consulta, self._versao_consulta = indice, versao
+
+    def _consulta_em_dia(self) -> bool:
+        """True se o índice de consulta existe e o arquivo não mudou desde então."""
+        return self._indice_consulta is not None and versao_db() == self._versao_consulta
+
+    def _atualizar_consulta(self, em_dia: bool, novos: list, removidos: list = ()) -> None:
+        """
+        Reflete uma gravação deste repositório no índice de consulta.
+
+        :param em_dia: Se o índice estava em dia antes da gravação; se não,
+                       é descartado (a gravação incluiu alterações externas).
+        """
+        if self._indice_consulta is None:
+            return
+        if not em_dia:
+            self._indice_consulta = None
+            return
+        for registro in removidos:
+            self._desindexar_consulta(self._indice_consulta, registro)
+        for registro in novos:
+            self._indexar_consulta(self._indice_consulta, registro)
+        self._versao_consulta = versao_db()
+
+    @staticmethod
+    def _chave_consulta(campo: str, valor):
+        """Valor normalizado de um filtro (o alvo, sem diferenciar maiúsculas)."""
+        return str(valor).lower() if campo == "alvo" else valor
+
+    def _indexar_consulta(self, indice: dict, registro: dict) -> None:
+        """Inclui o id do registro na lista de cada filtro, mantendo a ordem."""
+        id_sol = registro.get('id')
+        if not isinstance(id_sol, int):
+            return
+        for campo in self.FILTROS_CONSULTA:
+            ids = indice[campo].setdefault(self._chave_consulta(campo, registro.get(campo)), [])
+            if not ids or ids[-1] < id_sol:
+                ids.append(id_sol)  # caso comum: ids crescentes
+            else:
+                bisect.insort(ids, id_sol)
+
+    def _desindexar_consulta(self, indice: dict, registro: dict) -> None:
+        """Retira o id do registro das listas do índice de consulta."""
+        id_sol = registro.get('id')
+        for campo in self.FILTROS_CONSULTA:
+            ids = indice[campo].get(self._chave_consulta(campo, registro.get(campo)), [])
+            pos = bisect.bisect_left(ids, id_sol) if isinstance(id_sol, int) else len(ids)
+            if pos < len(ids) and ids[pos] == id_sol:
+                del ids[pos]
+
+    def _atende(self, registro: dict, filtros: dict) -> bool:
+        """True se o registro atende a todos os filtros normalizados."""
+        return all(self._chave_consulta(campo, registro.get(campo)) == valor
+                   for campo, valor in filtros.items())
+
+    def _consultar_indice(self, filtros: dict, apos: int):
+        """consultar() guiado pelo índice."""
+        todas = load_db().get('solicitacoes', [])
+        if not filtros:
+            # Sem filtros, os registros já estão em ordem de id: busca binária
+            inicio, fim = 0, len(todas)
+            while inicio < fim:
+                meio = (inicio + fim) // 2
+                if (todas[meio].get('id') or 0) <= apos:
+                    inicio = meio + 1
+                else:
+                    fim = meio
+            while inicio < len(todas):
+                yield todas[inicio]
+                inicio += 1
+            return
+
+        guia = min((self._indice_consulta[campo].get(valor, []) for campo, valor in filtros.items()),
+                   key=len)
+        # Por posição, sem copiar a lista: o consumidor costuma parar na primeira página
+        pos = bisect.bisect_right(guia, apos)
+        while pos < len(guia):
+            registro = self._buscar_por_id(todas, guia[pos])
+            pos += 1
+            if registro is not None and self._atende(registro, filtros):
+                yield registro
+
+    def _consultar_arquivo(self, filtros: dict, apos: int):
+        """consultar() lendo o arquivo incrementalmente."""
+        for registro in self.iterar():
+            if (registro.get('id') or 0) > apos and self._atende(registro, filtros):
+                yield registro
+
+    # ------------------------------------------------------------------
+    # Carga semestral (agregado por aluno e semestre)
+    # ------------------------------------------------------------------
+
+    def carga_semestral(self, aluno_id: str, semestre: str) -> int:
+        """
+        Retorna as horas matriculadas pelo aluno no semestre.
+
+        Lê o agregado mantido a cada gravação — não percorre as solicitações.
+
+        :param aluno_id: Matrícula do aluno.
+        :param semestre: Semestre letivo (ex: '2026.1').
+        :return: Total de horas das matrículas aprovadas e não trancadas.
+        """
+        entrada = load_db()['carga_semestral'].get(aluno_id, {}).get(semestre)
+        return entrada["horas"] if entrada else 0
+
+    def disciplinas_semestre(self, aluno_id: str, semestre: str) -> dict:
+        """
+        Retorna as disciplinas que compõem a carga do aluno no semestre.
+
+        :return: Dicionário {nome da disciplina: carga horária}.
+        """
+        entrada = load_db()['carga_semestral'].get(aluno_id, {}).get(semestre)
+        return dict(entrada["disciplinas"]) if entrada else {}
+
+    def reconstruir_carga_semestral(self) -> None:
+        """
+        Recalcula todo o agregado a partir das solicitações, em ordem de id.
+
+        Necessário apenas se o arquivo foi editado manualmente; as
+        gravações feitas por este repositório mantêm o agregado em dia.
+        """
+        db = load_db()
+        db['carga_semestral'] = {}
+        for registro in db['solicitacoes']:
+            self._contabilizar_carga(db, registro, +1)
+        save_db(db)
+
+    def _contabilizar_carga(self, db: dict, registro: dict, sinal: int) -> None:
+        """
+        Aplica (sinal +1) ou desfaz (sinal -1) o efeito de um registro
+        aprovado no agregado de carga semestral.
+
+        Matrícula aprovada inclui a disciplina no semestre; trancamento
+        aprovado a retira. Registros sem semestre não são contabilizados.
+        """
+        semestre = registro.get('semestre')
+        if registro.get('status') != "Aprovada" or not semestre:
+            return
+        incluir = (registro.get('tipo') == "matricula") == (sinal > 0)
+        por_semestre = db['carga_semestral'].setdefault(registro['aluno_id'], {})
+        entrada = por_semestre.setdefault(semestre, {"horas": 0, "disciplinas": {}})
+        disciplinas = entrada["disciplinas"]
+        alvo = registro.get('alvo')
+
+        if incluir and alvo not in disciplinas:
+            disciplinas[alvo] = registro.get('carga_horaria', 0)
+            entrada["horas"] += disciplinas[alvo]
+        elif not incluir and alvo in disciplinas:
+            entrada["horas"] -= disciplinas.pop(alvo)
@@ -0,0 +1,364 @@
+# infrastructure/servidor_http.py
+"""
+Módulo que implementa o transporte HTTP/JSON da API local do SGSA.
+
+Servidor HTTP/1.1 mínimo sobre asyncio, apenas com a biblioteca padrão:
+conexões persistentes (keep-alive), corpo e respostas em JSON, limite de
+tempo por requisição e paginação das listagens por chave. Assim como o servidor de
+socket Unix, o módulo não conhece as operações do sistema — elas são
+registradas como rotas por quem inicia o servidor (main.py).
+
+Execução das rotas:
+    - Leituras rodam em um pool limitado de threads; acima da fila
+      máxima, a requisição recebe 503 em vez de esperar indefinidamente.
+    - Escritas entram em uma fila atendida por uma única tarefa
+      gravadora, que as executa uma a uma em uma thread própria. O
+      sgsa.json é reescrito por inteiro a cada gravação: serializar as
+      escritas na origem evita disputa por lock e atualizações perdidas.
+    - Rotas em duas etapas preparam a escrita no pool de leituras (a
+      parte cara, como a avaliação das regras) e passam à tarefa
+      gravadora apenas a gravação do resultado.
+"""
+
+import asyncio
+import bisect
+import concurrent.futures
+import functools
+import json
+import threading
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+
+class ErroHTTP(Exception):
+    """
+    Erro de uma rota com o código de status HTTP correspondente.
+
+    Exemplo de uso:
+        >>> raise ErroHTTP(409, "Matrícula 2023001 já existe.")
+    """
+
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def ler_limite(consulta: dict, padrao: int = 50, maximo: int = 500) -> int:
+    """
+    Lê o tamanho da página ('limite') dos parâmetros da URL.
+
+    :raises ValueError: se 'limite' não for um inteiro entre 1 e 'maximo'.
+    :return: O limite informado, ou 'padrao'.
+    """
+    try:
+        limite = int(consulta.get("limite", padrao))
+    except ValueError:
+        raise ValueError("'limite' deve ser inteiro.")
+    if not 1 <= limite <= maximo:
+        raise ValueError(f"'limite' deve estar entre 1 e {maximo}.")
+    return limite
+
+
+def paginar(itens: list, consulta: dict, chave, padrao: int = 50, maximo: int = 500) -> dict:
+    """
+    Recorta uma página da listagem pela chave, como as solicitações.
+
+    Paginação por chave (keyset): 'apos' recebe a chave do último item da
+    página anterior, e a página seguinte começa no primeiro item com
+    chave maior. Itens incluídos ou removidos entre as páginas não
+    deslocam as seguintes, como aconteceria com um offset.
+
+    :param itens: Lista completa, já filtrada e ordenada pela chave.
+    :param consulta: Parâmetros da URL; usa 'limite' e 'apos'.
+    :param chave: Função que extrai a chave (única) de um item.
+    :param padrao: Tamanho da página quando 'limite' não é informado.
+    :param maximo: Maior 'limite' aceito.
+    :raises ValueError: se 'limite' for inválido.
+    :return: {"itens", "proximo", "limite", "apos"}, em que proximo é o
+             valor de 'apos' da página seguinte (None na última).
+    """
+    limite = ler_limite(consulta, padrao, maximo)
+    apos = consulta.get("apos")
+    inicio = 0 if apos is None else bisect.bisect_right([chave(i) for i in itens], apos)
+    pagina = itens[inicio:inicio + limite]
+    proximo = chave(pagina[-1]) if inicio + limite < len(itens) else None
+    return {"itens": pagina, "proximo": proximo, "limite": limite, "apos": apos}
+
+
+class ServidorHTTP:
+    """
+    Servidor HTTP/1.1 com rotas JSON, keep-alive e gravação serializada.
+
+    Cada rota é uma função síncrona funcao(consulta, corpo) -> dict, em
+    que consulta são os parâmetros da URL e corpo, o JSON recebido (ou
+    None). A função retorna o corpo da resposta (status 200) ou levanta
+    ErroHTTP; ValueError vira 400. Com 'gravacao', a rota tem duas
+    etapas: funcao roda no pool de leituras e o seu retorno é passado a
+    gravacao(preparado) -> dict, executada pela tarefa gravadora.
+
+    Limites:
+        timeout:     tempo máximo de espera pela resposta de uma rota
+                     (504). Uma escrita que ainda estava na fila é
+                     descartada; uma que já começou termina normalmente.
+        ociosidade:  tempo máximo para receber uma requisição completa
+                     em uma conexão aberta; depois disso ela é fechada.
+        fila:        leituras em andamento ou na fila, e escritas na
+                     fila, além das quais o servidor responde 503.
+
+    Exemplo de uso:
+        >>> servidor = ServidorHTTP(porta=8080)
+        >>> servidor.rota("GET", "/saude", lambda consulta, corpo: {"ok": True})
+        >>> servidor.servir()          # bloqueia até Ctrl+C ou encerrar()
+    """
+
+    LIMITE_CORPO = 1024 * 1024
+    LIMITE_CABECALHOS = 100
+
+    def __init__(self, host: str = "127.0.0.1", porta: int = 8080, trabalhadores: int = 4,
+                 fila: int = 64, timeout: float = 10.0, ociosidade: float = 15.0):
+        """
+        :param host: Endereço de escuta.
+        :param porta: Porta de escuta (0 escolhe uma porta livre).
+        :param trabalhadores: Threads do pool de leituras.
+        :param fila: Máximo de requisições pendentes (ver acima).
+        :param timeout: Tempo máximo por requisição, em segundos.
+        :param ociosidade: Tempo máximo de espera por uma requisição em
+                           uma conexão keep-alive, em segundos.
+        :raises ValueError: se trabalhadores, fila ou os tempos não forem positivos.
+        """
+        if trabalhadores < 1 or fila < 1 or timeout <= 0 or ociosidade <= 0:
+            raise ValueError("Trabalhadores, fila e tempos limite devem ser positivos.")
+        self.host = host
+        self.porta = porta
+        self.trabalhadores = trabalhadores
+        self.fila = fila
+        self.timeout = timeout
+        self.ociosidade = ociosidade
+        self.pronto = threading.Event()
+        self._rotas = {}
+        self._loop = None
+        self._parar = None
+
+    def rota(self, metodo: str, caminho: str, funcao, escrita: bool = False,
+             gravacao=None) -> None:
+        """
+        Registra uma rota.
+
+        :param metodo: Método HTTP ('GET', 'POST', ...).
+        :param caminho: Caminho exato, sem parâmetros (ex.: '/alunos').
+        :param funcao: funcao(consulta: dict, corpo) -> dict.
+        :param escrita: Se True, a rota altera o banco e é executada pela
+                        tarefa gravadora, uma de cada vez.
+        :param gravacao: gravacao(preparado) -> dict, executada pela tarefa
+                         gravadora com o retorno de funcao, que então roda
+                         no pool de leituras. O tempo limite vale para as
+                         duas etapas juntas.
+        :raises ValueError: se escrita e gravacao forem informadas juntas.
+        """
+        if escrita and gravacao is not None:
+            raise ValueError("Use 'escrita' ou 'gravacao', não as duas.")
+        self._rotas.setdefault(caminho, {})[metodo.upper()] = (funcao, escrita, gravacao)
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def servir(self) -> None:
+        """Atende requisições até Ctrl+C ou encerrar()."""
+        try:
+            asyncio.run(self._executar())
+        except KeyboardInterrupt:
+            pass
+
+    def encerrar(self) -> None:
+        """Interrompe servir() (pode ser chamado de outra thread)."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._parar.set)
+
+    async def _executar(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._parar = asyncio.Event()
+        self._escritas = asyncio.Queue(maxsize=self.fila)
+        self._pendentes = 0
+        self._conexoes = set()
+        self._leitores = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.trabalhadores, thread_name_prefix="sgsa-leitura")
+        self._gravador = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sgsa-gravacao")
+
+        servidor = await asyncio.start_server(self._conexao, self.host, self.porta)
+        self.porta = servidor.sockets[0].getsockname()[1]
+        tarefa_gravadora = asyncio.ensure_future(self._gravadora())
+        self.pronto.set()
+        try:
+            await self._parar.wait()
+        finally:
+            servidor.close()
+            for escritor in list(self._conexoes):
+                escritor.close()
+            await servidor.wait_closed()
+            tarefa_gravadora.cancel()
+            self._leitores.shutdown(wait=False)
+            self._gravador.shutdown(wait=True)  # não interrompe uma gravação no meio
+            self.pronto.clear()
+
+    # ------------------------------------------------------------------
+    # Conexões
+    # ------------------------------------------------------------------
+
+    async def _conexao(self, leitor, escritor) -> None:
+        """Atende as requisições de uma conexão até ela ser fechada."""
+        self._conexoes.add(escritor)
+        try:
+            while True:
+                try:
+                    requisicao = await asyncio.wait_for(self._ler_requisicao(leitor),
+                                                        self.ociosidade)
+                except ErroHTTP as e:
+                    await self._responder(escritor, e.status, {"erro": str(e)}, manter=False)
+                    break
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if requisicao is None:
+                    break
+                metodo, caminho, consulta, corpo, manter = requisicao
+                status, resposta = await self._despachar(metodo, caminho, consulta, corpo)
+                await self._responder(escritor, status, resposta, manter)
+                if not manter:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._conexoes.discard(escritor)
+            escritor.close()
+
+    async def _ler_requisicao(self, leitor):
+        """
+        Lê linha de requisição, cabeçalhos e corpo.
+
+        :raises ErroHTTP: se a requisição for malformada ou grande demais.
+        :return: (metodo, caminho, consulta, corpo, manter_conexao), ou
+                 None se o cliente fechou a conexão.
+        """
+        linha = await leitor.readline()
+        if not linha:
+            return None
+        try:
+            metodo, alvo, versao = linha.decode("latin-1").split()
+        except ValueError:
+            raise ErroHTTP(400, "Linha de requisição inválida.")
+
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b"\r\n", b"\n", b""):
+                break
+            if len(cabecalhos) >= self.LIMITE_CABECALHOS:
+                raise ErroHTTP(431, "Cabeçalhos demais.")
+            nome, _, valor = linha.decode("latin-1").partition(":")
+            cabecalhos[nome.strip().lower()] = valor.strip()
+
+        try:
+            tamanho = int(cabecalhos.get("content-length") or 0)
+        except ValueError:
+            raise ErroHTTP(400, "Content-Length inválido.")
+        if tamanho > self.LIMITE_CORPO:
+            raise ErroHTTP(413, f"Corpo acima de {self.LIMITE_CORPO} bytes.")
+        corpo = None
+        if tamanho:
+            try:
+                corpo = json.loads(await leitor.readexactly(tamanho))
+            except ValueError:
+                raise ErroHTTP(400, "Corpo da requisição não é JSON válido.")
+
+        conexao = cabecalhos.get("connection", "").lower()
+        manter = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+        partes = urlsplit(alvo)
+        consulta = {chave: valores[-1] for chave, valores in parse_qs(partes.query).items()}
+        return metodo.upper(), partes.path, consulta, corpo, manter
+
+    async def _responder(self, escritor, status: int, corpo: dict, manter: bool) -> None:
+        """Envia uma resposta JSON com Content-Length."""
+        dados = json.dumps(corpo, ensure_ascii=False, default=str).encode("utf-8")
+        cabecalho = (f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                     f"Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(dados)}\r\n"
+                     f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n")
+        escritor.write(cabecalho.encode("latin-1") + dados)
+        await escritor.drain()
+
+    # ------------------------------------------------------------------
+    # Execução das rotas
+    # ------------------------------------------------------------------
+
+    async def _despachar(self, metodo: str, caminho: str, consulta: dict, corpo) -> tuple:
+        """Executa a rota e converte o resultado em (status, corpo)."""
+        rotas = self._rotas.get(caminho)
+        if rotas is None:
+            return 404, {"erro": f"Recurso não encontrado: {caminho}."}
+        if metodo not in rotas:
+            return 405, {"erro": f"Método {metodo} não permitido em {caminho}."}
+        funcao, escrita, gravacao = rotas[metodo]
+        chamada = functools.partial(funcao, consulta, corpo)
+        try:
+            return 200, await asyncio.wait_for(self._executar_rota(chamada, escrita, gravacao),
+                                               self.timeout)
+        except asyncio.TimeoutError:
+            return 504, {"erro": f"Tempo limite de {self.timeout}s excedido."}
+        except ErroHTTP as e:
+            return e.status, {"erro": str(e)}
+        except ValueError as e:
+            return 400, {"erro": str(e)}
+        except Exception as e:
+            return 500, {"erro": f"Erro interno: {e}"}
+
+    async def _executar_rota(self, chamada, escrita: bool, gravacao):
+        """Executa a rota no pool, na tarefa gravadora ou nos dois, em sequência."""
+        if escrita:
+            return await self._enfileirar_escrita(chamada)
+        resultado = await self._ler(chamada)
+        if gravacao is None:
+            return resultado
+        return await self._enfileirar_escrita(functools.partial(gravacao, resultado))
+
+    def _ler(self, chamada):
+        """Agenda uma leitura no pool, respeitando o limite de pendentes."""
+        if self._pendentes >= self.fila:
+            raise ErroHTTP(503, "Servidor ocupado; tente novamente.")
+        self._pendentes += 1
+
+        def tarefa():
+            try:
+                return chamada()
+            finally:
+                # Libera a vaga só quando a thread termina, mesmo após um 504
+                self._loop.call_soon_threadsafe(self._liberar)
+
+        return self._loop.run_in_executor(self._leitores, tarefa)
+
+    def _liberar(self) -> None:
+        self._pendentes -= 1
+
+    def _enfileirar_escrita(self, chamada):
+        """Coloca uma escrita na fila da tarefa gravadora."""
+        futuro = self._loop.create_future()
+        try:
+            self._escritas.put_nowait((chamada, futuro))
+        except asyncio.QueueFull:
+            raise ErroHTTP(503, "Fila de gravação cheia; tente novamente.")
+        return futuro
+
+    async def _gravadora(self) -> None:
+        """Única tarefa que executa escritas, na ordem de chegada."""
+        while True:
+            chamada, futuro = await self._escritas.get()
+            if futuro.cancelled():
+                continue  # tempo esgotado ainda na fila: não executa
+            try:
+                resultado = await self._loop.run_in_executor(self._gravador, chamada)
+            except Exception as e:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            else:
+                if not futuro.done():
+                    futuro.set_result(resultado)
@@ -0,0 +1,157 @@
+# infrastructure/servidor_socket.py
+"""
+Módulo que implementa o transporte do servidor local do SGSA.
+
+O servidor escuta em um socket de domínio Unix e troca mensagens JSON
+delimitadas por quebra de linha (NDJSON): cada linha recebida é uma
+requisição e cada linha enviada, a resposta correspondente. Uma mesma
+conexão pode fazer várias requisições em sequência. O módulo não conhece
+as operações do sistema — elas são atendidas pela função tratadora
+fornecida por quem inicia o servidor (main.py).
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+
+
+def disponivel() -> bool:
+    """Indica se a plataforma oferece sockets de domínio Unix."""
+    return hasattr(socket, "AF_UNIX")
+
+
+class ServidorNDJSON:
+    """
+    Servidor NDJSON sobre socket de domínio Unix.
+
+    Cada conexão é atendida em sua própria thread, mas a função tratadora
+    é chamada uma requisição por vez (sob um lock): o estado mantido em
+    memória pelo processo — repositórios, pipelines, caches — não precisa
+    ser seguro para acesso concorrente.
+
+    Protocolo:
+        requisição: um objeto JSON por linha.
+        resposta:   um objeto JSON por linha, na mesma ordem. Uma linha
+                    que não é JSON válido recebe {"erro": "..."}.
+
+    Exemplo de uso:
+        >>> servidor = ServidorNDJSON("sgsa.sock", lambda req: {"eco": req})
+        >>> servidor.servir()          # bloqueia até encerrar()
+    """
+
+    def __init__(self, caminho: str, tratador):
+        """
+        :param caminho: Caminho do arquivo do socket.
+        :param tratador: Função que recebe a requisição (dict) e retorna
+                         a resposta (dict serializável em JSON).
+        :raises ValueError: se a plataforma não tiver sockets Unix ou se
+                            outro servidor já estiver ativo no caminho.
+        """
+        if not disponivel():
+            raise ValueError("Sockets de domínio Unix não são suportados nesta plataforma.")
+        if os.path.exists(caminho):
+            if em_execucao(caminho):
+                raise ValueError(f"Já existe um servidor ativo em {caminho}.")
+            os.remove(caminho)  # socket órfão de uma execução interrompida
+
+        self.caminho = caminho
+        self._tratador = tratador
+        self._lock = threading.Lock()
+        servidor = self
+
+        class _Conexao(socketserver.StreamRequestHandler):
+            def handle(self):
+                for linha in self.rfile:
+                    if not linha.strip():
+                        continue
+                    resposta = servidor._atender(linha)
+                    self.wfile.write(resposta.encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+        self._servidor = socketserver.ThreadingUnixStreamServer(caminho, _Conexao)
+        self._servidor.daemon_threads = True
+
+    def _atender(self, linha: bytes) -> str:
+        """Interpreta uma linha, chama o tratador e serializa a resposta."""
+        try:
+            requisicao = json.loads(linha)
+        except ValueError as e:
+            return json.dumps({"erro": f"Requisição não é JSON válido: {e}."})
+        with self._lock:
+            resposta = self._tratador(requisicao)
+        return json.dumps(resposta, ensure_ascii=False, default=str)
+
+    def servir(self) -> None:
+        """Atende conexões até encerrar(); remove o socket ao terminar."""
+        try:
+            self._servidor.serve_forever()
+        finally:
+            self._servidor.server_close()
+            if os.path.exists(self.caminho):
+                os.remove(self.caminho)
+
+    def encerrar(self) -> None:
+        """Interrompe servir() (chamar de outra thread)."""
+        self._servidor.shutdown()
+
+
+class ClienteNDJSON:
+    """
+    Conexão de cliente com um ServidorNDJSON.
+
+    Exemplo de uso:
+        >>> with ClienteNDJSON("sgsa.sock") as cliente:
+        ...     cliente.enviar({"op": "ping"})
+        {'ok': True}
+    """
+
+    def __init__(self, caminho: str, timeout: float = None):
+        """
+        :param caminho: Caminho do arquivo do socket.
+        :param timeout: Tempo máximo de espera por resposta, em segundos.
+        :raises OSError: se não houver servidor aceitando conexões.
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(caminho)
+        except OSError:
+            self._socket.close()
+            raise
+        self._leitor = self._socket.makefile("rb")
+
+    def enviar(self, requisicao: dict) -> dict:
+        """
+        Envia uma requisição e aguarda a resposta.
+
+        :raises OSError: se a conexão for interrompida.
+        """
+        self._socket.sendall(json.dumps(requisicao, ensure_ascii=False).encode("utf-8") + b"\n")
+        linha = self._leitor.readline()
+        if not linha:
+            raise ConnectionError("O servidor encerrou a conexão.")
+        return json.loads(linha)
+
+    def fechar(self) -> None:
+        """Encerra a conexão."""
+        self._leitor.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def em_execucao(caminho: str) -> bool:
+    """Indica se há um servidor aceitando conexões no caminho."""
+    if not disponivel() or not os.path.exists(caminho):
+        return False
+    try:
+        ClienteNDJSON(caminho, timeout=1).fechar()
+    except OSError:
+        return False
+    return True
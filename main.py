@@ -12,170 +12,101 @@ com status 'Rejeitada'. Solicitações que passam em todas as regras são
 registradas com status 'Aprovada'.
 
 O comando 'demo' executa cenários pré-configurados que demonstram
-explicitamente casos de aceite e de negação para cada tipo de solicitação.
+explicitamente casos de aceite e de negação para cada tipo de solicitação
+(ver cli/demo.py).
 """
 
+from __future__ import annotations
+
 import argparse
+import contextlib
 import datetime
-import uuid
+import io
+import itertools
+import json
+import os
 import sys
 import time
-import threading
-import itertools
 
-from infrastructure.db_config import init_db
+# Só o necessário a todos os comandos; os demais módulos são importados
+# pelo comando que os usa (ver tests/tempo_inicializacao.py).
+from infrastructure.db_config import (init_db, load_db, save_db, ativar_cache, versao_db,
+                                      adiar_gravacao, confirmar)
+from infrastructure.medicao import fase
 from infrastructure.repositorio_aluno import RepositorioAluno
 from infrastructure.repositorio_solicitacao import RepositorioSolicitacao
 from infrastructure.repositorio_disciplina import RepositorioDisciplina
+from cli.protocolo import gerar_protocolo, processar_solicitacao
 
-from application.solicitacao_service import SolicitacaoService
-from application.notificacao_service import NotificacaoService
-
-from domain.aluno import Aluno
-from domain.curso import Curso
-from domain.disciplina import Disciplina
-from domain.excecoes import ViolacaoRegraAcademicaError
-
-from rules.regra_pre_requisito import RegraPreRequisito
-from rules.regra_co_requisito import RegraCoRequisito
-from rules.regra_limite_carga_horaria import RegraLimiteCargaHoraria
-from rules.regra_prazo import RegraPrazo
-from rules.regra_limite_trancamentos import RegraLimiteTrancamentos
-from rules.regra_vinculo_ativo import RegraVinculoAtivo
-from rules.regra_elegibilidade import RegraElegibilidade
-from rules.regra_pendencia_documentacao import RegraPendenciaDocumentacao
-from rules.regra_creditos import RegraCreditos
+# Só para as anotações; equivale a typing.TYPE_CHECKING sem importar typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from domain.aluno import Aluno
+    from domain.disciplina import Disciplina
 
 
 # ---------------------------------------------------------------------------
-# Animação de carregamento CLI.
+# Política de regras por curso e tipo de solicitação (ver --politica).
+# Criados por preparar_regras() apenas nos comandos que avaliam regras: os
+# demais não importam os pipelines nem os módulos de regras.
 # ---------------------------------------------------------------------------
+CACHE_REGRAS = None
 
-def _suporta_unicode() -> bool:
-    """Verifica se o terminal suporta UTF-8."""
-    try:
-        return sys.stdout.encoding.lower().replace("-", "") in ("utf8", "utf16", "utf32")
-    except Exception:
-        return False
-
-
-def animacao_verificando_solicitacao(duracao: float = 3.5) -> None:
-    """
-    Exibe uma animação visual impactante de verificação de solicitação no CLI.
-    Dura aproximadamente `duracao` segundos.
-    """
-    unicode_ok = _suporta_unicode()
-
-    BARRA_CHEIA  = "█" if unicode_ok else "#"
-    BARRA_VAZIA  = "░" if unicode_ok else "-"
-    SETA         = "▶" if unicode_ok else ">"
-    CHECK        = "✔" if unicode_ok else "OK"
-    ICONE_SOL    = "◈" if unicode_ok else "*"
+POLITICA = None
 
-    LARGURA_BARRA = 35
+# Calendário acadêmico persistido; lido do banco na primeira consulta de prazo.
+# A demo usa os prazos dos próprios cenários e não o recebe.
+CALENDARIO = None
 
-    etapas = [
-        (f"  {SETA}  Autenticando solicitação    ", 0.22),
-        (f"  {SETA}  Carregando dados do aluno   ", 0.20),
-        (f"  {SETA}  Verificando pré-requisitos  ", 0.25),
-        (f"  {SETA}  Analisando regras acadêmicas", 0.20),
-        (f"  {SETA}  Consultando histórico        ", 0.18),
-        (f"  {SETA}  Validando carga horária      ", 0.20),
-        (f"  {SETA}  Registrando solicitação      ", 0.22),
-    ]
+# Instrumentação opcional (--instrumentar): acumulada neste arquivo a cada execução
+INSTRUMENTACAO = None
+ARQUIVO_INSTRUMENTACAO = os.environ.get("SGSA_INSTRUMENTACAO", "sgsa_instrumentacao.json")
 
-    # --- cabeçalho ---
-    sys.stdout.write("\n")
-    borda = "═" * 48 if unicode_ok else "=" * 48
-    sys.stdout.write(f"  {borda}\n")
-    sys.stdout.write(f"    {ICONE_SOL}  SGSA — PROCESSANDO SOLICITAÇÃO  {ICONE_SOL}\n")
-    sys.stdout.write(f"  {borda}\n\n")
-    sys.stdout.flush()
+# Socket do servidor 'serve'; com um servidor ativo, os comandos são encaminhados a ele
+ARQUIVO_SOCKET = os.environ.get("SGSA_SOCKET", "sgsa.sock")
 
-    tempo_por_etapa = duracao / len(etapas)
 
-    for label, _ in etapas:
-        passos = 0
-        total_passos = int(tempo_por_etapa / 0.045)
-        total_passos = max(total_passos, 8)
+def preparar_calendario() -> None:
+    """Cria CALENDARIO na primeira chamada."""
+    global CALENDARIO
+    if CALENDARIO is None:
+        from application.calendario_service import CalendarioService
+        from infrastructure.repositorio_calendario import RepositorioCalendario
+        CALENDARIO = CalendarioService(RepositorioCalendario())
 
-        for i in range(total_passos + 1):
-            progresso = i / total_passos
-            cheias = int(LARGURA_BARRA * progresso)
-            vazias = LARGURA_BARRA - cheias
-            barra = BARRA_CHEIA * cheias + BARRA_VAZIA * vazias
-            pct = int(progresso * 100)
-            sys.stdout.write(f"\r{label}  [{barra}] {pct:>3}%")
-            sys.stdout.flush()
-            time.sleep(0.045)
 
-        sys.stdout.write(f"\r{label}  [{BARRA_CHEIA * LARGURA_BARRA}] {CHECK}\n")
-        sys.stdout.flush()
+def preparar_regras() -> None:
+    """Cria CACHE_REGRAS, POLITICA, INSTRUMENTACAO e CALENDARIO na primeira chamada."""
+    global CACHE_REGRAS, POLITICA, INSTRUMENTACAO
+    if POLITICA is None:
+        from application.cache_regras import CacheResultadosRegras
+        from application.instrumentacao_regras import InstrumentacaoRegras
+        from application.politica_regras import PoliticaRegras
+        CACHE_REGRAS = CacheResultadosRegras(capacidade=4096,
+                                             versao_catalogo=RepositorioDisciplina.versao_catalogo)
+        POLITICA = PoliticaRegras(cache=CACHE_REGRAS)
+        INSTRUMENTACAO = InstrumentacaoRegras()
+    preparar_calendario()
 
-    # --- rodapé ---
-    sys.stdout.write("\n")
-    sys.stdout.write(f"  {borda}\n")
-    sys.stdout.flush()
-    time.sleep(0.15)
 
+def usa_regras(args) -> bool:
+    """True se o comando avalia regras acadêmicas (precisa de preparar_regras())."""
+    return args.command in ("serve", "api", "batch", "demo", "colacao") or \
+        (args.command == "solicitacao" and args.subcommand in ("criar", "matricular"))
 
-class Spinner:
-    """
-    Spinner simples usado em operações rápidas que não usam a animação completa.
-    """
-    FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"] if _suporta_unicode() \
-             else ["|", "/", "-", "\\"]
-
-    def __init__(self, mensagem: str = "Processando", delay: float = 0.08):
-        self.mensagem = mensagem
-        self.delay = delay
-        self._stop_event = threading.Event()
-        self._thread = threading.Thread(target=self._spin, daemon=True)
-
-    def _spin(self):
-        for frame in itertools.cycle(self.FRAMES):
-            if self._stop_event.is_set():
-                break
-            sys.stdout.write(f"\r   {frame}  {self.mensagem}...")
-            sys.stdout.flush()
-            time.sleep(self.delay)
-        sys.stdout.write("\r" + " " * (len(self.mensagem) + 10) + "\r")
-        sys.stdout.flush()
-
-    def __enter__(self):
-        self._thread.start()
-        return self
-
-    def __exit__(self, *args):
-        self._stop_event.set()
-        self._thread.join()
 
-
-# ---------------------------------------------------------------------------
-# Mapeamento de regras padrão por tipo de solicitação.
-# ---------------------------------------------------------------------------
-REGRAS_POR_TIPO = {
-    "matricula": [
-        RegraPreRequisito(),
-        RegraCoRequisito(),
-        RegraLimiteCargaHoraria(),
-    ],
-    "trancamento": [
-        RegraPrazo(),
-        RegraLimiteTrancamentos(),
-        RegraVinculoAtivo(),
-    ],
-    "colacao": [
-        RegraElegibilidade(),
-        RegraPendenciaDocumentacao(),
-        RegraCreditos(minimo=80),
-    ],
-}
-
-
-def gerar_protocolo() -> str:
-    """Gera um protocolo único no formato SGSA-XXXXXXXX."""
-    return f"SGSA-{uuid.uuid4().hex[:8].upper()}"
+def _acumular_instrumentacao() -> None:
+    """Soma a instrumentação desta execução ao arquivo acumulado."""
+    if not INSTRUMENTACAO:
+        return
+    from application.instrumentacao_regras import InstrumentacaoRegras
+    try:
+        acumulada = InstrumentacaoRegras.carregar(ARQUIVO_INSTRUMENTACAO)
+    except ValueError as e:
+        print(f"⚠️  {e} Recomeçando a instrumentação acumulada.")
+        acumulada = InstrumentacaoRegras()
+    acumulada.mesclar(INSTRUMENTACAO)
+    acumulada.salvar(ARQUIVO_INSTRUMENTACAO)
 
 
 def setup_argparse() -> argparse.ArgumentParser:
@@ -183,6 +114,28 @@ def setup_argparse() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="SGSA - Sistema de Gestão Acadêmica (Versão JSON)"
     )
+    saida = parser.add_mutually_exclusive_group()
+    saida.add_argument("--json", action="store_true",
+                       help="Modo não interativo: criação de solicitações sem animação, "
+                            "com o resultado em um objeto JSON (padrão fora de um terminal)")
+    saida.add_argument("--interativo", action="store_true",
+                       help="Força a saída para terminal mesmo sem TTY")
+    parser.add_argument("--politica", default=os.environ.get("SGSA_POLITICA"),
+                        help="Arquivo JSON/TOML com a política de regras por curso "
+                             "(padrão: variável SGSA_POLITICA ou regras embutidas)")
+    parser.add_argument("--instrumentar", action="store_true",
+                        default=bool(os.environ.get("SGSA_INSTRUMENTAR")),
+                        help="Mede latência e rejeições por regra e acumula em "
+                             "sgsa_instrumentacao.json (ou SGSA_INSTRUMENTACAO)")
+    parser.add_argument("--local", action="store_true",
+                        help="Executa neste processo mesmo com um servidor 'serve' ativo")
+    parser.add_argument("--perfil", "--profile", dest="perfil", metavar="ARQUIVO", default=None,
+                        help="Executa o comando sob cProfile e grava as estatísticas (pstats) "
+                             "em ARQUIVO; implica --local")
+    parser.add_argument("--tempos", "--timings", dest="tempos", action="store_true",
+                        help="Exibe na saída de erro o tempo de cada fase do comando "
+                             "(banco, busca do aluno, disciplinas, regras, gravação, "
+                             "notificação); implica --local")
     subparsers = parser.add_subparsers(dest="command", help="Comandos principais")
 
     # ---- aluno ----
@@ -201,9 +154,24 @@ def setup_argparse() -> argparse.ArgumentParser:
 
     aluno_sub.add_parser("listar")
 
+    imp_a = aluno_sub.add_parser("importar", help="Importa alunos de um CSV (tudo ou nada)")
+    imp_a.add_argument("arquivo",
+                       help="CSV com nome,email,matricula,curso[,limite_horas,min_optativas]")
+
     rem = aluno_sub.add_parser("remover")
     rem.add_argument("--mat", required=True)
 
+    eleg = aluno_sub.add_parser("elegiveis",
+                                help="Lista as disciplinas em que o aluno pode se matricular agora")
+    eleg.add_argument("--mat", required=True, help="Matrícula do aluno")
+
+    plan = aluno_sub.add_parser("planejar",
+                                help="Planeja os semestres restantes até a integralização")
+    plan_alvo = plan.add_mutually_exclusive_group(required=True)
+    plan_alvo.add_argument("--mat", help="Matrícula do aluno")
+    plan_alvo.add_argument("--todos", action="store_true",
+                           help="Planeja todos os alunos cadastrados (resumo por aluno)")
+
     # ---- disciplina ----
     disc_p = subparsers.add_parser("disciplina", help="Gestão de disciplinas")
     disc_sub = disc_p.add_subparsers(dest="subcommand")
@@ -221,6 +189,24 @@ def setup_argparse() -> argparse.ArgumentParser:
 
     disc_sub.add_parser("listar")
 
+    imp_d = disc_sub.add_parser("importar",
+                                help="Importa disciplinas e requisitos de um CSV (tudo ou nada)")
+    imp_d.add_argument("arquivo", help="CSV com nome,carga_horaria[,obrigatoria,pre_requisitos,"
+                                       "co_requisitos]; requisitos separados por ';'")
+
+    dep_d = disc_sub.add_parser("dependentes",
+                                help="Lista as disciplinas que exigem a informada como requisito")
+    dep_d.add_argument("--nome", required=True, help="Nome da disciplina-requisito")
+    dep_d.add_argument("--vinculo", choices=["pre", "co"], default=None,
+                       help="Restringe a pré ou co-requisitos (padrão: ambos)")
+    dep_d.add_argument("--transitivo", action="store_true",
+                       help="Inclui dependentes indiretos (toda a cadeia)")
+
+    ana_d = disc_sub.add_parser("analisar",
+                                help="Analisa a estrutura do catálogo (caminho crítico, gargalos)")
+    ana_d.add_argument("--top", type=int, default=10,
+                       help="Quantidade de gargalos exibidos (padrão: 10)")
+
     # ---- solicitacao ----
     sol_p = subparsers.add_parser("solicitacao", help="Gestão de solicitações")
     sol_sub = sol_p.add_subparsers(dest="subcommand")
@@ -234,17 +220,140 @@ def setup_argparse() -> argparse.ArgumentParser:
     criar.add_argument(
         "--prazo",
         default=None,
-        help="Prazo do calendário acadêmico no formato YYYY-MM-DD "
-             "(obrigatório para trancamento com verificação de prazo)"
+        help="Prazo do calendário acadêmico no formato YYYY-MM-DD, usado apenas "
+             "se o calendário cadastrado não definir o período do trancamento"
     )
-    criar.add_argument(
-        "--carga-atual",
-        type=int,
-        default=0,
-        help="Carga horária já matriculada no semestre atual (para verificação de limite)"
+    # Obsoleto: a carga do semestre vem das matrículas aprovadas persistidas
+    criar.add_argument("--carga-atual", type=int, default=None, help=argparse.SUPPRESS)
+
+    mat_l = sol_sub.add_parser(
+        "matricular",
+        help="Matrícula em várias disciplinas de uma vez (aprovada ou negada por inteiro)")
+    mat_l.add_argument("--mat", required=True, help="Matrícula do aluno solicitante")
+    mat_l.add_argument("--disciplinas", nargs="+", required=True,
+                       help="Nomes das disciplinas do pedido")
+
+    lst_s = sol_sub.add_parser("listar", help="Lista solicitações, com filtros e paginação")
+    lst_s.add_argument("--status", default=None, help="Só solicitações com este status")
+    lst_s.add_argument("--tipo", default=None, choices=["matricula", "trancamento", "colacao"])
+    lst_s.add_argument("--mat", default=None, help="Só solicitações deste aluno")
+    lst_s.add_argument("--alvo", default=None, help="Só solicitações desta disciplina ou curso")
+    lst_s.add_argument("--limite", "--limit", type=int, default=None,
+                       help="Máximo de solicitações exibidas (padrão: todas)")
+    lst_s.add_argument("--apos", "--after", type=int, default=0, metavar="ID",
+                       help="Começa após este id (use o indicado ao fim da página anterior)")
+
+    reval = sol_sub.add_parser(
+        "revalidar",
+        help="Revalida as matrículas abertas afetadas por uma mudança no catálogo ou histórico")
+    reval.add_argument("--disciplina", required=True,
+                       help="Disciplina cujos requisitos (ou situação no histórico) mudaram")
+    reval.add_argument("--vinculo", choices=["pre", "co"], default=None,
+                       help="Tipo de requisito alterado no catálogo (padrão: ambos)")
+    reval.add_argument("--mat", default=None,
+                       help="Matrícula do aluno cujo histórico mudou na disciplina informada")
+
+    # ---- colacao ----
+    col_p = subparsers.add_parser("colacao", help="Operações de colação de grau em massa")
+    col_sub = col_p.add_subparsers(dest="subcommand")
+
+    varr = col_sub.add_parser(
+        "varredura",
+        help="Avalia a elegibilidade para colação de todos os alunos, em paralelo")
+    varr.add_argument("--relatorio", default="varredura_colacao.jsonl",
+                      help="Arquivo JSONL de saída (padrão: varredura_colacao.jsonl)")
+    varr.add_argument("--curso", default=None,
+                      help="Restringe a varredura aos alunos de um curso")
+    varr.add_argument("--processos", type=int, default=None,
+                      help="Número de processos trabalhadores (padrão: um por CPU)")
+    varr.add_argument("--bloco", type=int, default=500,
+                      help="Alunos por tarefa (padrão: 500)")
+    varr.add_argument("--retomar", action="store_true",
+                      help="Continua uma varredura interrompida a partir do checkpoint")
+
+    # ---- calendario ----
+    cal_p = subparsers.add_parser("calendario", help="Calendário acadêmico (períodos e prazos)")
+    cal_sub = cal_p.add_subparsers(dest="subcommand")
+
+    imp_c = cal_sub.add_parser("importar", help="Importa períodos de um arquivo CSV ou JSON")
+    imp_c.add_argument("--arquivo", required=True,
+                       help="CSV (curso,semestre,tipo,inicio,fim) ou JSON com a lista de períodos")
+    imp_c.add_argument("--substituir", action="store_true",
+                       help="Descarta o calendário atual antes de importar")
+
+    lst_c = cal_sub.add_parser("listar", help="Lista os períodos cadastrados")
+    lst_c.add_argument("--tipo", choices=["matricula", "trancamento", "colacao"], default=None)
+    lst_c.add_argument("--curso", default=None, help="Apenas os períodos próprios do curso")
+
+    atu_c = cal_sub.add_parser("atual", help="Mostra o período vigente para um tipo de solicitação")
+    atu_c.add_argument("--tipo", choices=["matricula", "trancamento", "colacao"], required=True)
+    atu_c.add_argument("--curso", default=None,
+                       help="Curso consultado (padrão: calendário institucional)")
+
+    # ---- regras ----
+    reg_p = subparsers.add_parser("regras", help="Instrumentação das regras acadêmicas")
+    reg_sub = reg_p.add_subparsers(dest="subcommand")
+
+    est = reg_sub.add_parser(
+        "estatisticas",
+        help="Exibe latência (p50/p90/p99), rejeições e profundidade por regra")
+    est.add_argument("--ordenar", default="tempo_total_ms",
+                     choices=["tempo_total_ms", "p99_us", "p50_us", "rejeicoes",
+                              "taxa_rejeicao", "execucoes"],
+                     help="Métrica de ordenação (padrão: tempo_total_ms)")
+    est.add_argument("--exportar", default=None,
+                     help="Grava os dados completos (com histogramas) neste arquivo JSON")
+    est.add_argument("--limpar", action="store_true",
+                     help="Zera a instrumentação acumulada após exibir")
+
+    # ---- exportar ----
+    exp_p = subparsers.add_parser(
+        "exportar", help="Exporta solicitações, alunos ou o catálogo para CSV ou JSONL")
+    exp_p.add_argument("colecao", choices=["solicitacoes", "alunos", "disciplinas"])
+    exp_p.add_argument("--formato", choices=["csv", "jsonl"], default=None,
+                       help="Padrão: pela extensão de --saida (.jsonl) ou csv")
+    exp_p.add_argument("--saida", default=None,
+                       help="Arquivo de destino (padrão: saída padrão); '.gz' compacta")
+    exp_p.add_argument("--gzip", action="store_true", help="Compacta a saída com gzip")
+    exp_p.add_argument("--colunas", default=None,
+                       help="Colunas separadas por vírgula (padrão: todas as principais)")
+    exp_p.add_argument("--status", default=None, help="Só solicitações com este status")
+    exp_p.add_argument("--tipo", default=None, help="Só solicitações deste tipo")
+    exp_p.add_argument("--curso", default=None, help="Só alunos (ou solicitações de alunos) do curso")
+    exp_p.add_argument("--de", type=datetime.date.fromisoformat, default=None,
+                       help="Só solicitações criadas a partir desta data (AAAA-MM-DD)")
+    exp_p.add_argument("--ate", type=datetime.date.fromisoformat, default=None,
+                       help="Só solicitações criadas até esta data (AAAA-MM-DD)")
+
+    # ---- serve ----
+    serve_p = subparsers.add_parser(
+        "serve",
+        help="Mantém o sistema carregado e atende os demais comandos por um socket local"
     )
-
-    sol_sub.add_parser("listar")
+    serve_p.add_argument("--socket", default=ARQUIVO_SOCKET,
+                         help="Caminho do socket (padrão: variável SGSA_SOCKET ou sgsa.sock)")
+
+    # ---- batch ----
+    batch_p = subparsers.add_parser(
+        "batch", help="Executa um arquivo JSONL de operações do CLI em um único processo")
+    batch_p.add_argument("arquivo", help="Arquivo com uma operação por linha (lista de argumentos "
+                                         "ou objeto com 'argv' e 'id' opcional)")
+    batch_p.add_argument("--grupo", type=int, default=500,
+                         help="Operações por confirmação no banco (padrão: 500)")
+    batch_p.add_argument("--validar-em-lote", action="store_true",
+                         help="Avalia juntas as regras de 'solicitacao criar' consecutivas "
+                              "de alunos distintos")
+    batch_p.add_argument("--recomecar", action="store_true",
+                         help="Ignora o ponto de retomada de uma execução interrompida")
+
+    # ---- api ----
+    api_p = subparsers.add_parser("api", help="Servidor HTTP/JSON local para integrações")
+    api_p.add_argument("--host", default="127.0.0.1", help="Endereço de escuta (padrão: 127.0.0.1)")
+    api_p.add_argument("--porta", type=int, default=8080, help="Porta de escuta (padrão: 8080)")
+    api_p.add_argument("--trabalhadores", type=int, default=4,
+                       help="Threads para as consultas (padrão: 4)")
+    api_p.add_argument("--timeout", type=float, default=10.0,
+                       help="Tempo máximo por requisição, em segundos (padrão: 10)")
 
     # ---- demo ----
     subparsers.add_parser(
@@ -264,39 +373,42 @@ def reconstruir_disciplina(repo_disc: RepositorioDisciplina, nome: str) -> Disci
     :param nome: Nome da disciplina a reconstruir.
     :return: Objeto Disciplina completo, ou None se não encontrado.
     """
-    dados = repo_disc.buscar_por_nome(nome)
-    if dados is None:
-        return None
-
-    disc = Disciplina(
-        nome=dados['nome'],
-        carga_horaria=dados['carga_horaria'],
-        obrigatoria=dados.get('obrigatoria', True)
-    )
-
-    # Reconstrói pré-requisitos
-    for pre_nome in dados.get('pre_requisitos', []):
-        pre_dados = repo_disc.buscar_por_nome(pre_nome)
-        if pre_dados:
-            pre_disc = Disciplina(
-                nome=pre_dados['nome'],
-                carga_horaria=pre_dados['carga_horaria'],
-                obrigatoria=pre_dados.get('obrigatoria', True)
-            )
-            disc.adicionar_pre_requisito(pre_disc)
-
-    # Reconstrói co-requisitos
-    for co_nome in dados.get('co_requisitos', []):
-        co_dados = repo_disc.buscar_por_nome(co_nome)
-        if co_dados:
-            co_disc = Disciplina(
-                nome=co_dados['nome'],
-                carga_horaria=co_dados['carga_horaria'],
-                obrigatoria=co_dados.get('obrigatoria', True)
-            )
-            disc.adicionar_co_requisito(co_disc)
-
-    return disc
+    from domain.disciplina import Disciplina
+
+    with fase("reconstrucao_disciplina"):
+        dados = repo_disc.buscar_por_nome(nome)
+        if dados is None:
+            return None
+
+        disc = Disciplina(
+            nome=dados['nome'],
+            carga_horaria=dados['carga_horaria'],
+            obrigatoria=dados.get('obrigatoria', True)
+        )
+
+        # Reconstrói pré-requisitos
+        for pre_nome in dados.get('pre_requisitos', []):
+            pre_dados = repo_disc.buscar_por_nome(pre_nome)
+            if pre_dados:
+                pre_disc = Disciplina(
+                    nome=pre_dados['nome'],
+                    carga_horaria=pre_dados['carga_horaria'],
+                    obrigatoria=pre_dados.get('obrigatoria', True)
+                )
+                disc.adicionar_pre_requisito(pre_disc, reconstrucao=True)
+
+        # Reconstrói co-requisitos
+        for co_nome in dados.get('co_requisitos', []):
+            co_dados = repo_disc.buscar_por_nome(co_nome)
+            if co_dados:
+                co_disc = Disciplina(
+                    nome=co_dados['nome'],
+                    carga_horaria=co_dados['carga_horaria'],
+                    obrigatoria=co_dados.get('obrigatoria', True)
+                )
+                disc.adicionar_co_requisito(co_disc, reconstrucao=True)
+
+        return disc
 
 
 def buscar_disciplina_por_nome(repo_disc: RepositorioDisciplina, nome: str) -> Disciplina:
@@ -319,396 +431,923 @@ def buscar_aluno_por_matricula(repo_aluno: RepositorioAluno, matricula: str) ->
     :param matricula: Código de matrícula a buscar.
     :return: Objeto Aluno reconstruído a partir do JSON, ou None se não encontrado.
     """
-    for registro in repo_aluno.listar():
-        # registro: (nome, email, matricula, curso, limite_horas, min_optativas)
-        if registro[2] == matricula:
-            limite_horas = registro[4] if len(registro) > 4 else 360
-            min_optativas = registro[5] if len(registro) > 5 else 0
-            curso = Curso(registro[3],
-                          limite_horas_semestrais=limite_horas,
-                          min_horas_optativas=min_optativas)
-            return Aluno(registro[0], registro[1], registro[2], curso)
-    return None
+    with fase("busca_aluno"):
+        for registro in repo_aluno.listar():
+            # registro: (nome, email, matricula, curso, limite_horas, min_optativas)
+            if registro[2] == matricula:
+                return RepositorioAluno.reconstruir(registro)
+        return None
 
 
-def processar_solicitacao(sol, service, repo_sol, tipo: str, protocolo: str) -> str:
+def criar_revalidacao(repo_aluno, repo_disc, repo_sol):
     """
-    Aplica o fluxo de estado e persiste a solicitação como aprovada.
+    Monta o RevalidacaoService sobre os repositórios do comando.
 
-    :param sol: Objeto Solicitacao já validado pelas regras.
-    :param service: Instância de SolicitacaoService.
-    :param repo_sol: Instância de RepositorioSolicitacao.
-    :param tipo: Tipo da solicitação.
-    :param protocolo: Código de protocolo gerado para esta solicitação.
-    :return: Status final ('Aprovada').
+    O semestre atual de cada aluno vem do calendário do seu curso, o
+    mesmo gravado nas matrículas por executar_criar/executar_matricular.
     """
-    sol.avancar()  # Aberta → Em Análise
-    sol.avancar()  # Em Análise → Aprovada
-    sol.protocolo = protocolo
-    repo_sol.adicionar(sol, tipo)
-    return sol.status
+    from application.revalidacao_service import RevalidacaoService
+
+    preparar_calendario()
+    return RevalidacaoService(
+        repo_sol, repo_disc,
+        carregar_aluno=lambda mat: buscar_aluno_por_matricula(repo_aluno, mat),
+        carregar_disciplina=lambda nome: reconstruir_disciplina(repo_disc, nome),
+        semestre_atual=lambda aluno: CALENDARIO.semestre(curso=aluno.curso.nome),
+    )
 
 
-def _linha_separadora(char: str = "─", largura: int = 60) -> str:
-    """Retorna uma linha separadora formatada."""
-    return char * largura
+def exibir_revalidacao(resultados: list) -> None:
+    """Lista as matrículas revalidadas e o motivo das rejeições."""
+    print(f"\n🔁 {len(resultados)} solicitação(ões) revalidada(s):")
+    for r in resultados:
+        print(f"  - {r['protocolo']} | Aluno: {r['aluno_id']} | "
+              f"Alvo: {r['alvo']} | Status: {r['status']}")
+        if r['violacao']:
+            print(f"      Motivo: {r['violacao']}")
 
 
-def _cabecalho_cenario(numero: int, titulo: str) -> None:
-    """Imprime o cabeçalho de um cenário de demonstração."""
-    print(f"\n{'═' * 60}")
-    print(f"  CENÁRIO {numero}: {titulo}")
-    print('═' * 60)
+# ---------------------------------------------------------------------------
+# Criação de solicitações (modo interativo ou JSON para integrações).
+# ---------------------------------------------------------------------------
+
+def _violacao_dict(violacao) -> dict:
+    """Representação JSON de uma violação, com a mensagem já formatada."""
+    return dict(violacao.como_dict(), mensagem=violacao.mensagem)
 
 
-def _resultado(status: str, motivo: str = "") -> None:
-    """Imprime o resultado de um cenário com ícone visual."""
-    if status == "Aprovada":
-        icone = "✅ APROVADA"
-    elif status == "Rejeitada":
-        icone = "❌ REJEITADA"
+def _erro(mensagem: str, exibir) -> dict:
+    """Exibe um erro de entrada e retorna o resultado correspondente."""
+    exibir(f"❌ {mensagem}")
+    return {"status": "Erro", "erro": mensagem}
+
+
+def executar_criar(args, repo_aluno, repo_disc, repo_sol, service,
+                   interativo: bool = True, animacao: bool = True) -> dict:
+    """
+    Cria, valida e persiste uma solicitação (comando 'solicitacao criar').
+
+    No modo interativo exibe o andamento, com a animação de verificação.
+    No modo não interativo nada é exibido, e o chamador imprime o
+    dicionário retornado como JSON.
+
+    :param args: Argumentos do comando (tipo, mat, alvo, prazo, carga_atual).
+    :param interativo: Se False, omite a animação e as mensagens.
+    :param animacao: Se False, omite apenas a animação (servidor 'serve').
+    :return: Dicionário com protocolo, tipo, matricula, alvo, status
+             ('Aprovada', 'Rejeitada' ou 'Erro'), violacoes e tempos_ms
+             (carregar, validar, gravar e total).
+    """
+    preparada = preparar_criacao(args, repo_aluno, repo_disc, repo_sol, service,
+                                 interativo, animacao)
+    if "erro" in preparada:
+        return preparada
+
+    # Reúne todas as violações para o aluno corrigir tudo de uma vez
+    inicio = time.perf_counter()
+    resultado = service.avaliar_regras(preparada["sol"], preparada["regras"])
+    return concluir_criacao(preparada, resultado, time.perf_counter() - inicio,
+                            service, repo_sol, interativo)
+
+
+def preparar_criacao(args, repo_aluno, repo_disc, repo_sol, service,
+                     interativo: bool = True, animacao: bool = True) -> dict:
+    """
+    Primeira etapa de executar_criar(): carrega aluno e alvo e monta a solicitação.
+
+    :return: Dicionário com sol, regras, protocolo, tipo, aluno, alvo_nome
+             e carregar (segundos); ou o resultado de erro ('status' Erro).
+    """
+    exibir = print if interativo else (lambda *a, **k: None)
+    inicio = time.perf_counter()
+
+    # Busca o aluno real no banco de dados
+    aluno_obj = buscar_aluno_por_matricula(repo_aluno, args.mat)
+    if not aluno_obj:
+        return _erro(f"Aluno com matrícula '{args.mat}' não encontrado. "
+                     f"Cadastre o aluno primeiro com: aluno cadastrar --nome ... --mat {args.mat}",
+                     exibir)
+
+    alvo_obj = None
+    if args.tipo in ["matricula", "trancamento"]:
+        # Reconstrói a disciplina com pré/co-requisitos do banco
+        alvo_obj = buscar_disciplina_por_nome(repo_disc, args.alvo)
+        if not alvo_obj:
+            return _erro(f"Disciplina '{args.alvo}' não encontrada no catálogo.", exibir)
+    elif args.tipo == "colacao":
+        alvo_obj = aluno_obj.curso  # usa o curso real do aluno
+
+    kwargs = {}
+    if args.tipo == "trancamento" and args.prazo and \
+            CALENDARIO.define("trancamento", aluno_obj.curso.nome):
+        exibir("⚠️  --prazo ignorado: o prazo vem do calendário acadêmico cadastrado.")
+    elif args.tipo == "trancamento" and args.prazo:
+        kwargs["prazo"] = datetime.date.fromisoformat(args.prazo)
+        kwargs["data"] = datetime.date.today()
+
+    protocolo = gerar_protocolo()
+    alvo_nome = alvo_obj.nome if hasattr(alvo_obj, 'nome') else str(alvo_obj)
+    exibir(f"\n📋 Protocolo: {protocolo}")
+    exibir(f"   Aluno:  {aluno_obj.nome} (mat. {aluno_obj.matricula})")
+    exibir(f"   Tipo:   {args.tipo.capitalize()}")
+    exibir(f"   Alvo:   {alvo_nome}")
+
+    # Exibe informações de pré/co-requisitos para matrícula
+    if args.tipo == "matricula":
+        pre_reqs = [p.nome for p in alvo_obj.pre_requisitos]
+        co_reqs = [c.nome for c in alvo_obj.co_requisitos]
+        if pre_reqs:
+            exibir(f"   Pré-requisitos: {', '.join(pre_reqs)}")
+        if co_reqs:
+            exibir(f"   Co-requisitos: {', '.join(co_reqs)}")
+
+    if interativo and animacao:
+        # Animação visual enquanto processa
+        from cli.animacao import animacao_verificando_solicitacao
+        animacao_verificando_solicitacao(duracao=3.5)
+
+    sol = service.criar_solicitacao(args.tipo, aluno_obj, alvo_obj, **kwargs)
+    if args.tipo in ("matricula", "trancamento"):
+        sol.semestre = CALENDARIO.semestre(curso=aluno_obj.curso.nome)
+    if args.tipo == "matricula":
+        # Carga do semestre a partir das matrículas aprovadas, não do cliente
+        if args.carga_atual is not None:
+            exibir("⚠️  --carga-atual ignorado: a carga vem das matrículas aprovadas.")
+        sol.carga_horaria_semestre_atual = repo_sol.carga_semestral(
+            aluno_obj.matricula, sol.semestre)
+        exibir(f"   Carga no semestre {sol.semestre}: "
+               f"{sol.carga_horaria_semestre_atual}h")
+
+    return {
+        "sol": sol,
+        "regras": POLITICA.pipeline(args.tipo, aluno_obj.curso.nome),
+        "protocolo": protocolo,
+        "tipo": args.tipo,
+        "aluno": aluno_obj,
+        "alvo_nome": alvo_nome,
+        "carregar": time.perf_counter() - inicio,
+    }
+
+
+def concluir_criacao(preparada: dict, resultado, validar: float, service, repo_sol,
+                     interativo: bool = True) -> dict:
+    """
+    Última etapa de executar_criar(): persiste a solicitação avaliada.
+
+    :param preparada: Retorno de preparar_criacao().
+    :param resultado: ResultadoValidacao da solicitação.
+    :param validar: Tempo gasto na avaliação das regras, em segundos.
+    :return: O mesmo dicionário de executar_criar().
+    """
+    exibir = print if interativo else (lambda *a, **k: None)
+    inicio = time.perf_counter()
+    sol, protocolo, tipo = preparada["sol"], preparada["protocolo"], preparada["tipo"]
+
+    if resultado.aprovado:
+        status = processar_solicitacao(sol, service, repo_sol, tipo, protocolo)
+        exibir(f"\n✅ Solicitação {protocolo} APROVADA!")
+        exibir(f"   Status final: {status}")
     else:
-        icone = f"⚠️  {status.upper()}"
-
-    print(f"\n  Resultado: {icone}")
-    if motivo:
-        print(f"  Motivo:    {motivo}")
-    print("─" * 60)
-
-
-def executar_demo(repo_sol: RepositorioSolicitacao) -> None:
-    """
-    Executa cenários de demonstração que mostram claramente quando
-    solicitações são ACEITAS e quando são NEGADAS.
-
-    Cenários cobertos:
-        1.  Matrícula ACEITA  — sem pré-requisitos, sem co-requisitos.
-        2.  Matrícula NEGADA  — pré-requisito não cumprido.
-        3.  Matrícula NEGADA  — co-requisito não matriculado simultaneamente.
-        4.  Matrícula NEGADA  — limite de carga horária semestral excedido.
-        5.  Trancamento ACEITO — vínculo ativo, dentro do prazo.
-        6.  Trancamento NEGADO — prazo acadêmico encerrado.
-        7.  Trancamento NEGADO — limite de 4 trancamentos atingido.
-        8.  Trancamento NEGADO — vínculo já trancado (duplo trancamento).
-        9.  Colação ACEITA  — currículo integralizado, sem pendências.
-        10. Colação NEGADA  — disciplina obrigatória não concluída.
-        11. Colação NEGADA  — pendência documental em aberto.
-        12. Colação NEGADA  — créditos insuficientes.
-    """
-    service = SolicitacaoService(notificacao_service=None)
-
-    print("\n" + "═" * 60)
-    print("  DEMONSTRAÇÃO: CASOS DE ACEITE E NEGAÇÃO DE SOLICITAÇÕES")
-    print("  Sistema de Gestão de Solicitações Acadêmicas (SGSA)")
-    print("═" * 60)
-
-    def _aluno(nome, mat, curso_nome="Eng. Software", limite_horas=360):
-        curso = Curso(curso_nome, limite_horas_semestrais=limite_horas)
-        return Aluno(nome, f"{mat}@sgsa.edu.br", mat, curso)
-
-    def _disc(nome, carga=72, obrigatoria=True):
-        return Disciplina(nome=nome, carga_horaria=carga, obrigatoria=obrigatoria)
-
-    # ===============================================================
-    # BLOCO 1 — SOLICITAÇÕES DE MATRÍCULA
-    # ===============================================================
-    print("\n\n  ► BLOCO 1: SOLICITAÇÕES DE MATRÍCULA\n")
-
-    # Cenário 1: Matrícula ACEITA
-    _cabecalho_cenario(1, "Matrícula ACEITA — sem restrições")
-    aluno = _aluno("Carlos Mendes", "MAT001")
-    disc_poo = _disc("Programação Orientada a Objetos", 60)
-    print(f"  Aluno:      {aluno.nome} (mat. {aluno.matricula})")
-    print(f"  Disciplina: {disc_poo.nome} ({disc_poo.carga_horaria}h)")
-    print(f"  Pré-req.:   nenhum  |  Co-req.: nenhum  |  Carga atual: 0h")
-    try:
-        sol = service.criar_solicitacao("matricula", aluno, disc_poo)
-        service.aplicar_regras(sol, REGRAS_POR_TIPO["matricula"])
-        status = processar_solicitacao(sol, service, repo_sol, "matricula", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 2: Matrícula NEGADA — pré-requisito
-    _cabecalho_cenario(2, "Matrícula NEGADA — pré-requisito não cumprido")
-    aluno2 = _aluno("Fernanda Costa", "MAT002")
-    calc1 = _disc("Cálculo I", 72)
-    calc2 = _disc("Cálculo II", 72)
-    calc2.adicionar_pre_requisito(calc1)
-    print(f"  Aluno:      {aluno2.nome} (mat. {aluno2.matricula})")
-    print(f"  Disciplina: {calc2.nome} — exige pré-req.: {calc1.nome}")
-    print(f"  Histórico:  Cálculo I → NÃO cursado")
-    try:
-        sol2 = service.criar_solicitacao("matricula", aluno2, calc2)
-        service.aplicar_regras(sol2, REGRAS_POR_TIPO["matricula"])
-        status = processar_solicitacao(sol2, service, repo_sol, "matricula", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol2.avancar(); sol2.rejeitar()
-        sol2.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol2, "matricula")
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 3: Matrícula NEGADA — co-requisito
-    _cabecalho_cenario(3, "Matrícula NEGADA — co-requisito não matriculado simultaneamente")
-    aluno3 = _aluno("Lucas Alves", "MAT003")
-    teoria = _disc("Física Teórica", 60)
-    lab = _disc("Laboratório de Física", 30)
-    teoria.adicionar_co_requisito(lab)
-    print(f"  Aluno:      {aluno3.nome} (mat. {aluno3.matricula})")
-    print(f"  Disciplina: {teoria.nome} — exige co-req. simultâneo: {lab.nome}")
-    print(f"  Simultâneas informadas: nenhuma")
-    try:
-        sol3 = service.criar_solicitacao("matricula", aluno3, teoria)
-        service.aplicar_regras(sol3, REGRAS_POR_TIPO["matricula"])
-        status = processar_solicitacao(sol3, service, repo_sol, "matricula", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol3.avancar(); sol3.rejeitar()
-        sol3.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol3, "matricula")
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 4: Matrícula NEGADA — carga horária
-    _cabecalho_cenario(4, "Matrícula NEGADA — limite de carga horária excedido")
-    aluno4 = _aluno("Beatriz Lima", "MAT004", limite_horas=200)
-    disc_pesada = _disc("Projeto de Sistemas", 120)
-    sol4 = service.criar_solicitacao("matricula", aluno4, disc_pesada)
-    sol4.carga_horaria_semestre_atual = 100
-    print(f"  Aluno:      {aluno4.nome} (mat. {aluno4.matricula})")
-    print(f"  Disciplina: {disc_pesada.nome} ({disc_pesada.carga_horaria}h)")
-    print(f"  Limite: {aluno4.curso.limite_horas_semestrais}h  |  "
-          f"Atual: {sol4.carga_horaria_semestre_atual}h  |  "
-          f"Total seria: {sol4.carga_horaria_semestre_atual + disc_pesada.carga_horaria}h")
+        exibir(f"\n❌ Solicitação {protocolo} NEGADA.")
+        for violacao in resultado.violacoes:
+            exibir(f"   Motivo: {violacao}")
+        try:
+            sol.avancar()
+            sol.rejeitar()
+            sol.protocolo = protocolo
+            repo_sol.adicionar(sol, tipo)
+            exibir("   Registro salvo com status: Rejeitada")
+        except Exception:
+            pass
+    gravar = time.perf_counter() - inicio
+
+    return {
+        "protocolo": protocolo,
+        "tipo": tipo,
+        "matricula": preparada["aluno"].matricula,
+        "alvo": preparada["alvo_nome"],
+        "status": sol.status,
+        "violacoes": [_violacao_dict(v) for v in resultado.violacoes],
+        "tempos_ms": {
+            "carregar": round(preparada["carregar"] * 1000, 3),
+            "validar": round(validar * 1000, 3),
+            "gravar": round(gravar * 1000, 3),
+            "total": round((preparada["carregar"] + validar + gravar) * 1000, 3),
+        },
+    }
+
+
+def executar_matricular(args, repo_aluno, repo_disc, repo_sol, service,
+                        interativo: bool = True, animacao: bool = True) -> dict:
+    """
+    Matrícula em várias disciplinas, tudo ou nada ('solicitacao matricular').
+
+    :param args: Argumentos do comando (mat, disciplinas).
+    :param interativo: Se False, omite a animação e as mensagens.
+    :param animacao: Se False, omite apenas a animação (servidor 'serve').
+    :return: Dicionário com protocolo, matricula, semestre, status,
+             disciplinas (protocolo, nome, status e violacoes de cada uma)
+             e tempos_ms.
+    """
+    preparada = preparar_matricula(args, repo_aluno, repo_disc, repo_sol, service,
+                                   interativo, animacao)
+    if "erro" in preparada:
+        return preparada
+
+    inicio = time.perf_counter()
+    resultados = service.validar_lote(preparada["sols"], preparada["regras"])
+    return concluir_matricula(preparada, resultados, time.perf_counter() - inicio,
+                              repo_sol, interativo)
+
+
+def preparar_matricula(args, repo_aluno, repo_disc, repo_sol, service,
+                       interativo: bool = True, animacao: bool = True) -> dict:
+    """
+    Primeira etapa de executar_matricular(): carrega aluno e disciplinas e
+    monta as matrículas do pedido.
+
+    :return: Dicionário com sols, regras, protocolo, aluno, disciplinas,
+             semestre, carga_atual e carregar (segundos); ou o resultado
+             de erro ('status' Erro).
+    """
+    exibir = print if interativo else (lambda *a, **k: None)
+    inicio = time.perf_counter()
+
+    aluno_obj = buscar_aluno_por_matricula(repo_aluno, args.mat)
+    if not aluno_obj:
+        return _erro(f"Aluno com matrícula '{args.mat}' não encontrado.", exibir)
+    disciplinas = []
+    for nome in args.disciplinas:
+        disc = buscar_disciplina_por_nome(repo_disc, nome)
+        if not disc:
+            return _erro(f"Disciplina '{nome}' não encontrada no catálogo.", exibir)
+        disciplinas.append(disc)
+
+    semestre = CALENDARIO.semestre(curso=aluno_obj.curso.nome)
+    carga_atual = repo_sol.carga_semestral(aluno_obj.matricula, semestre)
     try:
-        service.aplicar_regras(sol4, REGRAS_POR_TIPO["matricula"])
-        status = processar_solicitacao(sol4, service, repo_sol, "matricula", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol4.avancar(); sol4.rejeitar()
-        sol4.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol4, "matricula")
-        _resultado("Rejeitada", str(e))
-
-    # ===============================================================
-    # BLOCO 2 — SOLICITAÇÕES DE TRANCAMENTO
-    # ===============================================================
-    print("\n\n  ► BLOCO 2: SOLICITAÇÕES DE TRANCAMENTO\n")
-    disc_tran = _disc("Banco de Dados", 60)
-    prazo_ok = datetime.date.today() + datetime.timedelta(days=30)
-    prazo_vencido = datetime.date.today() - datetime.timedelta(days=10)
-
-    # Cenário 5: Trancamento ACEITO
-    _cabecalho_cenario(5, "Trancamento ACEITO — dentro do prazo, vínculo ativo")
-    aluno5 = _aluno("Roberto Nunes", "TRA001")
-    print(f"  Aluno:      {aluno5.nome} (mat. {aluno5.matricula})")
-    print(f"  Vínculo:    {aluno5.historico.status_vinculo}  |  "
-          f"Trancamentos: {aluno5.historico.trancamentos}/4  |  "
-          f"Prazo: {prazo_ok.strftime('%d/%m/%Y')}")
+        sols = service.criar_matricula_lote(aluno_obj, disciplinas, carga_atual, semestre)
+    except ValueError as e:
+        return _erro(str(e), exibir)
+    carregado = time.perf_counter()
+
+    protocolo = gerar_protocolo()
+    total = carga_atual + sum(d.carga_horaria for d in disciplinas)
+    exibir(f"\n📋 Protocolo: {protocolo}")
+    exibir(f"   Aluno:  {aluno_obj.nome} (mat. {aluno_obj.matricula})")
+    exibir(f"   Disciplinas ({len(disciplinas)}): {', '.join(d.nome for d in disciplinas)}")
+    exibir(f"   Carga no semestre {semestre}: {carga_atual}h → {total}h "
+           f"(limite {aluno_obj.curso.limite_horas_semestrais}h)")
+    if interativo and animacao:
+        from cli.animacao import animacao_verificando_solicitacao
+        animacao_verificando_solicitacao(duracao=3.5)
+        carregado = time.perf_counter()
+
+    return {
+        "sols": sols,
+        "regras": POLITICA.pipeline("matricula", aluno_obj.curso.nome),
+        "protocolo": protocolo,
+        "aluno": aluno_obj,
+        "disciplinas": disciplinas,
+        "semestre": semestre,
+        "carga_atual": carga_atual,
+        "carregar": carregado - inicio,
+    }
+
+
+def concluir_matricula(preparada: dict, resultados: list, validar: float, repo_sol,
+                       interativo: bool = True) -> dict:
+    """
+    Última etapa de executar_matricular(): grava o pedido avaliado.
+
+    :param preparada: Retorno de preparar_matricula().
+    :param resultados: ResultadoValidacao de cada matrícula, na ordem de sols.
+    :param validar: Tempo gasto na avaliação das regras, em segundos.
+    :return: O mesmo dicionário de executar_matricular().
+    """
+    exibir = print if interativo else (lambda *a, **k: None)
+    inicio = time.perf_counter()
+    sols, protocolo = preparada["sols"], preparada["protocolo"]
+
+    # Tudo ou nada: uma única reprovação nega o pedido inteiro
+    aprovado = all(resultados)
+    for n, sol in enumerate(sols, start=1):
+        sol.avancar()
+        if aprovado:
+            sol.avancar()
+        else:
+            sol.rejeitar()
+        sol.protocolo = f"{protocolo}-{n}"
+    repo_sol.adicionar_lote(sols, "matricula", lote=protocolo)
+    gravar = time.perf_counter() - inicio
+
+    if aprovado:
+        exibir(f"\n✅ Matrícula {protocolo} APROVADA em {len(sols)} disciplina(s).")
+    else:
+        exibir(f"\n❌ Matrícula {protocolo} NEGADA (nenhuma disciplina foi matriculada).")
+        for sol, resultado in zip(sols, resultados):
+            for violacao in resultado.violacoes:
+                exibir(f"   {sol.disciplina.nome}: {violacao}")
+
+    return {
+        "protocolo": protocolo,
+        "matricula": preparada["aluno"].matricula,
+        "semestre": preparada["semestre"],
+        "status": "Aprovada" if aprovado else "Rejeitada",
+        "disciplinas": [
+            {"protocolo": sol.protocolo, "nome": sol.disciplina.nome, "status": sol.status,
+             "violacoes": [_violacao_dict(v) for v in resultado.violacoes]}
+            for sol, resultado in zip(sols, resultados)
+        ],
+        "tempos_ms": {
+            "carregar": round(preparada["carregar"] * 1000, 3),
+            "validar": round(validar * 1000, 3),
+            "gravar": round(gravar * 1000, 3),
+            "total": round((preparada["carregar"] + validar + gravar) * 1000, 3),
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Servidor local ('serve') e encaminhamento dos comandos para ele.
+# ---------------------------------------------------------------------------
+
+# Comandos que controlam o próprio processo: não rodam no servidor nem em lote
+COMANDOS_DE_PROCESSO = ("serve", "api", "batch", "demo", "exportar")
+
+
+def executar_capturado(argv: list, parser, repos: tuple, service,
+                       interativo: bool = False) -> dict:
+    """
+    Executa uma linha de comando capturando a saída, sem animação.
+
+    Usada pelo servidor 'serve' e pelo comando 'batch'.
+
+    :param argv: Argumentos da linha de comando (sem o nome do programa).
+    :param repos: Tupla (repo_aluno, repo_disc, repo_sol).
+    :param interativo: Modo de saída de 'solicitacao criar/matricular'.
+    :return: Dicionário com codigo (código de saída), saida, erro_saida e
+             resultado (o JSON do modo não interativo, ou None).
+    """
+    saida, erros = io.StringIO(), io.StringIO()
+    codigo, resultado = 0, None
+    with contextlib.redirect_stdout(saida), contextlib.redirect_stderr(erros):
+        try:
+            args = parser.parse_args(argv)
+            if args.command in COMANDOS_DE_PROCESSO:
+                print(f"❌ O comando '{args.command}' não pode ser executado pelo servidor "
+                      f"nem em lote.")
+                codigo = 2
+            else:
+                resultado = executar_comando(args, parser, *repos, service,
+                                             interativo=interativo, animacao=False)
+                if resultado is not None and resultado["status"] == "Erro":
+                    codigo = 1
+        except SystemExit as e:
+            codigo = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            print(f"❌ Erro interno: {e}")
+            codigo = 1
+    return {"codigo": codigo, "saida": saida.getvalue(),
+            "erro_saida": erros.getvalue(), "resultado": resultado}
+
+
+def encaminhar_ao_servidor(argv: list, interativo: bool) -> bool:
+    """
+    Executa o comando em um servidor 'serve' ativo, se houver.
+
+    A saída do servidor é reproduzida neste processo, que termina com o
+    mesmo código de saída.
+
+    :param argv: Argumentos da linha de comando (sem o nome do programa).
+    :param interativo: Modo de saída decidido por este processo.
+    :return: False se não houver servidor (o comando deve ser executado
+             localmente); True se o servidor o executou com sucesso.
+    """
+    if not os.path.exists(ARQUIVO_SOCKET):
+        return False
+    from infrastructure import servidor_socket
+    if not servidor_socket.disponivel():
+        return False
     try:
-        sol5 = service.criar_solicitacao(
-            "trancamento", aluno5, disc_tran,
-            data=datetime.date.today(), prazo=prazo_ok)
-        service.aplicar_regras(sol5, REGRAS_POR_TIPO["trancamento"])
-        status = processar_solicitacao(sol5, service, repo_sol, "trancamento", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 6: Trancamento NEGADO — prazo encerrado
-    _cabecalho_cenario(6, "Trancamento NEGADO — prazo acadêmico encerrado")
-    aluno6 = _aluno("Patrícia Souza", "TRA002")
-    print(f"  Aluno:      {aluno6.nome} (mat. {aluno6.matricula})")
-    print(f"  Data: {datetime.date.today().strftime('%d/%m/%Y')}  |  "
-          f"Prazo limite: {prazo_vencido.strftime('%d/%m/%Y')} (vencido há 10 dias)")
+        cliente = servidor_socket.ClienteNDJSON(ARQUIVO_SOCKET)
+    except OSError:
+        return False  # socket órfão: nenhum servidor escutando
+    # Daqui em diante o comando pode já ter sido executado: não repetir localmente
     try:
-        sol6 = service.criar_solicitacao(
-            "trancamento", aluno6, disc_tran,
-            data=datetime.date.today(), prazo=prazo_vencido)
-        service.aplicar_regras(sol6, REGRAS_POR_TIPO["trancamento"])
-        status = processar_solicitacao(sol6, service, repo_sol, "trancamento", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol6.avancar(); sol6.rejeitar()
-        sol6.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol6, "trancamento")
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 7: Trancamento NEGADO — limite atingido
-    _cabecalho_cenario(7, "Trancamento NEGADO — limite de 4 trancamentos atingido")
-    aluno7 = _aluno("Marcos Vieira", "TRA003")
-    aluno7.historico._trancamentos = 4
-    print(f"  Aluno:      {aluno7.nome} (mat. {aluno7.matricula})")
-    print(f"  Trancamentos realizados: {aluno7.historico.trancamentos}/4 (limite máximo atingido)")
+        with cliente:
+            resposta = cliente.enviar({"argv": argv, "interativo": interativo})
+    except (OSError, ValueError) as e:
+        print(f"❌ Falha na comunicação com o servidor em {ARQUIVO_SOCKET}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    sys.stdout.write(resposta.get("saida", ""))
+    sys.stderr.write(resposta.get("erro_saida", resposta.get("erro", "")))
+    if resposta.get("resultado") is not None:
+        print(json.dumps(resposta["resultado"], ensure_ascii=False, default=str))
+    if resposta.get("codigo"):
+        sys.exit(resposta["codigo"])
+    return True
+
+
+def servir(caminho: str, parser, service) -> None:
+    """
+    Executa o servidor local até ser interrompido (Ctrl+C ou SIGTERM).
+
+    O processo mantém carregados o banco (cache de load_db), os
+    repositórios com seus índices, os pipelines de regras e o calendário;
+    cada requisição paga apenas o comando em si. Se outro processo alterar
+    o sgsa.json, os repositórios e o calendário são recriados antes da
+    próxima requisição.
+
+    Requisições (uma linha JSON cada):
+        {"op": "ping"}                                  -> {"ok": true}
+        {"argv": ["aluno", "listar"], "interativo": false}
+            -> {"codigo": 0, "saida": "...", "erro_saida": "", "resultado": null}
+
+    :param caminho: Caminho do socket.
+    :param parser: Parser do CLI, usado para interpretar cada argv.
+    :param service: SolicitacaoService compartilhado entre requisições.
+    """
+    import signal
+    from infrastructure import servidor_socket
+
+    ativar_cache()
+    estado = {"versao": versao_db(), "repos": None}
+
+    def repositorios():
+        versao = versao_db()
+        if estado["repos"] is None or versao != estado["versao"]:
+            if estado["repos"] is not None:
+                # Alterado por outro processo: descarta os índices em memória (o
+                # cache de regras segue a versão do catálogo gravada no banco)
+                CALENDARIO.recarregar()
+            estado["repos"] = (RepositorioAluno(), RepositorioDisciplina(), RepositorioSolicitacao())
+            estado["repos"][2].indexar_consultas()
+        return estado["repos"]
+
+    def tratar(requisicao: dict) -> dict:
+        if requisicao.get("op") == "ping":
+            return {"ok": True}
+        argv = requisicao.get("argv")
+        if not isinstance(argv, list):
+            return {"codigo": 2, "erro": "Requisição deve ter 'argv' (lista) ou 'op'."}
+
+        try:
+            POLITICA.recarregar_se_alterado()
+        except ValueError as e:
+            print(f"⚠️  {e} Mantendo a política anterior.", file=sys.stderr)
+        resposta = executar_capturado(argv, parser, repositorios(), service,
+                                      interativo=bool(requisicao.get("interativo")))
+        estado["versao"] = versao_db()  # as gravações da própria requisição não invalidam
+        return resposta
+
     try:
-        sol7 = service.criar_solicitacao(
-            "trancamento", aluno7, disc_tran,
-            data=datetime.date.today(), prazo=prazo_ok)
-        service.aplicar_regras(sol7, REGRAS_POR_TIPO["trancamento"])
-        status = processar_solicitacao(sol7, service, repo_sol, "trancamento", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol7.avancar(); sol7.rejeitar()
-        sol7.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol7, "trancamento")
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 8: Trancamento NEGADO — vínculo trancado
-    _cabecalho_cenario(8, "Trancamento NEGADO — vínculo já está 'Trancado'")
-    aluno8 = _aluno("Juliana Ramos", "TRA004")
-    aluno8.historico.status_vinculo = "Trancado"
-    print(f"  Aluno:      {aluno8.nome} (mat. {aluno8.matricula})")
-    print(f"  Vínculo atual: {aluno8.historico.status_vinculo} "
-          f"(duplo trancamento não permitido)")
+        servidor = servidor_socket.ServidorNDJSON(caminho, tratar)
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    # SIGTERM encerra como Ctrl+C: remove o socket e grava a instrumentação (atexit)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"🟢 Servidor SGSA ouvindo em {caminho} (Ctrl+C para encerrar)")
     try:
-        sol8 = service.criar_solicitacao(
-            "trancamento", aluno8, disc_tran,
-            data=datetime.date.today(), prazo=prazo_ok)
-        service.aplicar_regras(sol8, REGRAS_POR_TIPO["trancamento"])
-        status = processar_solicitacao(sol8, service, repo_sol, "trancamento", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol8.avancar(); sol8.rejeitar()
-        sol8.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol8, "trancamento")
-        _resultado("Rejeitada", str(e))
-
-    # ===============================================================
-    # BLOCO 3 — SOLICITAÇÕES DE COLAÇÃO DE GRAU
-    # ===============================================================
-    print("\n\n  ► BLOCO 3: SOLICITAÇÕES DE COLAÇÃO DE GRAU\n")
-
-    # Cenário 9: Colação ACEITA
-    _cabecalho_cenario(9, "Colação ACEITA — currículo completo, sem pendências")
-    curso_ads = Curso("ADS", min_horas_optativas=0)
-    tcc = _disc("TCC", 80, obrigatoria=True)
-    poo_disc = _disc("POO", 60, obrigatoria=True)
-    curso_ads.adicionar_disciplina(tcc)
-    curso_ads.adicionar_disciplina(poo_disc)
-    aluno9 = Aluno("Aline Ferreira", "aline@sgsa.edu.br", "COL001", curso_ads)
-    aluno9.historico.adicionar_disciplina(tcc, 8.5)
-    aluno9.historico.adicionar_disciplina(poo_disc, 9.0)
-    print(f"  Aluno:      {aluno9.nome} (mat. {aluno9.matricula})")
-    print(f"  Disciplinas: TCC (8.5) ✓ | POO (9.0) ✓")
-    print(f"  Pendências: nenhuma  |  Créditos: {aluno9.historico.total_creditos()}h")
+        servidor.servir()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("🔴 Servidor encerrado.")
+
+
+# ---------------------------------------------------------------------------
+# Execução em lote de um arquivo de operações ('batch').
+# ---------------------------------------------------------------------------
+
+def _ler_operacao(texto: str) -> tuple:
+    """
+    Interpreta uma linha do arquivo de operações.
+
+    :return: Tupla (argv, id); id é o campo 'id' opcional, devolvido na
+             resposta para correlação.
+    :raises ValueError: se a linha não for uma lista de argumentos nem um
+                        objeto com 'argv'.
+    """
+    operacao = json.loads(texto)
+    if isinstance(operacao, dict):
+        argv, ident = operacao.get("argv"), operacao.get("id")
+    else:
+        argv, ident = operacao, None
+    if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+        raise ValueError("a operação deve ser uma lista de argumentos ou um objeto com 'argv'.")
+    return argv, ident
+
+
+def executar_batch(args, parser, service) -> int:
+    """
+    Executa um arquivo JSONL de operações do CLI em um único processo.
+
+    Cada linha é uma operação — ["aluno", "cadastrar", "--nome", ...] ou
+    {"id": ..., "argv": [...]} — executada pelos mesmos caminhos do CLI.
+    O resultado de cada uma é impresso como uma linha JSON assim que ela
+    termina: {"linha", "id", "codigo", "saida", "erro_saida", "resultado"}.
+
+    As gravações são confirmadas no sgsa.json a cada --grupo operações,
+    junto com o número da última linha confirmada. Se a execução for
+    interrompida, a mesma chamada retoma a partir dessa linha; as
+    operações do grupo interrompido são refeitas (e impressas de novo).
+    Ao terminar, o ponto de retomada é apagado.
+
+    Com --validar-em-lote, sequências de 'solicitacao criar' de alunos
+    distintos — que não dependem umas das outras — têm as regras
+    avaliadas juntas por SolicitacaoService.validar_lote().
+
+    :return: Código de saída: 0 se todas as operações terminaram com
+             código 0; 1 se alguma falhou; 2 se o arquivo não pôde ser
+             lido; 130 se interrompido.
+    """
+    chave = os.path.abspath(args.arquivo)
     try:
-        sol9 = service.criar_solicitacao("colacao", aluno9, curso_ads)
-        service.aplicar_regras(sol9, REGRAS_POR_TIPO["colacao"])
-        status = processar_solicitacao(sol9, service, repo_sol, "colacao", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 10: Colação NEGADA — obrigatória pendente
-    _cabecalho_cenario(10, "Colação NEGADA — disciplina obrigatória não concluída")
-    curso_si = Curso("Sistemas de Informação", min_horas_optativas=0)
-    tcc2 = _disc("TCC", 80, obrigatoria=True)
-    etica = _disc("Ética em TI", 40, obrigatoria=True)
-    curso_si.adicionar_disciplina(tcc2)
-    curso_si.adicionar_disciplina(etica)
-    aluno10 = Aluno("Diego Martins", "diego@sgsa.edu.br", "COL002", curso_si)
-    aluno10.historico.adicionar_disciplina(tcc2, 7.0)
-    # Ética em TI NÃO cursada
-    print(f"  Aluno:      {aluno10.nome} (mat. {aluno10.matricula})")
-    print(f"  Disciplinas: TCC (7.0) ✓ | Ética em TI → NÃO cursada ✗")
+        arquivo = open(args.arquivo, "r", encoding="utf-8")
+    except OSError as e:
+        print(f"❌ Não foi possível ler {args.arquivo}: {e}", file=sys.stderr)
+        return 2
+
+    adiar_gravacao()
+    repos = (RepositorioAluno(), RepositorioDisciplina(), RepositorioSolicitacao())
+    execucoes = load_db().get("execucoes_batch", {})
+    retomar_apos = 0 if args.recomecar else execucoes.get(chave, 0)
+    if retomar_apos:
+        print(f"↻ Retomando {args.arquivo} após a linha {retomar_apos} (última confirmação).",
+              file=sys.stderr)
+    contagem = {"operacoes": 0, "falhas": 0, "grupos": 0}
+    criacoes = []  # sequência de 'solicitacao criar' independentes, ainda não avaliada
+
+    def registrar(numero, ident, resposta):
+        contagem["operacoes"] += 1
+        contagem["falhas"] += resposta["codigo"] != 0
+        print(json.dumps(dict(linha=numero, id=ident, **resposta), ensure_ascii=False,
+                         default=str), flush=True)
+
+    def avaliar_criacoes():
+        # Uma chamada de validar_lote por conjunto de regras (tipo e curso)
+        validas = [c for c in criacoes if "erro" not in c["preparada"]]
+        por_regras = {}
+        for c in validas:
+            por_regras.setdefault(id(c["preparada"]["regras"]), []).append(c)
+        for grupo in por_regras.values():
+            inicio = time.perf_counter()
+            resultados = service.validar_lote([c["preparada"]["sol"] for c in grupo],
+                                              grupo[0]["preparada"]["regras"])
+            validar = (time.perf_counter() - inicio) / len(grupo)
+            for c, resultado in zip(grupo, resultados):
+                c["resultado"], c["validar"] = resultado, validar
+        for c in criacoes:
+            preparada = c["preparada"]
+            if "erro" in preparada:
+                registrar(c["linha"], c["id"], {"codigo": 1, "saida": "", "erro_saida": "",
+                                                "resultado": preparada})
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                resultado = concluir_criacao(preparada, c["resultado"], c["validar"],
+                                             service, repos[2], interativo=False)
+            registrar(c["linha"], c["id"], {"codigo": 0, "saida": "", "erro_saida": "",
+                                            "resultado": resultado})
+        criacoes.clear()
+
+    def confirmar_ate(numero):
+        avaliar_criacoes()
+        db = load_db()
+        db.setdefault("execucoes_batch", {})[chave] = numero
+        save_db(db)
+        confirmar()
+        contagem["grupos"] += 1
+
+    inicio = time.perf_counter()
+    numero = retomar_apos
     try:
-        sol10 = service.criar_solicitacao("colacao", aluno10, curso_si)
-        service.aplicar_regras(sol10, REGRAS_POR_TIPO["colacao"])
-        status = processar_solicitacao(sol10, service, repo_sol, "colacao", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol10.avancar(); sol10.rejeitar()
-        sol10.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol10, "colacao")
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 11: Colação NEGADA — pendência documental
-    _cabecalho_cenario(11, "Colação NEGADA — pendência documental em aberto")
-    curso_cc = Curso("Ciência da Computação", min_horas_optativas=0)
-    prog = _disc("Programação I", 72, obrigatoria=True)
-    prog2 = _disc("Programação II", 72, obrigatoria=True)
-    curso_cc.adicionar_disciplina(prog)
-    curso_cc.adicionar_disciplina(prog2)
-    aluno11 = Aluno("Renata Gomes", "renata@sgsa.edu.br", "COL003", curso_cc)
-    aluno11.historico.adicionar_disciplina(prog, 9.5)
-    aluno11.historico.adicionar_disciplina(prog2, 8.0)
-    aluno11.adicionar_pendencia("Débito na biblioteca")
-    aluno11.adicionar_pendencia("Certidão de nascimento pendente")
-    print(f"  Aluno:      {aluno11.nome} (mat. {aluno11.matricula})")
-    print(f"  Currículo:  completo ✓")
-    print(f"  Pendências: {', '.join(aluno11.pendencias)}")
+        with arquivo:
+            for numero, texto in enumerate(arquivo, start=1):
+                if numero <= retomar_apos:
+                    continue
+                if texto.strip():
+                    try:
+                        argv, ident = _ler_operacao(texto)
+                    except ValueError as e:
+                        registrar(numero, None, {"codigo": 2, "saida": "", "resultado": None,
+                                                 "erro_saida": f"Linha inválida: {e}"})
+                    else:
+                        operacao = None
+                        if args.validar_em_lote and argv[:2] == ["solicitacao", "criar"]:
+                            try:
+                                with contextlib.redirect_stderr(io.StringIO()):
+                                    operacao = parser.parse_args(argv)
+                            except SystemExit:
+                                pass  # argumentos inválidos: executar_capturado relata o erro
+                        if operacao is not None and \
+                                operacao.mat not in {c["mat"] for c in criacoes}:
+                            try:
+                                with contextlib.redirect_stdout(io.StringIO()):
+                                    preparada = preparar_criacao(operacao, *repos, service,
+                                                                 interativo=False)
+                            except ValueError as e:
+                                preparada = {"status": "Erro", "erro": str(e)}
+                            criacoes.append({"linha": numero, "id": ident, "mat": operacao.mat,
+                                             "preparada": preparada})
+                        else:
+                            # Depende do estado gravado: avalia antes as criações pendentes
+                            avaliar_criacoes()
+                            registrar(numero, ident,
+                                      executar_capturado(argv, parser, repos, service))
+                if (numero - retomar_apos) % args.grupo == 0:
+                    confirmar_ate(numero)
+        avaliar_criacoes()
+        db = load_db()
+        db.get("execucoes_batch", {}).pop(chave, None)
+        if not db.get("execucoes_batch", True):
+            del db["execucoes_batch"]
+        save_db(db)
+        confirmar()
+    except KeyboardInterrupt:
+        print(f"\n⏹️  Interrompido na linha {numero}; as operações após a última confirmação "
+              f"foram descartadas. Execute o mesmo comando para retomar.", file=sys.stderr)
+        return 130
+    finally:
+        adiar_gravacao(False)
+
+    print(f"✅ {contagem['operacoes']} operação(ões), {contagem['falhas']} com erro, "
+          f"{contagem['grupos'] + 1} confirmação(ões) em {time.perf_counter() - inicio:.2f}s.",
+          file=sys.stderr)
+    return 1 if contagem["falhas"] else 0
+
+
+# ---------------------------------------------------------------------------
+# API HTTP/JSON ('api').
+# ---------------------------------------------------------------------------
+
+def _campos(corpo, *nomes) -> list:
+    """Extrai campos obrigatórios do corpo JSON; ValueError se faltar algum."""
+    if not isinstance(corpo, dict):
+        raise ValueError("O corpo da requisição deve ser um objeto JSON.")
+    faltando = [n for n in nomes if corpo.get(n) in (None, "")]
+    if faltando:
+        raise ValueError(f"Campo(s) obrigatório(s): {', '.join(faltando)}.")
+    return [corpo[n] for n in nomes]
+
+
+def configurar_api(servidor, service) -> None:
+    """
+    Registra as rotas da API no servidor.
+
+    Consultas (GET) rodam no pool de leituras; cadastros (POST) passam
+    pela tarefa gravadora, uma de cada vez. As solicitações usam as
+    etapas do modo não interativo do CLI (preparar_criacao/
+    concluir_criacao e preparar_matricula/concluir_matricula): a
+    avaliação das regras roda no pool de leituras e só a gravação passa
+    pela tarefa gravadora, que reavalia o pedido se a carga do semestre
+    mudou desde a avaliação. O
+    conteúdo lido fica em cache e o índice de solicitações é protegido
+    pela trava do repositório (ver RepositorioSolicitacao.pagina).
+
+    :param servidor: ServidorHTTP ainda não iniciado.
+    :param service: SolicitacaoService compartilhado pelas gravações.
+    """
+    from application.relatorio_service import RelatorioService
+    from domain.aluno import Aluno
+    from domain.curso import Curso
+    from domain.disciplina import Disciplina
+    from infrastructure.servidor_http import ErroHTTP, ler_limite, paginar
+
+    # Como no servidor local: as consultas só relêem o arquivo quando ele muda
+    ativar_cache()
+    repo_aluno, repo_disc, repo_sol = RepositorioAluno(), RepositorioDisciplina(), RepositorioSolicitacao()
+    repo_sol.indexar_consultas()
+    relatorio = RelatorioService()
+    revalidacao = criar_revalidacao(repo_aluno, repo_disc, repo_sol)
+
+    def listar_alunos(consulta, corpo):
+        campos = ("nome", "email", "matricula", "curso",
+                  "limite_horas_semestrais", "min_horas_optativas")
+        alunos = [dict(zip(campos, a)) for a in repo_aluno.listar()]
+        if consulta.get("curso"):
+            alunos = [a for a in alunos if a["curso"] == consulta["curso"]]
+        alunos.sort(key=lambda a: a["matricula"])
+        return paginar(alunos, consulta, chave=lambda a: a["matricula"])
+
+    def cadastrar_aluno(consulta, corpo):
+        nome, email, matricula, curso = _campos(corpo, "nome", "email", "mat", "curso")
+        if buscar_aluno_por_matricula(repo_aluno, matricula):
+            raise ErroHTTP(409, f"Matrícula {matricula} já existe.")
+        aluno = Aluno(nome, email, matricula,
+                      Curso(curso, limite_horas_semestrais=int(corpo.get("limite_horas", 360)),
+                            min_horas_optativas=int(corpo.get("min_optativas", 0))))
+        repo_aluno.adicionar(aluno)
+        return {"id": aluno.id, "matricula": matricula}
+
+    def listar_disciplinas(consulta, corpo):
+        disciplinas = sorted(repo_disc.listar_completo(), key=lambda d: d["nome"])
+        return paginar(disciplinas, consulta, chave=lambda d: d["nome"])
+
+    def cadastrar_disciplina(consulta, corpo):
+        nome, carga = _campos(corpo, "nome", "carga")
+        pre = corpo.get("pre_requisitos") or []
+        co = corpo.get("co_requisitos") or []
+        if repo_disc.buscar_por_nome(nome):
+            raise ErroHTTP(409, f"Disciplina '{nome}' já cadastrada.")
+        faltando = [n for n in pre + co if not repo_disc.buscar_por_nome(n)]
+        if faltando:
+            raise ErroHTTP(422, f"Requisito(s) não encontrado(s) no catálogo: {', '.join(faltando)}.")
+        repo_disc.adicionar(Disciplina(nome, int(carga), obrigatoria=not corpo.get("optativa")))
+        if pre:
+            repo_disc.atualizar_pre_requisitos(nome, pre)
+        if co:
+            repo_disc.atualizar_co_requisitos(nome, co)
+        if pre or co:
+            revalidacao.apos_alteracao_catalogo(nome, None if pre and co else "pre" if pre else "co")
+        return repo_disc.buscar_por_nome(nome)
+
+    def listar_solicitacoes(consulta, corpo):
+        limite = ler_limite(consulta)
+        try:
+            apos = int(consulta.get("apos", 0))
+        except ValueError:
+            raise ValueError("'apos' deve ser inteiro.")
+        pagina = repo_sol.pagina(limite, apos, status=consulta.get("status"),
+                                 tipo=consulta.get("tipo"), aluno_id=consulta.get("mat"),
+                                 alvo=consulta.get("alvo"))
+        campos = (("id", "id"), ("tipo", "tipo"), ("matricula", "aluno_id"), ("status", "status"),
+                  ("alvo", "alvo"), ("protocolo", "protocolo"))
+        pagina["itens"] = [{nome: s.get(campo) for nome, campo in campos} for s in pagina["itens"]]
+        return dict(pagina, limite=limite, apos=apos)
+
+    # Solicitações em duas etapas: carga e regras no pool de leituras, gravação na
+    # tarefa gravadora. Se outra matrícula mudou a carga do semestre nesse meio
+    # tempo, a gravadora reavalia as regras sobre a carga gravada.
+
+    def avaliar_solicitacao(consulta, corpo):
+        tipo, matricula, alvo = _campos(corpo, "tipo", "mat", "alvo")
+        if tipo not in ("matricula", "trancamento", "colacao"):
+            raise ValueError(f"Tipo de solicitação inválido: '{tipo}'.")
+        args = argparse.Namespace(tipo=tipo, mat=matricula, alvo=alvo,
+                                  prazo=corpo.get("prazo"), carga_atual=None)
+        preparada = preparar_criacao(args, repo_aluno, repo_disc, repo_sol, service,
+                                     interativo=False)
+        if "erro" in preparada:
+            raise ErroHTTP(422, preparada["erro"])
+        inicio = time.perf_counter()
+        preparada["resultado"] = service.avaliar_regras(preparada["sol"], preparada["regras"])
+        preparada["validar"] = time.perf_counter() - inicio
+        return preparada
+
+    def gravar_solicitacao(preparada):
+        sol, resultado = preparada["sol"], preparada["resultado"]
+        if preparada["tipo"] == "matricula":
+            carga = repo_sol.carga_semestral(sol.aluno.matricula, sol.semestre)
+            if carga != sol.carga_horaria_semestre_atual:
+                sol.carga_horaria_semestre_atual = carga
+                resultado = service.avaliar_regras(sol, preparada["regras"])
+        return concluir_criacao(preparada, resultado, preparada["validar"], service, repo_sol,
+                                interativo=False)
+
+    def avaliar_matricula(consulta, corpo):
+        matricula, disciplinas = _campos(corpo, "mat", "disciplinas")
+        args = argparse.Namespace(mat=matricula, disciplinas=list(disciplinas))
+        preparada = preparar_matricula(args, repo_aluno, repo_disc, repo_sol, service,
+                                       interativo=False)
+        if "erro" in preparada:
+            raise ErroHTTP(422, preparada["erro"])
+        inicio = time.perf_counter()
+        preparada["resultados"] = service.validar_lote(preparada["sols"], preparada["regras"])
+        preparada["validar"] = time.perf_counter() - inicio
+        return preparada
+
+    def gravar_matricula(preparada):
+        resultados = preparada["resultados"]
+        carga = repo_sol.carga_semestral(preparada["aluno"].matricula, preparada["semestre"])
+        if carga != preparada["carga_atual"]:
+            preparada["sols"] = service.criar_matricula_lote(
+                preparada["aluno"], preparada["disciplinas"], carga, preparada["semestre"])
+            resultados = service.validar_lote(preparada["sols"], preparada["regras"])
+        return concluir_matricula(preparada, resultados, preparada["validar"], repo_sol,
+                                  interativo=False)
+
+    servidor.rota("GET", "/saude", lambda consulta, corpo: {"ok": True})
+    servidor.rota("GET", "/alunos", listar_alunos)
+    servidor.rota("POST", "/alunos", cadastrar_aluno, escrita=True)
+    servidor.rota("GET", "/disciplinas", listar_disciplinas)
+    servidor.rota("POST", "/disciplinas", cadastrar_disciplina, escrita=True)
+    servidor.rota("GET", "/solicitacoes", listar_solicitacoes)
+    servidor.rota("POST", "/solicitacoes", avaliar_solicitacao, gravacao=gravar_solicitacao)
+    servidor.rota("POST", "/matriculas", avaliar_matricula, gravacao=gravar_matricula)
+    servidor.rota("GET", "/relatorio", lambda consulta, corpo: relatorio.resumir(repo_sol.listar()))
+
+
+def servir_api(args, service) -> None:
+    """Executa a API HTTP até Ctrl+C ou SIGTERM."""
+    import signal
+    from infrastructure.servidor_http import ServidorHTTP
+
     try:
-        sol11 = service.criar_solicitacao("colacao", aluno11, curso_cc)
-        service.aplicar_regras(sol11, REGRAS_POR_TIPO["colacao"])
-        status = processar_solicitacao(sol11, service, repo_sol, "colacao", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol11.avancar(); sol11.rejeitar()
-        sol11.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol11, "colacao")
-        _resultado("Rejeitada", str(e))
-
-    # Cenário 12: Colação NEGADA — créditos insuficientes
-    _cabecalho_cenario(12, "Colação NEGADA — créditos insuficientes (< 80h)")
-    curso_mat = Curso("Matemática", min_horas_optativas=0)
-    intro = _disc("Introdução à Matemática", 40, obrigatoria=True)
-    curso_mat.adicionar_disciplina(intro)
-    aluno12 = Aluno("Pedro Carvalho", "pedro@sgsa.edu.br", "COL004", curso_mat)
-    aluno12.historico.adicionar_disciplina(intro, 8.0)
-    print(f"  Aluno:      {aluno12.nome} (mat. {aluno12.matricula})")
-    print(f"  Créditos: {aluno12.historico.total_creditos()}h  |  Mínimo exigido: 80h")
+        servidor = ServidorHTTP(args.host, args.porta, trabalhadores=args.trabalhadores,
+                                timeout=args.timeout)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    configurar_api(servidor, service)
+    signal.signal(signal.SIGTERM, lambda *_: servidor.encerrar())
+    print(f"🟢 API SGSA em http://{args.host}:{args.porta} (Ctrl+C para encerrar)")
     try:
-        sol12 = service.criar_solicitacao("colacao", aluno12, curso_mat)
-        service.aplicar_regras(sol12, REGRAS_POR_TIPO["colacao"])
-        status = processar_solicitacao(sol12, service, repo_sol, "colacao", gerar_protocolo())
-        _resultado(status)
-    except ViolacaoRegraAcademicaError as e:
-        sol12.avancar(); sol12.rejeitar()
-        sol12.protocolo = gerar_protocolo()
-        repo_sol.adicionar(sol12, "colacao")
-        _resultado("Rejeitada", str(e))
-
-    # ---------------------------------------------------------------
-    # Resumo final
-    # ---------------------------------------------------------------
-    print("\n" + "═" * 60)
-    print("  RESUMO DA DEMONSTRAÇÃO")
-    print("═" * 60)
-    print(f"  {'Cen.':<6} {'Tipo':<14} {'Resultado'}")
-    print("  " + "─" * 56)
-    resumo = [
-        ("1",  "Matrícula",   "✅ APROVADA  — sem restrições"),
-        ("2",  "Matrícula",   "❌ NEGADA    — pré-requisito não cumprido"),
-        ("3",  "Matrícula",   "❌ NEGADA    — co-requisito não simultâneo"),
-        ("4",  "Matrícula",   "❌ NEGADA    — carga horária excedida"),
-        ("5",  "Trancamento", "✅ APROVADA  — dentro do prazo, vínculo ativo"),
-        ("6",  "Trancamento", "❌ NEGADA    — prazo encerrado"),
-        ("7",  "Trancamento", "❌ NEGADA    — limite de 4 trancamentos"),
-        ("8",  "Trancamento", "❌ NEGADA    — vínculo já trancado"),
-        ("9",  "Colação",     "✅ APROVADA  — currículo completo"),
-        ("10", "Colação",     "❌ NEGADA    — disciplina obrigatória pendente"),
-        ("11", "Colação",     "❌ NEGADA    — pendência documental"),
-        ("12", "Colação",     "❌ NEGADA    — créditos insuficientes"),
-    ]
-    for num, tipo, resultado in resumo:
-        print(f"  {num:<6} {tipo:<14} {resultado}")
-    print("═" * 60 + "\n")
+        servidor.servir()
+    except OSError as e:
+        print(f"❌ Não foi possível abrir {args.host}:{args.porta}: {e}")
+        sys.exit(1)
+    print("🔴 API encerrada.")
 
 
-def main() -> None:
-    """Função principal que inicializa o sistema e executa o comando."""
-    init_db()
-    parser = setup_argparse()
-    args = parser.parse_args()
+# ---------------------------------------------------------------------------
+# Execução dos comandos (CLI e servidor local).
+# ---------------------------------------------------------------------------
 
-    repo_aluno = RepositorioAluno()
-    repo_disc = RepositorioDisciplina()
-    repo_sol = RepositorioSolicitacao()
-    notificacao = NotificacaoService()
-    service = SolicitacaoService(notificacao_service=notificacao)
+@contextlib.contextmanager
+def _abrir_exportacao(caminho: str, compactar: bool):
+    """
+    Abre o destino de uma exportação como arquivo de texto.
+
+    Com caminho, escreve em um temporário ao lado e só o renomeia ao
+    final: uma exportação interrompida não deixa um arquivo truncado no
+    lugar do anterior.
+
+    :param caminho: Arquivo de destino (None = saída padrão).
+    :param compactar: Compacta com gzip.
+    """
+    import gzip
+
+    if caminho is None:
+        if not compactar:
+            yield sys.stdout
+            return
+        with gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb") as bruto, \
+                io.TextIOWrapper(bruto, encoding="utf-8", newline="") as destino:
+            yield destino
+        return
+
+    temporario = f"{caminho}.tmp"
+    try:
+        if compactar:
+            destino = gzip.open(temporario, "wt", encoding="utf-8", newline="")
+        else:
+            destino = open(temporario, "w", encoding="utf-8", newline="")
+        with destino:
+            yield destino
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+
+def executar_exportacao(args, repo_aluno, repo_disc, repo_sol) -> None:
+    """Executa o comando 'exportar' (ver ExportacaoService)."""
+    from application.exportacao_service import ExportacaoService
+
+    exportacao = ExportacaoService(repo_aluno, repo_disc, repo_sol)
+    caminho = args.saida
+    compactar = args.gzip or (caminho or "").endswith(".gz")
+    formato = args.formato or \
+        ("jsonl" if (caminho or "").endswith((".jsonl", ".jsonl.gz")) else "csv")
+    colunas = [c.strip() for c in args.colunas.split(",") if c.strip()] if args.colunas else None
+    # Mensagens vão para stderr quando os dados saem pela saída padrão
+    mensagens = sys.stdout if caminho else sys.stderr
+    try:
+        # Valida antes de abrir o destino, para não criar arquivo à toa
+        exportacao.colunas(args.colecao, colunas)
+        filtros = dict(status=args.status, tipo=args.tipo, curso=args.curso, de=args.de, ate=args.ate)
+        exportacao.registros(args.colecao, **filtros)
+        with _abrir_exportacao(caminho, compactar) as destino:
+            total = exportacao.exportar(args.colecao, destino, formato, colunas, **filtros)
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}", file=mensagens)
+        sys.exit(1)
+    if caminho:
+        print(f"✅ {total} registro(s) exportado(s) para {caminho}.", file=mensagens)
+
+
+def executar_comando(args, parser, repo_aluno, repo_disc, repo_sol, service,
+                     interativo: bool = True, animacao: bool = True) -> dict:
+    """
+    Executa um comando já interpretado pelo argparse.
+
+    Usada pelo CLI e pelo servidor 'serve', que mantém os repositórios e
+    o serviço entre requisições.
 
+    :param args: Namespace retornado por setup_argparse().parse_args().
+    :param interativo: Se False, 'solicitacao criar/matricular' não exibem
+                       nada e retornam o resultado para saída em JSON.
+    :param animacao: Se False, omite a animação de verificação.
+    :return: Resultado de 'solicitacao criar/matricular' no modo não
+             interativo; None nos demais casos (a saída já foi exibida).
+    """
     if args.command == "aluno":
         if args.subcommand == "cadastrar":
+            from domain.aluno import Aluno
+            from domain.curso import Curso
             limite_horas = getattr(args, 'limite_horas', 360) or 360
             min_optativas = getattr(args, 'min_optativas', 0) or 0
             curso_obj = Curso(args.curso,
@@ -717,6 +1356,16 @@ def main() -> None:
             aluno = Aluno(args.nome, args.email, args.mat, curso_obj)
             repo_aluno.adicionar(aluno)
             print(f"✅ Aluno '{args.nome}' cadastrado com sucesso! (UUID: {aluno.id})")
+        elif args.subcommand == "importar":
+            from application.importacao_service import ImportacaoService
+            importacao = ImportacaoService(repo_aluno=repo_aluno)
+            try:
+                total = importacao.importar_alunos(ImportacaoService.ler_csv(args.arquivo))
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+            print(f"✅ {total} aluno(s) importado(s) de {args.arquivo}.")
+
         elif args.subcommand == "listar":
             registros = repo_aluno.listar()
             if not registros:
@@ -727,14 +1376,85 @@ def main() -> None:
                     print(f"  - {a[0]} | Mat: {a[2]} | Curso: {a[3]} | E-mail: {a[1]}")
         elif args.subcommand == "remover":
             repo_aluno.remover(args.mat)
+        elif args.subcommand == "elegiveis":
+            aluno_obj = buscar_aluno_por_matricula(repo_aluno, args.mat)
+            if not aluno_obj:
+                print(f"❌ Aluno com matrícula '{args.mat}' não encontrado.")
+                return
+            from application.catalogo_service import CatalogoService
+            resultado = CatalogoService(repo_disc.carregar_grafo()).disciplinas_elegiveis(aluno_obj)
+
+            print(f"\n✅ Disciplinas disponíveis para {aluno_obj.nome} (mat. {aluno_obj.matricula}):")
+            if not resultado["elegiveis"]:
+                print("  Nenhuma.")
+            for nome in sorted(resultado["elegiveis"]):
+                junto = resultado["elegiveis"][nome]
+                extra = f" (cursar junto: {', '.join(sorted(junto))})" if junto else ""
+                print(f"  - {nome}{extra}")
+
+            motivos = [
+                ("pre_requisito", "Pré-requisito pendente"),
+                ("co_requisito", "Co-requisito indisponível"),
+                ("carga_horaria", "Carga acima do limite semestral"),
+            ]
+            for chave, titulo in motivos:
+                if resultado[chave]:
+                    print(f"\n⛔ {titulo}:")
+                    for nome in sorted(resultado[chave]):
+                        detalhe = resultado[chave][nome]
+                        if isinstance(detalhe, int):
+                            detalhe = f"{detalhe}h"
+                        else:
+                            detalhe = ", ".join(sorted(detalhe))
+                        print(f"  - {nome}: {detalhe}")
+        elif args.subcommand == "planejar":
+            from application.planejamento_service import PlanejamentoService
+            planejador = PlanejamentoService(repo_disc.carregar_grafo())
+            if args.todos:
+                alunos = [buscar_aluno_por_matricula(repo_aluno, a[2]) for a in repo_aluno.listar()]
+                planos = planejador.planejar_lote(a for a in alunos if a)
+                if not planos:
+                    print("  Nenhum aluno cadastrado.")
+                    return
+                print("\n🗓️  Planos de integralização:")
+                for plano in planos:
+                    if "erro" in plano:
+                        print(f"  - {plano['matricula']}: ❌ {plano['erro']}")
+                    else:
+                        marca = "ótimo" if plano["otimo"] else f"mínimo ≥ {plano['limite_inferior']}"
+                        print(f"  - {plano['matricula']}: {plano['total_semestres']} semestre(s) ({marca})")
+                return
+
+            aluno_obj = buscar_aluno_por_matricula(repo_aluno, args.mat)
+            if not aluno_obj:
+                print(f"❌ Aluno com matrícula '{args.mat}' não encontrado.")
+                return
+            try:
+                plano = planejador.planejar(aluno_obj)
+            except ValueError as e:
+                print(f"❌ Plano inviável: {e}")
+                return
+
+            print(f"\n🗓️  Plano de integralização de {aluno_obj.nome} (mat. {aluno_obj.matricula}):")
+            if not plano["semestres"]:
+                print("  Nenhuma disciplina pendente.")
+            for i, (semestre, horas) in enumerate(zip(plano["semestres"], plano["horas_por_semestre"]), 1):
+                print(f"  {i}º semestre ({horas}h): {', '.join(semestre)}")
+            print(f"\n  Total: {plano['total_semestres']} semestre(s) | "
+                  f"limite inferior: {plano['limite_inferior']}"
+                  f"{' (plano ótimo)' if plano['otimo'] else ''}")
+            if plano["optativas_escolhidas"]:
+                print(f"  Optativas/requisitos escolhidos: {', '.join(plano['optativas_escolhidas'])}")
 
     elif args.command == "disciplina":
         if args.subcommand == "cadastrar":
+            from domain.disciplina import Disciplina
             obrigatoria = not getattr(args, 'optativa', False)
             disc = Disciplina(args.nome, args.carga, obrigatoria=obrigatoria)
             repo_disc.adicionar(disc)
 
             # Processa pré-requisito se informado
+            vinculos = []
             pre_req_nome = getattr(args, 'pre_req', None)
             if pre_req_nome:
                 pre_dados = repo_disc.buscar_por_nome(pre_req_nome)
@@ -744,6 +1464,7 @@ def main() -> None:
                         db_pre_reqs.append(pre_req_nome)
                     repo_disc.atualizar_pre_requisitos(args.nome, db_pre_reqs)
                     print(f"   Pré-requisito '{pre_req_nome}' vinculado.")
+                    vinculos.append("pre")
                 else:
                     print(f"   ⚠️  Pré-requisito '{pre_req_nome}' não encontrado no catálogo.")
 
@@ -757,11 +1478,30 @@ def main() -> None:
                         db_co_reqs.append(co_req_nome)
                     repo_disc.atualizar_co_requisitos(args.nome, db_co_reqs)
                     print(f"   Co-requisito '{co_req_nome}' vinculado.")
+                    vinculos.append("co")
                 else:
                     print(f"   ⚠️  Co-requisito '{co_req_nome}' não encontrado no catálogo.")
 
             print(f"✅ Disciplina '{args.nome}' ({args.carga}h) adicionada.")
 
+            # Um requisito novo numa disciplina já cadastrada pode invalidar matrículas
+            if vinculos:
+                revalidacao = criar_revalidacao(repo_aluno, repo_disc, repo_sol)
+                resultados = revalidacao.apos_alteracao_catalogo(
+                    args.nome, vinculos[0] if len(vinculos) == 1 else None)
+                if resultados:
+                    exibir_revalidacao(resultados)
+
+        elif args.subcommand == "importar":
+            from application.importacao_service import ImportacaoService
+            importacao = ImportacaoService(repo_disc=repo_disc)
+            try:
+                total = importacao.importar_disciplinas(ImportacaoService.ler_csv(args.arquivo))
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+            print(f"✅ {total} disciplina(s) importada(s) de {args.arquivo}.")
+
         elif args.subcommand == "listar":
             disciplinas = repo_disc.listar_completo()
             if not disciplinas:
@@ -775,100 +1515,344 @@ def main() -> None:
                     print(f"  - {d['nome']} ({d['carga_horaria']}h) | {tipo} "
                           f"| Pré-req: {pre_reqs} | Co-req: {co_reqs}")
 
+        elif args.subcommand == "dependentes":
+            if args.transitivo:
+                dependentes = repo_disc.dependentes_transitivos(args.nome, args.vinculo)
+            else:
+                dependentes = repo_disc.dependentes_diretos(args.nome, args.vinculo)
+            if not dependentes:
+                print(f"  Nenhuma disciplina depende de '{args.nome}'.")
+            else:
+                escopo = "direta ou indiretamente" if args.transitivo else "diretamente"
+                print(f"\n🔗 Disciplinas que dependem {escopo} de '{args.nome}':")
+                for nome in dependentes:
+                    print(f"  - {nome}")
+        elif args.subcommand == "analisar":
+            from application.analise_curricular_service import AnaliseCurricularService
+            try:
+                relatorio = AnaliseCurricularService(repo_disc.carregar_grafo()).analisar(top=args.top)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+            print(f"\n📊 Análise do catálogo ({relatorio['total_disciplinas']} disciplinas)")
+            print(f"\n  Caminho crítico ({relatorio['comprimento_caminho_critico']} semestre(s)):")
+            print(f"    {' → '.join(relatorio['caminho_critico']) or 'vazio'}")
+
+            print("\n  Disciplinas por nível de pré-requisito:")
+            for nivel, qtd in relatorio["histograma_profundidade"].items():
+                print(f"    {nivel:>3}: {qtd}")
+
+            print("\n  Gargalos (horas bloqueadas a jusante):")
+            if not relatorio["gargalos"]:
+                print("    Nenhum.")
+            for g in relatorio["gargalos"]:
+                print(f"    - {g['nome']}: {g['horas_bloqueadas']}h em {g['dependentes']} "
+                      f"disciplina(s) | fan-in {relatorio['fan_in'][g['nome']]}, "
+                      f"fan-out {relatorio['fan_out'][g['nome']]}")
+
     elif args.command == "solicitacao":
-        if args.subcommand == "criar":
-            # Busca o aluno real no banco de dados
-            aluno_obj = buscar_aluno_por_matricula(repo_aluno, args.mat)
-            if not aluno_obj:
-                print(f"❌ Aluno com matrícula '{args.mat}' não encontrado. "
-                      f"Cadastre o aluno primeiro com: aluno cadastrar --nome ... --mat {args.mat}")
+        if args.subcommand in ("criar", "matricular"):
+            executar = executar_criar if args.subcommand == "criar" else executar_matricular
+            if interativo:
+                executar(args, repo_aluno, repo_disc, repo_sol, service, animacao=animacao)
+                return None
+            # Saída de máquina: o resultado vira um único objeto JSON, sem avisos
+            with contextlib.redirect_stdout(io.StringIO()):
+                return executar(args, repo_aluno, repo_disc, repo_sol, service,
+                                interativo=False)
+
+        elif args.subcommand == "listar":
+            if args.limite is not None and args.limite < 1:
+                print("❌ --limite deve ser positivo.")
                 return
+            registros = repo_sol.consultar(status=args.status, tipo=args.tipo, aluno_id=args.mat,
+                                           alvo=args.alvo, apos=args.apos)
+            if args.limite is not None:
+                # Um a mais, só para saber se há próxima página
+                registros = itertools.islice(registros, args.limite + 1)
+            exibidas, ultimo, bloco = 0, None, []
+            for s in registros:
+                if exibidas == args.limite:
+                    bloco.append(f"  ... há mais solicitações: use --apos {ultimo}\n")
+                    break
+                if not exibidas:
+                    print("\n📄 Lista de Solicitações:")
+                    print(f"  {'ID':<4} {'Protocolo':<16} {'Tipo':<12} "
+                          f"{'Aluno':<12} {'Alvo':<30} {'Status'}")
+                    print("  " + "─" * 90)
+                bloco.append(
+                    f"  {str(s.get('id')):<4} "
+                    f"{str(s.get('protocolo', 'S/P')):<16} "
+                    f"{str(s.get('tipo')):<12} "
+                    f"{str(s.get('aluno_id')):<12} "
+                    f"{str(s.get('alvo')):<30} "
+                    f"{s.get('status')}\n"
+                )
+                exibidas, ultimo = exibidas + 1, s.get('id')
+                # Escrita em blocos: a primeira página aparece sem esperar o restante
+                if len(bloco) == 200:
+                    sys.stdout.write("".join(bloco))
+                    sys.stdout.flush()
+                    bloco = []
+            sys.stdout.write("".join(bloco))
+            if not exibidas:
+                filtrada = args.status or args.tipo or args.mat or args.alvo or args.apos
+                print("  Nenhuma solicitação encontrada." if filtrada
+                      else "  Nenhuma solicitação registrada.")
+
+        elif args.subcommand == "revalidar":
+            revalidacao = criar_revalidacao(repo_aluno, repo_disc, repo_sol)
+            if args.mat:
+                resultados = revalidacao.apos_alteracao_historico(args.mat, args.disciplina)
+            else:
+                resultados = revalidacao.apos_alteracao_catalogo(args.disciplina, args.vinculo)
 
-            alvo_obj = None
-            if args.tipo in ["matricula", "trancamento"]:
-                # Reconstrói a disciplina com pré/co-requisitos do banco
-                alvo_obj = buscar_disciplina_por_nome(repo_disc, args.alvo)
-                if not alvo_obj:
-                    print(f"❌ Disciplina '{args.alvo}' não encontrada no catálogo.")
-                    return
-            elif args.tipo == "colacao":
-                alvo_obj = aluno_obj.curso  # usa o curso real do aluno
-
-            kwargs = {}
-            if args.tipo == "trancamento" and args.prazo:
-                kwargs["prazo"] = datetime.date.fromisoformat(args.prazo)
-                kwargs["data"] = datetime.date.today()
-
-            protocolo = gerar_protocolo()
-            print(f"\n📋 Protocolo: {protocolo}")
-            print(f"   Aluno:  {aluno_obj.nome} (mat. {aluno_obj.matricula})")
-            print(f"   Tipo:   {args.tipo.capitalize()}")
-            alvo_nome = alvo_obj.nome if hasattr(alvo_obj, 'nome') else str(alvo_obj)
-            print(f"   Alvo:   {alvo_nome}")
-
-            # Exibe informações de pré/co-requisitos para matrícula
-            if args.tipo == "matricula":
-                pre_reqs = [p.nome for p in alvo_obj.pre_requisitos]
-                co_reqs = [c.nome for c in alvo_obj.co_requisitos]
-                if pre_reqs:
-                    print(f"   Pré-requisitos: {', '.join(pre_reqs)}")
-                if co_reqs:
-                    print(f"   Co-requisitos: {', '.join(co_reqs)}")
+            if not resultados:
+                print("  Nenhuma matrícula pendente afetada.")
+            else:
+                exibir_revalidacao(resultados)
+
+    elif args.command == "colacao":
+        if args.subcommand == "varredura":
+            alunos = repo_aluno.listar()
+            if args.curso:
+                alunos = [a for a in alunos if a[3] == args.curso]
+            if not alunos:
+                print("  Nenhum aluno para avaliar.")
+                return
+
+            inicio = time.perf_counter()
 
+            def _progresso(avaliados, total):
+                taxa = avaliados / max(time.perf_counter() - inicio, 1e-9)
+                print(f"\r  {avaliados}/{total} ({avaliados / total:.0%}) | "
+                      f"{taxa:.0f} alunos/s", end="", flush=True)
+
+            from application.varredura_colacao_service import VarreduraColacaoService
+            regras_colacao = POLITICA.regras_por_curso("colacao")
+            varredura = VarreduraColacaoService(repo_disc.listar_completo(),
+                                                regras_colacao.pop(None),
+                                                regras_por_curso=regras_colacao)
             try:
-                # Animação visual enquanto processa
-                animacao_verificando_solicitacao(duracao=3.5)
-
-                sol = service.criar_solicitacao(args.tipo, aluno_obj, alvo_obj, **kwargs)
-                carga_atual = getattr(args, 'carga_atual', 0) or 0
-                if carga_atual > 0 and args.tipo == "matricula":
-                    sol.carga_horaria_semestre_atual = carga_atual
-
-                regras = REGRAS_POR_TIPO.get(args.tipo, [])
-                service.aplicar_regras(sol, regras)
-                status = processar_solicitacao(sol, service, repo_sol, args.tipo, protocolo)
-
-                print(f"\n✅ Solicitação {protocolo} APROVADA!")
-                print(f"   Status final: {status}")
-
-            except ViolacaoRegraAcademicaError as e:
-                print(f"\n❌ Solicitação {protocolo} NEGADA.")
-                print(f"   Motivo: {e}")
-                try:
-                    sol.avancar()
-                    sol.rejeitar()
-                    sol.protocolo = protocolo
-                    repo_sol.adicionar(sol, args.tipo)
-                    print(f"   Registro salvo com status: Rejeitada")
-                except Exception:
-                    pass
+                resumo = varredura.executar(alunos, args.relatorio, processos=args.processos,
+                                            tamanho_bloco=args.bloco, retomar=args.retomar,
+                                            progresso=_progresso)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+            print(f"\n\n🎓 Varredura concluída em {time.perf_counter() - inicio:.1f}s: "
+                  f"{resumo['aptos']} apto(s), {resumo['inaptos']} inapto(s)"
+                  + (f", {resumo['retomados']} retomado(s) do checkpoint" if resumo['retomados'] else ""))
+            print(f"   Relatório: {resumo['relatorio']}")
+
+    elif args.command == "calendario":
+        if args.subcommand == "importar":
+            try:
+                total = CALENDARIO.importar_arquivo(args.arquivo, substituir=args.substituir)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+            print(f"✅ {total} período(s) importado(s) de {args.arquivo}.")
 
         elif args.subcommand == "listar":
-            solicitacoes = repo_sol.listar()
-            if not solicitacoes:
-                print("  Nenhuma solicitação registrada.")
+            periodos = CALENDARIO.listar(args.tipo, args.curso)
+            if not periodos:
+                print("  Nenhum período cadastrado.")
+            for p in periodos:
+                print(f"  {p['semestre']:<8} {p['tipo']:<12} "
+                      f"{p['inicio']:%d/%m/%Y} a {p['fim']:%d/%m/%Y}  "
+                      f"{p['curso'] or '(institucional)'}")
+
+        elif args.subcommand == "atual":
+            periodo = CALENDARIO.periodo_atual(args.tipo, args.curso)
+            if periodo is None:
+                print(f"  Nenhum período de {args.tipo} aberto hoje.")
             else:
-                print("\n📄 Lista de Solicitações:")
-                print(f"  {'ID':<4} {'Protocolo':<16} {'Tipo':<12} "
-                      f"{'Aluno':<12} {'Alvo':<30} {'Status'}")
-                print("  " + "─" * 90)
-                for s in solicitacoes:
-                    protocolo_val = s[5] if len(s) > 5 else "S/P"
-                    print(
-                        f"  {str(s[0]):<4} "
-                        f"{str(protocolo_val):<16} "
-                        f"{str(s[1]):<12} "
-                        f"{str(s[2]):<12} "
-                        f"{str(s[4]):<30} "
-                        f"{s[3]}"
-                    )
+                print(f"  {args.tipo.capitalize()} aberto ({periodo['semestre']}): "
+                      f"{periodo['inicio']:%d/%m/%Y} a {periodo['fim']:%d/%m/%Y}")
+
+    elif args.command == "regras":
+        if args.subcommand == "estatisticas":
+            from application.instrumentacao_regras import InstrumentacaoRegras
+            try:
+                dados = InstrumentacaoRegras.carregar(ARQUIVO_INSTRUMENTACAO)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+            if not dados:
+                print(f"  Nenhuma medição em {ARQUIVO_INSTRUMENTACAO}. "
+                      "Execute comandos com --instrumentar para coletar.")
+                return
+
+            print(f"\n⏱️  Instrumentação das regras ({ARQUIVO_INSTRUMENTACAO}):")
+            print(f"  {'Regra':<28} {'Execuções':>9} {'Rejeições':>9} {'Taxa':>5} "
+                  f"{'p50 µs':>9} {'p90 µs':>9} {'p99 µs':>9} {'máx µs':>9} {'total ms':>9}")
+            print("  " + "─" * 103)
+            for r in dados.resumo(args.ordenar):
+                print(f"  {r['regra']:<28} {r['execucoes']:>9} {r['rejeicoes']:>9} "
+                      f"{r['taxa_rejeicao']:>5.0%} {r['p50_us']:>9.1f} {r['p90_us']:>9.1f} "
+                      f"{r['p99_us']:>9.1f} {r['max_us']:>9.1f} {r['tempo_total_ms']:>9.2f}")
+
+            print("\n  Profundidade alcançada (regras executadas por avaliação):")
+            for conjunto, p in dados.profundidades().items():
+                distribuicao = ", ".join(f"{n}: {c}" for n, c in p["profundidade"].items())
+                print(f"    [{conjunto}] média {p['profundidade_media']:.2f} de "
+                      f"{p['total_regras']} | {distribuicao}")
+
+            if args.exportar:
+                dados.salvar(args.exportar)
+                print(f"\n  Dados exportados para {args.exportar}")
+            if args.limpar:
+                os.remove(ARQUIVO_INSTRUMENTACAO)
+                print("\n  Instrumentação acumulada zerada.")
 
     elif args.command == "demo":
-        executar_demo(repo_sol)
+        from cli.demo import executar_demo
+        executar_demo(repo_sol, POLITICA, CACHE_REGRAS)
 
     else:
         parser.print_help()
 
 
+# ---------------------------------------------------------------------------
+# Medição da execução (--perfil e --tempos).
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def medir_execucao(args):
+    """
+    Mede o bloco conforme as opções globais, inclusive se terminar com sys.exit().
+
+    --perfil grava as estatísticas do cProfile no arquivo informado (ver
+    com 'python -m pstats ARQUIVO'). --tempos ativa a medição por fase
+    (infrastructure/medicao.py) e exibe o resumo na saída de erro, para
+    não misturar com a saída JSON.
+    """
+    medicao = perfil = None
+    if args.tempos:
+        from infrastructure.medicao import ativar_medicao
+        medicao = ativar_medicao()
+    if args.perfil:
+        import cProfile
+        perfil = cProfile.Profile()
+        perfil.enable()
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        total = time.perf_counter() - inicio
+        if perfil is not None:
+            perfil.disable()
+            perfil.dump_stats(args.perfil)
+            print(f"📊 Perfil gravado em {args.perfil} (python -m pstats {args.perfil})",
+                  file=sys.stderr)
+        if medicao is not None:
+            imprimir_tempos(medicao, total)
+
+
+def imprimir_tempos(medicao, total: float) -> None:
+    """
+    Exibe na saída de erro o tempo de cada fase e, se houve avaliação de
+    regras, o de cada regra (medido pela instrumentação dos pipelines).
+
+    :param medicao: MedicaoFases da execução.
+    :param total: Duração do comando, em segundos.
+    """
+    total_ms = total * 1000
+    print(f"\n⏱️  Tempo por fase (comando: {total_ms:.2f} ms; fases internas "
+          f"recuadas, já incluídas na de cima):", file=sys.stderr)
+    print(f"  {'Fase':<34} {'Chamadas':>8} {'Total ms':>10} {'Média ms':>10} {'%':>6}",
+          file=sys.stderr)
+    linhas = []
+    for f in medicao.resumo():
+        linhas.append(("  " * f["nivel"] + f["fase"], f["chamadas"], f["total_ms"], f["media_ms"]))
+        if f["fase"] == "regras" and INSTRUMENTACAO:
+            recuo = "  " * (f["nivel"] + 1)
+            linhas += [(recuo + r["regra"], r["execucoes"], r["tempo_total_ms"],
+                        r["tempo_total_ms"] / r["execucoes"]) for r in INSTRUMENTACAO.resumo()]
+    # O que nenhuma fase cobre: importações sob demanda, argparse, formatação da saída
+    medido = sum(f["total_ms"] for f in medicao.resumo() if f["nivel"] == 0)
+    linhas.append(("outros (importações, CLI)", 1, total_ms - medido, total_ms - medido))
+    for nome, chamadas, total_fase, media in linhas:
+        print(f"  {nome:<34} {chamadas:>8} {total_fase:>10.3f} {media:>10.3f} "
+              f"{total_fase / max(total_ms, 1e-9):>6.1%}", file=sys.stderr)
+
+
+def main() -> None:
+    """Função principal que lê os argumentos e executa o comando, medindo se pedido."""
+    parser = setup_argparse()
+    args = parser.parse_args()
+    with medir_execucao(args):
+        iniciar(parser, args)
+
+
+def iniciar(parser, args) -> None:
+    """Inicializa o sistema e executa o comando."""
+    # Sem terminal (chamado por outro programa), a criação de solicitações responde em JSON
+    interativo = args.interativo or (not args.json and sys.stdout.isatty())
+    # As medições valem para este processo: não encaminha ao servidor
+    local = args.local or args.perfil or args.tempos
+    if not local and args.command not in COMANDOS_DE_PROCESSO and \
+            encaminhar_ao_servidor(sys.argv[1:], interativo):
+        return
+    saida_json = args.command == "batch" or (args.command == "exportar" and not args.saida) or \
+        (not interativo and getattr(args, "subcommand", None) in ("criar", "matricular"))
+    if not saida_json:
+        init_db()
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            init_db()
+    # Só os comandos que avaliam regras carregam a política e os módulos de regras
+    if args.politica or args.instrumentar or usa_regras(args):
+        preparar_regras()
+    elif args.command == "calendario":
+        preparar_calendario()
+    if args.politica:
+        try:
+            POLITICA.carregar(args.politica)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+    if POLITICA is not None and args.command != "demo":
+        POLITICA.calendario = CALENDARIO
+    # --tempos usa a instrumentação para o tempo de cada regra, sem acumulá-la
+    medir_regras = POLITICA is not None and (args.instrumentar or args.tempos)
+    if medir_regras:
+        POLITICA.instrumentacao = INSTRUMENTACAO
+    if args.instrumentar:
+        import atexit
+        atexit.register(_acumular_instrumentacao)
+
+    service = None
+    if usa_regras(args):
+        from application.notificacao_service import NotificacaoService
+        from application.solicitacao_service import SolicitacaoService
+        notificacao = NotificacaoService()
+        service = SolicitacaoService(notificacao_service=notificacao,
+                                     instrumentacao=INSTRUMENTACAO if medir_regras else None)
+
+    if args.command == "serve":
+        servir(args.socket, parser, service)
+        return
+    if args.command == "api":
+        servir_api(args, service)
+        return
+    if args.command == "exportar":
+        executar_exportacao(args, RepositorioAluno(), RepositorioDisciplina(), RepositorioSolicitacao())
+        return
+    if args.command == "batch":
+        if args.grupo < 1:
+            print("❌ --grupo deve ser positivo.", file=sys.stderr)
+            sys.exit(2)
+        sys.exit(executar_batch(args, parser, service))
+
+    resultado = executar_comando(args, parser, RepositorioAluno(), RepositorioDisciplina(),
+                                 RepositorioSolicitacao(), service, interativo)
+    if resultado is not None:
+        print(json.dumps(resultado, ensure_ascii=False, default=str))
+        if resultado["status"] == "Erro":
+            sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
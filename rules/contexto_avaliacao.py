@@ -0,0 +1,87 @@
+# rules/contexto_avaliacao.py
+"""
+Módulo que implementa o contexto compartilhado de avaliação de regras.
+
+Várias regras derivam os mesmos fatos do histórico do aluno: a lista de
+disciplinas aprovadas, o total de créditos, as horas de optativas, as
+pendências. Sem um lugar comum, cada regra percorre o histórico de novo.
+O ContextoAvaliacao é criado uma vez por avaliação (em
+SolicitacaoService.aplicar_regras/avaliar_regras ou pelo PipelineRegras)
+e calcula cada fato apenas quando uma regra o pede pela primeira vez.
+"""
+
+from functools import cached_property
+
+
+class ContextoAvaliacao:
+    """
+    Fatos derivados de uma solicitação, calculados sob demanda e memorizados.
+
+    Todas as regras de uma mesma avaliação recebem o mesmo contexto; uma
+    regra chamada isoladamente (sem contexto) cria o seu próprio, de modo
+    que o comportamento é idêntico nos dois casos.
+
+    O contexto vale para uma única avaliação: ele não observa alterações
+    feitas no histórico depois que um fato já foi calculado.
+
+    Exemplo de uso:
+        >>> ctx = ContextoAvaliacao(sol)
+        >>> ctx.total_creditos          # percorre o histórico uma vez
+        144
+        >>> ctx.horas_optativas         # reutiliza as aprovadas já obtidas
+        60
+    """
+
+    def __init__(self, solicitacao):
+        """
+        :param solicitacao: Solicitação sob avaliação.
+        """
+        self.solicitacao = solicitacao
+        self._aprovado = {}
+
+    @property
+    def aluno(self):
+        """Aluno da solicitação."""
+        return self.solicitacao.aluno
+
+    @cached_property
+    def historico(self):
+        """Histórico do aluno da solicitação."""
+        return self.solicitacao.aluno.historico
+
+    @cached_property
+    def aprovadas(self) -> list:
+        """Disciplinas aprovadas (uma única passada pelo histórico)."""
+        return list(self.historico.disciplinas_aprovadas())
+
+    @cached_property
+    def total_creditos(self) -> int:
+        """Soma das cargas horárias das disciplinas aprovadas."""
+        return sum(d.carga_horaria for d in self.aprovadas)
+
+    @cached_property
+    def horas_optativas(self) -> int:
+        """Soma das cargas horárias das optativas aprovadas."""
+        return sum(d.carga_horaria for d in self.aprovadas if not d.obrigatoria)
+
+    @cached_property
+    def tem_pendencias(self) -> bool:
+        """Indica se o aluno possui pendências documentais."""
+        return self.aluno.tem_pendencias()
+
+    @cached_property
+    def pendencias(self) -> list:
+        """Pendências documentais do aluno."""
+        return list(self.aluno.pendencias)
+
+    def foi_aprovado(self, disciplina) -> bool:
+        """
+        Verifica, com memorização, se o aluno foi aprovado na disciplina.
+
+        :param disciplina: Objeto Disciplina a verificar.
+        """
+        try:
+            return self._aprovado[disciplina]
+        except KeyError:
+            resultado = self._aprovado[disciplina] = self.historico.foi_aprovado(disciplina)
+            return resultado
@@ -3,13 +3,17 @@
 Módulo que define a interface abstrata para todas as regras acadêmicas.
 
 Este módulo é o coração do padrão Strategy no SGSA. Ao definir um contrato
-único (o método validar), ele permite que novas regras sejam adicionadas
+único (os métodos avaliar e validar), ele permite que novas regras sejam adicionadas
 simplesmente criando novas subclasses — sem modificar o SolicitacaoService
 nem qualquer outra parte do sistema (OCP).
 """
 
 from abc import ABC, abstractmethod
 
+from domain.excecoes import ViolacaoRegraAcademicaError
+from domain.resultado_validacao import Violacao
+from rules.contexto_avaliacao import ContextoAvaliacao
+
 
 class Regra(ABC):
     """
@@ -33,24 +37,75 @@ class Regra(ABC):
                implementações concretas.
 
     Convenção de implementação:
-        O método validar() deve:
-          - Retornar True se a regra for satisfeita.
-          - Lançar ViolacaoRegraAcademicaError com mensagem clara se falhar.
-          - NUNCA retornar False silenciosamente.
+        Regras novas implementam avaliar(), que NÃO lança exceções:
+          - Retorna uma lista vazia se a regra for satisfeita.
+          - Retorna uma Violacao por motivo de falha, criada com
+            self._violacao(codigo, **parametros) a partir dos modelos de
+            mensagem em MENSAGENS — o texto só é formatado se exibido.
+        avaliar() é abstrato: Regra() e subclasses que não definem nem
+        avaliar() nem validar() não podem ser instanciadas. validar() é um
+        invólucro fino e concreto sobre avaliar(): retorna True ou lança
+        ViolacaoRegraAcademicaError com a primeira violação. Regras que
+        implementam apenas validar() (o contrato anterior) continuam
+        funcionando: ao serem declaradas, recebem um avaliar() que converte
+        a exceção em Violacao (ver __init_subclass__).
+
+        Fatos derivados do histórico (aprovadas, créditos, pendências)
+        devem ser lidos do ContextoAvaliacao recebido, que os calcula uma
+        única vez por avaliação. Quando a regra é chamada isoladamente
+        (contexto=None), ela cria o seu próprio contexto.
+
+    Avaliação em lote:
+        avaliar_lote() avalia várias solicitações de uma vez. A versão
+        padrão chama avaliar() para cada uma; regras numéricas a
+        sobrescrevem para comparar todas as grandezas em uma única
+        operação vetorizada (rules.vetorizacao).
+
+    Dependências entre regras:
+        DEPENDE_DE lista nomes de classes de regras que devem ser avaliadas
+        antes desta quando ambas estiverem no mesmo PipelineRegras, que
+        reordena as demais livremente por custo e taxa de rejeição.
 
     Exemplo de implementação:
         >>> class MinhaRegra(Regra):
-        ...     def validar(self, solicitacao) -> bool:
+        ...     MENSAGENS = {"problema": "Descrição do problema: {detalhe}."}
+        ...
+        ...     def avaliar(self, solicitacao, contexto=None) -> list:
         ...         if not condicao:
-        ...             raise ViolacaoRegraAcademicaError(
-        ...                 mensagem="Descrição do problema.",
-        ...                 regra="MinhaRegra"
-        ...             )
-        ...         return True
+        ...             return [self._violacao("problema", detalhe=valor)]
+        ...         return []
     """
 
+    DEPENDE_DE: tuple = ()
+    MENSAGENS: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Dá às regras que só definem validar() um avaliar() adaptador."""
+        super().__init_subclass__(**kwargs)
+        if "validar" in cls.__dict__ and cls.avaliar is Regra.avaliar:
+            cls.avaliar = Regra._avaliar_por_validar
+
     @abstractmethod
-    def validar(self, solicitacao) -> bool:
+    def avaliar(self, solicitacao, contexto=None) -> list:
+        """
+        Avalia a solicitação sem lançar exceções.
+
+        :param solicitacao: Objeto do tipo Solicitacao (ou subclasse)
+                            a ser analisado.
+        :param contexto: ContextoAvaliacao compartilhado entre as regras da
+                         mesma avaliação. Se None, a regra cria o seu.
+        :return: Lista de objetos Violacao; vazia se a regra for satisfeita.
+        """
+
+    def _avaliar_por_validar(self, solicitacao, contexto=None) -> list:
+        """avaliar() das regras que só implementam validar(solicitacao)."""
+        try:
+            self.validar(solicitacao)
+        except ViolacaoRegraAcademicaError as e:
+            return [Violacao.de_excecao(e)]
+        return []
+
+    def validar(self, solicitacao, contexto=None) -> bool:
         """
         Valida a solicitação contra o critério encapsulado por esta regra.
 
@@ -58,9 +113,50 @@ class Regra(ABC):
                             a ser analisado. A regra acessa os dados
                             necessários a partir deste objeto
                             (aluno, disciplina, curso, etc.).
-        :raises ViolacaoRegraAcademicaError: se o critério da regra
-                                             não for atendido. A mensagem
-                                             deve ser clara e orientar
-                                             o usuário sobre o problema.
+        :param contexto: ContextoAvaliacao opcional, repassado a avaliar().
+        :raises ViolacaoRegraAcademicaError: com a primeira violação
+                                             encontrada por avaliar().
         :return: True se a solicitação satisfaz os requisitos da regra.
         """
+        violacoes = self.avaliar(solicitacao, contexto)
+        if violacoes:
+            raise violacoes[0].como_excecao()
+        return True
+
+    def avaliar_lote(self, solicitacoes: list, contextos: list = None) -> list:
+        """
+        Avalia várias solicitações, retornando as violações de cada uma.
+
+        :param solicitacoes: Lista de objetos Solicitacao.
+        :param contextos: Lista de ContextoAvaliacao, alinhada com
+                          solicitacoes. Se None, um contexto é criado
+                          para cada solicitação.
+        :return: Lista de listas de Violacao, na ordem das solicitações.
+        """
+        if contextos is None:
+            contextos = [ContextoAvaliacao(s) for s in solicitacoes]
+        return [self.avaliar(s, c) for s, c in zip(solicitacoes, contextos)]
+
+    def chave_cache(self, solicitacao):
+        """
+        Informa se o resultado desta regra pode ser memorizado.
+
+        Regras cujo resultado depende apenas do histórico do aluno, do
+        catálogo e de dados identificáveis da solicitação retornam uma
+        tupla com esses dados extras (ex: o nome da disciplina-alvo); o
+        CacheResultadosRegras acrescenta as versões do histórico e do
+        catálogo. O padrão é None (não memorizar), seguro para regras que
+        dependem de datas, cargas informadas ou outros dados voláteis.
+
+        :return: Tupla hashable ou None.
+        """
+        return None
+
+    def _violacao(self, codigo: str, **parametros) -> Violacao:
+        """
+        Cria uma Violacao desta regra usando o modelo de MENSAGENS[codigo].
+
+        :param codigo: Chave do modelo de mensagem em MENSAGENS.
+        :param parametros: Valores referenciados pelo modelo.
+        """
+        return Violacao(type(self).__name__, codigo, self.MENSAGENS[codigo], **parametros)
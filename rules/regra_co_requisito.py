@@ -8,7 +8,7 @@ juntas, ou que já foi aprovado na co-requisitada anteriormente.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.contexto_avaliacao import ContextoAvaliacao
 
 
 class RegraCoRequisito(Regra):
@@ -44,41 +44,44 @@ class RegraCoRequisito(Regra):
         True
     """
 
-    def validar(self, solicitacao) -> bool:
+    # Sem o pré-requisito, pedir a matrícula simultânea no co-requisito não resolve
+    DEPENDE_DE = ("RegraPreRequisito",)
+
+    MENSAGENS = {
+        "co_requisito_pendente":
+            "Co-requisito(s) não atendido(s) para '{disciplina}': {pendentes}. "
+            "Matricule-se nessas disciplinas simultaneamente.",
+    }
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se todos os co-requisitos estão sendo atendidos.
 
         Para cada co-requisito da disciplina, verifica se o aluno já foi
         aprovado anteriormente ou se está matriculando-se simultaneamente.
-        Lista todos os co-requisitos pendentes antes de lançar a exceção.
+        Todos os co-requisitos pendentes entram na mesma violação.
 
         :param solicitacao: Objeto SolicitacaoMatricula. Se disciplina
-                            for None, retorna True imediatamente.
-        :raises ViolacaoRegraAcademicaError: com a lista de co-requisitos
-                                             não atendidos.
-        :return: True se todos os co-requisitos estão satisfeitos.
+                            for None, não há violação.
+        :return: Lista vazia ou [Violacao 'co_requisito_pendente'] com os
+                 parâmetros 'disciplina' e 'pendentes'.
         """
         disciplina = solicitacao.disciplina
         if disciplina is None:
-            return True
+            return []
 
-        historico = solicitacao.aluno.historico
+        if contexto is None:
+            contexto = ContextoAvaliacao(solicitacao)
         simultaneas = getattr(solicitacao, "disciplinas_co_req_solicitadas", [])
 
         pendentes = []
         for co in disciplina.co_requisitos:
-            ja_aprovado = historico.foi_aprovado(co)
+            ja_aprovado = contexto.foi_aprovado(co)
             sendo_matriculado = co in simultaneas
             if not ja_aprovado and not sendo_matriculado:
                 pendentes.append(co.nome)
 
         if pendentes:
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Co-requisito(s) não atendido(s) para '{disciplina.nome}': "
-                    f"{', '.join(pendentes)}. "
-                    f"Matricule-se nessas disciplinas simultaneamente."
-                ),
-                regra="RegraCoRequisito"
-            )
-        return True
+            return [self._violacao("co_requisito_pendente",
+                                   disciplina=disciplina.nome, pendentes=pendentes)]
+        return []
@@ -8,7 +8,8 @@ regra oferece uma verificação genérica e configurável de créditos.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.contexto_avaliacao import ContextoAvaliacao
+from rules.vetorizacao import indices_violados
 
 
 class RegraCreditos(Regra):
@@ -22,7 +23,7 @@ class RegraCreditos(Regra):
     um patamar mínimo de progresso acadêmico.
 
     Atributos consultados da solicitação:
-        solicitacao.aluno.historico.total_creditos(): soma das cargas
+        ContextoAvaliacao.total_creditos: soma das cargas
             horárias de todas as disciplinas aprovadas.
 
     Configuração:
@@ -45,25 +46,45 @@ class RegraCreditos(Regra):
         """
         self._minimo = minimo
 
-    def validar(self, solicitacao) -> bool:
+    # Na colação, as obrigatórias pendentes explicam a falta de créditos
+    DEPENDE_DE = ("RegraElegibilidade",)
+
+    MENSAGENS = {
+        "creditos_insuficientes":
+            "Créditos insuficientes. Mínimo exigido: {minimo}h, total do aluno: {total}h.",
+    }
+
+    def chave_cache(self, solicitacao):
+        """Memorizável: depende apenas do histórico."""
+        return ()
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se o aluno atingiu o mínimo de créditos exigido.
 
         :param solicitacao: Qualquer objeto Solicitacao — esta regra
                             não é restrita a um tipo específico.
-        :raises ViolacaoRegraAcademicaError: se total_creditos() <
-                                             mínimo configurado.
-        :return: True se o aluno possui créditos suficientes.
+        :return: Lista vazia ou [Violacao 'creditos_insuficientes'] com os
+                 parâmetros 'minimo' e 'total'.
         """
-        total = solicitacao.aluno.historico.total_creditos()
-
+        if contexto is None:
+            contexto = ContextoAvaliacao(solicitacao)
+        total = contexto.total_creditos
         if total < self._minimo:
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Créditos insuficientes. "
-                    f"Mínimo exigido: {self._minimo}h, "
-                    f"total do aluno: {total}h."
-                ),
-                regra="RegraCreditos"
-            )
-        return True
+            return [self._violacao("creditos_insuficientes", minimo=self._minimo, total=total)]
+        return []
+
+    def avaliar_lote(self, solicitacoes: list, contextos: list = None) -> list:
+        """
+        Compara os créditos de todas as solicitações com o mínimo de uma vez.
+
+        :return: Lista de listas de Violacao, na ordem das solicitações.
+        """
+        if contextos is None:
+            contextos = [ContextoAvaliacao(s) for s in solicitacoes]
+        totais = [c.total_creditos for c in contextos]
+        resultados = [[] for _ in solicitacoes]
+        for i in indices_violados(totais, self._minimo, "<"):
+            resultados[i].append(self._violacao("creditos_insuficientes",
+                                                minimo=self._minimo, total=totais[i]))
+        return resultados
@@ -4,7 +4,8 @@ Módulo que implementa a regra de elegibilidade para colação de grau.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.contexto_avaliacao import ContextoAvaliacao
+from rules.vetorizacao import indices_violados
 
 MINIMO_CREDITOS_FALLBACK = 120  # usado quando o curso não tem disciplinas cadastradas
 
@@ -13,61 +14,118 @@ class RegraElegibilidade(Regra):
     Verifica se o aluno integralizou o currículo para colar grau.
     """
 
-    def validar(self, solicitacao) -> bool:
-        aluno = solicitacao.aluno
-        historico = aluno.historico
-        curso = aluno.curso
+    MENSAGENS = {
+        "curso_sem_grade":
+            "Integralização não verificável: o curso '{curso}' "
+            "está vazio no sistema. Exigido ao menos {minimo}h. "
+            "Total atual: {total}h.",
+        "obrigatorias_pendentes":
+            "Integralização incompleta. Disciplina(s) "
+            "obrigatória(s) pendente(s): {pendentes}.",
+        "optativas_insuficientes":
+            "Carga horária de optativas insuficiente. "
+            "Mínimo exigido: {minimo}h, concluído: {concluido}h.",
+    }
 
+    def __init__(self, minimo_fallback: int = None):
+        """
+        :param minimo_fallback: Horas exigidas quando o curso não tem grade
+                                cadastrada. Se None, usa MINIMO_CREDITOS_FALLBACK.
+        """
+        self._minimo_fallback = (minimo_fallback if minimo_fallback is not None
+                                 else MINIMO_CREDITOS_FALLBACK)
+
+    def chave_cache(self, solicitacao):
+        """
+        Memorizável por curso, pelos valores e não pelo objeto: cada
+        requisição reconstrói o Curso, e cursos iguais devem compartilhar
+        a entrada. Entram na chave o nome, os parâmetros e as obrigatórias
+        da grade.
+        """
+        curso = solicitacao.aluno.curso
+        return (curso.nome, curso.limite_horas_semestrais, curso.min_horas_optativas,
+                tuple(d.nome for d in curso.disciplinas_obrigatorias()))
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
+        """
+        Verifica obrigatórias e horas de optativas, reunindo todas as falhas.
+
+        A ordem das violações segue a ordem de verificação (obrigatórias
+        antes de optativas), de modo que validar() continua relatando as
+        obrigatórias pendentes primeiro.
+
+        :param solicitacao: Objeto SolicitacaoColacao.
+        :return: Lista de Violacao ('curso_sem_grade',
+                 'obrigatorias_pendentes', 'optativas_insuficientes');
+                 vazia se o aluno estiver apto.
+        """
+        if contexto is None:
+            contexto = ContextoAvaliacao(solicitacao)
+        violacoes, min_optativas = self._verificar_grade(solicitacao.aluno.curso, contexto)
+
+        # --- 2. Verificação do mínimo de optativas ---
+        # Se o curso exige optativas, checamos agora, mesmo que não tenha obrigatórias.
+        if min_optativas > 0:
+            horas_optativas = contexto.horas_optativas
+            if horas_optativas < min_optativas:
+                violacoes.append(self._violacao("optativas_insuficientes",
+                                                minimo=min_optativas,
+                                                concluido=horas_optativas))
+
+        return violacoes
+
+    def avaliar_lote(self, solicitacoes: list, contextos: list = None) -> list:
+        """
+        Avalia a elegibilidade de várias solicitações de colação.
+
+        As obrigatórias são conferidas solicitação a solicitação (dependem
+        da grade de cada curso); o mínimo de optativas é comparado em uma
+        única operação sobre todas as solicitações que o exigem.
+
+        :return: Lista de listas de Violacao, na ordem das solicitações.
+        """
+        if contextos is None:
+            contextos = [ContextoAvaliacao(s) for s in solicitacoes]
+        resultados, posicoes, minimos = [], [], []
+        for i, (sol, ctx) in enumerate(zip(solicitacoes, contextos)):
+            violacoes, min_optativas = self._verificar_grade(sol.aluno.curso, ctx)
+            resultados.append(violacoes)
+            if min_optativas > 0:
+                posicoes.append(i)
+                minimos.append(min_optativas)
+
+        horas = [contextos[i].horas_optativas for i in posicoes]
+        for j in indices_violados(horas, minimos, "<"):
+            resultados[posicoes[j]].append(self._violacao("optativas_insuficientes",
+                                                          minimo=minimos[j],
+                                                          concluido=horas[j]))
+        return resultados
+
+    def _verificar_grade(self, curso, contexto) -> tuple:
+        """
+        Verifica o fallback de curso vazio e as obrigatórias pendentes.
+
+        :return: Tupla (violações, mínimo de optativas ainda a conferir).
+                 O mínimo é 0 quando não há optativas a verificar.
+        """
         obrigatorias = curso.disciplinas_obrigatorias()
         min_optativas = curso.min_horas_optativas
 
-    
         if not obrigatorias and min_optativas == 0:
-            total = historico.total_creditos()
-            if total < MINIMO_CREDITOS_FALLBACK:
-                raise ViolacaoRegraAcademicaError(
-                    mensagem=(
-                        f"Integralização não verificável: o curso '{curso.nome}' "
-                        f"está vazio no sistema. Exigido ao menos {MINIMO_CREDITOS_FALLBACK}h. "
-                        f"Total atual: {total}h."
-                    ),
-                    regra="RegraElegibilidade"
-                )
-            return True # Curso vazio, mas aluno tem horas suficientes.
+            total = contexto.total_creditos
+            if total < self._minimo_fallback:
+                return [self._violacao("curso_sem_grade", curso=curso.nome,
+                                       minimo=self._minimo_fallback, total=total)], 0
+            return [], 0  # Curso vazio, mas aluno tem horas suficientes.
+
+        violacoes = []
 
         # --- 1. Verificação das disciplinas obrigatórias ---
-        # Se houver obrigatórias, elas DEVEM ser checadas primeiro.
         if obrigatorias:
             nao_integralizadas = [
-                d.nome for d in obrigatorias if not historico.foi_aprovado(d)
+                d.nome for d in obrigatorias if not contexto.foi_aprovado(d)
             ]
             if nao_integralizadas:
-                raise ViolacaoRegraAcademicaError(
-                    mensagem=(
-                        f"Integralização incompleta. Disciplina(s) "
-                        f"obrigatória(s) pendente(s): {', '.join(nao_integralizadas)}."
-                    ),
-                    regra="RegraElegibilidade"
-                )
-
-        # --- 2. Verificação do mínimo de optativas ---
-        # Se o curso exige optativas, checamos agora, mesmo que não tenha obrigatórias.
-        if min_optativas > 0:
-            horas_optativas = sum(
-                d.carga_horaria
-                for d in historico.disciplinas_aprovadas()
-                if not d.obrigatoria
-            )
-            
-            if horas_optativas < min_optativas:
-                raise ViolacaoRegraAcademicaError(
-                    mensagem=(
-                        f"Carga horária de optativas insuficiente. "
-                        f"Mínimo exigido: {min_optativas}h, "
-                        f"concluído: {horas_optativas}h."
-                    ),
-                    regra="RegraElegibilidade"
-                )
-
-        # Se passou por todas as travas acima, o aluno está apto.
-        return True
\ No newline at end of file
+                violacoes.append(self._violacao("obrigatorias_pendentes",
+                                                pendentes=nao_integralizadas))
+        return violacoes, min_optativas
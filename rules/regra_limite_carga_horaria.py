@@ -8,7 +8,7 @@ disciplina e verifica se o total não ultrapassa o limite do curso.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.vetorizacao import indices_violados, somar
 
 
 class RegraLimiteCargaHoraria(Regra):
@@ -38,7 +38,14 @@ class RegraLimiteCargaHoraria(Regra):
         #  Limite: 360h, atual: 200h, solicitada: 200h (total: 400h)."
     """
 
-    def validar(self, solicitacao) -> bool:
+    MENSAGENS = {
+        "carga_semestral_excedida":
+            "Limite de carga horária semestral excedido. "
+            "Limite do curso: {limite}h, carga atual: {atual}h, "
+            "disciplina solicitada: {solicitada}h (total seria {total}h).",
+    }
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se adicionar a nova disciplina não excede o teto semestral.
 
@@ -46,29 +53,42 @@ class RegraLimiteCargaHoraria(Regra):
         horas da nova disciplina) e compara com o limite do curso.
 
         :param solicitacao: Objeto SolicitacaoMatricula. Se disciplina
-                            for None, retorna True imediatamente.
-        :raises ViolacaoRegraAcademicaError: se o total resultante
-                                             ultrapassar o limite do curso,
-                                             com detalhamento dos valores.
-        :return: True se a carga total respeitar o limite.
+                            for None, não há violação.
+        :return: Lista vazia ou [Violacao 'carga_semestral_excedida'] com
+                 os parâmetros 'limite', 'atual', 'solicitada' e 'total'.
         """
         disciplina = solicitacao.disciplina
         if disciplina is None:
-            return True
+            return []
 
         limite = solicitacao.aluno.curso.limite_horas_semestrais
         ja_matriculado = getattr(solicitacao, "carga_horaria_semestre_atual", 0)
         nova_carga = ja_matriculado + disciplina.carga_horaria
 
         if nova_carga > limite:
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Limite de carga horária semestral excedido. "
-                    f"Limite do curso: {limite}h, "
-                    f"carga atual: {ja_matriculado}h, "
-                    f"disciplina solicitada: {disciplina.carga_horaria}h "
-                    f"(total seria {nova_carga}h)."
-                ),
-                regra="RegraLimiteCargaHoraria"
-            )
-        return True
+            return [self._violacao("carga_semestral_excedida", limite=limite,
+                                   atual=ja_matriculado,
+                                   solicitada=disciplina.carga_horaria,
+                                   total=nova_carga)]
+        return []
+
+    def avaliar_lote(self, solicitacoes: list, contextos: list = None) -> list:
+        """
+        Soma e compara as cargas de todas as matrículas de uma vez.
+
+        Solicitações sem disciplina não são avaliadas, como em avaliar().
+
+        :return: Lista de listas de Violacao, na ordem das solicitações.
+        """
+        resultados = [[] for _ in solicitacoes]
+        posicoes = [i for i, s in enumerate(solicitacoes) if s.disciplina is not None]
+        atuais = [getattr(solicitacoes[i], "carga_horaria_semestre_atual", 0) for i in posicoes]
+        solicitadas = [solicitacoes[i].disciplina.carga_horaria for i in posicoes]
+        limites = [solicitacoes[i].aluno.curso.limite_horas_semestrais for i in posicoes]
+        totais = somar(atuais, solicitadas)
+
+        for j in indices_violados(totais, limites, ">"):
+            resultados[posicoes[j]].append(self._violacao(
+                "carga_semestral_excedida", limite=limites[j], atual=atuais[j],
+                solicitada=solicitadas[j], total=totais[j]))
+        return resultados
@@ -9,7 +9,7 @@ dentro desse limite.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.vetorizacao import indices_violados
 
 
 class RegraLimiteTrancamentos(Regra):
@@ -43,6 +43,9 @@ class RegraLimiteTrancamentos(Regra):
 
     LIMITE_PADRAO: int = 4
 
+    # Com o vínculo trancado ou encerrado, o limite não é o motivo da recusa
+    DEPENDE_DE = ("RegraVinculoAtivo",)
+
     def __init__(self, limite: int = None):
         """
         Inicializa a regra com o limite de trancamentos desejado.
@@ -52,24 +55,40 @@ class RegraLimiteTrancamentos(Regra):
         """
         self._limite = limite if limite is not None else self.LIMITE_PADRAO
 
-    def validar(self, solicitacao) -> bool:
+    MENSAGENS = {
+        "limite_trancamentos":
+            "Limite de trancamentos atingido. "
+            "O aluno já realizou {realizados} trancamento(s) "
+            "(máximo permitido: {limite}).",
+    }
+
+    def chave_cache(self, solicitacao):
+        """Memorizável: depende apenas do histórico."""
+        return ()
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se o aluno não atingiu o limite de trancamentos.
 
         :param solicitacao: Objeto SolicitacaoTrancamento.
-        :raises ViolacaoRegraAcademicaError: se trancamentos >= limite,
-                                             com o número atual e o limite.
-        :return: True se o aluno ainda possui trancamentos disponíveis.
+        :return: Lista vazia ou [Violacao 'limite_trancamentos'] com os
+                 parâmetros 'realizados' e 'limite'.
         """
         trancamentos_realizados = solicitacao.aluno.historico.trancamentos
-
         if trancamentos_realizados >= self._limite:
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Limite de trancamentos atingido. "
-                    f"O aluno já realizou {trancamentos_realizados} trancamento(s) "
-                    f"(máximo permitido: {self._limite})."
-                ),
-                regra="RegraLimiteTrancamentos"
-            )
-        return True
+            return [self._violacao("limite_trancamentos",
+                                   realizados=trancamentos_realizados, limite=self._limite)]
+        return []
+
+    def avaliar_lote(self, solicitacoes: list, contextos: list = None) -> list:
+        """
+        Compara os trancamentos de todas as solicitações com o limite de uma vez.
+
+        :return: Lista de listas de Violacao, na ordem das solicitações.
+        """
+        realizados = [s.aluno.historico.trancamentos for s in solicitacoes]
+        resultados = [[] for _ in solicitacoes]
+        for i in indices_violados(realizados, self._limite, ">="):
+            resultados[i].append(self._violacao("limite_trancamentos",
+                                                realizados=realizados[i], limite=self._limite))
+        return resultados
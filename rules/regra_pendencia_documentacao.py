@@ -8,7 +8,7 @@ solicitação de colação de grau antes mesmo de chegar ao setor acadêmico.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.contexto_avaliacao import ContextoAvaliacao
 
 
 class RegraPendenciaDocumentacao(Regra):
@@ -29,6 +29,7 @@ class RegraPendenciaDocumentacao(Regra):
     Atributos consultados da solicitação:
         solicitacao.aluno.tem_pendencias(): boolean indicador.
         solicitacao.aluno.pendencias: lista de strings descritivas.
+        (ambos lidos uma única vez, via ContextoAvaliacao)
 
     Exemplo:
         >>> aluno.adicionar_pendencia("Débito na biblioteca")
@@ -40,26 +41,23 @@ class RegraPendenciaDocumentacao(Regra):
         #  Certidão de nascimento pendente. Regularize antes..."
     """
 
-    def validar(self, solicitacao) -> bool:
+    MENSAGENS = {
+        "pendencia_documental":
+            "Colação de grau negada: o aluno possui pendência(s) "
+            "não resolvida(s): {pendencias}. "
+            "Regularize-as antes de solicitar a formatura.",
+    }
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se o aluno está livre de pendências documentais.
 
         :param solicitacao: Objeto SolicitacaoColacao.
-        :raises ViolacaoRegraAcademicaError: se o aluno possuir qualquer
-                                             pendência registrada, listando
-                                             todas na mensagem de erro.
-        :return: True se o aluno não possuir pendências.
+        :return: Lista vazia ou [Violacao 'pendencia_documental'] com o
+                 parâmetro 'pendencias' (todas as pendências registradas).
         """
-        aluno = solicitacao.aluno
-
-        if aluno.tem_pendencias():
-            pendencias = ", ".join(aluno.pendencias)
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Colação de grau negada: o aluno possui pendência(s) "
-                    f"não resolvida(s): {pendencias}. "
-                    f"Regularize-as antes de solicitar a formatura."
-                ),
-                regra="RegraPendenciaDocumentacao"
-            )
-        return True
+        if contexto is None:
+            contexto = ContextoAvaliacao(solicitacao)
+        if contexto.tem_pendencias:
+            return [self._violacao("pendencia_documental", pendencias=contexto.pendencias)]
+        return []
@@ -3,13 +3,14 @@
 Módulo que implementa a regra de prazo do calendário acadêmico.
 
 O trancamento de disciplina só é permitido dentro do período definido
-pelo calendário acadêmico. Esta regra compara a data da solicitação com
-o prazo limite registrado na própria solicitação.
+pelo calendário acadêmico. Quando a regra recebe um CalendarioService, o
+período é resolvido no calendário persistido pelo tipo da solicitação e
+pelo curso do aluno; sem calendário (ou sem períodos para o tipo), a data
+da solicitação é comparada com o prazo registrado na própria solicitação.
 """
 
 import datetime
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
 
 
 class RegraPrazo(Regra):
@@ -17,9 +18,16 @@ class RegraPrazo(Regra):
     Verifica se a solicitação foi realizada dentro do período permitido
     pelo calendário acadêmico.
 
-    Compara solicitacao.data (quando foi feita) com solicitacao.prazo
-    (último dia válido). Se a data for posterior ao prazo, a solicitação
-    está fora do período e deve ser negada.
+    Compara solicitacao.data (quando foi feita) com o período do
+    calendário acadêmico. Se a data for posterior ao fim do período, ou
+    anterior ao seu início, a solicitação deve ser negada.
+
+    Origem do prazo:
+        - Com calendário que define o tipo da solicitação (TIPO) para o
+          curso do aluno ou para a instituição: o período vem do
+          calendário, e solicitacao.prazo é ignorado — o prazo não
+          depende do que o cliente informou.
+        - Caso contrário: usa solicitacao.prazo (comportamento original).
 
     Aplica-se a: SolicitacaoTrancamento (e qualquer outra que tenha
     atributos data e prazo).
@@ -45,27 +53,51 @@ class RegraPrazo(Regra):
         #  Data da solicitação: DD/MM/AAAA, prazo limite: DD/MM/AAAA."
     """
 
-    def validar(self, solicitacao) -> bool:
+    MENSAGENS = {
+        "prazo_encerrado":
+            "Prazo acadêmico encerrado. "
+            "Data da solicitação: {data:%d/%m/%Y}, "
+            "prazo limite: {prazo:%d/%m/%Y}.",
+        "periodo_nao_iniciado":
+            "Período de solicitação ainda não iniciado ({semestre}). "
+            "Data da solicitação: {data:%d/%m/%Y}, "
+            "início: {inicio:%d/%m/%Y}.",
+    }
+
+    def __init__(self, calendario=None):
+        """
+        :param calendario: CalendarioService consultado para obter o
+                           período. Se None, usa o prazo da solicitação.
+        """
+        self.calendario = calendario
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se a solicitação foi feita dentro do prazo acadêmico.
 
         :param solicitacao: Objeto Solicitacao com atributos data e prazo.
                             Se ausentes, assume datetime.date.today() para ambos.
-        :raises ViolacaoRegraAcademicaError: se data > prazo, com as datas
-                                             formatadas no formato DD/MM/AAAA.
-        :return: True se data <= prazo.
+        :return: Lista vazia, [Violacao 'prazo_encerrado'] com os
+                 parâmetros 'data' e 'prazo' (datetime.date) ou, com
+                 calendário, [Violacao 'periodo_nao_iniciado'] com 'data',
+                 'inicio' e 'semestre'.
         """
         hoje = datetime.date.today()
         data = getattr(solicitacao, "data", hoje)
+
+        if self.calendario is not None:
+            curso = getattr(getattr(getattr(solicitacao, "aluno", None), "curso", None), "nome", None)
+            periodo = self.calendario.periodo(getattr(solicitacao, "TIPO", None), data, curso)
+            if periodo is not None:
+                if data < periodo["inicio"]:
+                    return [self._violacao("periodo_nao_iniciado", data=data,
+                                           inicio=periodo["inicio"], semestre=periodo["semestre"])]
+                if data > periodo["fim"]:
+                    return [self._violacao("prazo_encerrado", data=data, prazo=periodo["fim"])]
+                return []
+
         prazo = getattr(solicitacao, "prazo", hoje)
 
         if data > prazo:
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Prazo acadêmico encerrado. "
-                    f"Data da solicitação: {data.strftime('%d/%m/%Y')}, "
-                    f"prazo limite: {prazo.strftime('%d/%m/%Y')}."
-                ),
-                regra="RegraPrazo"
-            )
-        return True
+            return [self._violacao("prazo_encerrado", data=data, prazo=prazo)]
+        return []
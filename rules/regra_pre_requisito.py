@@ -8,7 +8,7 @@ Esta regra consulta o histórico do aluno para verificar cada pré-requisito.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.contexto_avaliacao import ContextoAvaliacao
 
 
 class RegraPreRequisito(Regra):
@@ -35,43 +35,49 @@ class RegraPreRequisito(Regra):
         #  Pré-requisito(s) não cumprido(s) para 'Cálculo 2': Cálculo 1."
     """
 
-    def validar(self, solicitacao) -> bool:
+    MENSAGENS = {
+        "pre_requisito_pendente":
+            "Pré-requisito(s) não cumprido(s) para '{disciplina}': {pendentes}.",
+    }
+
+    def chave_cache(self, solicitacao):
+        """Memorizável por disciplina-alvo (depende só do histórico e do catálogo)."""
+        disciplina = solicitacao.disciplina
+        if disciplina is None or isinstance(disciplina, str):
+            return None
+        return (disciplina.nome,)
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se todos os pré-requisitos da disciplina foram cumpridos.
 
         Percorre a lista disciplina.pre_requisitos e consulta o histórico
-        do aluno para cada um. Coleta todos os pendentes antes de lançar
-        a exceção, para que a mensagem liste todos os problemas de uma vez.
+        do aluno para cada um. Coleta todos os pendentes em uma única
+        violação, para que a mensagem liste todos os problemas de uma vez.
 
         :param solicitacao: Objeto SolicitacaoMatricula. Se disciplina
-                            for None (ex: colação), retorna True
-                            imediatamente.
-        :raises ViolacaoRegraAcademicaError: com a lista de pré-requisitos
-                                             não cumpridos.
-        :return: True se todos os pré-requisitos foram satisfeitos.
+                            for None (ex: colação), não há violação.
+        :return: Lista vazia ou [Violacao 'pre_requisito_pendente'] com os
+                 parâmetros 'disciplina' e 'pendentes'.
         """
         disciplina = solicitacao.disciplina
         if disciplina is None:
-            return True
-        
-        # Se disciplina for uma string (erro de integração), retorna True
-        # para evitar AttributeError
+            return []
+
+        # Se disciplina for uma string (erro de integração), não há o que
+        # verificar — evita AttributeError
         if isinstance(disciplina, str):
-            return True
+            return []
 
-        historico = solicitacao.aluno.historico
+        if contexto is None:
+            contexto = ContextoAvaliacao(solicitacao)
         pendentes = [
             pre.nome
             for pre in disciplina.pre_requisitos
-            if not historico.foi_aprovado(pre)
+            if not contexto.foi_aprovado(pre)
         ]
 
         if pendentes:
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Pré-requisito(s) não cumprido(s) para '{disciplina.nome}': "
-                    f"{', '.join(pendentes)}."
-                ),
-                regra="RegraPreRequisito"
-            )
-        return True
+            return [self._violacao("pre_requisito_pendente",
+                                   disciplina=disciplina.nome, pendentes=pendentes)]
+        return []
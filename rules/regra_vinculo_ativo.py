@@ -9,7 +9,6 @@ qualquer trancamento.
 """
 
 from rules.regra_base import Regra
-from domain.excecoes import ViolacaoRegraAcademicaError
 
 
 class RegraVinculoAtivo(Regra):
@@ -40,23 +39,36 @@ class RegraVinculoAtivo(Regra):
 
     VINCULOS_BLOQUEADOS: set = {"Trancado", "Egresso"}
 
-    def validar(self, solicitacao) -> bool:
+    def __init__(self, bloqueados=None):
+        """
+        Inicializa a regra com os status de vínculo que impedem o trancamento.
+
+        :param bloqueados: Coleção de status bloqueados. Se None, usa
+                           VINCULOS_BLOQUEADOS.
+        """
+        self._bloqueados = (frozenset(bloqueados) if bloqueados is not None
+                            else frozenset(self.VINCULOS_BLOQUEADOS))
+
+    MENSAGENS = {
+        "vinculo_inativo":
+            "Trancamento não permitido: o aluno possui vínculo '{status}'. "
+            "Apenas alunos com vínculo 'Ativo' podem solicitar trancamento.",
+    }
+
+    def chave_cache(self, solicitacao):
+        """Memorizável: depende apenas do histórico."""
+        return ()
+
+    def avaliar(self, solicitacao, contexto=None) -> list:
         """
         Verifica se o vínculo do aluno permite o trancamento.
 
         :param solicitacao: Objeto SolicitacaoTrancamento.
-        :raises ViolacaoRegraAcademicaError: se o status do vínculo
-                                             for 'Trancado' ou 'Egresso'.
-        :return: True se o vínculo for 'Ativo'.
+        :return: Lista vazia ou [Violacao 'vinculo_inativo'] com o
+                 parâmetro 'status' quando o vínculo estiver entre os
+                 bloqueados ('Trancado' ou 'Egresso', por padrão).
         """
         status = solicitacao.aluno.historico.status_vinculo
-
-        if status in self.VINCULOS_BLOQUEADOS:
-            raise ViolacaoRegraAcademicaError(
-                mensagem=(
-                    f"Trancamento não permitido: o aluno possui vínculo '{status}'. "
-                    f"Apenas alunos com vínculo 'Ativo' podem solicitar trancamento."
-                ),
-                regra="RegraVinculoAtivo"
-            )
-        return True
+        if status in self._bloqueados:
+            return [self._violacao("vinculo_inativo", status=status)]
+        return []
@@ -0,0 +1,70 @@
+# rules/vetorizacao.py
+"""
+Módulo com as comparações vetorizadas usadas na avaliação em lote.
+
+As regras numéricas (créditos, carga semestral, trancamentos, horas de
+optativas) se resumem a comparar uma grandeza de cada solicitação com um
+limite. Em lote, essas grandezas são reunidas em sequências e comparadas
+de uma só vez: com NumPy, quando instalado, em uma única operação sobre
+arrays; sem ele, em uma compreensão de lista sobre as sequências.
+
+O NumPy é uma dependência opcional — o resultado é idêntico nos dois
+caminhos.
+"""
+
+import operator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+
+# Abaixo deste tamanho, converter para array custa mais do que comparar em Python
+LOTE_MINIMO_NUMPY = 64
+
+_OPERADORES = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def indices_violados(valores, limites, operador: str) -> list:
+    """
+    Retorna as posições em que 'valor <operador> limite' é verdadeiro.
+
+    :param valores: Sequência de números, um por solicitação.
+    :param limites: Sequência de limites do mesmo tamanho, ou um único
+                    número aplicado a todas as posições.
+    :param operador: Um de '<', '<=', '>', '>='.
+    :raises ValueError: se o operador não for reconhecido ou se os
+                        tamanhos das sequências forem diferentes.
+    :return: Lista crescente de índices em que a condição é satisfeita.
+    """
+    comparar = _OPERADORES.get(operador)
+    if comparar is None:
+        raise ValueError(f"Operador inválido: '{operador}'. Use um de {list(_OPERADORES)}.")
+    escalar = not hasattr(limites, "__len__")
+    if not escalar and len(limites) != len(valores):
+        raise ValueError("Valores e limites devem ter o mesmo tamanho.")
+
+    if np is not None and len(valores) >= LOTE_MINIMO_NUMPY:
+        mascara = comparar(np.asarray(valores), limites if escalar else np.asarray(limites))
+        return np.flatnonzero(mascara).tolist()
+
+    if escalar:
+        return [i for i, v in enumerate(valores) if comparar(v, limites)]
+    return [i for i, (v, l) in enumerate(zip(valores, limites)) if comparar(v, l)]
+
+
+def somar(a, b) -> list:
+    """
+    Soma elemento a elemento duas sequências de mesmo tamanho.
+
+    :return: Lista com as somas, na mesma ordem.
+    """
+    if np is not None and len(a) >= LOTE_MINIMO_NUMPY:
+        return np.add(np.asarray(a), np.asarray(b)).tolist()
+    return [x + y for x, y in zip(a, b)]
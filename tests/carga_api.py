@@ -0,0 +1,97 @@
+# tests/carga_api.py
+"""
+Teste de carga da API HTTP local ('python main.py api').
+
+Abre várias conexões keep-alive em paralelo, envia a mesma requisição
+repetidas vezes em cada uma e relata vazão e latências. Usado pelo teste
+automatizado com carga pequena e, à mão, contra uma instância real:
+
+    python main.py api --porta 8080 &
+    python -m tests.carga_api --url http://127.0.0.1:8080/alunos --conexoes 16 --requisicoes 500
+"""
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def executar_carga(host: str, porta: int, caminho: str = "/saude", conexoes: int = 8,
+                   requisicoes: int = 100, metodo: str = "GET", corpo: dict = None) -> dict:
+    """
+    Dispara a carga e mede o resultado.
+
+    :param conexoes: Conexões simultâneas, cada uma em sua thread.
+    :param requisicoes: Requisições por conexão, todas na mesma conexão.
+    :param corpo: Corpo JSON enviado em cada requisição (ex.: POST).
+    :return: Dicionário com requisicoes, erros (status >= 500 ou falha
+             de conexão), por_status, segundos, req_por_s, p50_ms e p99_ms.
+    """
+    dados = json.dumps(corpo).encode("utf-8") if corpo is not None else None
+    latencias, por_status, erros = [], {}, [0]
+    lock = threading.Lock()
+
+    def cliente():
+        conexao = http.client.HTTPConnection(host, porta, timeout=30)
+        medidas, contagem, falhas = [], {}, 0
+        try:
+            for _ in range(requisicoes):
+                inicio = time.perf_counter()
+                try:
+                    conexao.request(metodo, caminho, body=dados,
+                                    headers={"Content-Type": "application/json"})
+                    resposta = conexao.getresponse()
+                    resposta.read()
+                except OSError:
+                    falhas += 1
+                    conexao.close()
+                    continue
+                medidas.append(time.perf_counter() - inicio)
+                contagem[resposta.status] = contagem.get(resposta.status, 0) + 1
+                if resposta.status >= 500:
+                    falhas += 1
+        finally:
+            conexao.close()
+            with lock:
+                latencias.extend(medidas)
+                erros[0] += falhas
+                for status, n in contagem.items():
+                    por_status[status] = por_status.get(status, 0) + n
+
+    threads = [threading.Thread(target=cliente) for _ in range(conexoes)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    segundos = time.perf_counter() - inicio
+
+    latencias.sort()
+
+    def percentil(p):
+        return round(latencias[min(len(latencias) - 1, int(p * len(latencias)))] * 1000, 3) \
+            if latencias else None
+
+    total = conexoes * requisicoes
+    return {"requisicoes": total, "erros": erros[0], "por_status": por_status,
+            "segundos": round(segundos, 3), "req_por_s": round(total / segundos, 1),
+            "p50_ms": percentil(0.50), "p99_ms": percentil(0.99)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Teste de carga da API HTTP do SGSA")
+    parser.add_argument("--url", default="http://127.0.0.1:8080/saude")
+    parser.add_argument("--conexoes", type=int, default=8)
+    parser.add_argument("--requisicoes", type=int, default=200, help="Requisições por conexão")
+    parser.add_argument("--metodo", default="GET")
+    parser.add_argument("--corpo", default=None, help="Corpo JSON (ex.: para POST)")
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    caminho = url.path + (f"?{url.query}" if url.query else "")
+    print(json.dumps(executar_carga(url.hostname, url.port or 80, caminho or "/", args.conexoes,
+                                    args.requisicoes, args.metodo.upper(),
+                                    json.loads(args.corpo) if args.corpo else None),
+                     indent=2))
@@ -0,0 +1,115 @@
+# tests/tempo_inicializacao.py
+"""
+Relatório do tempo de inicialização do CLI ('python -X importtime').
+
+Executa main.py com um comando, em um diretório temporário e sem
+servidor, lê o relatório de importações que o Python escreve na saída de
+erro e soma o tempo dos módulos importados pelo CLI (os módulos que o
+próprio interpretador carrega ao iniciar ficam de fora). Usado pelo teste
+automatizado, que impõe o orçamento, e à mão:
+
+    python -m tests.tempo_inicializacao aluno listar
+    python -m tests.tempo_inicializacao --orcamento 40 --repeticoes 7 -- solicitacao listar
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(RAIZ, "main.py")
+
+
+def ler_importtime(texto: str) -> list:
+    """
+    Interpreta a saída de 'python -X importtime'.
+
+    :return: Lista de dicionários (modulo, nivel, proprio_us, acumulado_us),
+             na ordem em que as importações terminaram.
+    """
+    importacoes = []
+    for linha in texto.splitlines():
+        if not linha.startswith("import time:"):
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|", 2)
+        if not proprio.strip().isdigit():
+            continue  # cabeçalho
+        recuo = len(nome) - len(nome.lstrip(" "))
+        importacoes.append({"modulo": nome.strip(), "nivel": (recuo - 1) // 2,
+                            "proprio_us": int(proprio), "acumulado_us": int(acumulado)})
+    return importacoes
+
+
+def _importtime(argumentos: list, diretorio: str) -> list:
+    """Executa o Python com -X importtime e devolve as importações lidas."""
+    ambiente = dict(os.environ)
+    ambiente.pop("SGSA_POLITICA", None)
+    processo = subprocess.run([sys.executable, "-X", "importtime"] + argumentos, cwd=diretorio,
+                              env=ambiente, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                              text=True, timeout=60)
+    return ler_importtime(processo.stderr)
+
+
+def medir(argv: list, repeticoes: int = 5) -> dict:
+    """
+    Mede a importação do CLI para um comando.
+
+    Cada repetição roda em um processo novo (o cache de bytecode em disco
+    continua valendo, como em produção). O tempo de cada repetição é a
+    soma do tempo acumulado das importações de primeiro nível que não
+    acontecem em um 'python -c pass'.
+
+    :param argv: Comando do CLI (ex.: ['aluno', 'listar']); '--local' é
+                 acrescentado para não usar um servidor ativo.
+    :param repeticoes: Execuções medidas; o relatório usa a mediana.
+    :return: Dicionário com comando, mediana_ms, minimo_ms, modulos
+             (nomes importados pelo CLI) e mais_caros (os 10 de maior
+             tempo acumulado, com o tempo em ms).
+    """
+    with tempfile.TemporaryDirectory() as diretorio:
+        inicio = {i["modulo"] for i in _importtime(["-c", "pass"], diretorio)}
+        tempos, ultima = [], []
+        for _ in range(repeticoes):
+            ultima = [i for i in _importtime([MAIN, "--local"] + list(argv), diretorio)
+                      if i["modulo"] not in inicio]
+            tempos.append(sum(i["acumulado_us"] for i in ultima if i["nivel"] == 0) / 1000)
+
+    primeiro_nivel = sorted((i for i in ultima if i["nivel"] == 0),
+                            key=lambda i: i["acumulado_us"], reverse=True)
+    return {
+        "comando": " ".join(argv),
+        "mediana_ms": round(statistics.median(tempos), 2),
+        "minimo_ms": round(min(tempos), 2),
+        "modulos": sorted(i["modulo"] for i in ultima),
+        "mais_caros": [(i["modulo"], round(i["acumulado_us"] / 1000, 2)) for i in primeiro_nivel[:10]],
+    }
+
+
+def imprimir(relatorio: dict, orcamento: float = None) -> None:
+    """Exibe o relatório de medir() no console."""
+    print(f"\n⏱️  Inicialização de 'main.py {relatorio['comando']}'")
+    print(f"  Importações do CLI: mediana {relatorio['mediana_ms']:.2f} ms "
+          f"(mínimo {relatorio['minimo_ms']:.2f} ms), {len(relatorio['modulos'])} módulo(s)")
+    if orcamento is not None:
+        marca = "✅" if relatorio["mediana_ms"] <= orcamento else "❌"
+        print(f"  Orçamento: {orcamento:.2f} ms {marca}")
+    print("  Mais caras (tempo acumulado):")
+    for modulo, ms in relatorio["mais_caros"]:
+        print(f"    {ms:>8.2f} ms  {modulo}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tempo de inicialização do CLI do SGSA")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--orcamento", type=float, default=None,
+                        help="Tempo máximo (ms); sai com código 1 se a mediana passar dele")
+    parser.add_argument("comando", nargs="*", default=["aluno", "listar"])
+    args = parser.parse_args()
+
+    resultado = medir(args.comando, args.repeticoes)
+    imprimir(resultado, args.orcamento)
+    if args.orcamento is not None and resultado["mediana_ms"] > args.orcamento:
+        sys.exit(1)
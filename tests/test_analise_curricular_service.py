@@ -0,0 +1,58 @@
+import pytest
+from application.analise_curricular_service import AnaliseCurricularService
+from domain.grafo_curricular import GrafoCurricular
+
+#FIXTURES
+
+@pytest.fixture
+def grafo():
+    registros = [
+        {"nome": "Cálculo I", "carga_horaria": 72},
+        {"nome": "Cálculo II", "carga_horaria": 72, "pre_requisitos": ["Cálculo I"]},
+        {"nome": "Cálculo III", "carga_horaria": 72, "pre_requisitos": ["Cálculo II"]},
+        {"nome": "Física I", "carga_horaria": 60, "pre_requisitos": ["Cálculo I"],
+         "co_requisitos": ["Laboratório de Física"]},
+        {"nome": "Laboratório de Física", "carga_horaria": 30},
+        {"nome": "Mecânica", "carga_horaria": 60, "pre_requisitos": ["Física I", "Cálculo II"]},
+    ]
+    return GrafoCurricular.de_registros(registros)
+
+#TESTES DE MÉTRICAS
+
+def test_caminho_critico_e_histograma(grafo):
+    relatorio = AnaliseCurricularService(grafo).analisar()
+
+    assert relatorio["total_disciplinas"] == 6
+    assert relatorio["comprimento_caminho_critico"] == 3
+    assert relatorio["caminho_critico"][0] == "Cálculo I"
+    assert len(relatorio["caminho_critico"]) == 3
+    assert relatorio["histograma_profundidade"] == {1: 2, 2: 2, 3: 2}
+
+def test_fan_in_e_fan_out_incluem_co_requisitos(grafo):
+    relatorio = AnaliseCurricularService(grafo).analisar()
+
+    assert relatorio["fan_in"]["Física I"] == 2
+    assert relatorio["fan_out"]["Cálculo I"] == 2
+    assert relatorio["fan_out"]["Laboratório de Física"] == 1
+
+def test_gargalos_contam_horas_a_jusante_sem_duplicar(grafo):
+    gargalos = AnaliseCurricularService(grafo).analisar()["gargalos"]
+
+    # Mecânica depende de Cálculo I por dois caminhos, mas conta uma vez
+    assert gargalos[0] == {"nome": "Cálculo I", "horas_bloqueadas": 264, "dependentes": 4}
+    assert "Laboratório de Física" not in [g["nome"] for g in gargalos]
+
+def test_analise_restrita_a_grade(grafo):
+    relatorio = AnaliseCurricularService(grafo).analisar(grade=["Cálculo I", "Cálculo II"], top=1)
+
+    assert relatorio["total_disciplinas"] == 2
+    assert relatorio["caminho_critico"] == ["Cálculo I", "Cálculo II"]
+    assert relatorio["gargalos"] == [{"nome": "Cálculo I", "horas_bloqueadas": 72, "dependentes": 1}]
+
+def test_ciclo_de_pre_requisitos_gera_erro():
+    grafo = GrafoCurricular.de_registros([
+        {"nome": "A", "carga_horaria": 30, "pre_requisitos": ["B"]},
+        {"nome": "B", "carga_horaria": 30, "pre_requisitos": ["A"]},
+    ])
+    with pytest.raises(ValueError):
+        AnaliseCurricularService(grafo).analisar()
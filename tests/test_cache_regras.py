@@ -0,0 +1,208 @@
+import json
+import threading
+import time
+import pytest
+from collections import OrderedDict
+from unittest.mock import patch
+import infrastructure.db_config as db_config
+from infrastructure.repositorio_aluno import RepositorioAluno
+from infrastructure.repositorio_disciplina import RepositorioDisciplina
+from application.cache_regras import CacheResultadosRegras
+from application.pipeline_regras import PipelineRegras
+from rules.regra_pre_requisito import RegraPreRequisito
+from rules.regra_creditos import RegraCreditos
+from rules.regra_elegibilidade import RegraElegibilidade
+from rules.regra_limite_carga_horaria import RegraLimiteCargaHoraria
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+from domain.solicitacao_colacao import SolicitacaoColacao
+from domain.solicitacao_matricula import SolicitacaoMatricula
+
+#FIXTURES
+
+@pytest.fixture
+def calculo():
+    return Disciplina("Cálculo I", 72)
+
+@pytest.fixture
+def aluno(calculo):
+    aluno = Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso("Física"))
+    aluno.historico.adicionar_disciplina(calculo, 8.0)
+    return aluno
+
+@pytest.fixture
+def solicitacao(aluno, calculo):
+    calculo2 = Disciplina("Cálculo II", 72)
+    calculo2.adicionar_pre_requisito(calculo)
+    return SolicitacaoMatricula(aluno, calculo2)
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch, capsys):
+    """Banco com Ana e Cálculo II exigindo Cálculo I, que ela não cursou."""
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    db_config.init_db()
+    repo_disc = RepositorioDisciplina()
+    repo_disc.adicionar(Disciplina("Cálculo I", 72))
+    repo_disc.adicionar(Disciplina("Cálculo II", 72))
+    repo_disc.atualizar_pre_requisitos("Cálculo II", ["Cálculo I"])
+    RepositorioAluno().adicionar(Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso("Física")))
+
+def _requisicao():
+    """Recarrega aluno e disciplina do banco, como cada requisição do CLI ou da API."""
+    registro = RepositorioAluno().listar()[0]
+    aluno = Aluno(registro[0], registro[1], registro[2], Curso(registro[3]))
+    aluno.historico.carimbar(registro)
+    return SolicitacaoMatricula(aluno, RepositorioDisciplina().carregar_todas()["Cálculo II"])
+
+#TESTES DE MEMORIZAÇÃO
+
+def test_segunda_avaliacao_usa_o_cache(solicitacao):
+    cache = CacheResultadosRegras()
+    regra = RegraPreRequisito()
+
+    with patch.object(RegraPreRequisito, "avaliar", wraps=regra.avaliar) as espiao:
+        assert cache.avaliar(regra, solicitacao) == []
+        assert cache.avaliar(regra, solicitacao) == []
+
+    assert espiao.call_count == 1
+    assert (cache.acertos, cache.faltas) == (1, 1)
+    assert cache.estatisticas()["taxa_acerto"] == 0.5
+
+def test_alteracao_no_historico_invalida(solicitacao):
+    cache = CacheResultadosRegras()
+    regra = RegraCreditos(minimo=100)
+
+    assert [v.codigo for v in cache.avaliar(regra, solicitacao)] == ["creditos_insuficientes"]
+    solicitacao.aluno.historico.adicionar_disciplina(Disciplina("Física I", 60), 7.0)
+
+    assert cache.avaliar(regra, solicitacao) == []
+    assert cache.faltas == 2
+
+def test_alteracao_no_catalogo_invalida(solicitacao):
+    cache = CacheResultadosRegras()
+    regra = RegraPreRequisito()
+
+    assert cache.avaliar(regra, solicitacao) == []
+    solicitacao.disciplina.adicionar_pre_requisito(Disciplina("Álgebra Linear", 60))
+
+    assert [v.codigo for v in cache.avaliar(regra, solicitacao)] == ["pre_requisito_pendente"]
+    assert cache.acertos == 0
+
+def test_regra_volatil_nao_e_memorizada(solicitacao):
+    cache = CacheResultadosRegras()
+
+    cache.avaliar(RegraLimiteCargaHoraria(), solicitacao)
+    cache.avaliar(RegraLimiteCargaHoraria(), solicitacao)
+
+    assert len(cache) == 0
+    assert (cache.acertos, cache.faltas) == (0, 0)
+
+#TESTES COM DADOS RECARREGADOS DO BANCO
+
+def test_requisicoes_recarregadas_do_banco_reaproveitam_o_cache(banco):
+    cache = CacheResultadosRegras(versao_catalogo=RepositorioDisciplina.versao_catalogo)
+    regra = RegraPreRequisito()
+
+    primeira = cache.avaliar(regra, _requisicao())
+    segunda = cache.avaliar(regra, _requisicao())
+
+    assert [v.codigo for v in primeira] == [v.codigo for v in segunda] == ["pre_requisito_pendente"]
+    assert (cache.acertos, cache.faltas) == (1, 1)
+
+def test_catalogo_gravado_por_outro_processo_invalida(banco):
+    cache = CacheResultadosRegras(versao_catalogo=RepositorioDisciplina.versao_catalogo)
+    regra = RegraPreRequisito()
+    assert cache.avaliar(regra, _requisicao()) != []
+
+    # Outro processo retira o pré-requisito e avança a versão gravada
+    with open(db_config.DB_FILE, encoding="utf-8") as f:
+        dados = json.load(f)
+    dados["disciplinas"][1]["pre_requisitos"] = []
+    dados["versao_catalogo"] += 1
+    with open(db_config.DB_FILE, "w", encoding="utf-8") as f:
+        json.dump(dados, f)
+
+    assert cache.avaliar(regra, _requisicao()) == []
+    assert cache.acertos == 0
+
+def test_cursos_reconstruidos_compartilham_a_entrada_da_elegibilidade(banco):
+    cache = CacheResultadosRegras(versao_catalogo=RepositorioDisciplina.versao_catalogo)
+    regra = RegraElegibilidade()
+
+    for _ in range(2):
+        aluno = RepositorioAluno.reconstruir(RepositorioAluno().listar()[0])
+        assert [v.codigo for v in cache.avaliar(regra, SolicitacaoColacao(aluno, aluno.curso))] \
+            == ["curso_sem_grade"]
+
+    assert (cache.acertos, cache.faltas, len(cache)) == (1, 1, 1)
+
+#TESTES DE CAPACIDADE
+
+def test_descarta_a_entrada_menos_recente(calculo):
+    cache = CacheResultadosRegras(capacidade=2)
+    regra = RegraCreditos(minimo=0)
+    sols = [
+        SolicitacaoMatricula(Aluno(f"A{i}", f"a{i}@sgsa.edu.br", f"MAT{i}", Curso("Física")), calculo)
+        for i in range(3)
+    ]
+
+    cache.avaliar(regra, sols[0])
+    cache.avaliar(regra, sols[1])
+    cache.avaliar(regra, sols[0])      # renova MAT0
+    cache.avaliar(regra, sols[2])      # descarta MAT1
+
+    assert cache.descartes == 1
+    cache.avaliar(regra, sols[0])
+    assert cache.acertos == 2
+
+def test_capacidade_invalida():
+    with pytest.raises(ValueError):
+        CacheResultadosRegras(capacidade=0)
+
+def test_pipeline_com_cache(solicitacao):
+    cache = CacheResultadosRegras()
+    pipeline = PipelineRegras([RegraPreRequisito(), RegraLimiteCargaHoraria()], cache=cache)
+
+    for _ in range(3):
+        assert pipeline.validar(solicitacao) is True
+
+    assert (cache.acertos, cache.faltas) == (2, 1)
+
+#TESTES DE CONCORRÊNCIA
+
+class _EntradasLentas(OrderedDict):
+    """Pausa após cada consulta: outra thread pode descartar a entrada nesse meio tempo."""
+
+    def get(self, chave, padrao=None):
+        valor = super().get(chave, padrao)
+        time.sleep(0.0005)
+        return valor
+
+def test_threads_concorrentes_com_descartes(calculo):
+    cache = CacheResultadosRegras(capacidade=2)
+    cache._entradas = _EntradasLentas()
+    regra = RegraCreditos(minimo=0)
+    sols = [
+        SolicitacaoMatricula(Aluno(f"A{i}", f"a{i}@sgsa.edu.br", f"MAT{i}", Curso("Física")), calculo)
+        for i in range(3)
+    ]
+    erros = []
+
+    def avaliar():
+        try:
+            for _ in range(30):
+                for sol in sols:
+                    cache.avaliar(regra, sol)
+        except Exception as e:
+            erros.append(e)
+
+    threads = [threading.Thread(target=avaliar) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert erros == []
+    assert cache.acertos + cache.faltas == 4 * 30 * len(sols)
+    assert len(cache) <= 2
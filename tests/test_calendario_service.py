@@ -0,0 +1,99 @@
+import datetime
+import pytest
+import infrastructure.db_config as db_config
+from application.calendario_service import CalendarioService
+from application.politica_regras import PoliticaRegras
+from infrastructure.repositorio_calendario import RepositorioCalendario
+from rules.regra_prazo import RegraPrazo
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.solicitacao_trancamento import SolicitacaoTrancamento
+
+D = datetime.date
+
+#FIXTURES
+
+@pytest.fixture
+def periodos():
+    return [
+        {"semestre": "2026.1", "tipo": "trancamento", "inicio": "2026-02-02", "fim": "2026-04-10"},
+        {"semestre": "2026.2", "tipo": "trancamento", "inicio": "2026-08-03", "fim": "2026-10-09"},
+        {"curso": "Medicina", "semestre": "2026.1", "tipo": "trancamento",
+         "inicio": "2026-02-02", "fim": "2026-03-06"},
+    ]
+
+@pytest.fixture
+def calendario(periodos):
+    return CalendarioService(periodos=periodos)
+
+def _trancamento(data, curso="Física", prazo=None):
+    aluno = Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso(curso))
+    return SolicitacaoTrancamento(aluno, None, data=data, prazo=prazo)
+
+#TESTES DE CONSULTA
+
+@pytest.mark.parametrize("data, semestre", [
+    (D(2026, 3, 10), "2026.1"),   # dentro do período
+    (D(2026, 6, 1), "2026.1"),    # após o fim: o último período iniciado
+    (D(2026, 1, 5), "2026.1"),    # antes de tudo: o próximo período
+    (D(2026, 12, 1), "2026.2"),
+])
+def test_periodo_que_rege_a_data(calendario, data, semestre):
+    assert calendario.periodo("trancamento", data)["semestre"] == semestre
+
+def test_curso_com_periodo_proprio(calendario):
+    assert calendario.periodo("trancamento", D(2026, 3, 10), "Medicina")["fim"] == D(2026, 3, 6)
+    assert calendario.periodo("matricula", D(2026, 3, 10)) is None
+    assert calendario.periodo_atual("trancamento", hoje=D(2026, 6, 1)) is None
+
+def test_periodos_sobrepostos_sao_rejeitados(periodos):
+    periodos.append({"semestre": "2026.1b", "tipo": "trancamento",
+                     "inicio": "2026-04-01", "fim": "2026-05-01"})
+    with pytest.raises(ValueError):
+        CalendarioService(periodos=periodos)
+
+#TESTES DE IMPORTAÇÃO
+
+def test_importar_csv_persiste_e_recarrega(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    arquivo = tmp_path / "calendario.csv"
+    arquivo.write_text(
+        "curso,semestre,tipo,inicio,fim\n"
+        ",2026.1,trancamento,2026-02-02,2026-04-10\n"
+        "Medicina,2026.1,trancamento,2026-02-02,2026-03-06\n", encoding="utf-8")
+
+    assert CalendarioService(RepositorioCalendario()).importar_arquivo(str(arquivo)) == 2
+
+    relido = CalendarioService(RepositorioCalendario())
+    assert relido.periodo("trancamento", D(2026, 3, 1), "Medicina")["curso"] == "Medicina"
+    assert len(relido.listar()) == 2
+
+def test_importacao_invalida_nao_altera_o_calendario(calendario):
+    with pytest.raises(ValueError):
+        calendario.importar([
+            {"semestre": "2027.1", "tipo": "trancamento", "inicio": "2027-02-01", "fim": "2027-04-01"},
+            {"semestre": "2027.2", "tipo": "estagio", "inicio": "2027-08-01", "fim": "2027-10-01"},
+        ])
+    assert len(calendario.listar()) == 3
+
+#TESTES DA REGRA
+
+def test_regra_usa_o_calendario_e_ignora_o_prazo_informado(calendario):
+    regra = RegraPrazo(calendario)
+    fora = _trancamento(D(2026, 4, 20), prazo=D(2026, 12, 31))
+
+    violacao = regra.avaliar(fora)[0]
+
+    assert violacao.codigo == "prazo_encerrado"
+    assert violacao.parametros["prazo"] == D(2026, 4, 10)
+    assert regra.avaliar(_trancamento(D(2026, 3, 10), "Medicina"))[0].codigo == "prazo_encerrado"
+    assert regra.avaliar(_trancamento(D(2026, 1, 5)))[0].codigo == "periodo_nao_iniciado"
+    assert regra.avaliar(_trancamento(D(2026, 9, 1))) == []
+
+def test_politica_entrega_o_calendario(calendario):
+    politica = PoliticaRegras(calendario=calendario)
+    sol = _trancamento(D(2026, 4, 20), prazo=D(2026, 12, 31))
+
+    assert politica.pipeline("trancamento").avaliar(sol)[0].codigo == "prazo_encerrado"
+    politica.calendario = None
+    assert politica.pipeline("trancamento").avaliar(sol) == []
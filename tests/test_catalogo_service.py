@@ -0,0 +1,49 @@
+import pytest
+from application.catalogo_service import CatalogoService
+from domain.grafo_curricular import GrafoCurricular
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+
+#FIXTURES
+
+@pytest.fixture
+def grafo():
+    registros = [
+        {"nome": "Cálculo I", "carga_horaria": 72},
+        {"nome": "Cálculo II", "carga_horaria": 72, "pre_requisitos": ["cálculo i"]},
+        {"nome": "Física Teórica", "carga_horaria": 60, "co_requisitos": ["Laboratório de Física"]},
+        {"nome": "Laboratório de Física", "carga_horaria": 30},
+        {"nome": "Mecânica", "carga_horaria": 60, "co_requisitos": ["Cálculo II"]},
+        {"nome": "Estágio", "carga_horaria": 400},
+    ]
+    return GrafoCurricular.de_registros(registros)
+
+@pytest.fixture
+def aluno():
+    return Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso("Física", limite_horas_semestrais=360))
+
+#TESTES DE AGRUPAMENTO
+
+def test_aluno_sem_historico(grafo, aluno):
+    resultado = CatalogoService(grafo).disciplinas_elegiveis(aluno)
+
+    assert resultado["elegiveis"] == {
+        "Cálculo I": set(),
+        "Física Teórica": {"Laboratório de Física"},
+        "Laboratório de Física": set(),
+    }
+    # Nome do requisito é normalizado para o nome canônico
+    assert resultado["pre_requisito"] == {"Cálculo II": {"Cálculo I"}}
+    assert resultado["co_requisito"] == {"Mecânica": {"Cálculo II"}}
+    assert resultado["carga_horaria"] == {"Estágio": 400}
+    assert resultado["ja_aprovadas"] == []
+
+def test_aprovacao_libera_dependentes(grafo, aluno):
+    aluno.historico.adicionar_disciplina(Disciplina("Cálculo I", 72), 8.0)
+    resultado = CatalogoService(grafo).disciplinas_elegiveis(aluno)
+
+    assert resultado["ja_aprovadas"] == ["Cálculo I"]
+    assert resultado["elegiveis"]["Cálculo II"] == set()
+    assert resultado["elegiveis"]["Mecânica"] == {"Cálculo II"}
+    assert resultado["co_requisito"] == {}
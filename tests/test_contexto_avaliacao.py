@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import MagicMock
+from application.solicitacao_service import SolicitacaoService
+from application.pipeline_regras import PipelineRegras
+from rules.contexto_avaliacao import ContextoAvaliacao
+from rules.regra_elegibilidade import RegraElegibilidade
+from rules.regra_creditos import RegraCreditos
+from rules.regra_pendencia_documentacao import RegraPendenciaDocumentacao
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+from domain.solicitacao_colacao import SolicitacaoColacao
+
+#FIXTURES
+
+@pytest.fixture
+def solicitacao():
+    curso = Curso("Física", min_horas_optativas=60)
+    aluno = Aluno("Ana", "ana@sgsa.edu.br", "MAT001", curso)
+    aluno.historico.adicionar_disciplina(Disciplina("Cálculo I", 72), 8.0)
+    aluno.historico.adicionar_disciplina(Disciplina("Libras", 60, obrigatoria=False), 9.0)
+    aluno.historico.adicionar_disciplina(Disciplina("Física I", 60), 3.0)
+    return SolicitacaoColacao(aluno, curso)
+
+def _espiar_historico(solicitacao):
+    """Envolve o histórico real em um MagicMock que conta as chamadas."""
+    historico = solicitacao.aluno.historico
+    espiao = MagicMock(wraps=historico)
+    solicitacao.aluno.historico = espiao
+    return espiao
+
+#TESTES DO CONTEXTO
+
+def test_fatos_derivados_do_historico(solicitacao):
+    ctx = ContextoAvaliacao(solicitacao)
+
+    assert ctx.total_creditos == 132
+    assert ctx.horas_optativas == 60
+    assert [d.nome for d in ctx.aprovadas] == ["Cálculo I", "Libras"]
+    assert ctx.tem_pendencias is False
+
+def test_foi_aprovado_e_memorizado():
+    historico = MagicMock()
+    historico.foi_aprovado.return_value = True
+    ctx = ContextoAvaliacao(MagicMock(aluno=MagicMock(historico=historico)))
+    disc = MagicMock(nome="Cálculo I")
+
+    assert ctx.foi_aprovado(disc) and ctx.foi_aprovado(disc)
+    historico.foi_aprovado.assert_called_once_with(disc)
+
+#TESTES DE COMPARTILHAMENTO
+
+def test_colacao_percorre_o_historico_uma_unica_vez(solicitacao):
+    historico = _espiar_historico(solicitacao)
+    regras = [RegraElegibilidade(), RegraPendenciaDocumentacao(), RegraCreditos(minimo=80)]
+
+    assert SolicitacaoService().aplicar_regras(solicitacao, regras) is True
+    assert historico.disciplinas_aprovadas.call_count == 1
+    assert historico.total_creditos.call_count == 0
+
+def test_pipeline_compartilha_o_contexto(solicitacao):
+    historico = _espiar_historico(solicitacao)
+    pipeline = PipelineRegras([RegraElegibilidade(), RegraCreditos(minimo=500)])
+
+    resultado = SolicitacaoService().avaliar_regras(solicitacao, pipeline)
+
+    assert resultado.codigos == ["creditos_insuficientes"]
+    assert historico.disciplinas_aprovadas.call_count == 1
+
+def test_regra_isolada_cria_o_proprio_contexto(solicitacao):
+    assert RegraCreditos(minimo=132).validar(solicitacao) is True
+    assert RegraCreditos(minimo=133).avaliar(solicitacao)[0].parametros == {"minimo": 133, "total": 132}
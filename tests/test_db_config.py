@@ -0,0 +1,94 @@
+import json
+import pytest
+import infrastructure.db_config as db_config
+
+#FIXTURES
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch):
+    """sgsa.json temporário com gravações agrupadas ligadas."""
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    db_config.save_db({"alunos": []})
+    db_config.adiar_gravacao()
+    yield tmp_path / "sgsa.json"
+    db_config.adiar_gravacao(False)
+    db_config.ativar_cache(False)
+
+def _no_arquivo(caminho):
+    return json.loads(caminho.read_text(encoding="utf-8"))
+
+#TESTES DE GRAVAÇÃO AGRUPADA
+
+def test_gravacoes_ficam_em_memoria_ate_confirmar(banco):
+    for nome in ("Ana", "Bruno"):
+        db = db_config.load_db()
+        db["alunos"].append({"nome": nome})
+        db_config.save_db(db)
+
+    assert _no_arquivo(banco)["alunos"] == []
+    assert len(db_config.load_db()["alunos"]) == 2
+
+    db_config.confirmar()
+    assert [a["nome"] for a in _no_arquivo(banco)["alunos"]] == ["Ana", "Bruno"]
+
+def test_desligar_sem_confirmar_descarta_o_grupo(banco):
+    db = db_config.load_db()
+    db["alunos"].append({"nome": "Ana"})
+    db_config.save_db(db)
+
+    db_config.adiar_gravacao(False)
+
+    assert db_config.load_db()["alunos"] == []
+
+#TESTES DA VERSÃO DO ARQUIVO
+
+def test_regravacao_de_mesmo_tamanho_e_mesma_data_muda_a_versao(tmp_path, monkeypatch):
+    import os
+    caminho = tmp_path / "sgsa.json"
+    monkeypatch.setattr(db_config, "DB_FILE", str(caminho))
+    db_config.ativar_cache()
+    try:
+        db_config.save_db({"alunos": [{"nome": "Ana"}]})
+        assert db_config.load_db()["alunos"] == [{"nome": "Ana"}]
+        antes = os.stat(caminho)
+
+        # Outro processo regrava com o mesmo tamanho, na mesma marca de tempo
+        temporario = tmp_path / "outro.tmp"
+        temporario.write_text(json.dumps({"alunos": [{"nome": "Bia"}]}, indent=4), encoding="utf-8")
+        os.replace(temporario, caminho)
+        os.utime(caminho, ns=(antes.st_atime_ns, antes.st_mtime_ns))
+        assert os.stat(caminho).st_size == antes.st_size
+
+        assert db_config.load_db()["alunos"] == [{"nome": "Bia"}]
+    finally:
+        db_config.ativar_cache(False)
+
+#TESTES DE LEITURA INCREMENTAL
+
+@pytest.mark.parametrize("bloco", [1, 7, 1 << 16])
+def test_iterar_colecao_le_em_blocos_qualquer_tamanho(tmp_path, monkeypatch, bloco):
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    monkeypatch.setattr(db_config, "_TAMANHO_BLOCO", bloco)
+    dados = {"carga_semestral": {"M1": {"2025.1": {"total": 60, "disciplinas": {"a": 60}}}},
+             "alunos": [{"nome": "Ana", "n": 12345}, {"nome": "Bia [\"}\"]", "n": -1.5e3}],
+             "vazia": [], "solicitacoes": [{"id": 1}]}
+    (tmp_path / "sgsa.json").write_text(json.dumps(dados, indent=2), encoding="utf-8")
+
+    assert list(db_config.iterar_colecao("alunos")) == dados["alunos"]
+    assert list(db_config.iterar_colecao("solicitacoes")) == [{"id": 1}]
+    assert list(db_config.iterar_colecao("vazia")) == []
+    assert list(db_config.iterar_colecao("ausente")) == []
+
+def test_iterar_colecao_usa_gravacoes_pendentes(banco):
+    db = db_config.load_db()
+    db["alunos"].append({"nome": "Ana"})
+    db_config.save_db(db)
+
+    assert list(db_config.iterar_colecao("alunos")) == [{"nome": "Ana"}]
+
+def test_iterar_colecao_rejeita_arquivo_corrompido(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    (tmp_path / "sgsa.json").write_text('{"alunos": [{"nome": "Ana"}, {"nome"', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(db_config.iterar_colecao("alunos"))
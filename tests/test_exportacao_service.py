@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+from datetime import date
+import pytest
+import infrastructure.db_config as db_config
+from application.exportacao_service import ExportacaoService
+from infrastructure.repositorio_aluno import RepositorioAluno
+from infrastructure.repositorio_disciplina import RepositorioDisciplina
+from infrastructure.repositorio_solicitacao import RepositorioSolicitacao
+
+#FIXTURES
+
+@pytest.fixture
+def exportacao(tmp_path, monkeypatch):
+    """Serviço sobre um sgsa.json temporário com alunos, catálogo e solicitações."""
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    db_config.save_db({
+        "alunos": [
+            {"nome": "Ana", "email": "a@x", "matricula": "M1", "curso": "Física"},
+            {"nome": "Bia", "email": "b@x", "matricula": "M2", "curso": "Química"},
+        ],
+        "disciplinas": [
+            {"nome": "Cálculo II", "carga_horaria": 60, "obrigatoria": False,
+             "pre_requisitos": ["Cálculo I", "Álgebra"], "co_requisitos": []},
+        ],
+        "solicitacoes": [
+            {"id": 1, "tipo": "matricula", "aluno_id": "M1", "status": "Aberta", "alvo": "A",
+             "criada_em": "2025-02-10T09:00:00"},
+            {"id": 2, "tipo": "trancamento", "aluno_id": "M2", "status": "Aberta", "alvo": "B",
+             "criada_em": "2025-03-01T10:00:00"},
+            {"id": 3, "tipo": "matricula", "aluno_id": "M2", "status": "Rejeitada", "alvo": "C"},
+        ],
+    })
+    return ExportacaoService(RepositorioAluno(), RepositorioDisciplina(), RepositorioSolicitacao())
+
+def _ids(exportacao, **filtros):
+    return [r["id"] for r in exportacao.registros("solicitacoes", **filtros)]
+
+#TESTES DE FILTROS
+
+def test_filtra_solicitacoes_por_status_tipo_e_curso(exportacao):
+    assert _ids(exportacao, status="Aberta") == [1, 2]
+    assert _ids(exportacao, tipo="matricula") == [1, 3]
+    assert _ids(exportacao, curso="Química") == [2, 3]
+    assert _ids(exportacao, curso="Química", status="Aberta") == [2]
+
+def test_periodo_e_inclusivo_e_ignora_registros_sem_data(exportacao):
+    assert _ids(exportacao, de=date(2025, 3, 1)) == [2]
+    assert _ids(exportacao, ate=date(2025, 2, 10)) == [1]
+    assert _ids(exportacao, de=date(2025, 1, 1), ate=date(2025, 12, 31)) == [1, 2]
+
+def test_filtro_que_nao_se_aplica_a_colecao(exportacao):
+    with pytest.raises(ValueError):
+        exportacao.registros("disciplinas", curso="Física")
+    with pytest.raises(ValueError):
+        exportacao.registros("planilhas")
+
+#TESTES DE FORMATOS
+
+def test_csv_com_listas_e_booleanos_no_formato_da_importacao(exportacao):
+    destino = io.StringIO()
+    assert exportacao.exportar("disciplinas", destino) == 1
+
+    linhas = list(csv.DictReader(io.StringIO(destino.getvalue())))
+    assert linhas == [{"nome": "Cálculo II", "carga_horaria": "60", "obrigatoria": "nao",
+                       "pre_requisitos": "Cálculo I;Álgebra", "co_requisitos": ""}]
+
+def test_jsonl_com_selecao_de_colunas(exportacao):
+    destino = io.StringIO()
+    total = exportacao.exportar("alunos", destino, "jsonl", ["matricula", "curso"], curso="Física")
+
+    assert total == 1
+    assert [json.loads(l) for l in destino.getvalue().splitlines()] == [
+        {"matricula": "M1", "curso": "Física"}]
+
+def test_coluna_ou_formato_invalido(exportacao):
+    with pytest.raises(ValueError):
+        exportacao.exportar("alunos", io.StringIO(), colunas=["senha"])
+    with pytest.raises(ValueError):
+        exportacao.exportar("alunos", io.StringIO(), formato="xlsx")
@@ -78,4 +78,16 @@ def test_sobrescrever_nota_da_mesma_disciplina(historico, anatomia):
     
     # Aluno faz segunda chamada ou re-cursa e passa
     historico.adicionar_disciplina(anatomia, nota=6.0)
-    assert historico.total_creditos() == 80
\ No newline at end of file
+    assert historico.total_creditos() == 80
+
+#TESTE DE VERSÃO
+
+def test_historicos_carimbados_com_o_mesmo_registro_compartilham_a_versao(anatomia):
+    """Dois carregamentos do mesmo aluno têm a mesma versão até alguma alteração."""
+    primeiro, segundo = Historico(), Historico()
+    primeiro.carimbar(("Ana", "MAT001"))
+    segundo.carimbar(("Ana", "MAT001"))
+    assert primeiro.versao == segundo.versao
+
+    segundo.adicionar_disciplina(anatomia, nota=7.0)
+    assert primeiro.versao != segundo.versao
@@ -0,0 +1,81 @@
+import pytest
+import infrastructure.db_config as db_config
+from application.importacao_service import ImportacaoService
+from infrastructure.repositorio_aluno import RepositorioAluno
+from infrastructure.repositorio_disciplina import RepositorioDisciplina
+
+#FIXTURES
+
+@pytest.fixture
+def importacao(tmp_path, monkeypatch):
+    """Serviço com repositórios apontando para um sgsa.json temporário."""
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    return ImportacaoService(RepositorioAluno(), RepositorioDisciplina())
+
+def _linhas(*registros):
+    return [(n, r) for n, r in enumerate(registros, start=2)]
+
+def _disciplina(nome, carga="60", pre="", co="", obrigatoria=""):
+    return {"nome": nome, "carga_horaria": carga, "obrigatoria": obrigatoria,
+            "pre_requisitos": pre, "co_requisitos": co}
+
+#TESTES DE ALUNOS
+
+def test_importa_alunos_com_padroes_do_curso(importacao):
+    total = importacao.importar_alunos(_linhas(
+        {"nome": "Ana", "email": "ana@x", "matricula": "M1", "curso": "Física"},
+        {"nome": "Bia", "email": "bia@x", "matricula": "M2", "curso": "Física", "limite_horas": "200"},
+    ))
+
+    assert total == 2
+    assert [a[2:5] for a in RepositorioAluno().listar()] == [("M1", "Física", 360), ("M2", "Física", 200)]
+
+def test_matricula_repetida_cancela_toda_a_importacao(importacao):
+    importacao.importar_alunos(_linhas({"nome": "Ana", "email": "a", "matricula": "M1", "curso": "F"}))
+
+    with pytest.raises(ValueError) as erro:
+        importacao.importar_alunos(_linhas(
+            {"nome": "Bia", "email": "b", "matricula": "M2", "curso": "F"},
+            {"nome": "Caio", "email": "c", "matricula": "M2", "curso": "F"},
+            {"nome": "Ana", "email": "a", "matricula": "M1", "curso": "F"},
+        ))
+
+    assert "linha 3: matrícula M2 repetida (linha 2)" in str(erro.value)
+    assert "linha 4: matrícula M1 já cadastrada" in str(erro.value)
+    assert len(RepositorioAluno().listar()) == 1
+
+#TESTES DE DISCIPLINAS
+
+def test_requisitos_em_qualquer_ordem_viram_nome_canonico(importacao):
+    importacao.importar_disciplinas(_linhas(_disciplina("Cálculo I")))
+
+    importacao.importar_disciplinas(_linhas(
+        _disciplina("Física II", pre="física i; CÁLCULO I", co="Lab"),
+        _disciplina("Física I", obrigatoria="nao"),
+        _disciplina("Lab", carga="30"),
+    ))
+
+    registros = {d["nome"]: d for d in RepositorioDisciplina().listar_completo()}
+    assert registros["Física II"]["pre_requisitos"] == ["Física I", "Cálculo I"]
+    assert registros["Física II"]["co_requisitos"] == ["Lab"]
+    assert registros["Física I"]["obrigatoria"] is False
+    assert RepositorioDisciplina().dependentes_diretos("Cálculo I") == ["Física II"]
+
+def test_problemas_sao_reunidos_e_nada_e_gravado(importacao):
+    with pytest.raises(ValueError) as erro:
+        importacao.importar_disciplinas(_linhas(
+            _disciplina("A", pre="Inexistente"),
+            _disciplina("B", carga="0"),
+            _disciplina("C", co="c"),
+        ))
+
+    mensagem = str(erro.value)
+    assert "3 problema(s)" in mensagem
+    assert "'Inexistente'" in mensagem and "positiva" in mensagem and "si mesma" in mensagem
+    assert RepositorioDisciplina().listar() == []
+
+def test_ciclo_de_pre_requisitos_e_rejeitado(importacao):
+    with pytest.raises(ValueError, match="ciclo de pré-requisitos envolvendo: A, B"):
+        importacao.importar_disciplinas(_linhas(
+            _disciplina("A", pre="B"), _disciplina("B", pre="A"), _disciplina("C"),
+        ))
@@ -0,0 +1,99 @@
+import random
+import pytest
+from application.instrumentacao_regras import HistogramaLatencia, InstrumentacaoRegras
+from application.pipeline_regras import PipelineRegras
+from application.solicitacao_service import SolicitacaoService
+from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.regra_base import Regra
+from rules.regra_creditos import RegraCreditos
+from rules.regra_vinculo_ativo import RegraVinculoAtivo
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.solicitacao_colacao import SolicitacaoColacao
+
+#FIXTURES
+
+class RegraLegada(Regra):
+    """Regra que só implementa validar() e informa outra regra na exceção."""
+
+    def validar(self, solicitacao, contexto=None):
+        raise ViolacaoRegraAcademicaError("Bloqueio externo.", regra="SistemaFinanceiro")
+
+@pytest.fixture
+def solicitacao():
+    aluno = Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso("Física"))
+    return SolicitacaoColacao(aluno, aluno.curso)
+
+#TESTES DO HISTOGRAMA
+
+def test_percentis_com_erro_relativo_limitado():
+    random.seed(7)
+    valores = sorted(random.randint(1, 10 ** 7) for _ in range(20000))
+    h = HistogramaLatencia()
+    for v in valores:
+        h.registrar(v)
+
+    for p in (50, 90, 99):
+        exato = valores[int(len(valores) * p / 100) - 1]
+        assert abs(h.percentil(p) - exato) / exato < 1 / 32
+    assert h.percentil(100) == valores[-1]
+
+def test_valores_pequenos_sao_exatos_e_mesclagem():
+    a, b = HistogramaLatencia(), HistogramaLatencia()
+    for v in (3, 5, 7):
+        a.registrar(v)
+    b.registrar(30, vezes=2)
+
+    a.mesclar(b)
+
+    assert (a.contagem, a.minimo, a.maximo, a.soma) == (5, 3, 30, 75)
+    assert a.percentil(50) == 7
+    with pytest.raises(ValueError):
+        a.mesclar(HistogramaLatencia(bits=3))
+
+#TESTES DE COLETA
+
+def test_servico_instrumentado_registra_rejeicao_e_profundidade(solicitacao):
+    instr = InstrumentacaoRegras()
+    svc = SolicitacaoService(instrumentacao=instr)
+    regras = [RegraVinculoAtivo(), RegraCreditos(minimo=80), RegraVinculoAtivo()]
+
+    with pytest.raises(ViolacaoRegraAcademicaError):
+        svc.aplicar_regras(solicitacao, regras)
+
+    resumo = {r["regra"]: r for r in instr.resumo()}
+    assert resumo["RegraVinculoAtivo"]["aprovacoes"] == 1
+    assert resumo["RegraCreditos"]["rejeicoes"] == 1
+    assert instr.profundidades()["aplicar_regras"]["profundidade"] == {2: 1}
+
+def test_rejeicao_atribuida_pela_regra_da_excecao(solicitacao):
+    instr = InstrumentacaoRegras()
+    pipeline = PipelineRegras([RegraLegada()], nome="colacao", instrumentacao=instr)
+
+    assert pipeline.avaliar(solicitacao)
+
+    resumo = {r["regra"]: r for r in instr.resumo()}
+    assert resumo["RegraLegada"]["execucoes"] == 1
+    assert resumo["SistemaFinanceiro"]["rejeicoes"] == 1
+    assert instr.profundidades()["colacao"]["total_regras"] == 1
+
+#TESTES DE PERSISTÊNCIA
+
+def test_salvar_carregar_e_acumular(tmp_path, solicitacao):
+    caminho = str(tmp_path / "instrumentacao.json")
+    instr = InstrumentacaoRegras()
+    SolicitacaoService(instrumentacao=instr).avaliar_regras(solicitacao, [RegraCreditos()])
+    instr.salvar(caminho)
+
+    acumulada = InstrumentacaoRegras.carregar(caminho)
+    acumulada.mesclar(instr)
+
+    assert acumulada.resumo()[0]["execucoes"] == 2
+    assert acumulada.profundidades()["aplicar_regras"]["avaliacoes"] == 2
+    assert not InstrumentacaoRegras.carregar(str(tmp_path / "ausente.json"))
+
+def test_ordenacao_invalida(solicitacao):
+    instr = InstrumentacaoRegras()
+    SolicitacaoService(instrumentacao=instr).avaliar_regras(solicitacao, [RegraCreditos()])
+    with pytest.raises(ValueError):
+        instr.resumo("inexistente")
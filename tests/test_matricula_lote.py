@@ -0,0 +1,66 @@
+import pytest
+import infrastructure.db_config as db_config
+from application.politica_regras import PoliticaRegras
+from application.solicitacao_service import SolicitacaoService
+from infrastructure.repositorio_solicitacao import RepositorioSolicitacao
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+
+#FIXTURES
+
+@pytest.fixture
+def aluno():
+    return Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso("Física", limite_horas_semestrais=150))
+
+@pytest.fixture
+def disciplinas():
+    teoria, lab, calc = Disciplina("Física I", 60), Disciplina("Lab. Física I", 30), Disciplina("Cálculo I", 72)
+    teoria.adicionar_co_requisito(lab)
+    return teoria, lab, calc
+
+@pytest.fixture
+def matricula():
+    return PoliticaRegras().pipeline("matricula")
+
+#TESTES DE VALIDAÇÃO DO CONJUNTO
+
+def test_co_requisito_satisfeito_dentro_do_conjunto(aluno, disciplinas, matricula):
+    teoria, lab, _ = disciplinas
+    svc = SolicitacaoService()
+
+    assert all(svc.validar_lote(svc.criar_matricula_lote(aluno, [teoria, lab]), matricula))
+    assert not all(svc.validar_lote(svc.criar_matricula_lote(aluno, [teoria]), matricula))
+
+def test_carga_acumulada_do_conjunto(aluno, disciplinas, matricula):
+    svc = SolicitacaoService()
+    sols = svc.criar_matricula_lote(aluno, list(disciplinas), carga_atual=0)
+
+    resultados = svc.validar_lote(sols, matricula)
+
+    assert [bool(r) for r in resultados] == [True, True, False]
+    assert resultados[2].violacoes[0].parametros["total"] == 162
+
+def test_conjunto_invalido(aluno, disciplinas):
+    with pytest.raises(ValueError):
+        SolicitacaoService().criar_matricula_lote(aluno, [disciplinas[0], Disciplina("Física I", 60)])
+    with pytest.raises(ValueError):
+        SolicitacaoService().criar_matricula_lote(aluno, [])
+
+#TESTES DE PERSISTÊNCIA
+
+def test_lote_gravado_de_uma_vez(tmp_path, monkeypatch, aluno, disciplinas, capsys):
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    gravacoes = []
+    salvar = db_config.save_db
+    monkeypatch.setattr("infrastructure.repositorio_solicitacao.save_db",
+                        lambda dados: (gravacoes.append(1), salvar(dados)))
+    repo = RepositorioSolicitacao()
+    sols = SolicitacaoService().criar_matricula_lote(aluno, list(disciplinas[:2]), semestre="2026.1")
+    for sol in sols:
+        sol.avancar()
+        sol.avancar()
+
+    assert repo.adicionar_lote(sols, "matricula", lote="SGSA-1") == [1, 2]
+    assert len(gravacoes) == 1
+    assert repo.carga_semestral("MAT001", "2026.1") == 90
@@ -0,0 +1,71 @@
+import json
+import pytest
+import infrastructure.db_config as db_config
+from infrastructure.medicao import MedicaoFases, ativar_medicao, desativar_medicao, fase
+
+#FIXTURES
+
+@pytest.fixture
+def medicao():
+    medicao = ativar_medicao()
+    yield medicao
+    desativar_medicao()
+
+def _caminhos(medicao):
+    return {f["caminho"]: f["chamadas"] for f in medicao.resumo()}
+
+#TESTES DA MEDIÇÃO POR FASE
+
+def test_sem_medicao_ativa_fase_e_um_contexto_vazio():
+    assert fase("load_db") is fase("parse")
+    with fase("load_db"):
+        pass
+
+def test_fases_aninhadas_sao_acumuladas_pelo_caminho(medicao):
+    with fase("busca_aluno"):
+        with fase("load_db"):
+            pass
+    for _ in range(2):
+        with fase("load_db"):
+            pass
+
+    resumo = medicao.resumo()
+    assert [(f["caminho"], f["nivel"], f["chamadas"]) for f in resumo] == [
+        ("busca_aluno", 0, 1), ("busca_aluno/load_db", 1, 1), ("load_db", 0, 2)]
+    assert resumo[0]["total_ms"] >= resumo[1]["total_ms"]
+
+def test_resumo_lista_cada_fase_seguida_das_internas(medicao):
+    with fase("a"):
+        pass
+    with fase("b"):
+        pass
+    with fase("a"):
+        with fase("c"):
+            pass
+
+    assert [f["caminho"] for f in medicao.resumo()] == ["a", "a/c", "b"]
+
+def test_fase_e_registrada_mesmo_com_excecao(medicao):
+    with pytest.raises(ValueError):
+        with fase("regras"):
+            raise ValueError("falhou")
+    with fase("persistencia"):
+        pass
+
+    assert _caminhos(medicao) == {"regras": 1, "persistencia": 1}
+
+def test_medicao_vazia_e_falsa():
+    assert not MedicaoFases()
+
+#TESTES DAS FASES DO BANCO
+
+def test_banco_mede_leitura_interpretacao_e_gravacao(tmp_path, monkeypatch, medicao):
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    db_config.init_db()
+    db = db_config.load_db()
+    db["alunos"].append({"nome": "Ana"})
+    db_config.save_db(db)
+
+    assert json.loads((tmp_path / "sgsa.json").read_text(encoding="utf-8"))["alunos"] == [{"nome": "Ana"}]
+    assert _caminhos(medicao) == {"init_db": 1, "init_db/persistencia": 1, "load_db": 1,
+                                  "load_db/parse": 1, "persistencia": 1}
@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import MagicMock
+from application.pipeline_regras import PipelineRegras
+from application.solicitacao_service import SolicitacaoService
+from domain.excecoes import ViolacaoRegraAcademicaError
+from rules.regra_base import Regra
+
+#REGRAS DE TESTE
+
+class RegraRaraCara(Regra):
+    """Rejeita apenas solicitações marcadas com 'rara'."""
+    def validar(self, solicitacao):
+        if solicitacao.rara:
+            raise ViolacaoRegraAcademicaError("rara", regra="RegraRaraCara")
+        return True
+
+class RegraFrequente(Regra):
+    """Rejeita solicitações marcadas com 'frequente'."""
+    def validar(self, solicitacao):
+        if solicitacao.frequente:
+            raise ViolacaoRegraAcademicaError("frequente", regra="RegraFrequente")
+        return True
+
+class RegraDependente(RegraFrequente):
+    DEPENDE_DE = ("RegraRaraCara",)
+
+def _sol(rara=False, frequente=False):
+    return MagicMock(rara=rara, frequente=frequente)
+
+def _executar(pipeline, sol):
+    try:
+        pipeline.validar(sol)
+    except ViolacaoRegraAcademicaError:
+        pass
+
+#TESTES DE EXECUÇÃO
+
+def test_pipeline_e_uma_regra_aceita_pelo_servico():
+    pipeline = PipelineRegras([RegraRaraCara(), RegraFrequente()], nome="teste")
+    service = SolicitacaoService()
+
+    assert service.aplicar_regras(_sol(), pipeline) is True
+    with pytest.raises(ViolacaoRegraAcademicaError):
+        service.aplicar_regras(_sol(frequente=True), pipeline)
+
+def test_estatisticas_contam_execucoes_e_rejeicoes():
+    pipeline = PipelineRegras([RegraRaraCara(), RegraFrequente()])
+    _executar(pipeline, _sol(rara=True))
+    _executar(pipeline, _sol())
+
+    stats = {e["regra"]: e for e in pipeline.estatisticas()}
+    assert stats["RegraRaraCara"]["execucoes"] == 2
+    assert stats["RegraRaraCara"]["rejeicoes"] == 1
+    assert stats["RegraFrequente"]["execucoes"] == 1
+    assert stats["RegraFrequente"]["taxa_rejeicao"] == 0.0
+
+#TESTES DE REORDENAÇÃO
+
+def test_regra_que_mais_rejeita_passa_para_a_frente():
+    pipeline = PipelineRegras([RegraRaraCara(), RegraFrequente()], amostras_minimas=20)
+    assert [type(r).__name__ for r in pipeline.regras] == ["RegraRaraCara", "RegraFrequente"]
+
+    for i in range(20):
+        _executar(pipeline, _sol(rara=(i == 0), frequente=(i > 0)))
+
+    assert [type(r).__name__ for r in pipeline.regras] == ["RegraFrequente", "RegraRaraCara"]
+
+def test_dependencia_declarada_e_respeitada():
+    pipeline = PipelineRegras([RegraRaraCara(), RegraDependente()], amostras_minimas=20)
+    for _ in range(20):
+        _executar(pipeline, _sol(frequente=True))
+
+    assert [type(r).__name__ for r in pipeline.regras] == ["RegraRaraCara", "RegraDependente"]
+
+def test_dependencias_ciclicas_geram_erro():
+    class A(Regra):
+        DEPENDE_DE = ("B",)
+        def validar(self, solicitacao):
+            return True
+
+    class B(A):
+        DEPENDE_DE = ("A",)
+
+    with pytest.raises(ValueError):
+        PipelineRegras([A(), B()])
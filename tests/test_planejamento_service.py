@@ -0,0 +1,79 @@
+import pytest
+from application.planejamento_service import PlanejamentoService
+from domain.grafo_curricular import GrafoCurricular
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+
+#FIXTURES
+
+@pytest.fixture
+def grafo():
+    registros = [
+        {"nome": "Cálculo I", "carga_horaria": 72},
+        {"nome": "Cálculo II", "carga_horaria": 72, "pre_requisitos": ["Cálculo I"]},
+        {"nome": "Cálculo III", "carga_horaria": 72, "pre_requisitos": ["Cálculo II"]},
+        {"nome": "Física Teórica", "carga_horaria": 60, "co_requisitos": ["Laboratório de Física"]},
+        {"nome": "Laboratório de Física", "carga_horaria": 30},
+        {"nome": "Libras", "carga_horaria": 60, "obrigatoria": False},
+        {"nome": "Tópicos Avançados", "carga_horaria": 60, "obrigatoria": False,
+         "pre_requisitos": ["Cálculo III"]},
+    ]
+    return GrafoCurricular.de_registros(registros)
+
+def _aluno(limite=360, min_optativas=0):
+    curso = Curso("Física", limite_horas_semestrais=limite, min_horas_optativas=min_optativas)
+    return Aluno("Ana", "ana@sgsa.edu.br", "MAT001", curso)
+
+#TESTES DE PLANEJAMENTO
+
+def test_plano_respeita_caminho_critico(grafo):
+    plano = PlanejamentoService(grafo).planejar(_aluno())
+
+    assert plano["total_semestres"] == 3
+    assert plano["otimo"] is True
+    assert plano["semestres"][0] == ["Cálculo I", "Física Teórica", "Laboratório de Física"]
+    assert plano["semestres"][1:] == [["Cálculo II"], ["Cálculo III"]]
+
+def test_teto_semestral_e_co_requisitos_no_mesmo_semestre(grafo):
+    plano = PlanejamentoService(grafo).planejar(_aluno(limite=100))
+
+    for horas in plano["horas_por_semestre"]:
+        assert horas <= 100
+    semestre_de = {n: i for i, s in enumerate(plano["semestres"]) for n in s}
+    assert semestre_de["Física Teórica"] == semestre_de["Laboratório de Física"]
+    assert semestre_de["Cálculo I"] < semestre_de["Cálculo II"] < semestre_de["Cálculo III"]
+
+def test_optativa_mais_barata_e_escolhida(grafo):
+    plano = PlanejamentoService(grafo).planejar(_aluno(min_optativas=60))
+    assert plano["optativas_escolhidas"] == ["Libras"]
+
+def test_historico_reduz_o_plano(grafo):
+    aluno = _aluno()
+    aluno.historico.adicionar_disciplina(Disciplina("Cálculo I", 72), 9.0)
+    aluno.historico.adicionar_disciplina(Disciplina("Cálculo II", 72), 9.0)
+    plano = PlanejamentoService(grafo).planejar(aluno)
+    assert plano["total_semestres"] == 1
+
+def test_co_requisito_acima_do_teto_e_cursado_antes(grafo):
+    # Física Teórica + Laboratório somam 90h: o laboratório vem antes
+    plano = PlanejamentoService(grafo).planejar(_aluno(limite=80))
+
+    semestre_de = {n: i for i, s in enumerate(plano["semestres"]) for n in s}
+    assert semestre_de["Laboratório de Física"] < semestre_de["Física Teórica"]
+    assert max(plano["horas_por_semestre"]) <= 80
+
+#TESTES DE INVIABILIDADE E LOTE
+
+def test_disciplina_maior_que_o_teto_vira_erro_no_lote(grafo):
+    planos = PlanejamentoService(grafo).planejar_lote([_aluno(limite=70), _aluno()])
+    assert "Cálculo I" in planos[0]["erro"]
+    assert planos[1]["total_semestres"] == 3
+
+def test_co_requisitos_mutuos_maiores_que_o_teto_sao_inviaveis():
+    grafo = GrafoCurricular.de_registros([
+        {"nome": "Física Teórica", "carga_horaria": 60, "co_requisitos": ["Laboratório de Física"]},
+        {"nome": "Laboratório de Física", "carga_horaria": 30, "co_requisitos": ["Física Teórica"]},
+    ])
+    with pytest.raises(ValueError, match="precisam ser cursadas juntas"):
+        PlanejamentoService(grafo).planejar(_aluno(limite=80))
@@ -0,0 +1,151 @@
+import json
+import pytest
+from application import politica_regras
+from application.politica_regras import PoliticaRegras
+from rules.regra_creditos import RegraCreditos
+from rules.regra_vinculo_ativo import RegraVinculoAtivo
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.solicitacao_colacao import SolicitacaoColacao
+from domain.solicitacao_trancamento import SolicitacaoTrancamento
+
+#FIXTURES
+
+@pytest.fixture
+def definicao():
+    return {
+        "padrao": {
+            "matricula": ["RegraPreRequisito"],
+            "trancamento": [{"regra": "RegraVinculoAtivo", "bloqueados": ["Egresso"]}],
+            "colacao": [{"regra": "RegraCreditos", "minimo": 80}],
+        },
+        "cursos": {
+            "Medicina": {"colacao": [{"regra": "RegraCreditos", "minimo": 200}]},
+        },
+    }
+
+@pytest.fixture
+def arquivo(tmp_path, definicao):
+    caminho = tmp_path / "politica.json"
+    caminho.write_text(json.dumps(definicao), encoding="utf-8")
+    return caminho
+
+def _colacao(curso="Física"):
+    aluno = Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso(curso))
+    return SolicitacaoColacao(aluno, aluno.curso)
+
+#TESTES DE COMPILAÇÃO
+
+def test_politica_padrao_mantem_as_regras_historicas():
+    politica = PoliticaRegras()
+
+    assert [type(r).__name__ for r in politica.pipeline("colacao").regras] == [
+        "RegraElegibilidade", "RegraPendenciaDocumentacao", "RegraCreditos"]
+    assert politica.pipeline("matricula") is politica.pipeline("matricula", "Qualquer")
+
+def test_pipelines_padrao_respeitam_as_dependencias_das_regras():
+    politica = PoliticaRegras()
+    for tipo in ("colacao", "trancamento", "matricula"):
+        regras = politica.pipeline(tipo).regras
+        nomes = [type(r).__name__ for r in regras]
+        for posicao, regra in enumerate(regras):
+            assert all(nomes.index(d) < posicao for d in regra.DEPENDE_DE if d in nomes), nomes
+
+def test_curso_substitui_apenas_os_tipos_declarados(definicao):
+    politica = PoliticaRegras(definicao)
+
+    assert politica.pipeline("colacao", "Medicina") is not politica.pipeline("colacao")
+    assert politica.pipeline("trancamento", "Medicina") is politica.pipeline("trancamento")
+    assert politica.pipeline("colacao", "Medicina").nome == "Medicina/colacao"
+
+def test_parametros_sao_repassados_as_regras(definicao):
+    politica = PoliticaRegras(definicao)
+    sol = SolicitacaoTrancamento(_colacao().aluno, None)
+    sol.aluno.historico.status_vinculo = "Trancado"
+
+    assert politica.pipeline("trancamento").avaliar(sol) == []
+    assert RegraVinculoAtivo().avaliar(sol) != []
+    violacao = politica.pipeline("colacao", "Medicina").avaliar(_colacao("Medicina"))[0]
+    assert violacao.parametros["minimo"] == 200
+
+@pytest.mark.parametrize("alteracao", [
+    {"matricula": ["RegraInexistente"]},
+    {"matricula": [{"regra": "RegraCreditos", "maximo": 3}]},
+    {"estagio": ["RegraCreditos"]},
+])
+def test_definicao_invalida(definicao, alteracao):
+    definicao["padrao"].update(alteracao)
+    with pytest.raises(ValueError):
+        PoliticaRegras(definicao)
+
+@pytest.mark.parametrize("secao, nome, valor, trecho", [
+    ("padrao", "matricula", ["RegraPreRequisito", 42], "padrão, tipo 'matricula'), regra 2"),
+    ("cursos", "Medicina", {"colacao": [None]}, "curso 'Medicina', tipo 'colacao'), regra 1"),
+    ("cursos", "Medicina", {"colacao": "RegraCreditos"}, "curso 'Medicina', tipo 'colacao'"),
+    ("cursos", "Medicina", ["RegraCreditos"], "curso 'Medicina'"),
+])
+def test_tipos_invalidos_indicam_onde_estao(definicao, secao, nome, valor, trecho):
+    definicao[secao][nome] = valor
+    with pytest.raises(ValueError) as excinfo:
+        PoliticaRegras(definicao)
+    assert trecho in str(excinfo.value)
+
+def test_tipo_desconhecido_na_consulta():
+    with pytest.raises(ValueError):
+        PoliticaRegras().pipeline("estagio")
+
+#TESTES DE RECARGA
+
+def test_recarga_a_quente_preserva_pipelines_em_uso(arquivo, definicao):
+    politica = PoliticaRegras()
+    politica.carregar(str(arquivo))
+    em_uso = politica.pipeline("colacao")
+    assert politica.recarregar_se_alterado() is False
+
+    definicao["padrao"]["colacao"] = [{"regra": "RegraCreditos", "minimo": 150}]
+    arquivo.write_text(json.dumps(definicao, indent=2), encoding="utf-8")
+
+    assert politica.recarregar_se_alterado() is True
+    assert politica.pipeline("colacao") is not em_uso
+    assert em_uso.avaliar(_colacao())[0].parametros["minimo"] == 80
+    assert politica.pipeline("colacao").avaliar(_colacao())[0].parametros["minimo"] == 150
+
+def test_recarga_invalida_mantem_a_politica_atual(arquivo):
+    politica = PoliticaRegras()
+    politica.carregar(str(arquivo))
+    atual = politica.pipeline("colacao")
+
+    arquivo.write_text("{ quebrado", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        politica.recarregar_se_alterado()
+    assert politica.pipeline("colacao") is atual
+    assert politica.recarregar_se_alterado() is False
+
+def test_recarga_com_entrada_de_tipo_invalido_mantem_a_politica_atual(arquivo, definicao):
+    politica = PoliticaRegras()
+    politica.carregar(str(arquivo))
+    atual = politica.pipeline("colacao", "Medicina")
+
+    definicao["cursos"]["Medicina"] = "RegraCreditos"
+    arquivo.write_text(json.dumps(definicao, indent=2), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Medicina"):
+        politica.recarregar_se_alterado()
+    assert politica.pipeline("colacao", "Medicina") is atual
+
+def test_politica_em_toml(tmp_path):
+    if politica_regras.tomllib is None:
+        pytest.skip("TOML indisponível nesta versão do Python")
+    caminho = tmp_path / "politica.toml"
+    caminho.write_text(
+        '[padrao]\n'
+        'matricula = ["RegraPreRequisito"]\n'
+        'trancamento = ["RegraPrazo"]\n'
+        'colacao = [{ regra = "RegraCreditos", minimo = 100 }]\n',
+        encoding="utf-8")
+
+    politica = PoliticaRegras()
+    politica.carregar(str(caminho))
+
+    assert isinstance(politica.pipeline("colacao").regras[0], RegraCreditos)
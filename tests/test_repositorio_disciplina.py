@@ -0,0 +1,59 @@
+import pytest
+import infrastructure.db_config as db_config
+from infrastructure.repositorio_disciplina import RepositorioDisciplina
+from domain.disciplina import Disciplina
+
+#FIXTURES
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Repositório apontando para um sgsa.json temporário."""
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    return RepositorioDisciplina()
+
+@pytest.fixture
+def catalogo(repo):
+    """Cadeia Cálculo I → Cálculo II → Cálculo III, com laboratório como co-requisito."""
+    calc1 = Disciplina("Cálculo I", 72)
+    calc2 = Disciplina("Cálculo II", 72)
+    calc3 = Disciplina("Cálculo III", 72)
+    lab = Disciplina("Laboratório de Cálculo", 36)
+    calc2.adicionar_pre_requisito(calc1)
+    calc3.adicionar_pre_requisito(calc2)
+    calc2.adicionar_co_requisito(lab)
+    for d in (calc1, lab, calc2, calc3):
+        repo.adicionar(d)
+    return repo
+
+#TESTES DE DEPENDENTES DIRETOS
+
+def test_dependentes_diretos_por_vinculo(catalogo):
+    assert catalogo.dependentes_diretos("Cálculo I") == ["Cálculo II"]
+    assert catalogo.dependentes_diretos("Laboratório de Cálculo", "co") == ["Cálculo II"]
+    assert catalogo.dependentes_diretos("Laboratório de Cálculo", "pre") == []
+
+def test_consulta_ignora_maiusculas(catalogo):
+    assert catalogo.dependentes_diretos("cálculo i") == ["Cálculo II"]
+
+def test_vinculo_invalido(catalogo):
+    with pytest.raises(ValueError):
+        catalogo.dependentes_diretos("Cálculo I", "equivalencia")
+
+#TESTES DE DEPENDENTES TRANSITIVOS
+
+def test_dependentes_transitivos_segue_a_cadeia(catalogo):
+    assert catalogo.dependentes_transitivos("Cálculo I") == ["Cálculo II", "Cálculo III"]
+    assert catalogo.dependentes_transitivos("Laboratório de Cálculo") == ["Cálculo II", "Cálculo III"]
+
+#TESTES DE MANUTENÇÃO DO ÍNDICE
+
+def test_indice_acompanha_atualizacao_de_pre_requisitos(catalogo):
+    # Constrói o índice antes da alteração
+    assert catalogo.dependentes_diretos("Cálculo I") == ["Cálculo II"]
+
+    catalogo.atualizar_pre_requisitos("Cálculo III", ["Cálculo II", "Cálculo I"])
+    catalogo.atualizar_pre_requisitos("Cálculo II", [])
+
+    assert catalogo.dependentes_diretos("Cálculo I") == ["Cálculo III"]
+    # Uma nova instância (índice reconstruído do arquivo) enxerga o mesmo estado
+    assert RepositorioDisciplina().dependentes_diretos("Cálculo I") == ["Cálculo III"]
@@ -0,0 +1,156 @@
+import pytest
+import infrastructure.db_config as db_config
+from infrastructure.repositorio_solicitacao import RepositorioSolicitacao
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+from domain.solicitacao_matricula import SolicitacaoMatricula
+from domain.solicitacao_trancamento import SolicitacaoTrancamento
+
+#FIXTURES
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Repositório apontando para um sgsa.json temporário."""
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    return RepositorioSolicitacao()
+
+@pytest.fixture
+def aluno():
+    return Aluno("Ana", "ana@sgsa.edu.br", "MAT001", Curso("Física"))
+
+def _aprovada(sol, semestre="2026.1"):
+    sol.semestre = semestre
+    sol.avancar()
+    sol.avancar()
+    return sol
+
+#TESTES DE CARGA SEMESTRAL
+
+def test_matriculas_aprovadas_somam_e_trancamento_retira(repo, aluno, capsys):
+    calc, fis = Disciplina("Cálculo I", 72), Disciplina("Física I", 60)
+    repo.adicionar(_aprovada(SolicitacaoMatricula(aluno, calc)), "matricula")
+    repo.adicionar(_aprovada(SolicitacaoMatricula(aluno, fis)), "matricula")
+    repo.adicionar(_aprovada(SolicitacaoMatricula(aluno, fis), "2026.2"), "matricula")
+    assert repo.carga_semestral("MAT001", "2026.1") == 132
+
+    repo.adicionar(_aprovada(SolicitacaoTrancamento(aluno, calc)), "trancamento")
+
+    assert repo.carga_semestral("MAT001", "2026.1") == 60
+    assert repo.disciplinas_semestre("MAT001", "2026.1") == {"Física I": 60}
+    assert repo.carga_semestral("MAT001", "2026.2") == 60
+
+def test_somente_aprovadas_com_semestre_contam(repo, aluno, capsys):
+    aberta = SolicitacaoMatricula(aluno, Disciplina("Cálculo I", 72))
+    aberta.semestre = "2026.1"
+    repo.adicionar(aberta, "matricula")
+    repo.adicionar(_aprovada(SolicitacaoMatricula(aluno, Disciplina("Física I", 60)), None),
+                   "matricula")
+
+    assert repo.carga_semestral("MAT001", "2026.1") == 0
+
+def test_mudanca_de_status_atualiza_o_agregado(repo, aluno, capsys):
+    repo.adicionar(_aprovada(SolicitacaoMatricula(aluno, Disciplina("Cálculo I", 72))), "matricula")
+
+    repo.atualizar_status(1, "Rejeitada")
+    assert repo.carga_semestral("MAT001", "2026.1") == 0
+
+    repo.atualizar_status(1, "Aprovada")
+    repo.reconstruir_carga_semestral()
+    assert repo.carga_semestral("MAT001", "2026.1") == 72
+
+#TESTES DO ÍNDICE DE PENDENTES
+
+def test_pendentes_acompanham_gravacoes_e_alteracoes_externas(repo, aluno, capsys):
+    repo.adicionar(SolicitacaoMatricula(aluno, Disciplina("Cálculo I", 72)), "matricula")
+    assert _ids(repo.listar_pendentes(alvos=["Cálculo I"])) == [1]
+
+    repo.atualizar_status(1, "Rejeitada")
+    assert repo.listar_pendentes(alvos=["Cálculo I"]) == []
+
+    # Outro processo reabre a solicitação: o índice é reconstruído
+    db = db_config.load_db()
+    db["solicitacoes"][0]["status"] = "Aberta"
+    db_config.save_db(db)
+    assert _ids(repo.listar_pendentes(aluno_id="MAT001")) == [1]
+
+#TESTES DE CONSULTA PAGINADA
+
+@pytest.fixture
+def povoado(repo, aluno, capsys):
+    """Dez matrículas alternando entre Cálculo I e Física I."""
+    outro = Aluno("Bia", "bia@sgsa.edu.br", "MAT002", Curso("Física"))
+    for i in range(10):
+        disciplina = Disciplina("Cálculo I" if i % 2 else "Física I", 60)
+        repo.adicionar(SolicitacaoMatricula(aluno if i < 5 else outro, disciplina), "matricula")
+    return repo
+
+def _ids(registros):
+    return [r["id"] for r in registros]
+
+@pytest.mark.parametrize("indexado", [False, True])
+def test_consulta_filtra_e_continua_apos_o_id(povoado, indexado):
+    if indexado:
+        povoado.indexar_consultas()
+
+    assert _ids(povoado.consultar(alvo="cálculo i")) == [2, 4, 6, 8, 10]
+    assert _ids(povoado.consultar(alvo="Cálculo I", aluno_id="MAT002", apos=6)) == [8, 10]
+    assert _ids(povoado.consultar(apos=8)) == [9, 10]
+    assert _ids(povoado.consultar(status="Rejeitada")) == []
+
+def test_paginas_encadeadas_pelo_proximo(povoado):
+    pagina = povoado.pagina(limite=4, status="Aberta")
+    assert (_ids(pagina["itens"]), pagina["proximo"]) == ([1, 2, 3, 4], 4)
+
+    pagina = povoado.pagina(limite=4, apos=8, status="Aberta")
+    assert (_ids(pagina["itens"]), pagina["proximo"]) == ([9, 10], None)
+
+    with pytest.raises(ValueError):
+        povoado.pagina(limite=0)
+
+def test_indice_acompanha_gravacoes_e_descarta_alteracoes_externas(povoado, aluno, capsys):
+    povoado.indexar_consultas()
+    povoado.atualizar_status(3, "Rejeitada")
+    povoado.adicionar(SolicitacaoMatricula(aluno, Disciplina("Química", 60)), "matricula")
+
+    assert _ids(povoado.consultar(status="Rejeitada")) == [3]
+    assert _ids(povoado.consultar(alvo="Química")) == [11]
+
+    # Outro processo altera o arquivo: o índice deixa de ser usado
+    db = db_config.load_db()
+    db["solicitacoes"][0]["status"] = "Rejeitada"
+    db_config.save_db(db)
+    assert _ids(povoado.consultar(status="Rejeitada")) == [1, 3]
+
+#TESTES DE CONCORRÊNCIA
+
+def test_paginas_lidas_durante_gravacoes_sao_consistentes(repo, aluno, monkeypatch, capsys):
+    import threading
+    monkeypatch.setattr(db_config, "_cache", dict(db_config._cache))
+    db_config.ativar_cache()
+    repo.indexar_consultas()
+    falhas, fim = [], threading.Event()
+
+    def gravar():
+        for i in range(150):
+            repo.adicionar(SolicitacaoMatricula(aluno, Disciplina(f"D{i % 3}", 60)), "matricula")
+            if i % 2:
+                repo.atualizar_status(i, "Rejeitada")
+        fim.set()
+
+    def ler():
+        while not fim.is_set():
+            ids = _ids(repo.pagina(limite=500, status="Aberta")["itens"])
+            if ids != sorted(set(ids)):
+                falhas.append(ids)
+
+    leitores = [threading.Thread(target=ler) for _ in range(3)]
+    gravador = threading.Thread(target=gravar)
+    for t in leitores + [gravador]:
+        t.start()
+    for t in [gravador] + leitores:
+        t.join()
+
+    assert falhas == []
+    esperado = [r["id"] for r in db_config.load_db()["solicitacoes"] if r["status"] == "Aberta"]
+    assert _ids(repo.pagina(limite=500, status="Aberta")["itens"]) == esperado
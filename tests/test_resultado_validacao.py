@@ -0,0 +1,104 @@
+import datetime
+import pytest
+from unittest.mock import MagicMock
+from application.solicitacao_service import SolicitacaoService
+from application.pipeline_regras import PipelineRegras
+from domain.excecoes import ViolacaoRegraAcademicaError
+from domain.resultado_validacao import Violacao, ResultadoValidacao
+from rules.regra_base import Regra
+from rules.regra_elegibilidade import RegraElegibilidade
+from rules.regra_prazo import RegraPrazo
+from rules.regra_creditos import RegraCreditos
+
+#FIXTURES
+
+@pytest.fixture
+def colacao_reprovada():
+    """Aluno com obrigatória pendente e optativas insuficientes."""
+    solicitacao = MagicMock()
+    solicitacao.aluno.curso.min_horas_optativas = 100
+    solicitacao.aluno.curso.disciplinas_obrigatorias.return_value = [MagicMock(nome="Anatomia I")]
+    solicitacao.aluno.historico.foi_aprovado.return_value = False
+    solicitacao.aluno.historico.disciplinas_aprovadas.return_value = [
+        MagicMock(carga_horaria=60, obrigatoria=False)
+    ]
+    solicitacao.aluno.historico.total_creditos.return_value = 60
+    return solicitacao
+
+#TESTES DE VIOLACAO
+
+def test_mensagem_formatada_apenas_no_acesso():
+    v = Violacao("RegraX", "codigo", "Faltam: {itens} até {prazo:%d/%m/%Y}.",
+                 itens=["A", "B"], prazo=datetime.date(2026, 3, 15))
+
+    assert v._mensagem is None
+    assert v.mensagem == "Faltam: A, B até 15/03/2026."
+    assert str(v) == "[Violação Acadêmica - RegraX] Faltam: A, B até 15/03/2026."
+    assert v.como_dict() == {"regra": "RegraX", "codigo": "codigo",
+                             "parametros": {"itens": ["A", "B"], "prazo": datetime.date(2026, 3, 15)}}
+
+def test_excecao_equivalente_carrega_codigo_e_parametros():
+    erro = Violacao("RegraCreditos", "creditos_insuficientes", "{total}h", total=40).como_excecao()
+
+    assert isinstance(erro, ViolacaoRegraAcademicaError)
+    assert erro.regra == "RegraCreditos"
+    assert erro.codigo == "creditos_insuficientes"
+    assert erro.parametros == {"total": 40}
+
+#TESTES DAS REGRAS
+
+def test_regra_retorna_todas_as_violacoes_sem_lancar(colacao_reprovada):
+    violacoes = RegraElegibilidade().avaliar(colacao_reprovada)
+
+    assert [v.codigo for v in violacoes] == ["obrigatorias_pendentes", "optativas_insuficientes"]
+    assert violacoes[0].parametros == {"pendentes": ["Anatomia I"]}
+    assert violacoes[1].parametros == {"minimo": 100, "concluido": 60}
+
+def test_validar_continua_lancando_a_primeira_violacao(colacao_reprovada):
+    with pytest.raises(ViolacaoRegraAcademicaError) as excinfo:
+        RegraElegibilidade().validar(colacao_reprovada)
+
+    assert excinfo.value.codigo == "obrigatorias_pendentes"
+    assert "Anatomia I" in str(excinfo.value)
+
+def test_regra_apenas_com_validar_e_adaptada():
+    class RegraAntiga(Regra):
+        def validar(self, solicitacao):
+            raise ViolacaoRegraAcademicaError("Sempre falha.", regra="RegraAntiga")
+
+    violacoes = RegraAntiga().avaliar(MagicMock())
+    assert violacoes[0].codigo == "violacao"
+    assert violacoes[0].mensagem == "Sempre falha."
+
+def test_regra_sem_avaliar_nem_validar_nao_pode_ser_instanciada():
+    class RegraIncompleta(Regra):
+        MENSAGENS = {"x": "x"}
+
+    with pytest.raises(TypeError):
+        Regra()
+    with pytest.raises(TypeError):
+        RegraIncompleta()
+
+#TESTES DO SERVIÇO
+
+def test_avaliar_regras_reune_violacoes_de_todas_as_regras(colacao_reprovada):
+    colacao_reprovada.data = datetime.date(2026, 3, 20)
+    colacao_reprovada.prazo = datetime.date(2026, 3, 15)
+    regras = [RegraElegibilidade(), RegraPrazo(), RegraCreditos(minimo=80)]
+
+    resultado = SolicitacaoService().avaliar_regras(colacao_reprovada, regras)
+
+    assert isinstance(resultado, ResultadoValidacao)
+    assert not resultado
+    assert resultado.codigos == ["obrigatorias_pendentes", "optativas_insuficientes",
+                                 "prazo_encerrado", "creditos_insuficientes"]
+    with pytest.raises(ViolacaoRegraAcademicaError):
+        resultado.levantar()
+
+def test_pipeline_avalia_todas_as_regras_e_conta_rejeicoes(colacao_reprovada):
+    pipeline = PipelineRegras([RegraElegibilidade(), RegraCreditos(minimo=80)])
+
+    resultado = SolicitacaoService().avaliar_regras(colacao_reprovada, pipeline)
+
+    assert len(resultado.violacoes) == 3
+    assert [e["rejeicoes"] for e in pipeline.estatisticas()] == [1, 1]
@@ -0,0 +1,85 @@
+import pytest
+import infrastructure.db_config as db_config
+from infrastructure.repositorio_disciplina import RepositorioDisciplina
+from infrastructure.repositorio_solicitacao import RepositorioSolicitacao
+from application.politica_regras import PoliticaRegras
+from application.revalidacao_service import RevalidacaoService
+from application.solicitacao_service import SolicitacaoService
+from cli.protocolo import processar_solicitacao
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+
+#FIXTURES
+
+@pytest.fixture
+def ambiente(tmp_path, monkeypatch, capsys):
+    """
+    Catálogo com Cálculo I/II e Física e matrículas aprovadas pelo fluxo
+    normal: A1 em Cálculo II e Física (2026.2); A2 em Física (2026.2) e
+    em Cálculo II num semestre já encerrado (2026.1).
+    """
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    repo_disc = RepositorioDisciplina()
+    repo_sol = RepositorioSolicitacao()
+    for nome, carga in (("Cálculo I", 72), ("Cálculo II", 72), ("Física", 60)):
+        repo_disc.adicionar(Disciplina(nome, carga))
+
+    alunos = {m: Aluno(m, f"{m}@sgsa.edu.br", m, Curso("ADS")) for m in ("A1", "A2")}
+    service, regras = SolicitacaoService(), PoliticaRegras().pipeline("matricula")
+    for mat, alvo, semestre in (("A1", "Cálculo II", "2026.2"), ("A1", "Física", "2026.2"),
+                                ("A2", "Física", "2026.2"), ("A2", "Cálculo II", "2026.1")):
+        sol = service.criar_solicitacao("matricula", alunos[mat], repo_disc.carregar_todas()[alvo])
+        sol.semestre = semestre
+        sol.carga_horaria_semestre_atual = repo_sol.carga_semestral(mat, semestre)
+        service.aplicar_regras(sol, regras)
+        processar_solicitacao(sol, service, repo_sol, "matricula", f"SGSA-{mat}-{alvo}")
+
+    carregados = []
+
+    def carregar_disciplina(nome):
+        carregados.append(nome)
+        return repo_disc.carregar_todas().get(nome)
+
+    svc = RevalidacaoService(repo_sol, repo_disc, alunos.get, carregar_disciplina,
+                             semestre_atual=lambda aluno: "2026.2")
+    return svc, repo_disc, repo_sol, carregados
+
+#TESTES DE ALTERAÇÃO DO CATÁLOGO
+
+def test_novo_pre_requisito_rejeita_matricula_aprovada_do_semestre(ambiente):
+    svc, repo_disc, repo_sol, carregados = ambiente
+    repo_disc.atualizar_pre_requisitos("Cálculo II", ["Cálculo I"])
+
+    resultados = svc.apos_alteracao_catalogo("Cálculo II", "pre")
+
+    # A matrícula de A2 em 2026.1 já foi cursada e não é revalidada
+    assert [(r["id"], r["status"]) for r in resultados] == [(1, "Rejeitada")]
+    assert "Cálculo I" in resultados[0]["violacao"]
+    assert carregados == ["Cálculo II"]  # Física nunca é reconstruída
+    # O registro persistido é atualizado, sai do índice e da carga do semestre
+    assert [r["id"] for r in repo_sol.listar_pendentes(alvos=["Cálculo II"])] == [4]
+    assert repo_sol.disciplinas_semestre("A1", "2026.2") == {"Física": 60}
+
+def test_co_requisito_cursado_no_mesmo_semestre_mantem_a_aprovacao(ambiente):
+    svc, repo_disc, repo_sol, _ = ambiente
+    repo_disc.atualizar_co_requisitos("Cálculo II", ["Física"])
+
+    resultados = svc.apos_alteracao_catalogo("Cálculo II", "co")
+
+    assert [(r["id"], r["status"], r["violacao"]) for r in resultados] == [(1, "Aprovada", None)]
+
+def test_alvo_sem_matriculas_pendentes_nao_faz_trabalho(ambiente):
+    svc, _, _, carregados = ambiente
+    assert svc.apos_alteracao_catalogo("Cálculo I") == []
+    assert carregados == []
+
+#TESTES DE ALTERAÇÃO DO HISTÓRICO
+
+def test_alteracao_de_historico_usa_dependentes_diretos(ambiente):
+    svc, repo_disc, _, _ = ambiente
+    repo_disc.atualizar_pre_requisitos("Física", ["Cálculo I"])
+
+    resultados = svc.apos_alteracao_historico("A2", "Cálculo I")
+
+    assert [(r["id"], r["status"]) for r in resultados] == [(3, "Rejeitada")]
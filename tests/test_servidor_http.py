@@ -0,0 +1,129 @@
+import http.client
+import json
+import threading
+import time
+import pytest
+from infrastructure.servidor_http import ServidorHTTP, ErroHTTP, paginar
+from tests.carga_api import executar_carga
+
+#FIXTURES
+
+@pytest.fixture
+def estado():
+    return {"gravacoes": [], "simultaneas": 0, "maximo": 0}
+
+@pytest.fixture
+def servidor(estado):
+    """Servidor em porta livre com rotas de teste, encerrado ao fim do teste."""
+    srv = ServidorHTTP(porta=0, trabalhadores=2, fila=8, timeout=0.5)
+    lock = threading.Lock()
+
+    def gravar(consulta, corpo):
+        with lock:
+            estado["simultaneas"] += 1
+            estado["maximo"] = max(estado["maximo"], estado["simultaneas"])
+        time.sleep(0.01)
+        estado["gravacoes"].append(corpo["n"])
+        with lock:
+            estado["simultaneas"] -= 1
+        return {"gravado": corpo["n"]}
+
+    def conflito(consulta, corpo):
+        raise ErroHTTP(409, "Já existe.")
+
+    srv.rota("GET", "/saude", lambda consulta, corpo: {"ok": True})
+    srv.rota("GET", "/eco", lambda consulta, corpo: consulta)
+    srv.rota("GET", "/lento", lambda consulta, corpo: time.sleep(2))
+    srv.rota("GET", "/conflito", conflito)
+    srv.rota("POST", "/gravar", gravar, escrita=True)
+    srv.rota("POST", "/etapas", lambda consulta, corpo: [threading.current_thread().name],
+             gravacao=lambda nomes: {"threads": nomes + [threading.current_thread().name]})
+    thread = threading.Thread(target=srv.servir, daemon=True)
+    thread.start()
+    assert srv.pronto.wait(5)
+    yield srv
+    srv.encerrar()
+    thread.join(timeout=5)
+
+def _pedir(conexao, metodo, caminho, corpo=None):
+    conexao.request(metodo, caminho, body=json.dumps(corpo) if corpo is not None else None)
+    resposta = conexao.getresponse()
+    return resposta.status, json.loads(resposta.read())
+
+#TESTES DO PROTOCOLO
+
+def test_keep_alive_reaproveita_a_conexao(servidor):
+    conexao = http.client.HTTPConnection("127.0.0.1", servidor.porta, timeout=5)
+    assert _pedir(conexao, "GET", "/saude") == (200, {"ok": True})
+    socket_usado = conexao.sock
+    assert _pedir(conexao, "GET", "/eco?curso=F%C3%ADsica") == (200, {"curso": "Física"})
+    assert conexao.sock is socket_usado
+    conexao.close()
+
+def test_erros_de_rota_e_de_metodo(servidor):
+    conexao = http.client.HTTPConnection("127.0.0.1", servidor.porta, timeout=5)
+    assert _pedir(conexao, "GET", "/nada")[0] == 404
+    assert _pedir(conexao, "DELETE", "/saude")[0] == 405
+    assert _pedir(conexao, "GET", "/conflito") == (409, {"erro": "Já existe."})
+    conexao.close()
+
+def test_tempo_limite_responde_504(servidor):
+    conexao = http.client.HTTPConnection("127.0.0.1", servidor.porta, timeout=5)
+    status, corpo = _pedir(conexao, "GET", "/lento")
+    assert status == 504
+    assert "Tempo limite" in corpo["erro"]
+    conexao.close()
+
+#TESTES DA GRAVAÇÃO SERIALIZADA E CARGA
+
+def test_escritas_concorrentes_executam_uma_de_cada_vez(servidor, estado):
+    def enviar(n):
+        conexao = http.client.HTTPConnection("127.0.0.1", servidor.porta, timeout=5)
+        assert _pedir(conexao, "POST", "/gravar", {"n": n}) == (200, {"gravado": n})
+        conexao.close()
+
+    threads = [threading.Thread(target=enviar, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(estado["gravacoes"]) == list(range(6))
+    assert estado["maximo"] == 1
+
+def test_rota_em_duas_etapas_prepara_no_pool_e_grava_na_gravadora(servidor):
+    conexao = http.client.HTTPConnection("127.0.0.1", servidor.porta, timeout=5)
+    status, corpo = _pedir(conexao, "POST", "/etapas", {})
+    conexao.close()
+
+    assert status == 200
+    preparo, gravacao = corpo["threads"]
+    assert preparo.startswith("sgsa-leitura") and gravacao.startswith("sgsa-gravacao")
+
+def test_escrita_e_gravacao_sao_exclusivas():
+    with pytest.raises(ValueError):
+        ServidorHTTP().rota("POST", "/x", dict, escrita=True, gravacao=dict)
+
+def test_carga_com_conexoes_persistentes(servidor):
+    resultado = executar_carga("127.0.0.1", servidor.porta, "/saude", conexoes=4, requisicoes=50)
+    assert resultado["erros"] == 0
+    assert resultado["por_status"] == {200: 200}
+
+#TESTES DA PAGINAÇÃO
+
+def test_paginar_continua_apos_a_chave():
+    itens = [{"nome": n} for n in "abcde"]
+    pagina = paginar(itens, {"limite": "2"}, chave=lambda i: i["nome"])
+    assert (pagina["itens"], pagina["proximo"]) == ([{"nome": "a"}, {"nome": "b"}], "b")
+
+    # Um item removido antes do cursor não faz a página seguinte pular nenhum outro
+    del itens[0]
+    pagina = paginar(itens, {"limite": "2", "apos": "b"}, chave=lambda i: i["nome"])
+    assert (pagina["itens"], pagina["proximo"]) == ([{"nome": "c"}, {"nome": "d"}], "d")
+    assert paginar(itens, {"limite": "2", "apos": "d"}, chave=lambda i: i["nome"])["proximo"] is None
+
+def test_paginar_rejeita_parametros_invalidos():
+    with pytest.raises(ValueError):
+        paginar([], {"limite": "0"}, chave=str)
+    with pytest.raises(ValueError):
+        paginar([], {"limite": "x"}, chave=str)
@@ -0,0 +1,75 @@
+import os
+import threading
+import pytest
+import infrastructure.db_config as db_config
+from infrastructure.servidor_socket import ServidorNDJSON, ClienteNDJSON, disponivel, em_execucao
+
+pytestmark = pytest.mark.skipif(not disponivel(), reason="sem sockets de domínio Unix")
+
+#FIXTURES
+
+@pytest.fixture
+def servidor(tmp_path):
+    """Servidor de eco em uma thread, encerrado ao fim do teste."""
+    chamadas = []
+
+    def tratar(requisicao):
+        chamadas.append(requisicao)
+        return {"eco": requisicao, "n": len(chamadas)}
+
+    srv = ServidorNDJSON(str(tmp_path / "s.sock"), tratar)
+    thread = threading.Thread(target=srv.servir, daemon=True)
+    thread.start()
+    yield srv
+    srv.encerrar()
+    thread.join(timeout=5)
+
+@pytest.fixture
+def banco(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_config, "DB_FILE", str(tmp_path / "sgsa.json"))
+    db_config.save_db({"alunos": [{"nome": "Ana"}]})
+    db_config.ativar_cache()
+    yield tmp_path / "sgsa.json"
+    db_config.ativar_cache(False)
+
+#TESTES DO TRANSPORTE
+
+def test_varias_requisicoes_na_mesma_conexao(servidor):
+    with ClienteNDJSON(servidor.caminho, timeout=5) as cliente:
+        assert cliente.enviar({"op": "ping"}) == {"eco": {"op": "ping"}, "n": 1}
+        assert cliente.enviar({"argv": ["aluno", "listar"]})["n"] == 2
+
+def test_linha_invalida_recebe_erro_sem_derrubar_a_conexao(servidor):
+    with ClienteNDJSON(servidor.caminho, timeout=5) as cliente:
+        cliente._socket.sendall(b"nao e json\n")
+        assert "erro" in cliente._leitor.readline().decode()
+        assert cliente.enviar({"op": "ping"})["n"] == 1
+
+def test_em_execucao_e_remocao_do_socket_ao_encerrar(servidor):
+    assert em_execucao(servidor.caminho)
+    with pytest.raises(ValueError):
+        ServidorNDJSON(servidor.caminho, lambda req: req)
+
+    servidor.encerrar()
+    for _ in range(100):
+        if not os.path.exists(servidor.caminho):
+            break
+        threading.Event().wait(0.01)
+    assert not em_execucao(servidor.caminho)
+
+def test_cliente_sem_servidor_levanta_oserror(tmp_path):
+    with pytest.raises(OSError):
+        ClienteNDJSON(str(tmp_path / "inexistente.sock"))
+
+#TESTES DO CACHE DO BANCO
+
+def test_cache_reaproveita_leitura_enquanto_o_arquivo_nao_muda(banco):
+    primeira = db_config.load_db()
+    assert db_config.load_db() is primeira
+
+def test_cache_detecta_alteracao_por_outro_processo(banco):
+    db_config.load_db()
+    banco.write_text('{"alunos": [{"nome": "Ana"}, {"nome": "Bruno"}]}', encoding="utf-8")
+    os.utime(banco, ns=(0, 1))  # garante mtime diferente mesmo em sistemas de arquivos lentos
+
+    assert [a["nome"] for a in db_config.load_db()["alunos"]] == ["Ana", "Bruno"]
@@ -0,0 +1,49 @@
+import pytest
+from tests.tempo_inicializacao import ler_importtime, medir
+
+# Orçamento generoso (ms de importação do CLI, mediana) para não oscilar em
+# máquinas lentas; antes da carga sob demanda, 'aluno listar' passava de 120 ms.
+ORCAMENTO_MS = 80
+
+# Módulos que os comandos de consulta não devem carregar
+PESADOS = ("asyncio", "multiprocessing", "uuid", "application.politica_regras",
+           "application.solicitacao_service", "cli.demo", "cli.animacao",
+           "infrastructure.servidor_http", "infrastructure.servidor_socket")
+
+#FIXTURES
+
+@pytest.fixture(scope="module")
+def listar_alunos():
+    return medir(["aluno", "listar"], repeticoes=3)
+
+#TESTES DO RELATÓRIO
+
+def test_ler_importtime_interpreta_niveis_e_ignora_cabecalho():
+    texto = ("import time: self [us] | cumulative | imported package\n"
+             "import time:       120 |        300 |   json.decoder\n"
+             "import time:        80 |        380 | json\n"
+             "outra linha\n")
+
+    assert ler_importtime(texto) == [
+        {"modulo": "json.decoder", "nivel": 1, "proprio_us": 120, "acumulado_us": 300},
+        {"modulo": "json", "nivel": 0, "proprio_us": 80, "acumulado_us": 380},
+    ]
+
+#TESTES DO ORÇAMENTO
+
+def test_consulta_nao_importa_regras_servidores_nem_demo(listar_alunos):
+    carregados = set(listar_alunos["modulos"])
+
+    assert [m for m in PESADOS if m in carregados] == []
+    assert not any(m.startswith("rules.") for m in carregados)
+
+def test_consulta_dentro_do_orcamento(listar_alunos):
+    assert listar_alunos["mediana_ms"] <= ORCAMENTO_MS, listar_alunos["mais_caros"]
+
+def test_criar_solicitacao_carrega_so_as_regras():
+    relatorio = medir(["solicitacao", "criar", "--tipo", "matricula", "--mat", "X", "--alvo", "Y"],
+                      repeticoes=1)
+    carregados = set(relatorio["modulos"])
+
+    assert "application.politica_regras" in carregados
+    assert not {"asyncio", "cli.demo", "infrastructure.servidor_http"} & carregados
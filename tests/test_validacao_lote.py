@@ -0,0 +1,101 @@
+import pytest
+from application.solicitacao_service import SolicitacaoService
+from application.pipeline_regras import PipelineRegras
+from application.cache_regras import CacheResultadosRegras
+from rules import vetorizacao
+from rules.vetorizacao import indices_violados
+from rules.regra_creditos import RegraCreditos
+from rules.regra_elegibilidade import RegraElegibilidade
+from rules.regra_limite_carga_horaria import RegraLimiteCargaHoraria
+from rules.regra_limite_trancamentos import RegraLimiteTrancamentos
+from rules.regra_pre_requisito import RegraPreRequisito
+from domain.aluno import Aluno
+from domain.curso import Curso
+from domain.disciplina import Disciplina
+from domain.solicitacao_matricula import SolicitacaoMatricula
+from domain.solicitacao_colacao import SolicitacaoColacao
+
+#FIXTURES
+
+@pytest.fixture
+def matriculas():
+    curso = Curso("Física", limite_horas_semestrais=300)
+    calculo = Disciplina("Cálculo I", 72)
+    sols = []
+    for i in range(150):
+        aluno = Aluno(f"A{i}", f"a{i}@sgsa.edu.br", f"MAT{i:03}", curso)
+        for _ in range(i % 4):
+            aluno.historico.adicionar_disciplina(Disciplina(f"D{i}-{_}", 60), 8.0)
+        for _ in range(i % 6):
+            aluno.historico.registrar_trancamento()
+        sol = SolicitacaoMatricula(aluno, calculo)
+        sol.carga_horaria_semestre_atual = (i * 37) % 300
+        sols.append(sol)
+    return sols
+
+@pytest.fixture
+def regras():
+    return [RegraCreditos(minimo=120), RegraLimiteCargaHoraria(),
+            RegraLimiteTrancamentos(), RegraPreRequisito()]
+
+def _por_objeto(sols, regras):
+    svc = SolicitacaoService()
+    return [svc.avaliar_regras(s, regras) for s in sols]
+
+def _resumo(resultados):
+    return [[(v.codigo, v.parametros) for v in r.violacoes] for r in resultados]
+
+#TESTES DE EQUIVALÊNCIA
+
+def test_lote_equivale_a_avaliacao_individual(matriculas, regras):
+    lote = SolicitacaoService().validar_lote(matriculas, regras)
+
+    assert len(lote) == len(matriculas)
+    assert _resumo(lote) == _resumo(_por_objeto(matriculas, regras))
+    assert any(lote) and not all(lote)
+
+def test_lote_sem_numpy_equivale(monkeypatch, matriculas, regras):
+    monkeypatch.setattr(vetorizacao, "np", None)
+    lote = SolicitacaoService().validar_lote(matriculas, regras)
+
+    assert _resumo(lote) == _resumo(_por_objeto(matriculas, regras))
+
+def test_lote_de_colacao_verifica_optativas():
+    curso = Curso("Física", min_horas_optativas=60)
+    curso.adicionar_disciplina(Disciplina("Cálculo I", 72))
+    sols = []
+    for horas in (0, 30, 60):
+        aluno = Aluno("Ana", "ana@sgsa.edu.br", f"MAT{horas}", curso)
+        aluno.historico.adicionar_disciplina(Disciplina("Cálculo I", 72), 8.0)
+        if horas:
+            aluno.historico.adicionar_disciplina(Disciplina(f"Opt{horas}", horas, obrigatoria=False), 8.0)
+        sols.append(SolicitacaoColacao(aluno, curso))
+
+    lote = SolicitacaoService().validar_lote(sols, RegraElegibilidade())
+
+    assert [r.codigos for r in lote] == [["optativas_insuficientes"]] * 2 + [[]]
+    assert lote[1].violacoes[0].parametros == {"minimo": 60, "concluido": 30}
+
+def test_pipeline_com_cache_em_lote(matriculas, regras):
+    cache = CacheResultadosRegras()
+    pipeline = PipelineRegras(regras, cache=cache)
+    svc = SolicitacaoService()
+
+    primeiro = svc.validar_lote(matriculas, pipeline)
+    segundo = svc.validar_lote(matriculas, pipeline)
+
+    assert [bool(r) for r in primeiro] == [bool(r) for r in segundo]
+    assert cache.acertos == 3 * len(matriculas)
+    assert pipeline.estatisticas()[0]["execucoes"] == 2 * len(matriculas)
+
+#TESTES DA COMPARAÇÃO VETORIZADA
+
+def test_indices_violados_com_limite_escalar_e_por_posicao():
+    assert indices_violados([10, 80, 120], 80, "<") == [0]
+    assert indices_violados([10, 80, 120], [5, 90, 120], ">=") == [0, 2]
+
+def test_indices_violados_entrada_invalida():
+    with pytest.raises(ValueError):
+        indices_violados([1], 1, "==")
+    with pytest.raises(ValueError):
+        indices_violados([1, 2], [1], "<")
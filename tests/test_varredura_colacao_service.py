@@ -0,0 +1,114 @@
+import json
+import pytest
+from application.solicitacao_service import SolicitacaoService
+from application.varredura_colacao_service import VarreduraColacaoService
+from domain.solicitacao_colacao import SolicitacaoColacao
+from infrastructure.repositorio_aluno import RepositorioAluno
+from rules.regra_elegibilidade import RegraElegibilidade
+from rules.regra_pendencia_documentacao import RegraPendenciaDocumentacao
+from rules.regra_creditos import RegraCreditos
+
+#FIXTURES
+
+def _regras():
+    return [RegraElegibilidade(), RegraPendenciaDocumentacao(), RegraCreditos(minimo=80)]
+
+@pytest.fixture
+def varredura():
+    catalogo = [
+        {"nome": "Cálculo I", "carga_horaria": 72, "obrigatoria": True},
+        {"nome": "Libras", "carga_horaria": 60, "obrigatoria": False},
+    ]
+    return VarreduraColacaoService(catalogo, _regras())
+
+@pytest.fixture
+def alunos():
+    return [(f"Aluno {i}", f"a{i}@sgsa.edu.br", f"MAT{i:03}", "Física", 360, 0)
+            for i in range(25)]
+
+def _ler(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        return [json.loads(linha) for linha in f]
+
+class _Interrompido(Exception):
+    pass
+
+#TESTES DE EXECUÇÃO
+
+def test_grava_um_veredicto_por_aluno(tmp_path, varredura, alunos):
+    relatorio = str(tmp_path / "colacao.jsonl")
+
+    resumo = varredura.executar(alunos, relatorio, processos=1, tamanho_bloco=10)
+
+    linhas = _ler(relatorio)
+    assert [l["matricula"] for l in linhas] == sorted(a[2] for a in alunos)
+    assert resumo["avaliados"] == resumo["inaptos"] == 25
+    assert linhas[0]["violacoes"][0]["codigo"] == "curso_sem_grade"
+    assert not (tmp_path / "colacao.jsonl.checkpoint").exists()
+
+def test_veredicto_igual_ao_da_solicitacao_individual(tmp_path, varredura, alunos):
+    relatorio = str(tmp_path / "colacao.jsonl")
+    varredura.executar(alunos[:1], relatorio, processos=1)
+
+    # Mesmo aluno montado como na busca do CLI ('solicitacao criar --tipo colacao')
+    aluno = RepositorioAluno.reconstruir(alunos[0])
+    resultado = SolicitacaoService().avaliar_regras(SolicitacaoColacao(aluno, aluno.curso),
+                                                    _regras())
+
+    assert _ler(relatorio)[0]["violacoes"] == [v.como_dict() for v in resultado.violacoes]
+
+def test_pool_de_processos(tmp_path, varredura, alunos):
+    relatorio = str(tmp_path / "colacao.jsonl")
+
+    resumo = varredura.executar(alunos, relatorio, processos=2, tamanho_bloco=5)
+
+    assert resumo["avaliados"] == 25
+    assert sorted(l["matricula"] for l in _ler(relatorio)) == sorted(a[2] for a in alunos)
+
+#TESTES DE RETOMADA
+
+def test_retoma_a_partir_do_checkpoint(tmp_path, varredura, alunos):
+    relatorio = str(tmp_path / "colacao.jsonl")
+
+    def interromper(avaliados, total):
+        if avaliados >= 20:
+            raise _Interrompido()
+
+    with pytest.raises(_Interrompido):
+        varredura.executar(alunos, relatorio, processos=1, tamanho_bloco=10, progresso=interromper)
+    with open(relatorio, "a", encoding="utf-8") as f:
+        f.write('{"matricula": "linha incompleta')
+
+    resumo = varredura.executar(alunos, relatorio, processos=1, tamanho_bloco=10, retomar=True)
+
+    assert resumo["retomados"] == 20 and resumo["avaliados"] == 5
+    assert [l["matricula"] for l in _ler(relatorio)] == sorted(a[2] for a in alunos)
+
+def test_outra_coorte_do_mesmo_tamanho_nao_herda_o_checkpoint(tmp_path, varredura, alunos):
+    relatorio = str(tmp_path / "colacao.jsonl")
+
+    def interromper(avaliados, total):
+        raise _Interrompido()
+
+    with pytest.raises(_Interrompido):
+        varredura.executar(alunos, relatorio, processos=1, tamanho_bloco=10, progresso=interromper)
+    outra = [(nome, email, "OUT" + mat, curso, *config)
+             for nome, email, mat, curso, *config in alunos]
+
+    resumo = varredura.executar(outra, relatorio, processos=1, tamanho_bloco=10, retomar=True)
+
+    assert resumo["retomados"] == 0 and resumo["avaliados"] == 25
+    assert [l["matricula"] for l in _ler(relatorio)] == sorted(a[2] for a in outra)
+
+def test_sem_retomar_recomeca(tmp_path, varredura, alunos):
+    relatorio = str(tmp_path / "colacao.jsonl")
+    varredura.executar(alunos, relatorio, processos=1)
+
+    resumo = varredura.executar(alunos, relatorio, processos=1)
+
+    assert resumo["retomados"] == 0
+    assert len(_ler(relatorio)) == 25
+
+def test_parametros_invalidos(tmp_path, varredura, alunos):
+    with pytest.raises(ValueError):
+        varredura.executar(alunos, str(tmp_path / "r.jsonl"), processos=1, tamanho_bloco=0)